@@ -0,0 +1,31 @@
+"""Index exploit_missions.created_at for mission history paging
+
+Revision ID: add_missions_created_idx
+Revises: add_users_rbac
+Create Date: 2025-12-05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_missions_created_idx'
+down_revision: Union[str, Sequence[str], None] = 'add_users_rbac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the created_at index used by keyset pagination."""
+    # Databases bootstrapped with init_db() already have it from the model
+    op.create_index(
+        'ix_exploit_missions_created_at', 'exploit_missions', ['created_at'],
+        unique=False, if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the created_at index."""
+    op.drop_index('ix_exploit_missions_created_at', table_name='exploit_missions', if_exists=True)
@@ -196,7 +196,8 @@ export default function ChatModal({ isOpen, onClose, audioRef, radioState, setRa
           break
           
         case 'complete':
-          // Non-streaming response complete
+          // Response complete (replaces any streamed text)
+          setStreamingContent('')
           setMessages(prev => [...prev, {
             id: `msg-${Date.now()}`,
             role: 'assistant',
@@ -217,6 +218,12 @@ export default function ChatModal({ isOpen, onClose, audioRef, radioState, setRa
           setIsLoading(false)
           break
           
+        case 'start':
+        case 'tool_calls':
+        case 'tool_results':
+          break
+          
+        case 'chunk':
         case 'stream':
           setStreamingContent(prev => prev + parsed.content)
           break
@@ -290,7 +297,7 @@ export default function ChatModal({ isOpen, onClose, audioRef, radioState, setRa
         type: 'message',
         content: contextualMessage,
         context: helpContext, // Send help context as additional data
-        stream: false
+        stream: true
       }))
     } else {
       // Fallback to REST API
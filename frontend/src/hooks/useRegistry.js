@@ -208,16 +208,24 @@ export function useRegistryEvents(labId = null) {
   const [events, setEvents] = useState([])
   const [connected, setConnected] = useState(false)
   const wsRef = useRef(null)
+  const lastIdRef = useRef(null)
 
   useEffect(() => {
     // Determine WebSocket URL
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:'
     const host = window.location.host
-    const wsUrl = labId 
-      ? `${protocol}//${host}${API_BASE}/ws/events?lab_id=${labId}`
-      : `${protocol}//${host}${API_BASE}/ws/events`
+    let closed = false
+    lastIdRef.current = null
 
     const connect = () => {
+      if (closed) return
+      // Resume after the last event seen so reconnects don't lose events
+      const params = new URLSearchParams()
+      if (labId) params.set('lab_id', labId)
+      if (lastIdRef.current) params.set('last_id', lastIdRef.current)
+      const query = params.toString()
+      const wsUrl = `${protocol}//${host}${API_BASE}/ws/events${query ? `?${query}` : ''}`
+
       try {
         wsRef.current = new WebSocket(wsUrl)
 
@@ -229,6 +237,7 @@ export function useRegistryEvents(labId = null) {
         wsRef.current.onmessage = (event) => {
           try {
             const data = JSON.parse(event.data)
+            if (data.event_id) lastIdRef.current = data.event_id
             setEvents(prev => [data, ...prev.slice(0, 99)]) // Keep last 100 events
           } catch (err) {
             console.error('Failed to parse event:', err)
@@ -237,6 +246,7 @@ export function useRegistryEvents(labId = null) {
 
         wsRef.current.onclose = () => {
           setConnected(false)
+          if (closed) return
           console.log('Registry WebSocket disconnected, reconnecting...')
           // Reconnect after 3 seconds
           setTimeout(connect, 3000)
@@ -255,6 +265,7 @@ export function useRegistryEvents(labId = null) {
     connect()
 
     return () => {
+      closed = true
       if (wsRef.current) {
         wsRef.current.close()
       }
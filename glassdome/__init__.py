@@ -10,30 +10,60 @@ __version__ = "0.6.5"
 __author__ = "ntounix"
 __email__ = "ntounix@gmail.com"
 
-# Core imports for easy access
-from glassdome.core.config import settings
-from glassdome.agents.manager import agent_manager
-from glassdome.orchestration.engine import OrchestrationEngine
+from typing import TYPE_CHECKING
 
-# Platform clients
-from glassdome.platforms.proxmox_client import ProxmoxClient
-from glassdome.platforms.azure_client import AzureClient
-from glassdome.platforms.aws_client import AWSClient
+from glassdome._lazy import lazy_attributes
 
-# Agent types
-from glassdome.agents.base import (
-    BaseAgent,
-    DeploymentAgent,
-    MonitoringAgent,
-    OptimizationAgent,
-    AgentStatus,
-    AgentType,
-)
+# Public names and the modules that define them. They are imported on first
+# access (PEP 562) so that "import glassdome" - and with it the CLI, workers
+# and scripts - does not load the cloud SDKs and SQLAlchemy models up front.
+_LAZY_IMPORTS = {
+    # Core
+    "settings": "glassdome.core.config",
+    "agent_manager": "glassdome.agents.manager",
+    "OrchestrationEngine": "glassdome.orchestration.engine",
+    # Platform clients
+    "ProxmoxClient": "glassdome.platforms.proxmox_client",
+    "AzureClient": "glassdome.platforms.azure_client",
+    "AWSClient": "glassdome.platforms.aws_client",
+    # Agent types
+    "BaseAgent": "glassdome.agents.base",
+    "DeploymentAgent": "glassdome.agents.base",
+    "MonitoringAgent": "glassdome.agents.base",
+    "OptimizationAgent": "glassdome.agents.base",
+    "AgentStatus": "glassdome.agents.base",
+    "AgentType": "glassdome.agents.base",
+    # Database models
+    "Lab": "glassdome.models.lab",
+    "LabTemplate": "glassdome.models.lab",
+    "LabElement": "glassdome.models.lab",
+    "Deployment": "glassdome.models.deployment",
+    "DeploymentStatus": "glassdome.models.deployment",
+    "Platform": "glassdome.models.platform",
+    "PlatformType": "glassdome.models.platform",
+}
+
+if TYPE_CHECKING:
+    from glassdome.core.config import settings
+    from glassdome.agents.manager import agent_manager
+    from glassdome.orchestration.engine import OrchestrationEngine
+    from glassdome.platforms.proxmox_client import ProxmoxClient
+    from glassdome.platforms.azure_client import AzureClient
+    from glassdome.platforms.aws_client import AWSClient
+    from glassdome.agents.base import (
+        BaseAgent,
+        DeploymentAgent,
+        MonitoringAgent,
+        OptimizationAgent,
+        AgentStatus,
+        AgentType,
+    )
+    from glassdome.models.lab import Lab, LabTemplate, LabElement
+    from glassdome.models.deployment import Deployment, DeploymentStatus
+    from glassdome.models.platform import Platform, PlatformType
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_IMPORTS)
 
-# Database models
-from glassdome.models.lab import Lab, LabTemplate, LabElement
-from glassdome.models.deployment import Deployment, DeploymentStatus
-from glassdome.models.platform import Platform, PlatformType
 
 # New package modules (structure ready for development)
 # These are importable but contain no implementations yet:
@@ -0,0 +1,38 @@
+"""
+Lazy package attributes
+
+Packages list their public names with the module each comes from; the
+module is imported on first access instead of when the package is.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_attributes(package: str, lazy_imports: Mapping[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module-level __getattr__ and __dir__ for a package.
+    
+    Usage, in the package's __init__.py:
+        __getattr__, __dir__ = lazy_attributes(__name__, {"Name": "package.module"})
+    
+    A resolved name is stored in the package namespace, so later lookups
+    don't go through __getattr__.
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(lazy_imports))
+    
+    return __getattr__, __dir__
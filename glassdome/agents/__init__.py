@@ -5,25 +5,50 @@ Author: Brett Turner (ntounix)
 Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
-from glassdome.agents.base import (
-    BaseAgent,
-    DeploymentAgent,
-    MonitoringAgent,
-    OptimizationAgent,
-    AgentStatus,
-    AgentType
-)
-from glassdome.agents.manager import AgentManager
-
-# Specific agent implementations
-from glassdome.agents.ubuntu_installer import UbuntuInstallerAgent
-from glassdome.agents.windows_installer import WindowsInstallerAgent
-from glassdome.agents.rocky_installer import RockyInstallerAgent
-from glassdome.agents.kali_installer import KaliInstallerAgent
-from glassdome.agents.parrot_installer import ParrotInstallerAgent
-from glassdome.agents.rhel_installer import RHELInstallerAgent
-from glassdome.agents.overseer import OverseerAgent
-from glassdome.agents.mailcow_agent import MailcowAgent
+
+from typing import TYPE_CHECKING
+
+from glassdome._lazy import lazy_attributes
+
+# Imported on first access; the installer agents pull in the platform clients
+_LAZY_IMPORTS = {
+    "BaseAgent": "glassdome.agents.base",
+    "DeploymentAgent": "glassdome.agents.base",
+    "MonitoringAgent": "glassdome.agents.base",
+    "OptimizationAgent": "glassdome.agents.base",
+    "AgentStatus": "glassdome.agents.base",
+    "AgentType": "glassdome.agents.base",
+    "AgentManager": "glassdome.agents.manager",
+    "UbuntuInstallerAgent": "glassdome.agents.ubuntu_installer",
+    "WindowsInstallerAgent": "glassdome.agents.windows_installer",
+    "RockyInstallerAgent": "glassdome.agents.rocky_installer",
+    "KaliInstallerAgent": "glassdome.agents.kali_installer",
+    "ParrotInstallerAgent": "glassdome.agents.parrot_installer",
+    "RHELInstallerAgent": "glassdome.agents.rhel_installer",
+    "OverseerAgent": "glassdome.agents.overseer",
+    "MailcowAgent": "glassdome.agents.mailcow_agent",
+}
+
+if TYPE_CHECKING:
+    from glassdome.agents.base import (
+        BaseAgent,
+        DeploymentAgent,
+        MonitoringAgent,
+        OptimizationAgent,
+        AgentStatus,
+        AgentType
+    )
+    from glassdome.agents.manager import AgentManager
+
+    # Specific agent implementations
+    from glassdome.agents.ubuntu_installer import UbuntuInstallerAgent
+    from glassdome.agents.windows_installer import WindowsInstallerAgent
+    from glassdome.agents.rocky_installer import RockyInstallerAgent
+    from glassdome.agents.kali_installer import KaliInstallerAgent
+    from glassdome.agents.parrot_installer import ParrotInstallerAgent
+    from glassdome.agents.rhel_installer import RHELInstallerAgent
+    from glassdome.agents.overseer import OverseerAgent
+    from glassdome.agents.mailcow_agent import MailcowAgent
 
 __all__ = [
     # Base classes
@@ -46,3 +71,4 @@ __all__ = [
     "MailcowAgent",
 ]
 
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_IMPORTS)
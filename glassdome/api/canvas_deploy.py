@@ -815,6 +815,7 @@ async def deploy_aws_lab(
         # Step 6: Deploy other VMs (vulnerable targets)
         other_nodes = [n for n in vm_nodes if n.elementId not in ['kali', 'parrot', 'guacamole', 'pfsense']]
         
+        vm_configs = []
         for idx, node in enumerate(other_nodes):
             logger.info(f"[AWS] Deploying lab VM: {node.elementId}...")
             
@@ -833,22 +834,24 @@ async def deploy_aws_lab(
                 "subnet_id": infra.subnets.get(SubnetType.DMZ),
                 "security_group_ids": [infra.security_groups.get('lab')],
             }
-            
-            try:
-                result = await aws_client.create_vm(vm_config)
-                if result.get("vm_id"):
-                    deployed_vms.append(DeployedVMInfo(
-                        node_id=node.id,
-                        name=f"{lab_short}-{node.elementId}",
-                        vm_id=result["vm_id"],
-                        ip_address=result.get("ip_address"),
-                        role="target",
-                        status="running"
-                    ))
-                    logger.info(f"[AWS] ✓ Lab VM deployed: {result.get('ip_address')}")
-            except Exception as e:
-                logger.error(f"[AWS] Failed to deploy {node.elementId}: {e}")
-                errors.append(f"{node.elementId}: {str(e)}")
+            vm_configs.append(vm_config)
+        
+        # Identical specs are launched together (one run_instances per spec)
+        results = await aws_client.create_vms(vm_configs) if vm_configs else []
+        for node, result in zip(other_nodes, results):
+            if isinstance(result, Exception):
+                logger.error(f"[AWS] Failed to deploy {node.elementId}: {result}")
+                errors.append(f"{node.elementId}: {str(result)}")
+            elif result.get("vm_id"):
+                deployed_vms.append(DeployedVMInfo(
+                    node_id=node.id,
+                    name=f"{lab_short}-{node.elementId}",
+                    vm_id=result["vm_id"],
+                    ip_address=result.get("ip_address"),
+                    role="target",
+                    status="running"
+                ))
+                logger.info(f"[AWS] ✓ Lab VM deployed: {result.get('ip_address')}")
         
         # Save deployment info to database
         orchestrator = get_network_orchestrator()
@@ -124,6 +124,7 @@ async def chat_info():
         "service": "Overseer Chat",
         "status": "online",
         "active_conversations": len(agent.conversations),
+        "persistent_conversations": agent.store is not None,
         "llm_providers": agent.llm.list_available_providers()
     }
 
@@ -151,7 +152,7 @@ async def get_conversation(conversation_id: str):
     Get conversation details and history
     """
     agent = get_chat_agent()
-    conversation = agent.get_conversation(conversation_id)
+    conversation = await agent.load_conversation(conversation_id)
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
@@ -188,7 +189,7 @@ async def delete_conversation(conversation_id: str):
     """
     agent = get_chat_agent()
     
-    if agent.delete_conversation(conversation_id):
+    if await agent.delete_conversation(conversation_id):
         return {"success": True, "conversation_id": conversation_id}
     else:
         raise HTTPException(status_code=404, detail="Conversation not found")
@@ -205,7 +206,7 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     agent = get_chat_agent()
     
     # Validate conversation exists or will be created
-    conversation = agent.get_conversation(conversation_id)
+    conversation = await agent.load_conversation(conversation_id)
     if not conversation:
         # Create new conversation with the provided ID
         conversation = agent.create_conversation()
@@ -241,7 +242,7 @@ async def confirm_action(
     Confirm or reject a pending action
     """
     agent = get_chat_agent()
-    conversation = agent.get_conversation(conversation_id)
+    conversation = await agent.load_conversation(conversation_id)
     
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
@@ -313,7 +314,9 @@ async def chat_websocket(websocket: WebSocket, conversation_id: str):
     
     Protocol:
     - Client sends: {"type": "message", "content": "user message"}
+    - Client sends: {"type": "message", "content": "...", "stream": true} to stream
     - Server sends: {"type": "chunk", "content": "..."} for streaming
+    - Server sends: {"type": "tool_calls"/"tool_results", ...} between streamed rounds
     - Server sends: {"type": "complete", "response": "full response", ...} when done
     - Server sends: {"type": "action", "action": {...}} for pending actions
     - Client sends: {"type": "confirm", "approved": true/false} for actions
@@ -333,7 +336,7 @@ async def chat_websocket(websocket: WebSocket, conversation_id: str):
         return
     
     # Ensure conversation exists
-    if not agent.get_conversation(conversation_id):
+    if not await agent.load_conversation(conversation_id):
         conversation = agent.create_conversation()
         agent.conversations.pop(conversation.conversation_id)
         conversation.conversation_id = conversation_id
@@ -360,8 +363,8 @@ async def chat_websocket(websocket: WebSocket, conversation_id: str):
             if msg_type == "message":
                 content = data.get("content", "")
                 context = data.get("context", "")  # Page-specific help context
-                # Default to NON-streaming to support tool calls
-                # Streaming mode doesn't support tools properly
+                # Streaming sends text as the LLM generates it; tool calls
+                # run between streamed rounds
                 stream = data.get("stream", False)
                 
                 # Prepend context if provided
@@ -377,15 +380,13 @@ async def chat_websocket(websocket: WebSocket, conversation_id: str):
                         "timestamp": datetime.now(timezone.utc).isoformat()
                     })
                     
-                    full_response = ""
+                    streamed = 0
                     try:
-                        async for chunk in agent.stream_response(conversation_id, content):
-                            full_response += chunk
-                            await websocket.send_json({
-                                "type": "chunk",
-                                "content": chunk
-                            })
-                        logger.info(f"[WS:{conversation_id}] Stream complete, {len(full_response)} chars")
+                        async for event in agent.stream_message(conversation_id, content):
+                            if event["type"] == "chunk":
+                                streamed += len(event["content"])
+                            await websocket.send_json(event)
+                        logger.info(f"[WS:{conversation_id}] Stream complete, {streamed} chars")
                     except Exception as e:
                         logger.error(f"[WS:{conversation_id}] Streaming error: {e}")
                         logger.error(traceback.format_exc())
@@ -395,11 +396,6 @@ async def chat_websocket(websocket: WebSocket, conversation_id: str):
                             "details": traceback.format_exc()
                         })
                         continue
-                    
-                    await websocket.send_json({
-                        "type": "complete",
-                        "response": full_response
-                    })
                 else:
                     # Non-streaming response
                     try:
@@ -421,22 +417,22 @@ async def chat_websocket(websocket: WebSocket, conversation_id: str):
                             "details": traceback.format_exc()
                         })
                         continue
-                    
-                    # Check for pending action
-                    conversation = agent.get_conversation(conversation_id)
-                    if conversation and conversation.pending_action:
-                        action = conversation.pending_action
-                        logger.info(f"[WS:{conversation_id}] Pending action: {action.action_type}")
-                        await websocket.send_json({
-                            "type": "action",
-                            "action": {
-                                "action_id": action.action_id,
-                                "action_type": action.action_type,
-                                "summary": action.summary,
-                                "details": action.details,
-                                "warnings": action.warnings
-                            }
-                        })
+                
+                # Check for pending action
+                conversation = agent.get_conversation(conversation_id)
+                if conversation and conversation.pending_action:
+                    action = conversation.pending_action
+                    logger.info(f"[WS:{conversation_id}] Pending action: {action.action_type}")
+                    await websocket.send_json({
+                        "type": "action",
+                        "action": {
+                            "action_id": action.action_id,
+                            "action_type": action.action_type,
+                            "summary": action.summary,
+                            "details": action.details,
+                            "warnings": action.warnings
+                        }
+                    })
             
             elif msg_type == "confirm":
                 # Handle action confirmation
@@ -11,8 +11,11 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 
 import asyncio
 import logging
+import re
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
@@ -41,9 +44,9 @@ NETWORK_PROBES = {
     },
 }
 
-# State tracking for uptime/downtime history
-_probe_history: Dict[str, List[Dict]] = {}
-_last_check: Dict[str, Dict] = {}
+# Sweep cadence (seconds) and history kept per probe
+PROBE_INTERVAL = 15
+HISTORY_SIZE = 100
 
 
 # ============================================================================
@@ -54,13 +57,15 @@ class ProbeStatus(BaseModel):
     probe_id: str
     name: str
     host: str
-    status: str  # "up", "down", "error"
+    status: str  # "up", "down", "error", "pending"
     reachable: bool
     latency_ms: Optional[float] = None
     last_check: str
     description: Optional[str] = None
     critical: bool = False
     via_gateway: Optional[str] = None
+    age_seconds: Optional[float] = None  # Since last_check
+    stale: bool = False  # No result for several sweep intervals
 
 
 class ProbeResult(BaseModel):
@@ -77,7 +82,7 @@ class ProbeHistoryEntry(BaseModel):
 
 
 # ============================================================================
-# Helper Functions
+# Probing
 # ============================================================================
 
 async def ping_host(host: str, count: int = 2, timeout: int = 3) -> tuple[bool, Optional[float]]:
@@ -90,13 +95,17 @@ async def ping_host(host: str, count: int = 2, timeout: int = 3) -> tuple[bool,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout + 5)
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout + 5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
         
         if proc.returncode == 0:
             # Parse latency from ping output
             output = stdout.decode()
             # Look for "time=XX.X ms" pattern
-            import re
             match = re.search(r'time[=<](\d+\.?\d*)\s*ms', output)
             latency = float(match.group(1)) if match else None
             return True, latency
@@ -110,22 +119,140 @@ async def ping_host(host: str, count: int = 2, timeout: int = 3) -> tuple[bool,
         return False, None
 
 
-def record_history(probe_id: str, status: str, latency: Optional[float]):
-    """Record probe result in history (keep last 100 entries)"""
-    if probe_id not in _probe_history:
-        _probe_history[probe_id] = []
+class NetworkProber:
+    """
+    Background prober for NETWORK_PROBES
     
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "status": status,
-        "latency_ms": latency
-    }
+    Every `interval` seconds all probes are pinged concurrently (a sweep
+    takes as long as the slowest probe, not the sum). The API serves the
+    latest results, so dashboard polls never wait on an unreachable host.
+    History is kept in fixed-size ring buffers.
+    """
+    
+    def __init__(self, interval: int = PROBE_INTERVAL, history_size: int = HISTORY_SIZE):
+        self.interval = interval
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._latest: Dict[str, ProbeStatus] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {
+            probe_id: deque(maxlen=history_size) for probe_id in NETWORK_PROBES
+        }
+        self.last_sweep: Optional[datetime] = None
+    
+    async def start(self):
+        """Start the sweep loop"""
+        if self._running:
+            logger.warning("Network prober already running")
+            return
+        
+        self._running = True
+        self._task = asyncio.create_task(self._probe_loop())
+        logger.info(f"Network prober started (interval: {self.interval}s)")
+    
+    async def stop(self):
+        """Stop the sweep loop"""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Network prober stopped")
+    
+    async def _probe_loop(self):
+        while self._running:
+            started = time.monotonic()
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Network probe sweep failed: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+    
+    async def check(self, probe_id: str) -> ProbeStatus:
+        """Ping one probe now and record the result"""
+        config = NETWORK_PROBES[probe_id]
+        reachable, latency = await ping_host(config["host"])
+        status = "up" if reachable else "down"
+        now = datetime.now()
+        
+        self._history.setdefault(probe_id, deque(maxlen=HISTORY_SIZE)).append({
+            "timestamp": now.isoformat(),
+            "status": status,
+            "latency_ms": latency
+        })
+        
+        probe_status = ProbeStatus(
+            probe_id=probe_id,
+            name=config["name"],
+            host=config["host"],
+            status=status,
+            reachable=reachable,
+            latency_ms=latency,
+            last_check=now.isoformat(),
+            description=config.get("description"),
+            critical=config.get("critical", False),
+            via_gateway=config.get("via_gateway")
+        )
+        self._latest[probe_id] = probe_status
+        self._checked_at[probe_id] = time.monotonic()
+        return probe_status
+    
+    async def sweep(self):
+        """Ping every probe concurrently (concurrent callers share one sweep)"""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep())
+        await asyncio.shield(self._sweep_task)
     
-    _probe_history[probe_id].append(entry)
+    async def _sweep(self):
+        await asyncio.gather(*(self.check(probe_id) for probe_id in NETWORK_PROBES))
+        self.last_sweep = datetime.now()
     
-    # Keep only last 100 entries
-    if len(_probe_history[probe_id]) > 100:
-        _probe_history[probe_id] = _probe_history[probe_id][-100:]
+    def status(self, probe_id: str) -> ProbeStatus:
+        """Latest result for a probe, with its age"""
+        config = NETWORK_PROBES[probe_id]
+        latest = self._latest.get(probe_id)
+        if latest is None:
+            return ProbeStatus(
+                probe_id=probe_id,
+                name=config["name"],
+                host=config["host"],
+                status="pending",
+                reachable=False,
+                last_check="",
+                description=config.get("description"),
+                critical=config.get("critical", False),
+                via_gateway=config.get("via_gateway"),
+                stale=True
+            )
+        
+        age = time.monotonic() - self._checked_at[probe_id]
+        return latest.model_copy(update={
+            "age_seconds": round(age, 1),
+            "stale": age > self.interval * 3
+        })
+    
+    async def snapshot(self) -> Dict[str, ProbeStatus]:
+        """Latest status of every probe (sweeps once if nothing is known yet)"""
+        if not self._latest:
+            await self.sweep()
+        return {probe_id: self.status(probe_id) for probe_id in NETWORK_PROBES}
+    
+    def history(self, probe_id: str) -> List[Dict[str, Any]]:
+        return list(self._history.get(probe_id, ()))
+
+
+_prober: Optional[NetworkProber] = None
+
+
+def get_network_prober(interval: int = PROBE_INTERVAL) -> NetworkProber:
+    """Get or create the network prober singleton"""
+    global _prober
+    if _prober is None:
+        _prober = NetworkProber(interval=interval)
+    return _prober
 
 
 # ============================================================================
@@ -152,73 +279,37 @@ async def list_probes():
 @router.get("/status", response_model=ProbeResult)
 async def get_all_probe_status():
     """
-    Check all network probes and return current status.
+    Latest status of all network probes.
     
-    This is the main endpoint for dashboard integration.
+    This is the main endpoint for dashboard integration. Results come from
+    the background prober (see age_seconds / stale per probe); nothing is
+    pinged on the request path once the first sweep has completed.
     """
-    results = {}
-    critical_down = []
-    
-    for probe_id, config in NETWORK_PROBES.items():
-        host = config["host"]
-        reachable, latency = await ping_host(host)
-        status = "up" if reachable else "down"
-        
-        # Record in history
-        record_history(probe_id, status, latency)
-        
-        # Track critical failures
-        if not reachable and config.get("critical", False):
-            critical_down.append(probe_id)
-        
-        probe_status = ProbeStatus(
-            probe_id=probe_id,
-            name=config["name"],
-            host=host,
-            status=status,
-            reachable=reachable,
-            latency_ms=latency,
-            last_check=datetime.now().isoformat(),
-            description=config.get("description"),
-            critical=config.get("critical", False),
-            via_gateway=config.get("via_gateway")
-        )
-        
-        results[probe_id] = probe_status
-        _last_check[probe_id] = probe_status.dict()
+    probes = await get_network_prober().snapshot()
+    critical_down = [
+        probe_id for probe_id, probe in probes.items()
+        if probe.critical and probe.status == "down"
+    ]
     
     return ProbeResult(
         timestamp=datetime.now().isoformat(),
-        probes=results,
+        probes=probes,
         all_healthy=len(critical_down) == 0,
         critical_down=critical_down
     )
 
 
 @router.get("/status/{probe_id}")
-async def get_probe_status(probe_id: str):
-    """Check a single probe"""
+async def get_probe_status(probe_id: str, live: bool = False):
+    """Status of a single probe (live=true pings it now)"""
     if probe_id not in NETWORK_PROBES:
         raise HTTPException(status_code=404, detail=f"Probe '{probe_id}' not found")
     
-    config = NETWORK_PROBES[probe_id]
-    reachable, latency = await ping_host(config["host"])
-    status = "up" if reachable else "down"
-    
-    record_history(probe_id, status, latency)
-    
-    return ProbeStatus(
-        probe_id=probe_id,
-        name=config["name"],
-        host=config["host"],
-        status=status,
-        reachable=reachable,
-        latency_ms=latency,
-        last_check=datetime.now().isoformat(),
-        description=config.get("description"),
-        critical=config.get("critical", False),
-        via_gateway=config.get("via_gateway")
-    )
+    prober = get_network_prober()
+    if live:
+        return await prober.check(probe_id)
+    await prober.snapshot()
+    return prober.status(probe_id)
 
 
 @router.get("/history/{probe_id}")
@@ -227,7 +318,7 @@ async def get_probe_history(probe_id: str, limit: int = 50):
     if probe_id not in NETWORK_PROBES:
         raise HTTPException(status_code=404, detail=f"Probe '{probe_id}' not found")
     
-    history = _probe_history.get(probe_id, [])
+    history = get_network_prober().history(probe_id)
     
     return {
         "probe_id": probe_id,
@@ -245,8 +336,10 @@ async def mxwest_quick_status():
     Returns simple status for easy monitoring.
     Designed for mobile/quick checks.
     """
-    gateway_up, gateway_latency = await ping_host("192.168.3.99")
-    mxwest_up, mxwest_latency = await ping_host("10.30.0.1")
+    probes = await get_network_prober().snapshot()
+    gateway, mxwest = probes["mxwest-gateway"], probes["mxwest"]
+    gateway_up, gateway_latency = gateway.reachable, gateway.latency_ms
+    mxwest_up, mxwest_latency = mxwest.reachable, mxwest.latency_ms
     
     # Determine overall status
     if gateway_up and mxwest_up:
@@ -269,13 +362,16 @@ async def mxwest_quick_status():
         "gateway": {
             "host": "192.168.3.99",
             "reachable": gateway_up,
-            "latency_ms": gateway_latency
+            "latency_ms": gateway_latency,
+            "last_check": gateway.last_check
         },
         "mxwest": {
             "host": "10.30.0.1",
             "reachable": mxwest_up,
-            "latency_ms": mxwest_latency
+            "latency_ms": mxwest_latency,
+            "last_check": mxwest.last_check
         },
+        "stale": gateway.stale or mxwest.stale,
         "timestamp": datetime.now().isoformat()
     }
 
@@ -439,7 +535,8 @@ async def restart_mxwest_wireguard():
         if result.returncode == 0:
             # Verify link is back
             await asyncio.sleep(3)
-            mxwest_up, latency = await ping_host("10.30.0.1")
+            mxwest = await get_network_prober().check("mxwest")
+            mxwest_up, latency = mxwest.reachable, mxwest.latency_ms
             
             return {
                 "success": True,
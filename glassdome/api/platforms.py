@@ -8,10 +8,12 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
+import asyncio
 import logging
 
 from glassdome.core.config import settings
 from glassdome.core.session import get_session
+from glassdome.platforms.inventory import get_platform_inventory
 from glassdome.platforms.proxmox_factory import get_proxmox_client, list_available_proxmox_instances
 
 logger = logging.getLogger(__name__)
@@ -200,11 +202,26 @@ async def get_proxmox_vms(instance_id: str):
 
 
 @router.get("/proxmox/all-instances")
-async def get_all_proxmox_status():
-    """Get status from all configured Proxmox instances (pve01, pve02, etc.)"""
+async def get_all_proxmox_status(refresh: bool = False):
+    """
+    Get status from all configured Proxmox instances (pve01, pve02, etc.)
+    
+    Instances are queried concurrently, each with its own timeout; an
+    unreachable instance is reported in summary.instances without holding
+    up the others. Results are cached for a few seconds (refresh=true
+    bypasses the cache).
+    """
     try:
         instances = list_available_proxmox_instances()
-        logger.info(f"Checking Proxmox instances: {instances}")
+        configs = {}
+        for instance_id in instances:
+            config = settings.get_proxmox_config(instance_id)
+            if not config.get("host"):
+                logger.warning(f"Proxmox instance {instance_id} has no host configured, skipping")
+                continue
+            configs[instance_id] = config
+        
+        results = await get_platform_inventory().proxmox(list(configs), refresh=refresh)
         
         all_vms = []
         all_nodes = []
@@ -212,78 +229,49 @@ async def get_all_proxmox_status():
         connected_count = 0
         instance_details = []
         
-        for instance_id in instances:
-            try:
-                config = settings.get_proxmox_config(instance_id)
-                if not config.get("host"):
-                    logger.warning(f"Proxmox instance {instance_id} has no host configured, skipping")
-                    continue
-                    
-                client = get_proxmox_client(instance_id)
-                connected = await client.test_connection()
-                
-                if not connected:
-                    logger.warning(f"Proxmox instance {instance_id} not reachable")
-                    instance_details.append({
-                        "instance_id": instance_id,
-                        "host": config.get("host"),
-                        "connected": False,
-                        "node": config.get("node", "pve"),
-                        "vms": 0
-                    })
-                    continue
-                
-                connected_count += 1
-                nodes = await client.list_nodes()
-                
-                for node_info in nodes:
-                    node_name = node_info.get("node", config.get("node", "pve"))
-                    # Add instance info to node
-                    node_info["instance_id"] = instance_id
-                    node_info["host"] = config.get("host")
-                    all_nodes.append(node_info)
-                    
-                    vms = await client.list_vms(node_name)
-                    
-                    for vm in vms:
-                        vm_info = VMInfo(
-                            vmid=vm.get("vmid", 0),
-                            name=vm.get("name", f"VM-{vm.get('vmid')}"),
-                            status=vm.get("status", "unknown"),
-                            cpu=vm.get("cpu", 0),
-                            memory=vm.get("maxmem", 0),
-                            memory_used=vm.get("mem", 0),
-                            disk=vm.get("maxdisk", 0),
-                            uptime=vm.get("uptime", 0),
-                            node=f"{node_name} ({instance_id})",  # Show which cluster
-                            template=vm.get("template", False)
-                        )
-                        all_vms.append(vm_info)
-                        
-                        summary["total"] += 1
-                        if vm_info.template:
-                            summary["templates"] += 1
-                        elif vm_info.status == "running":
-                            summary["running"] += 1
-                        else:
-                            summary["stopped"] += 1
+        for instance_id, config in configs.items():
+            result = results[instance_id]
+            detail = {
+                "instance_id": instance_id,
+                "host": config.get("host"),
+                "connected": result.ok,
+                "node": config.get("node", "pve"),
+                "elapsed_ms": result.elapsed_ms,
+            }
+            if not result.ok:
+                logger.warning(f"Proxmox instance {instance_id} not reachable: {result.error}")
+                instance_details.append({**detail, "vms": 0, "error": result.error})
+                continue
+            
+            connected_count += 1
+            for node_info in result.data["nodes"]:
+                all_nodes.append({**node_info, "instance_id": instance_id, "host": config.get("host")})
+            
+            for vm in result.data["vms"]:
+                node_name = vm.get("node", config.get("node", "pve"))
+                vm_info = VMInfo(
+                    vmid=vm.get("vmid", 0),
+                    name=vm.get("name", f"VM-{vm.get('vmid')}"),
+                    status=vm.get("status", "unknown"),
+                    cpu=vm.get("cpu", 0),
+                    memory=vm.get("maxmem", 0),
+                    memory_used=vm.get("mem", 0),
+                    disk=vm.get("maxdisk", 0),
+                    uptime=vm.get("uptime", 0),
+                    node=f"{node_name} ({instance_id})",  # Show which cluster
+                    template=bool(vm.get("template", False))
+                )
+                all_vms.append(vm_info)
                 
-                instance_details.append({
-                    "instance_id": instance_id,
-                    "host": config.get("host"),
-                    "connected": True,
-                    "node": config.get("node", "pve"),
-                    "vms": len([v for v in all_vms if f"({instance_id})" in v.node])
-                })
-                    
-            except Exception as e:
-                logger.error(f"Failed to get status from Proxmox instance {instance_id}: {e}")
-                instance_details.append({
-                    "instance_id": instance_id,
-                    "host": config.get("host") if 'config' in dir() else "unknown",
-                    "connected": False,
-                    "error": str(e)
-                })
+                summary["total"] += 1
+                if vm_info.template:
+                    summary["templates"] += 1
+                elif vm_info.status == "running":
+                    summary["running"] += 1
+                else:
+                    summary["stopped"] += 1
+            
+            instance_details.append({**detail, "vms": len(result.data["vms"])})
         
         return PlatformStatusResponse(
             platform="proxmox",
@@ -315,6 +303,7 @@ async def start_proxmox_vm(instance_id: str, vmid: int):
         node = config.get("node", "pve")
         
         result = await client.start_vm(node, vmid)
+        get_platform_inventory().invalidate("proxmox")
         return {"success": True, "vmid": vmid, "result": result}
     except Exception as e:
         logger.error(f"Failed to start VM {vmid}: {e}")
@@ -330,6 +319,7 @@ async def stop_proxmox_vm(instance_id: str, vmid: int):
         node = config.get("node", "pve")
         
         result = await client.stop_vm(node, vmid)
+        get_platform_inventory().invalidate("proxmox")
         return {"success": True, "vmid": vmid, "result": result}
     except Exception as e:
         logger.error(f"Failed to stop VM {vmid}: {e}")
@@ -504,8 +494,14 @@ async def get_aws_status(region: str = None):
 
 
 @router.get("/aws/all-regions", response_model=PlatformStatusResponse)
-async def get_aws_all_regions_status():
-    """Get AWS status across multiple regions (us-east-1, us-west-2)"""
+async def get_aws_all_regions_status(refresh: bool = False):
+    """
+    Get AWS status across multiple regions (us-east-1, us-west-2)
+    
+    Regions are queried concurrently (all pages of describe_instances);
+    a failing region is listed in summary.regions and the others are still
+    returned. Results are cached for a few seconds.
+    """
     # Get credentials from Vault
     from glassdome.core.secrets_backend import get_secret
     aws_access_key = get_secret('aws_access_key_id')
@@ -519,60 +515,58 @@ async def get_aws_all_regions_status():
         )
     
     try:
-        import boto3
+        import boto3  # noqa: F401
+        
+        results = await get_platform_inventory().aws(aws_access_key, aws_secret_key, refresh=refresh)
         
-        regions = ['us-east-1', 'us-west-2']  # Virginia and Oregon
         all_vms = []
         summary = {"total": 0, "running": 0, "stopped": 0, "templates": 0}
-        
-        for region in regions:
-            try:
-                ec2 = boto3.client(
-                    'ec2',
-                    aws_access_key_id=aws_access_key,
-                    aws_secret_access_key=aws_secret_key,
-                    region_name=region
-                )
+        region_details = []
+        
+        for region, result in results.items():
+            region_details.append({
+                "region": region,
+                "connected": result.ok,
+                "instances": len(result.data) if result.ok else 0,
+                "elapsed_ms": result.elapsed_ms,
+                **({"error": result.error} if not result.ok else {})
+            })
+            if not result.ok:
+                logger.warning(f"Failed to get instances from {region}: {result.error}")
+                continue
+            
+            for instance in result.data:
+                name = "Unnamed"
+                for tag in instance.get('Tags', []):
+                    if tag['Key'] == 'Name':
+                        name = tag['Value']
+                        break
+                
+                state = instance.get('State', {}).get('Name', 'unknown')
                 
-                response = ec2.describe_instances()
+                vm_info = VMInfo(
+                    vmid=hash(instance['InstanceId']) % 10000,
+                    name=f"{name} ({region})",
+                    status=state,
+                    cpu=0,
+                    memory=0,
+                    template=False,
+                    node=region
+                )
+                all_vms.append(vm_info)
                 
-                for reservation in response.get('Reservations', []):
-                    for instance in reservation.get('Instances', []):
-                        name = "Unnamed"
-                        for tag in instance.get('Tags', []):
-                            if tag['Key'] == 'Name':
-                                name = tag['Value']
-                                break
-                        
-                        state = instance.get('State', {}).get('Name', 'unknown')
-                        instance_type = instance.get('InstanceType', '')
-                        
-                        vm_info = VMInfo(
-                            vmid=hash(instance['InstanceId']) % 10000,
-                            name=f"{name} ({region})",
-                            status=state,
-                            cpu=0,
-                            memory=0,
-                            template=False,
-                            node=region
-                        )
-                        all_vms.append(vm_info)
-                        
-                        summary["total"] += 1
-                        if state == "running":
-                            summary["running"] += 1
-                        else:
-                            summary["stopped"] += 1
-                            
-            except Exception as e:
-                logger.warning(f"Failed to get instances from {region}: {e}")
+                summary["total"] += 1
+                if state == "running":
+                    summary["running"] += 1
+                else:
+                    summary["stopped"] += 1
         
         return PlatformStatusResponse(
             platform="aws",
             connected=True,
-            message=f"Connected to AWS ({summary['total']} instances across {len(regions)} regions)",
+            message=f"Connected to AWS ({summary['total']} instances across {len(results)} regions)",
             vms=all_vms,
-            summary=summary
+            summary={**summary, "regions": region_details}
         )
         
     except ImportError:
@@ -595,8 +589,13 @@ async def get_aws_all_regions_status():
 # ============================================================================
 
 @router.get("/azure", response_model=PlatformStatusResponse)
-async def get_azure_status():
-    """Get Azure platform status and list VMs"""
+async def get_azure_status(refresh: bool = False):
+    """
+    Get Azure platform status and list VMs
+    
+    azure_subscription_id may list several subscriptions (comma-separated);
+    they are queried concurrently. Results are cached for a few seconds.
+    """
     if not settings.azure_subscription_id:
         return PlatformStatusResponse(
             platform="azure",
@@ -605,64 +604,69 @@ async def get_azure_status():
         )
     
     try:
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
+        from azure.identity import ClientSecretCredential  # noqa: F401
+        from azure.mgmt.compute import ComputeManagementClient  # noqa: F401
         
         from glassdome.core.secrets_backend import get_secret
-        credential = ClientSecretCredential(
+        subscriptions = [s.strip() for s in settings.azure_subscription_id.split(",") if s.strip()]
+        results = await get_platform_inventory().azure(
+            subscriptions,
             tenant_id=settings.azure_tenant_id,
             client_id=settings.azure_client_id,
-            client_secret=get_secret('azure_client_secret')
-        )
-        
-        compute_client = ComputeManagementClient(
-            credential,
-            settings.azure_subscription_id
+            client_secret=get_secret('azure_client_secret'),
+            refresh=refresh
         )
         
-        # Get all VMs
-        vms_raw = compute_client.virtual_machines.list_all()
-        
         vms = []
         summary = {"total": 0, "running": 0, "stopped": 0, "templates": 0}
-        
-        for vm in vms_raw:
-            # Get instance view for power state
-            try:
-                resource_group = vm.id.split('/')[4]
-                instance_view = compute_client.virtual_machines.instance_view(
-                    resource_group, vm.name
-                )
-                power_state = "unknown"
-                for status in instance_view.statuses:
-                    if status.code.startswith("PowerState/"):
-                        power_state = status.code.split("/")[1]
-                        break
-            except:
-                power_state = "unknown"
+        subscription_details = []
+        
+        for subscription_id, result in results.items():
+            subscription_details.append({
+                "subscription_id": subscription_id,
+                "connected": result.ok,
+                "vms": len(result.data) if result.ok else 0,
+                "elapsed_ms": result.elapsed_ms,
+                **({"error": result.error} if not result.ok else {})
+            })
+            if not result.ok:
+                logger.warning(f"Failed to list Azure VMs in {subscription_id}: {result.error}")
+                continue
             
-            vm_info = VMInfo(
-                vmid=hash(vm.vm_id) % 10000 if vm.vm_id else 0,
-                name=vm.name,
-                status=power_state,
-                cpu=0,
-                memory=0,
-                template=False
+            for vm in result.data:
+                power_state = vm["power_state"]
+                vm_info = VMInfo(
+                    vmid=hash(vm["vm_id"]) % 10000 if vm["vm_id"] else 0,
+                    name=vm["name"],
+                    status=power_state,
+                    cpu=0,
+                    memory=0,
+                    template=False,
+                    node=vm["location"]
+                )
+                vms.append(vm_info)
+                
+                summary["total"] += 1
+                if power_state == "running":
+                    summary["running"] += 1
+                else:
+                    summary["stopped"] += 1
+        
+        connected = any(result.ok for result in results.values())
+        if not connected:
+            return PlatformStatusResponse(
+                platform="azure",
+                connected=False,
+                message=f"Error: {subscription_details[0]['error']}",
+                summary={**summary, "subscriptions": subscription_details}
             )
-            vms.append(vm_info)
-            
-            summary["total"] += 1
-            if power_state == "running":
-                summary["running"] += 1
-            else:
-                summary["stopped"] += 1
         
         return PlatformStatusResponse(
             platform="azure",
             connected=True,
             message=f"Connected to Azure ({summary['total']} VMs)",
             vms=vms,
-            summary=summary
+            summary={**summary, "subscriptions": subscription_details}
         )
         
     except ImportError:
@@ -679,3 +683,19 @@ async def get_azure_status():
             message=f"Error: {str(e)}"
         )
 
+
+@router.get("/inventory")
+async def get_platform_inventory_status(refresh: bool = False):
+    """
+    Status of every platform in one call
+    
+    Proxmox instances, AWS regions and Azure subscriptions are all queried
+    at the same time, so the response takes as long as the slowest source
+    rather than the sum of all of them.
+    """
+    proxmox, aws, azure = await asyncio.gather(
+        get_all_proxmox_status(refresh=refresh),
+        get_aws_all_regions_status(refresh=refresh),
+        get_azure_status(refresh=refresh)
+    )
+    return {"platforms": {"proxmox": proxmox, "aws": aws, "azure": azure}}
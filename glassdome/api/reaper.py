@@ -24,7 +24,9 @@ from glassdome.reaper.exploit_library import (
     Exploit, ExploitMission, ExploitType, ExploitSeverity, ExploitOS,
     seed_default_exploits
 )
-from sqlalchemy import select, update, delete
+from glassdome.reaper.mission_log_sink import get_mission_log_sink
+from sqlalchemy import select, update, delete, func, literal, union_all, or_, and_
+from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 import os
 from pathlib import Path
@@ -658,6 +660,20 @@ async def execute_mission(mission_id: str):
     logger.info(f"[MISSION START] {mission_id}")
     logger.info("=" * 60)
     
+    # Persisted MissionLog entries are buffered and written in batches
+    sink = get_mission_log_sink()
+    mission = None
+    
+    def mission_log(level: int, message: str):
+        logger.log(level, f"[MISSION] {mission_id} - {message}")
+        if level < logging.INFO:
+            return  # DEBUG detail (e.g. the requested VM config) is not persisted
+        sink.log(
+            mission_id, message,
+            level=logging.getLevelName(level),
+            step=mission.status if mission else None,
+        )
+    
     async with async_session_factory() as session:
         try:
             result = await session.execute(
@@ -669,9 +685,9 @@ async def execute_mission(mission_id: str):
                 logger.error(f"[MISSION ERROR] {mission_id} - Mission not found in database")
                 return
             
-            logger.info(f"[MISSION] {mission_id} - Name: {mission.name}")
-            logger.info(f"[MISSION] {mission_id} - Platform: {mission.platform}")
-            logger.info(f"[MISSION] {mission_id} - Exploits: {mission.exploit_ids}")
+            mission_log(logging.INFO, f"Name: {mission.name}")
+            mission_log(logging.INFO, f"Platform: {mission.platform}")
+            mission_log(logging.INFO, f"Exploits: {mission.exploit_ids}")
             
             # Get exploits
             exploit_result = await session.execute(
@@ -685,17 +701,17 @@ async def execute_mission(mission_id: str):
             await session.commit()
             
             # Step 1: Get or create target VM
-            logger.info(f"[MISSION] {mission_id} - Step 1: Acquiring target VM")
+            mission_log(logging.INFO, "Step 1: Acquiring target VM")
             vm_ip = None
             acquired_spare = None
             
             if mission.target_vm_id:
                 # Use existing VM - need to get its IP
-                logger.info(f"[MISSION] {mission_id} - Using existing VM: {mission.target_vm_id}")
+                mission_log(logging.INFO, f"Using existing VM: {mission.target_vm_id}")
                 mission.current_step = f"Using existing VM: {mission.target_vm_id}"
                 # TODO: Get IP from platform
                 vm_ip = mission.vm_ip_address  # Assume already set
-                logger.info(f"[MISSION] {mission_id} - VM IP: {vm_ip}")
+                mission_log(logging.INFO, f"VM IP: {vm_ip}")
             elif mission.target_vm_config:
                 # Try to get a hot spare first (instant!)
                 vm_config = mission.target_vm_config
@@ -703,7 +719,7 @@ async def execute_mission(mission_id: str):
                 use_hot_spare = vm_config.get("use_hot_spare", True)  # Default to using spares
                 
                 if use_hot_spare:
-                    logger.info(f"[MISSION] {mission_id} - Checking for available hot spare ({os_type})")
+                    mission_log(logging.INFO, f"Checking for available hot spare ({os_type})")
                     mission.current_step = "Checking hot spare pool..."
                     await session.commit()
                     
@@ -716,7 +732,7 @@ async def execute_mission(mission_id: str):
                         vm_ip = acquired_spare.ip_address
                         mission.vm_ip_address = vm_ip
                         mission.progress = 30
-                        logger.info(f"[MISSION] {mission_id} - ⚡ Hot spare acquired: {acquired_spare.name} (VMID {acquired_spare.vmid}, IP {vm_ip})")
+                        mission_log(logging.INFO, f"⚡ Hot spare acquired: {acquired_spare.name} (VMID {acquired_spare.vmid}, IP {vm_ip})")
                         
                         # Rename the spare VM to reflect the mission
                         # mission_id is like "mission-a5d86d20", extract just the hash part
@@ -744,16 +760,16 @@ async def execute_mission(mission_id: str):
                             # Update spare record with new name
                             acquired_spare.name = new_vm_name
                             await session.commit()
-                            logger.info(f"[MISSION] {mission_id} - Renamed VM to {new_vm_name}")
+                            mission_log(logging.INFO, f"Renamed VM to {new_vm_name}")
                         except Exception as e:
-                            logger.warning(f"[MISSION] {mission_id} - Could not rename VM: {e}")
+                            mission_log(logging.WARNING, f"Could not rename VM: {e}")
                     else:
-                        logger.info(f"[MISSION] {mission_id} - No hot spares available, falling back to clone")
+                        mission_log(logging.INFO, "No hot spares available, falling back to clone")
                 
                 if not vm_ip:
                     # No spare available or hot spare disabled - deploy new VM (slow path)
-                    logger.info(f"[MISSION] {mission_id} - Deploying new VM on {mission.platform}")
-                    logger.debug(f"[MISSION] {mission_id} - VM Config: {vm_config}")
+                    mission_log(logging.INFO, f"Deploying new VM on {mission.platform}")
+                    mission_log(logging.DEBUG, f"VM Config: {vm_config}")
                     mission.current_step = "Deploying new VM (this may take a few minutes)..."
                     await session.commit()
                     
@@ -767,13 +783,13 @@ async def execute_mission(mission_id: str):
                         vm_ip = vm_result.get("ip_address")
                         mission.vm_ip_address = vm_ip
                         mission.progress = 30
-                        logger.info(f"[MISSION] {mission_id} - VM deployed: ID={mission.vm_created_id}, IP={vm_ip}")
+                        mission_log(logging.INFO, f"VM deployed: ID={mission.vm_created_id}, IP={vm_ip}")
                     else:
                         error_msg = vm_result.get('error', 'Unknown error')
-                        logger.error(f"[MISSION] {mission_id} - VM deployment failed: {error_msg}")
+                        mission_log(logging.ERROR, f"VM deployment failed: {error_msg}")
                         raise Exception(f"VM deployment failed: {error_msg}")
             else:
-                logger.error(f"[MISSION] {mission_id} - No target VM specified")
+                mission_log(logging.ERROR, "No target VM specified")
                 raise Exception("No target VM specified")
             
             if not vm_ip:
@@ -784,13 +800,13 @@ async def execute_mission(mission_id: str):
             await session.commit()
             
             # Step 2: Inject exploits
-            logger.info(f"[MISSION] {mission_id} - Step 2: Injecting {len(exploits)} exploits")
+            mission_log(logging.INFO, f"Step 2: Injecting {len(exploits)} exploits")
             results = {}
             progress_per_exploit = 40 / len(exploits)  # 40-80% for injection
             
             for i, exploit in enumerate(exploits):
-                logger.info(f"[MISSION] {mission_id} - [{i+1}/{len(exploits)}] Injecting: {exploit.display_name}")
-                logger.debug(f"[MISSION] {mission_id} - Exploit details: type={exploit.exploit_type}, severity={exploit.severity}")
+                mission_log(logging.INFO, f"[{i+1}/{len(exploits)}] Injecting: {exploit.display_name}")
+                mission_log(logging.DEBUG, f"Exploit details: type={exploit.exploit_type}, severity={exploit.severity}")
                 mission.current_step = f"Injecting: {exploit.display_name}"
                 await session.commit()
                 
@@ -798,9 +814,9 @@ async def execute_mission(mission_id: str):
                 results[str(exploit.id)] = inject_result
                 
                 if inject_result.get("status") == "success":
-                    logger.info(f"[MISSION] {mission_id} - ✓ {exploit.display_name} injected successfully")
+                    mission_log(logging.INFO, f"✓ {exploit.display_name} injected successfully")
                 else:
-                    logger.warning(f"[MISSION] {mission_id} - ✗ {exploit.display_name} injection failed: {inject_result.get('output', 'Unknown error')}")
+                    mission_log(logging.WARNING, f"✗ {exploit.display_name} injection failed: {inject_result.get('output', 'Unknown error')}")
                 
                 mission.progress = int(40 + ((i + 1) * progress_per_exploit))
                 await session.commit()
@@ -835,6 +851,7 @@ async def execute_mission(mission_id: str):
             logger.info(f"  Exploits: {successful} success, {failed} failed")
             logger.info(f"  Results: {results}")
             logger.info("=" * 60)
+            mission_log(logging.INFO, f"Mission complete: {successful} success, {failed} failed")
             
         except Exception as e:
             logger.error("=" * 60)
@@ -847,6 +864,11 @@ async def execute_mission(mission_id: str):
             mission.error_message = str(e)
             mission.current_step = f"Failed: {str(e)}"
             await session.commit()
+            mission_log(logging.ERROR, f"Mission failed: {e}")
+        
+        finally:
+            # Write this mission's buffered log entries before returning
+            await sink.flush(mission_id)
 
 
 async def deploy_mission_vm(platform: str, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -1075,7 +1097,7 @@ async def verify_with_whiteknight(vm_ip: str, exploit: Exploit) -> Dict[str, Any
     WhiteKnight runs automated attack tools (nmap, sshpass, sqlmap, etc.)
     to validate that vulnerabilities are actually exploitable.
     """
-    from glassdome.whiteknight import WhiteKnightClient, ValidationResult
+    from glassdome.whiteknight import get_whiteknight_client
     
     logger.info(f"🛡️ WhiteKnight validating: {exploit.name} on {vm_ip}")
     
@@ -1097,7 +1119,7 @@ async def verify_with_whiteknight(vm_ip: str, exploit: Exploit) -> Dict[str, Any
         exploit_config["verify_command"] = exploit.verify_script.replace("{target}", vm_ip)
     
     try:
-        client = WhiteKnightClient(use_docker=True)
+        client = get_whiteknight_client()  # Shared warm worker pool
         result = await client.validate(vm_ip, exploit_config, timeout=120)
         
         logger.info(f"🛡️ WhiteKnight result: {result.status.value}")
@@ -1129,35 +1151,44 @@ async def get_reaper_stats(
     current_user: User = Depends(get_current_user_optional)  # Public read
 ):
     """Get Reaper statistics"""
-    # Count exploits
-    exploit_result = await session.execute(select(Exploit))
-    exploits = exploit_result.scalars().all()
-    
-    # Count missions
-    mission_result = await session.execute(select(ExploitMission))
-    missions = mission_result.scalars().all()
+    # One round trip: every breakdown is a grouped count, stacked with
+    # UNION ALL into (category, key, count) rows
+    stats_query = union_all(
+        select(literal("type"), Exploit.exploit_type, func.count())
+        .group_by(Exploit.exploit_type),
+        select(literal("severity"), Exploit.severity, func.count())
+        .group_by(Exploit.severity),
+        select(
+            literal("flag"), literal("enabled"),
+            func.count().filter(Exploit.enabled.is_(True)),
+        ),
+        select(
+            literal("flag"), literal("verified"),
+            func.count().filter(Exploit.verified.is_(True)),
+        ),
+        select(literal("status"), ExploitMission.status, func.count())
+        .group_by(ExploitMission.status),
+    )
+    rows = (await session.execute(stats_query)).all()
     
-    # Categorize
     by_type = {}
     by_severity = {}
-    for e in exploits:
-        by_type[e.exploit_type] = by_type.get(e.exploit_type, 0) + 1
-        by_severity[e.severity] = by_severity.get(e.severity, 0) + 1
-    
+    flags = {}
     mission_by_status = {}
-    for m in missions:
-        mission_by_status[m.status] = mission_by_status.get(m.status, 0) + 1
+    buckets = {"type": by_type, "severity": by_severity, "flag": flags, "status": mission_by_status}
+    for category, key, count in rows:
+        buckets[category][key] = count
     
     return {
         "exploits": {
-            "total": len(exploits),
-            "enabled": sum(1 for e in exploits if e.enabled),
-            "verified": sum(1 for e in exploits if e.verified),
+            "total": sum(by_type.values()),
+            "enabled": flags.get("enabled", 0),
+            "verified": flags.get("verified", 0),
             "by_type": by_type,
             "by_severity": by_severity,
         },
         "missions": {
-            "total": len(missions),
+            "total": sum(mission_by_status.values()),
             "by_status": mission_by_status,
         }
     }
@@ -1170,6 +1201,13 @@ async def get_reaper_stats(
 from fastapi import WebSocket
 from starlette.websockets import WebSocketDisconnect
 
+from glassdome.core.config import settings as _settings
+from glassdome.core.log_tail import get_log_tailer
+
+# Reaper logs go through the central file handler (see core/logging.py)
+reaper_log_file = Path(_settings.log_dir) / "glassdome.log"
+
+
 @router.get("/logs")
 async def get_recent_logs(
     lines: int = 100,
@@ -1177,14 +1215,14 @@ async def get_recent_logs(
 ):
     """Get recent Reaper log entries"""
     try:
-        if reaper_log_file.exists():
-            with open(reaper_log_file, 'r') as f:
-                all_lines = f.readlines()
-                return {
-                    "logs": all_lines[-lines:],
-                    "total_lines": len(all_lines)
-                }
-        return {"logs": [], "total_lines": 0}
+        tailer = get_log_tailer(reaper_log_file)
+        recent, total = await asyncio.to_thread(
+            lambda: (tailer.tail(lines), tailer.total_lines())
+        )
+        return {
+            "logs": recent,
+            "total_lines": total
+        }
     except Exception as e:
         logger.error(f"Failed to read logs: {e}")
         return {"logs": [], "error": str(e)}
@@ -1192,37 +1230,26 @@ async def get_recent_logs(
 
 @router.websocket("/logs/stream")
 async def stream_logs(websocket: WebSocket):
-    """WebSocket endpoint for live log streaming"""
+    """
+    WebSocket endpoint for live log streaming
+    
+    All clients share one tailer that follows the file; each client only
+    drains its own queue of new text.
+    """
     await websocket.accept()
     logger.info("Log stream client connected")
     
+    tailer = get_log_tailer(reaper_log_file)
+    queue = tailer.subscribe()
     try:
-        last_position = 0
-        if reaper_log_file.exists():
-            last_position = reaper_log_file.stat().st_size
-        
         while True:
-            await asyncio.sleep(1)  # Check every second
-            
-            if reaper_log_file.exists():
-                current_size = reaper_log_file.stat().st_size
-                
-                if current_size > last_position:
-                    with open(reaper_log_file, 'r') as f:
-                        f.seek(last_position)
-                        new_lines = f.read()
-                        if new_lines:
-                            await websocket.send_text(new_lines)
-                        last_position = f.tell()
-                elif current_size < last_position:
-                    # File was truncated/rotated
-                    last_position = 0
-                    
+            await websocket.send_text(await queue.get())
     except WebSocketDisconnect:
         logger.info("Log stream client disconnected")
     except Exception as e:
         logger.debug(f"Log stream error: {e}")
     finally:
+        tailer.unsubscribe(queue)
         logger.info("Log stream closed")
 
 
@@ -1489,6 +1516,9 @@ async def get_mission_logs(
     current_user: User = Depends(require_engineer)  # Engineer+ can view logs
 ):
     """Get all logs for a specific mission"""
+    # Include entries still sitting in the write buffer
+    await get_mission_log_sink().flush(mission_id)
+    
     result = await session.execute(
         select(MissionLog)
         .where(MissionLog.mission_id == mission_id)
@@ -1529,44 +1559,77 @@ async def get_mission_validations(
     }
 
 
+def _encode_history_cursor(mission: ExploitMission) -> str:
+    """Keyset cursor for the page after `mission` (created_at|id)."""
+    created_at = mission.created_at.isoformat() if mission.created_at else ""
+    return f"{created_at}|{mission.id}"
+
+
+def _decode_history_cursor(cursor: str):
+    try:
+        created_at, mission_pk = cursor.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(mission_pk)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid history cursor")
+
+
 @router.get("/history")
 async def get_mission_history(
     days: int = 14,
     limit: int = 100,
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_async_session),
     current_user: User = Depends(require_engineer)  # Engineer+ can view history
 ):
     """
     Get mission history with logs and validation summary
-    Default: last 14 days, max 100 missions
+    Default: last 14 days, max 100 missions per page
+    
+    Pages are keyset-paginated on (created_at, id): pass the returned
+    `next_cursor` as `cursor` to fetch the next page.
     """
+    limit = max(1, min(limit, 500))
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     
-    result = await session.execute(
-        select(ExploitMission)
+    # Log counts come from a correlated subquery (logs can be large, so they
+    # are not loaded); validation statuses are eager-loaded in one batch
+    log_count = (
+        select(func.count(MissionLog.id))
+        .where(MissionLog.mission_id == ExploitMission.mission_id)
+        .correlate(ExploitMission)
+        .scalar_subquery()
+    )
+    query = (
+        select(ExploitMission, log_count.label("log_count"))
+        .options(
+            selectinload(ExploitMission.validations).load_only(
+                ValidationResult.mission_id, ValidationResult.status
+            )
+        )
         .where(ExploitMission.created_at >= cutoff)
-        .order_by(ExploitMission.created_at.desc())
+        .order_by(ExploitMission.created_at.desc(), ExploitMission.id.desc())
         .limit(limit)
     )
-    missions = result.scalars().all()
+    if cursor:
+        cursor_created_at, cursor_id = _decode_history_cursor(cursor)
+        query = query.where(
+            or_(
+                ExploitMission.created_at < cursor_created_at,
+                and_(
+                    ExploitMission.created_at == cursor_created_at,
+                    ExploitMission.id < cursor_id,
+                ),
+            )
+        )
+    
+    rows = (await session.execute(query)).all()
     
     history = []
-    for mission in missions:
-        # Get log count
-        log_result = await session.execute(
-            select(MissionLog).where(MissionLog.mission_id == mission.mission_id)
-        )
-        log_count = len(log_result.scalars().all())
-        
-        # Get validation summary
-        val_result = await session.execute(
-            select(ValidationResult).where(ValidationResult.mission_id == mission.mission_id)
-        )
-        validations = val_result.scalars().all()
-        
+    for mission, mission_log_count in rows:
+        validations = mission.validations
         history.append({
             **mission.to_dict(),
-            "log_count": log_count,
+            "log_count": mission_log_count,
             "validation_count": len(validations),
             "validation_summary": {
                 "success": sum(1 for v in validations if v.status == "success"),
@@ -1577,7 +1640,8 @@ async def get_mission_history(
     return {
         "history": history,
         "total": len(history),
-        "retention_days": days
+        "retention_days": days,
+        "next_cursor": _encode_history_cursor(rows[-1][0]) if len(rows) == limit else None,
     }
 
 
@@ -1744,16 +1808,17 @@ async def add_mission_log(
     exploit_id: int = None,
     details: Dict = None
 ):
-    """Helper function to add a log entry for a mission"""
-    log = MissionLog(
-        mission_id=mission_id,
+    """
+    Helper function to add a log entry for a mission
+    
+    The entry is buffered by the mission log sink and written with the
+    next batch; `session` is accepted for compatibility and not committed.
+    """
+    get_mission_log_sink().log(
+        mission_id,
+        message,
         level=level,
-        message=message,
         step=step,
         exploit_id=exploit_id,
         details=details
     )
-    session.add(log)
-    await session.commit()
-    return log
-
@@ -15,12 +15,14 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Query
 from pydantic import BaseModel
 
-from glassdome.registry.core import get_registry, LabRegistry
+from glassdome.registry.core import get_registry, LabRegistry, parse_event_id
+from glassdome.registry.event_hub import EventFilter, SubscriptionOverflow, get_event_hub
 from glassdome.registry.models import (
     Resource, ResourceType, ResourceState,
     StateChange, EventType, Drift, LabSnapshot
 )
 from glassdome.registry.controllers.lab_controller import get_lab_controller
+from glassdome.registry.agents.proxmox_agent import get_change_feed
 
 logger = logging.getLogger(__name__)
 
@@ -180,26 +182,15 @@ async def delete_resource(resource_id: str):
 # =============================================================================
 
 @router.get("/labs")
-async def list_labs():
-    """List all labs in the registry"""
+async def list_labs(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """List labs in the registry with their summaries, one page at a time"""
     registry = get_registry()
-    labs = await registry.list_labs()
-    
-    # Get snapshot for each lab
-    lab_summaries = []
-    for lab_id in labs:
-        snapshot = await registry.get_lab_snapshot(lab_id)
-        if snapshot:
-            lab_summaries.append({
-                "lab_id": lab_id,
-                "name": snapshot.name,
-                "total_vms": snapshot.total_vms,
-                "running_vms": snapshot.running_vms,
-                "healthy": snapshot.healthy,
-                "drift_count": snapshot.drift_count,
-            })
+    lab_summaries, total = await registry.list_lab_summaries(offset=offset, limit=limit)
     
-    return {"labs": lab_summaries}
+    return {"labs": lab_summaries, "total": total, "offset": offset, "limit": limit}
 
 
 @router.get("/labs/{lab_id}")
@@ -286,27 +277,72 @@ async def get_events(
 # =============================================================================
 
 @router.websocket("/ws/events")
-async def websocket_events(websocket: WebSocket, lab_id: Optional[str] = None):
+async def websocket_events(
+    websocket: WebSocket,
+    lab_id: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    event_type: Optional[str] = None,
+    last_id: Optional[str] = None,
+):
     """
     WebSocket endpoint for real-time event streaming.
     
-    Optional query param:
+    Each message is an event dict with an "event_id".
+    
+    Optional query params:
     - lab_id: Only receive events for a specific lab
+    - resource_type: Comma-separated resource types to receive
+    - event_type: Comma-separated event types to receive
+    - last_id: Resume after this event_id, replaying what was missed
     """
+    event_filter = EventFilter(
+        lab_id=lab_id,
+        resource_types=set(resource_type.split(",")) if resource_type else None,
+        event_types=set(event_type.split(",")) if event_type else None,
+    )
+    try:
+        resume_after = parse_event_id(last_id) if last_id else None
+    except ValueError:
+        await websocket.close(code=1008, reason="Invalid last_id")
+        return
+    
     await websocket.accept()
     
-    registry = get_registry()
+    hub = get_event_hub()
+    subscription = await hub.subscribe(event_filter)
+    
+    async def forward():
+        sent = resume_after
+        if last_id:
+            for event_id, message in await hub.replay(last_id, event_filter):
+                await websocket.send_text(message)
+                sent = parse_event_id(event_id)
+        async for event_id, message in subscription:
+            # Live events queued while replaying may already have been sent
+            if sent and parse_event_id(event_id) <= sent:
+                continue
+            await websocket.send_text(message)
+    
+    async def wait_for_disconnect():
+        while True:
+            await websocket.receive_text()
     
+    tasks = [asyncio.create_task(forward()), asyncio.create_task(wait_for_disconnect())]
     try:
-        # Subscribe to events
-        async for event in registry.subscribe_events(lab_id=lab_id):
-            # Send event as JSON
-            await websocket.send_json(event.to_dict())
-            
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
     except WebSocketDisconnect:
         logger.debug("WebSocket client disconnected")
+    except SubscriptionOverflow:
+        # Client reconnects with last_id and catches up from the stream
+        await websocket.close(code=1013, reason="Event backlog exceeded, resume with last_id")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(subscription)
 
 
 # =============================================================================
@@ -316,10 +352,10 @@ async def websocket_events(websocket: WebSocket, lab_id: Optional[str] = None):
 class ProxmoxWebhook(BaseModel):
     """Proxmox webhook payload"""
     type: str
-    vmid: Optional[int]
-    node: Optional[str]
-    action: Optional[str]
-    status: Optional[str]
+    vmid: Optional[int] = None
+    node: Optional[str] = None
+    action: Optional[str] = None
+    status: Optional[str] = None
 
 
 @router.post("/webhook/proxmox")
@@ -330,13 +366,15 @@ async def proxmox_webhook(payload: ProxmoxWebhook):
     Configure in Proxmox:
     pvesh create /cluster/notifications/endpoints/webhook/glassdome \
       --url "http://agentx:8011/api/registry/webhook/proxmox"
+    
+    Payloads naming a vmid refresh just that VM; anything else makes the
+    agents check the cluster task log right away.
     """
-    logger.info(f"Received Proxmox webhook: {payload}")
+    logger.debug(f"Received Proxmox webhook: {payload}")
     
-    # TODO: Process webhook and update registry immediately
-    # For now, just log it - the polling agents will pick up changes
+    agents = get_change_feed().notify(vmid=payload.vmid, node=payload.node)
     
-    return {"received": True}
+    return {"received": True, "agents_notified": agents}
 
 
 # =============================================================================
@@ -77,6 +77,13 @@ async def health_check_v1():
     }
 
 
+@v1_router.get("/health/db")
+async def database_metrics_v1(top: int = 10):
+    """Database query/pool metrics per route and background task (v1)."""
+    from glassdome.core.db_metrics import db_metrics
+    return db_metrics.snapshot(top=top)
+
+
 @v1_router.get("/")
 async def root_v1():
     """Root API endpoint (v1)."""
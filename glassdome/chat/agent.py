@@ -6,9 +6,11 @@ Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
+import asyncio
 import uuid
 import json
 import logging
+import time
 import traceback
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, AsyncIterator
@@ -16,6 +18,8 @@ from datetime import datetime, timezone
 from enum import Enum
 
 from glassdome.chat.llm_service import LLMService, LLMMessage, LLMResponse, Tool, ToolCall
+from glassdome.chat.context_builder import ContextBuilder
+from glassdome.chat.conversation_store import ConversationStore
 from glassdome.chat.workflow_engine import WorkflowEngine, Workflow, WorkflowStatus
 from glassdome.chat.tools import OVERSEER_TOOLS, get_tool_by_name, LAB_TEMPLATES
 
@@ -24,6 +28,22 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+# Read-only tools; independent calls to these run concurrently
+CONCURRENT_TOOLS = {"get_status", "list_resources", "search_knowledge", "get_platform_status"}
+
+# Per-tool execution timeouts (seconds)
+DEFAULT_TOOL_TIMEOUT = 60
+TOOL_TIMEOUTS = {
+    "get_status": 30,
+    "list_resources": 30,
+    "search_knowledge": 30,
+    "get_platform_status": 45,
+}
+
+# Max LLM -> tools -> LLM rounds per streamed turn
+MAX_TOOL_ROUNDS = 5
+
+
 class MessageRole(str, Enum):
     """Chat message roles"""
     SYSTEM = "system"
@@ -74,6 +94,10 @@ class Conversation:
     context: Dict[str, Any] = field(default_factory=dict)
     created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    summary: str = ""  # Rolling summary of messages[1:summarized_count]
+    summarized_count: int = 0
+    persisted_count: int = 0  # Messages already in the conversation store
+    last_active: float = field(default_factory=time.monotonic)
     
     def add_message(self, role: MessageRole, content: str, **kwargs) -> ChatMessage:
         """Add a message to the conversation"""
@@ -140,18 +164,35 @@ class OverseerChatAgent:
     - Action confirmation
     """
     
-    def __init__(self, overseer_entity=None):
+    def __init__(self, overseer_entity=None, store: Optional[ConversationStore] = None):
         """
         Initialize the chat agent
         
         Args:
             overseer_entity: Optional OverseerEntity instance for system integration
+            store: Conversation store (default: database store, if
+                chat_persist_conversations is enabled)
         """
+        from glassdome.core.config import settings
+        
         self.llm = LLMService()
         self.workflow_engine = WorkflowEngine()
-        self.conversations: Dict[str, Conversation] = {}
+        self.conversations: Dict[str, Conversation] = {}  # In-memory (active) conversations
         self.overseer = overseer_entity
         
+        if store is None and settings.chat_persist_conversations:
+            store = ConversationStore()
+        self.store = store
+        self.idle_eviction_seconds = settings.chat_idle_eviction_seconds
+        self._last_eviction = time.monotonic()
+        
+        self.context_builder = ContextBuilder(
+            max_tokens=settings.chat_context_tokens,
+            summary_tokens=settings.chat_summary_tokens,
+            tool_result_tokens=settings.chat_tool_result_tokens,
+            summarizer=self._summarize
+        )
+        
         # Register workflow handlers
         self._register_workflow_handlers()
         
@@ -191,18 +232,115 @@ class OverseerChatAgent:
         
         self.conversations[conv_id] = conversation
         logger.info(f"Created conversation {conv_id}")
+        self.evict_idle_conversations()
         return conversation
     
     def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
-        """Get an existing conversation"""
-        return self.conversations.get(conversation_id)
+        """Get an in-memory conversation (see load_conversation for stored ones)"""
+        conversation = self.conversations.get(conversation_id)
+        if conversation:
+            conversation.last_active = time.monotonic()
+        return conversation
     
-    def delete_conversation(self, conversation_id: str) -> bool:
-        """Delete a conversation"""
-        if conversation_id in self.conversations:
-            del self.conversations[conversation_id]
-            return True
-        return False
+    async def load_conversation(self, conversation_id: str) -> Optional[Conversation]:
+        """Get a conversation from memory, or reload it from the store"""
+        conversation = self.get_conversation(conversation_id)
+        if conversation or not self.store:
+            return conversation
+        
+        try:
+            conversation = await self.store.load(conversation_id)
+        except Exception as e:
+            logger.warning(f"Could not load conversation {conversation_id}: {e}")
+            return None
+        
+        if conversation:
+            if conversation.active_workflow and not self.workflow_engine.get_workflow(conversation.active_workflow):
+                # Workflows are in-memory only; don't resume one that is gone
+                conversation.active_workflow = None
+            self.conversations[conversation_id] = conversation
+            logger.info(f"Loaded conversation {conversation_id} ({len(conversation.messages)} messages)")
+        self.evict_idle_conversations()
+        return conversation
+    
+    async def save_conversation(self, conversation: Conversation):
+        """Persist new messages and state; failures are logged, not raised"""
+        if not self.store:
+            return
+        try:
+            await self.store.save(conversation)
+        except Exception as e:
+            logger.warning(f"Could not save conversation {conversation.conversation_id}: {e}")
+    
+    async def delete_conversation(self, conversation_id: str) -> bool:
+        """Delete a conversation from memory and the store"""
+        deleted = self.conversations.pop(conversation_id, None) is not None
+        if self.store:
+            try:
+                deleted = await self.store.delete(conversation_id) or deleted
+            except Exception as e:
+                logger.warning(f"Could not delete stored conversation {conversation_id}: {e}")
+        return deleted
+    
+    def evict_idle_conversations(self, max_idle: Optional[float] = None, force: bool = False) -> int:
+        """
+        Drop conversations idle longer than `max_idle` seconds from memory
+        
+        Only fully saved conversations are evicted when a store is
+        configured, and ones with a workflow in progress are kept. Runs at
+        most once a minute unless forced.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_eviction < 60:
+            return 0
+        self._last_eviction = now
+        
+        max_idle = self.idle_eviction_seconds if max_idle is None else max_idle
+        evicted = [
+            conv_id for conv_id, conv in self.conversations.items()
+            if now - conv.last_active > max_idle
+            and not conv.active_workflow
+            and (not self.store or conv.persisted_count == len(conv.messages))
+        ]
+        for conv_id in evicted:
+            del self.conversations[conv_id]
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} idle conversations from memory")
+        return len(evicted)
+    
+    async def _build_context(self, conversation: Conversation) -> List[LLMMessage]:
+        """Token-budgeted messages for the next LLM call"""
+        return await self.context_builder.build(conversation)
+    
+    async def _summarize(self, previous: str, messages: List[ChatMessage], max_tokens: int) -> str:
+        """Fold aged-out messages into the rolling conversation summary"""
+        transcript = "\n".join(
+            f"{m.role.value}: {m.content[:2000]}"
+            for m in messages
+            if m.content and m.role in (MessageRole.USER, MessageRole.ASSISTANT, MessageRole.TOOL)
+        )
+        if not transcript:
+            return previous
+        
+        response = await self.llm.complete(
+            messages=[
+                LLMMessage(
+                    role="system",
+                    content=(
+                        "You maintain a running summary of an operator's conversation with Overseer. "
+                        "Merge the new messages into the summary. Keep decisions, requested resources, "
+                        "IDs, names, platforms and open questions; drop pleasantries. Be concise."
+                    )
+                ),
+                LLMMessage(
+                    role="user",
+                    content=f"Current summary:\n{previous or '(none)'}\n\nNew messages:\n{transcript}"
+                )
+            ],
+            temperature=0.2,
+            max_tokens=max_tokens
+        )
+        return response.content.strip()
     
     # ═══════════════════════════════════════════════════
     # Message Processing
@@ -223,7 +361,7 @@ class OverseerChatAgent:
         Returns:
             Response dict with content and metadata
         """
-        conversation = self.get_conversation(conversation_id)
+        conversation = await self.load_conversation(conversation_id)
         if not conversation:
             conversation = self.create_conversation()
             conversation_id = conversation.conversation_id
@@ -231,16 +369,19 @@ class OverseerChatAgent:
         # Add user message
         conversation.add_message(MessageRole.USER, message)
         
-        # Check for pending action confirmation
-        if conversation.pending_action:
-            return await self._handle_action_response(conversation, message)
-        
-        # Check for active workflow
-        if conversation.active_workflow:
-            return await self._handle_workflow_message(conversation, message)
-        
-        # Normal message processing with LLM
-        return await self._process_with_llm(conversation)
+        try:
+            # Check for pending action confirmation
+            if conversation.pending_action:
+                return await self._handle_action_response(conversation, message)
+            
+            # Check for active workflow
+            if conversation.active_workflow:
+                return await self._handle_workflow_message(conversation, message)
+            
+            # Normal message processing with LLM
+            return await self._process_with_llm(conversation)
+        finally:
+            await self.save_conversation(conversation)
     
     async def _process_with_llm(self, conversation: Conversation) -> Dict[str, Any]:
         """Process message through LLM with tool calling"""
@@ -264,7 +405,7 @@ class OverseerChatAgent:
             # Get LLM response
             logger.debug(f"[{conv_id}] Calling LLM.complete() with {len(self.tools)} tools")
             response = await self.llm.complete(
-                messages=conversation.get_llm_messages(),
+                messages=await self._build_context(conversation),
                 tools=self.tools,
                 temperature=0.7
             )
@@ -306,65 +447,13 @@ class OverseerChatAgent:
         response: LLMResponse
     ) -> Dict[str, Any]:
         """Handle LLM tool calls"""
-        results = []
-        
-        # First, add the assistant message with tool_calls to conversation
-        # This is required by OpenAI - tool results must follow a message with tool_calls
-        assistant_msg = conversation.add_message(
-            MessageRole.ASSISTANT,
-            response.content or "",
-            tool_calls=[
-                {
-                    "id": tc.id,
-                    "type": "function",
-                    "function": {
-                        "name": tc.name,
-                        "arguments": json.dumps(tc.arguments)
-                    }
-                }
-                for tc in response.tool_calls
-            ]
-        )
-        
-        for tool_call in response.tool_calls:
-            logger.info(f"Executing tool: {tool_call.name} with args: {tool_call.arguments}")
-            
-            try:
-                result = await self._execute_tool(
-                    conversation,
-                    tool_call.name,
-                    tool_call.arguments
-                )
-                results.append({
-                    "tool": tool_call.name,
-                    "result": result
-                })
-                
-                # Add tool result to conversation
-                conversation.add_message(
-                    MessageRole.TOOL,
-                    json.dumps(result),
-                    tool_call_id=tool_call.id
-                )
-                
-            except Exception as e:
-                logger.error(f"Tool execution error: {e}", exc_info=True)
-                error_result = {"error": str(e)}
-                results.append({
-                    "tool": tool_call.name,
-                    "error": str(e)
-                })
-                # Still need to add tool result even on error
-                conversation.add_message(
-                    MessageRole.TOOL,
-                    json.dumps(error_result),
-                    tool_call_id=tool_call.id
-                )
+        self._add_tool_call_message(conversation, response)
+        results = await self._run_tool_calls(conversation, response.tool_calls)
         
         # Get follow-up response from LLM
         try:
             follow_up = await self.llm.complete(
-                messages=conversation.get_llm_messages(),
+                messages=await self._build_context(conversation),
                 tools=self.tools,
                 temperature=0.7
             )
@@ -400,6 +489,81 @@ class OverseerChatAgent:
                 "tool_results": results
             }
     
+    def _add_tool_call_message(self, conversation: Conversation, response: LLMResponse):
+        """Record the assistant message that carries tool_calls"""
+        # This is required by OpenAI - tool results must follow a message with tool_calls
+        conversation.add_message(
+            MessageRole.ASSISTANT,
+            response.content or "",
+            tool_calls=[
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": json.dumps(tc.arguments)
+                    }
+                }
+                for tc in response.tool_calls
+            ]
+        )
+    
+    async def _run_tool_call(self, conversation: Conversation, tool_call: ToolCall) -> Dict[str, Any]:
+        """Execute one tool call with its timeout; never raises"""
+        timeout = TOOL_TIMEOUTS.get(tool_call.name, DEFAULT_TOOL_TIMEOUT)
+        logger.info(f"Executing tool: {tool_call.name} with args: {tool_call.arguments}")
+        
+        try:
+            result = await asyncio.wait_for(
+                self._execute_tool(conversation, tool_call.name, tool_call.arguments),
+                timeout
+            )
+            return {"tool": tool_call.name, "result": result}
+        except asyncio.TimeoutError:
+            logger.warning(f"Tool {tool_call.name} timed out after {timeout}s")
+            return {"tool": tool_call.name, "error": f"Tool timed out after {timeout}s"}
+        except Exception as e:
+            logger.error(f"Tool execution error: {e}", exc_info=True)
+            return {"tool": tool_call.name, "error": str(e)}
+    
+    async def _run_tool_calls(
+        self,
+        conversation: Conversation,
+        tool_calls: List[ToolCall]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a batch of tool calls and record their results
+        
+        Read-only tools (CONCURRENT_TOOLS) run concurrently; tools that
+        change conversation state (pending actions, workflows) run one at
+        a time in the order the LLM requested them. Results are added to
+        the conversation in the original call order.
+        """
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+        
+        concurrent = [i for i, tc in enumerate(tool_calls) if tc.name in CONCURRENT_TOOLS]
+        batch = asyncio.ensure_future(asyncio.gather(
+            *(self._run_tool_call(conversation, tool_calls[i]) for i in concurrent)
+        ))
+        
+        for i, tool_call in enumerate(tool_calls):
+            if tool_call.name not in CONCURRENT_TOOLS:
+                outcomes[i] = await self._run_tool_call(conversation, tool_call)
+        
+        for i, outcome in zip(concurrent, await batch):
+            outcomes[i] = outcome
+        
+        for tool_call, outcome in zip(tool_calls, outcomes):
+            # Every tool call needs a result message, even on error
+            payload = outcome["result"] if "result" in outcome else {"error": outcome["error"]}
+            conversation.add_message(
+                MessageRole.TOOL,
+                json.dumps(payload, default=str),
+                tool_call_id=tool_call.id
+            )
+        
+        return outcomes
+    
     # ═══════════════════════════════════════════════════
     # Tool Execution
     # ═══════════════════════════════════════════════════
@@ -710,10 +874,9 @@ class OverseerChatAgent:
         search_type = args.get("search_type", "general")
         
         if self.overseer and hasattr(self.overseer, 'rag'):
-            if search_type == "error":
-                result = self.overseer.rag.search_error(query)
-            else:
-                result = self.overseer.rag.quick_search(query)
+            result = await self.overseer.rag.search(query, search_type, timeout=20)
+            if result is None:
+                return {"results": "Knowledge base is busy or unavailable, try again shortly"}
             return {"results": result}
         
         return {"results": "Knowledge base not available"}
@@ -1609,7 +1772,7 @@ class OverseerChatAgent:
         Yields:
             Response chunks as they arrive
         """
-        conversation = self.get_conversation(conversation_id)
+        conversation = await self.load_conversation(conversation_id)
         if not conversation:
             conversation = self.create_conversation()
         
@@ -1618,7 +1781,7 @@ class OverseerChatAgent:
         # Stream from LLM
         full_response = ""
         async for chunk in self.llm.stream(
-            messages=conversation.get_llm_messages(),
+            messages=await self._build_context(conversation),
             temperature=0.7
         ):
             full_response += chunk
@@ -1626,4 +1789,116 @@ class OverseerChatAgent:
         
         # Save complete response
         conversation.add_message(MessageRole.ASSISTANT, full_response)
-
+        await self.save_conversation(conversation)
+    
+    async def stream_message(
+        self,
+        conversation_id: str,
+        message: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a message, streaming the LLM's text as it is generated
+        
+        Same flow as process_message (including tool calls), but yields
+        events instead of returning one result:
+            {"type": "chunk", "content": "..."}        text as it arrives
+            {"type": "tool_calls", "tools": [...]}     tools about to run
+            {"type": "tool_results", "tool_results": [...]}
+            {"type": "complete", "response": "...", "result_type": ..., "tool_results": ...}
+        
+        Args:
+            conversation_id: Conversation ID
+            message: User message text
+        """
+        conversation = await self.load_conversation(conversation_id)
+        if not conversation:
+            conversation = self.create_conversation()
+        
+        conversation.add_message(MessageRole.USER, message)
+        
+        try:
+            async for event in self._stream_turn(conversation, message):
+                yield event
+        finally:
+            await self.save_conversation(conversation)
+    
+    async def _stream_turn(
+        self,
+        conversation: Conversation,
+        message: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Events for one streamed turn (user message already added)"""
+        conv_id = conversation.conversation_id
+        
+        # Confirmations and workflows don't involve the LLM
+        if conversation.pending_action or conversation.active_workflow:
+            if conversation.pending_action:
+                result = await self._handle_action_response(conversation, message)
+            else:
+                result = await self._handle_workflow_message(conversation, message)
+            yield {
+                "type": "complete",
+                "conversation_id": conv_id,
+                "response": result["response"],
+                "result_type": result.get("type"),
+                "tool_results": result.get("tool_results")
+            }
+            return
+        
+        tool_results: List[Dict[str, Any]] = []
+        
+        try:
+            for _ in range(MAX_TOOL_ROUNDS):
+                response = None
+                async for item in self.llm.stream_complete(
+                    messages=await self._build_context(conversation),
+                    tools=self.tools,
+                    temperature=0.7
+                ):
+                    if isinstance(item, LLMResponse):
+                        response = item
+                    else:
+                        yield {"type": "chunk", "content": item}
+                
+                if response is None or not response.tool_calls:
+                    content = response.content if response else ""
+                    conversation.add_message(MessageRole.ASSISTANT, content)
+                    yield {
+                        "type": "complete",
+                        "conversation_id": conv_id,
+                        "response": content,
+                        "result_type": "tool_result" if tool_results else "message",
+                        "tool_results": tool_results or None
+                    }
+                    return
+                
+                logger.info(f"[{conv_id}] Processing {len(response.tool_calls)} tool calls")
+                self._add_tool_call_message(conversation, response)
+                yield {"type": "tool_calls", "tools": [tc.name for tc in response.tool_calls]}
+                
+                results = await self._run_tool_calls(conversation, response.tool_calls)
+                tool_results.extend(results)
+                yield {"type": "tool_results", "tool_results": results}
+            
+            content = "I stopped after several rounds of tool calls. Please refine the request."
+            conversation.add_message(MessageRole.ASSISTANT, content)
+            yield {
+                "type": "complete",
+                "conversation_id": conv_id,
+                "response": content,
+                "result_type": "tool_result",
+                "tool_results": tool_results
+            }
+        
+        except Exception as e:
+            logger.error(f"[{conv_id}] LLM STREAMING ERROR: {e}")
+            logger.error(f"[{conv_id}] Traceback:\n{traceback.format_exc()}")
+            
+            error_msg = f"I encountered an error processing your request: {str(e)}"
+            conversation.add_message(MessageRole.ASSISTANT, error_msg)
+            yield {
+                "type": "error",
+                "conversation_id": conv_id,
+                "response": error_msg,
+                "error": str(e)
+            }
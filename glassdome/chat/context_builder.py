@@ -0,0 +1,189 @@
+"""
+Token-budgeted context builder
+
+Builds the message list sent to the LLM for a conversation within a fixed
+token budget:
+- the system prompt is always sent
+- the most recent turns are sent verbatim, as many as fit
+- older turns are replaced by a rolling summary, cached on the conversation
+  and extended incrementally as turns age out (each message is summarized
+  once)
+- tool results are truncated to a per-result budget
+
+Token counts are estimates (about 4 characters per token), which is close
+enough for budgeting without a tokenizer dependency.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import json
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+from glassdome.chat.llm_service import LLMMessage
+
+logger = logging.getLogger(__name__)
+
+# Rough characters per token for English text and JSON
+CHARS_PER_TOKEN = 4
+
+# Per-message overhead (role, separators) in tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Chars kept per message by the fallback (non-LLM) summary
+FALLBACK_SNIPPET_CHARS = 200
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+# summarizer(previous_summary, messages, max_tokens) -> new summary
+Summarizer = Callable[[str, List[Any], int], Awaitable[str]]
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Estimated token count of a string"""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to about `max_tokens`, noting how much was dropped"""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}\n...[truncated {len(text) - max_chars} chars]"
+
+
+def message_tokens(message: LLMMessage) -> int:
+    """Estimated tokens of one LLM message, including tool call arguments"""
+    tokens = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.content)
+    if message.tool_calls:
+        tokens += estimate_tokens(json.dumps(message.tool_calls))
+    return tokens
+
+
+def fallback_summary(previous: str, messages: List[Any], max_tokens: int) -> str:
+    """
+    Extractive summary used when the LLM summarizer is unavailable.
+    
+    Keeps the start of each user/assistant message; when over budget the
+    oldest lines are dropped first.
+    """
+    lines = previous.splitlines() if previous else []
+    for message in messages:
+        role = getattr(message.role, "value", message.role)
+        if role not in ("user", "assistant") or not message.content:
+            continue
+        snippet = " ".join(message.content.split())[:FALLBACK_SNIPPET_CHARS]
+        lines.append(f"- {role}: {snippet}")
+    
+    while lines and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+class ContextBuilder:
+    """
+    Per-turn prompt builder with a fixed token budget.
+    
+    Works on chat.agent.Conversation objects; the rolling summary and the
+    number of messages it covers are kept on the conversation
+    (`summary`, `summarized_count`) so they persist with it.
+    """
+    
+    def __init__(
+        self,
+        max_tokens: int = 12000,
+        summary_tokens: int = 800,
+        tool_result_tokens: int = 1500,
+        summarizer: Optional[Summarizer] = None,
+    ):
+        """
+        Args:
+            max_tokens: Budget for the whole prompt (system + summary + recent turns)
+            summary_tokens: Budget for the rolling summary
+            tool_result_tokens: Budget for each tool result
+            summarizer: Async callable producing the rolling summary
+                (default: extractive fallback_summary)
+        """
+        self.max_tokens = max_tokens
+        self.summary_tokens = summary_tokens
+        self.tool_result_tokens = tool_result_tokens
+        self.summarizer = summarizer
+    
+    def to_llm_message(self, message) -> LLMMessage:
+        """Convert a ChatMessage, truncating tool results"""
+        llm_message = message.to_llm_message()
+        if llm_message.role == "tool":
+            llm_message.content = truncate_to_tokens(llm_message.content, self.tool_result_tokens)
+        return llm_message
+    
+    def _recent_start(self, conversation, history_start: int, budget: int) -> int:
+        """
+        Index of the first message sent verbatim.
+        
+        Only user messages start a turn, so a cut never separates tool
+        results from the assistant message that requested them. The
+        latest turn is always kept, even when it is over budget.
+        """
+        messages = conversation.messages
+        start = len(messages)
+        used = 0
+        for i in range(len(messages) - 1, history_start - 1, -1):
+            used += message_tokens(self.to_llm_message(messages[i]))
+            if getattr(messages[i].role, "value", messages[i].role) != "user":
+                continue
+            if used > budget and start < len(messages):
+                break
+            start = i
+        
+        if start == len(messages):
+            # No user message in range (e.g. history is all system/tool)
+            start = history_start
+        # Never re-send what is already summarized
+        return max(start, conversation.summarized_count, history_start)
+    
+    async def _extend_summary(self, conversation, upto: int) -> None:
+        """Fold messages[summarized_count:upto] into the rolling summary"""
+        aged_out = conversation.messages[conversation.summarized_count:upto]
+        previous = conversation.summary or ""
+        summary = None
+        if self.summarizer is not None:
+            try:
+                summary = await self.summarizer(previous, aged_out, self.summary_tokens)
+            except Exception as e:
+                logger.warning(f"Conversation summary failed, using extractive summary: {e}")
+        if not summary:
+            summary = fallback_summary(previous, aged_out, self.summary_tokens)
+        
+        conversation.summary = truncate_to_tokens(summary, self.summary_tokens)
+        conversation.summarized_count = upto
+        logger.debug(
+            f"[{conversation.conversation_id}] Summarized {len(aged_out)} messages "
+            f"({estimate_tokens(conversation.summary)} tokens)"
+        )
+    
+    async def build(self, conversation) -> List[LLMMessage]:
+        """Messages to send to the LLM for the next completion"""
+        messages = conversation.messages
+        system: List[LLMMessage] = []
+        history_start = 0
+        if messages and getattr(messages[0].role, "value", messages[0].role) == "system":
+            system = [messages[0].to_llm_message()]
+            history_start = 1
+        conversation.summarized_count = max(conversation.summarized_count, history_start)
+        
+        fixed = sum(message_tokens(m) for m in system)
+        budget = max(0, self.max_tokens - fixed - self.summary_tokens - MESSAGE_OVERHEAD_TOKENS)
+        start = self._recent_start(conversation, history_start, budget)
+        
+        if start > conversation.summarized_count:
+            await self._extend_summary(conversation, start)
+        
+        result = list(system)
+        if conversation.summary:
+            result.append(LLMMessage(role="system", content=SUMMARY_PREFIX + conversation.summary))
+        result.extend(self.to_llm_message(m) for m in messages[start:])
+        return result
@@ -0,0 +1,148 @@
+"""
+Persistent conversation store
+
+Saves Overseer conversations to the database so they survive restarts
+and can be evicted from memory while idle. Messages are append-only:
+each save inserts only the messages added since the previous save, plus
+one update of the conversation's state (summary, pending action, ...).
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import logging
+from dataclasses import asdict
+from typing import Callable, Optional
+
+from sqlalchemy import delete, insert, select
+
+from glassdome.chat.models import ChatConversationRecord, ChatMessageRecord
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationStore:
+    """Database-backed storage for chat.agent.Conversation objects."""
+    
+    def __init__(self, session_factory: Optional[Callable] = None):
+        """
+        Args:
+            session_factory: async_sessionmaker to use (default: AsyncSessionLocal)
+        """
+        self._session_factory = session_factory
+    
+    def _get_session_factory(self):
+        if self._session_factory is None:
+            from glassdome.core.database import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+    
+    async def save(self, conversation) -> int:
+        """
+        Persist a conversation's state and any unsaved messages.
+        
+        Returns:
+            Number of messages inserted
+        """
+        new_messages = conversation.messages[conversation.persisted_count:]
+        state = {
+            "summary": conversation.summary or None,
+            "summarized_count": conversation.summarized_count,
+            "active_workflow": conversation.active_workflow,
+            "pending_action": asdict(conversation.pending_action) if conversation.pending_action else None,
+            "context": conversation.context,
+            "updated_at": conversation.updated_at,
+        }
+        
+        async with self._get_session_factory()() as session:
+            record = (await session.execute(
+                select(ChatConversationRecord)
+                .where(ChatConversationRecord.conversation_id == conversation.conversation_id)
+            )).scalar_one_or_none()
+            
+            if record is None:
+                record = ChatConversationRecord(
+                    conversation_id=conversation.conversation_id,
+                    created_at=conversation.created_at,
+                )
+                session.add(record)
+            for key, value in state.items():
+                setattr(record, key, value)
+            await session.flush()
+            
+            if new_messages:
+                await session.execute(insert(ChatMessageRecord), [
+                    {
+                        "conversation_id": conversation.conversation_id,
+                        "seq": conversation.persisted_count + i,
+                        "message_id": m.id,
+                        "role": m.role.value,
+                        "content": m.content,
+                        "tool_calls": m.tool_calls,
+                        "tool_call_id": m.tool_call_id,
+                        "message_metadata": m.metadata,
+                        "timestamp": m.timestamp,
+                    }
+                    for i, m in enumerate(new_messages)
+                ])
+            await session.commit()
+        
+        conversation.persisted_count += len(new_messages)
+        return len(new_messages)
+    
+    async def load(self, conversation_id: str):
+        """Load a conversation, or None if it was never stored."""
+        from glassdome.chat.agent import ActionRequest, ChatMessage, Conversation, MessageRole
+        
+        async with self._get_session_factory()() as session:
+            record = (await session.execute(
+                select(ChatConversationRecord)
+                .where(ChatConversationRecord.conversation_id == conversation_id)
+            )).scalar_one_or_none()
+            if record is None:
+                return None
+            
+            rows = (await session.execute(
+                select(ChatMessageRecord)
+                .where(ChatMessageRecord.conversation_id == conversation_id)
+                .order_by(ChatMessageRecord.seq)
+            )).scalars().all()
+        
+        messages = [
+            ChatMessage(
+                id=row.message_id,
+                role=MessageRole(row.role),
+                content=row.content,
+                timestamp=row.timestamp,
+                tool_calls=row.tool_calls,
+                tool_call_id=row.tool_call_id,
+                metadata=row.message_metadata,
+            )
+            for row in rows
+        ]
+        
+        return Conversation(
+            conversation_id=conversation_id,
+            messages=messages,
+            active_workflow=record.active_workflow,
+            pending_action=ActionRequest(**record.pending_action) if record.pending_action else None,
+            context=record.context or {},
+            created_at=record.created_at,
+            updated_at=record.updated_at,
+            summary=record.summary or "",
+            summarized_count=record.summarized_count or 0,
+            persisted_count=len(messages),
+        )
+    
+    async def delete(self, conversation_id: str) -> bool:
+        """Delete a stored conversation; True if it existed."""
+        async with self._get_session_factory()() as session:
+            await session.execute(
+                delete(ChatMessageRecord).where(ChatMessageRecord.conversation_id == conversation_id)
+            )
+            result = await session.execute(
+                delete(ChatConversationRecord).where(ChatConversationRecord.conversation_id == conversation_id)
+            )
+            await session.commit()
+            return result.rowcount > 0
@@ -11,7 +11,7 @@ import logging
 import traceback
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, AsyncIterator, Callable
+from typing import Dict, Any, List, Optional, AsyncIterator, Callable, Union
 from enum import Enum
 from datetime import datetime, timezone
 
@@ -139,6 +139,30 @@ class LLMProvider(ABC):
         """
         pass
     
+    async def stream_complete(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream a completion that may include tool calls
+        
+        Yields text chunks as they arrive, then one final LLMResponse with
+        the full content and any tool calls. Providers without native
+        support fall back to complete() (a single chunk).
+        """
+        response = await self.complete(
+            messages=messages,
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        if response.content:
+            yield response.content
+        yield response
+    
     def is_available(self) -> bool:
         """Check if provider is configured and available"""
         return bool(self.api_key)
@@ -289,6 +313,80 @@ class OpenAIProvider(LLMProvider):
                 yield chunk.choices[0].delta.content
 
 
+    async def stream_complete(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """Stream from OpenAI, reassembling tool call fragments"""
+        client = self._get_client()
+        
+        kwargs = {
+            "model": self.model,
+            "messages": self._convert_messages(messages),
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        }
+        
+        if tools:
+            kwargs["tools"] = self._convert_tools(tools)
+            kwargs["tool_choice"] = "auto"
+        
+        response = await client.chat.completions.create(**kwargs)
+        
+        content_parts = []
+        calls: Dict[int, Dict[str, str]] = {}  # index -> {id, name, arguments}
+        finish_reason = "stop"
+        usage = None
+        
+        async for chunk in response:
+            if getattr(chunk, "usage", None):
+                usage = {
+                    "prompt_tokens": chunk.usage.prompt_tokens,
+                    "completion_tokens": chunk.usage.completion_tokens,
+                    "total_tokens": chunk.usage.total_tokens
+                }
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = choice.delta
+            if delta.content:
+                content_parts.append(delta.content)
+                yield delta.content
+            for tc in delta.tool_calls or []:
+                entry = calls.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                if tc.id:
+                    entry["id"] = tc.id
+                if tc.function:
+                    entry["name"] += tc.function.name or ""
+                    entry["arguments"] += tc.function.arguments or ""
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+        
+        tool_calls = [
+            ToolCall(
+                id=entry["id"],
+                name=entry["name"],
+                arguments=json.loads(entry["arguments"] or "{}")
+            )
+            for _, entry in sorted(calls.items())
+        ]
+        
+        yield LLMResponse(
+            content="".join(content_parts),
+            role="assistant",
+            tool_calls=tool_calls or None,
+            finish_reason=finish_reason,
+            usage=usage,
+            provider=self.provider_name,
+            model=self.model
+        )
+
+
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude provider"""
     
@@ -322,12 +420,15 @@ class AnthropicProvider(LLMProvider):
     
     def _convert_messages(self, messages: List[LLMMessage]) -> tuple:
         """Convert LLMMessage to Anthropic format (separate system prompt)"""
-        system_prompt = ""
+        # Anthropic takes one system prompt: join them all (e.g. the agent
+        # prompt followed by the rolling conversation summary)
+        system_parts = []
         converted = []
         
         for msg in messages:
             if msg.role == "system":
-                system_prompt = msg.content
+                if msg.content:
+                    system_parts.append(msg.content)
             elif msg.role == "tool":
                 # Anthropic uses tool_result blocks
                 converted.append({
@@ -344,7 +445,7 @@ class AnthropicProvider(LLMProvider):
                     "content": msg.content
                 })
         
-        return system_prompt, converted
+        return "\n\n".join(system_parts), converted
     
     def _convert_tools(self, tools: List[Tool]) -> List[Dict[str, Any]]:
         """Convert Tool to Anthropic format"""
@@ -383,7 +484,10 @@ class AnthropicProvider(LLMProvider):
             kwargs["tools"] = self._convert_tools(tools)
         
         response = await client.messages.create(**kwargs)
-        
+        return self._to_llm_response(response)
+    
+    def _to_llm_response(self, response) -> LLMResponse:
+        """Convert an Anthropic Message to LLMResponse"""
         # Parse response content
         content = ""
         tool_calls = []
@@ -441,6 +545,38 @@ class AnthropicProvider(LLMProvider):
         async with client.messages.stream(**kwargs) as stream:
             async for text in stream.text_stream:
                 yield text
+    
+    async def stream_complete(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """Stream from Anthropic; tool_use blocks come from the final message"""
+        client = self._get_client()
+        
+        system_prompt, converted_messages = self._convert_messages(messages)
+        
+        kwargs = {
+            "model": self.model,
+            "messages": converted_messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        
+        if tools:
+            kwargs["tools"] = self._convert_tools(tools)
+        
+        async with client.messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+            final = await stream.get_final_message()
+        
+        yield self._to_llm_response(final)
 
 
 class LLMService:
@@ -641,6 +777,55 @@ class LLMService:
         ):
             yield chunk
     
+    async def stream_complete(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        provider: Optional[str] = None
+    ) -> AsyncIterator[Union[str, LLMResponse]]:
+        """
+        Stream a completion (text chunks, then the final LLMResponse)
+        
+        Falls back to the next provider only if one fails before
+        producing any output.
+        """
+        if not self._providers:
+            self._initialize_providers()
+            if not self._providers:
+                raise ValueError("No LLM providers configured. Check API keys in secrets or environment.")
+        
+        providers_to_try = [provider or self.default_provider] + self.fallback_providers
+        if not any(name in self._providers for name in providers_to_try):
+            # Same fallback as get_provider(): first available provider
+            providers_to_try = list(self._providers)[:1]
+        
+        last_error = None
+        for provider_name in providers_to_try:
+            llm = self._providers.get(provider_name)
+            if llm is None:
+                continue
+            
+            started = False
+            try:
+                async for item in llm.stream_complete(
+                    messages=messages,
+                    tools=tools,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                ):
+                    started = True
+                    yield item
+                return
+            except Exception as e:
+                if started:
+                    raise
+                logger.error(f"Provider '{provider_name}' stream failed: {e}")
+                last_error = e
+        
+        raise ValueError(f"All providers failed. Last error: {last_error}")
+    
     def register_provider(self, name: str, provider: LLMProvider):
         """
         Register a custom provider
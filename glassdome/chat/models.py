@@ -0,0 +1,60 @@
+"""
+Chat persistence models
+
+Overseer conversations and their messages, so conversations survive
+restarts and idle ones can be dropped from memory.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+
+from glassdome.core.database import Base
+
+
+class ChatConversationRecord(Base):
+    """A stored Overseer conversation (state only; messages are separate rows)."""
+    
+    __tablename__ = "chat_conversations"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    conversation_id = Column(String(64), unique=True, nullable=False, index=True)
+    
+    # Rolling summary of messages[1:summarized_count] (see chat/context_builder.py)
+    summary = Column(Text, nullable=True)
+    summarized_count = Column(Integer, default=0)
+    
+    active_workflow = Column(String(64), nullable=True)
+    pending_action = Column(JSON, nullable=True)  # ActionRequest fields
+    context = Column(JSON, default=dict)
+    
+    created_at = Column(String(40))  # ISO timestamps, as on Conversation
+    updated_at = Column(String(40), index=True)
+    stored_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class ChatMessageRecord(Base):
+    """One message of a stored conversation."""
+    
+    __tablename__ = "chat_messages"
+    __table_args__ = (UniqueConstraint("conversation_id", "seq", name="uq_chat_message_seq"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    conversation_id = Column(
+        String(64),
+        ForeignKey("chat_conversations.conversation_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    seq = Column(Integer, nullable=False)  # Position in the conversation
+    
+    message_id = Column(String(32), nullable=False)
+    role = Column(String(16), nullable=False)
+    content = Column(Text, nullable=False, default="")
+    tool_calls = Column(JSON, nullable=True)
+    tool_call_id = Column(String(128), nullable=True)
+    message_metadata = Column("metadata", JSON, nullable=True)
+    timestamp = Column(String(40))
@@ -11,7 +11,6 @@ import getpass
 from pathlib import Path
 from glassdome import __version__
 from glassdome.core.config import settings
-from glassdome.core.secrets import get_secrets_manager
 
 
 @click.group()
@@ -619,6 +618,8 @@ def secrets():
 @click.option('--value', prompt=True, hide_input=True, help='Secret value (prompted if not provided)')
 def secrets_set(key, value):
     """Set a secret value"""
+    from glassdome.core.secrets import get_secrets_manager
+    
     try:
         secrets = get_secrets_manager()
         if secrets.set_secret(key, value):
@@ -633,6 +634,8 @@ def secrets_set(key, value):
 @click.argument('key')
 def secrets_get(key):
     """Get a secret value (displayed, use with caution)"""
+    from glassdome.core.secrets import get_secrets_manager
+    
     try:
         secrets = get_secrets_manager()
         value = secrets.get_secret(key)
@@ -647,6 +650,8 @@ def secrets_get(key):
 @secrets.command('list')
 def secrets_list():
     """List all stored secret keys"""
+    from glassdome.core.secrets import get_secrets_manager
+    
     try:
         secrets = get_secrets_manager()
         keys = secrets.list_secrets()
@@ -665,6 +670,8 @@ def secrets_list():
 @click.confirmation_option(prompt='Are you sure you want to delete this secret?')
 def secrets_delete(key):
     """Delete a secret"""
+    from glassdome.core.secrets import get_secrets_manager
+    
     try:
         secrets = get_secrets_manager()
         if secrets.delete_secret(key):
@@ -5,10 +5,29 @@ Author: Brett Turner (ntounix)
 Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
-from glassdome.core.session import get_session, require_session, GlassdomeSession
-from glassdome.core.config import settings, Settings
-from glassdome.core.secrets import get_secrets_manager
-from glassdome.core.secrets_backend import get_secret, set_secret, list_secrets
+
+from typing import TYPE_CHECKING
+
+from glassdome._lazy import lazy_attributes
+
+# Imported on first access; config alone is enough for most callers
+_LAZY_IMPORTS = {
+    "get_session": "glassdome.core.session",
+    "require_session": "glassdome.core.session",
+    "GlassdomeSession": "glassdome.core.session",
+    "settings": "glassdome.core.config",
+    "Settings": "glassdome.core.config",
+    "get_secrets_manager": "glassdome.core.secrets",
+    "get_secret": "glassdome.core.secrets_backend",
+    "set_secret": "glassdome.core.secrets_backend",
+    "list_secrets": "glassdome.core.secrets_backend",
+}
+
+if TYPE_CHECKING:
+    from glassdome.core.session import get_session, require_session, GlassdomeSession
+    from glassdome.core.config import settings, Settings
+    from glassdome.core.secrets import get_secrets_manager
+    from glassdome.core.secrets_backend import get_secret, set_secret, list_secrets
 
 __all__ = [
     'get_session',
@@ -22,3 +41,5 @@ __all__ = [
     'set_secret',
     'list_secrets',
 ]
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_IMPORTS)
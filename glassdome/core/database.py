@@ -1,30 +1,79 @@
 """
 Database module
 
+Two engines share the same database but have separate connection pools:
+- engine / AsyncSessionLocal: API request handlers
+- background_engine / BackgroundSessionLocal: long-running loops
+  (WhitePawn, hot spare pool, reconcilers, Overseer sync, Celery workers)
+so a busy background loop can't starve API requests of connections.
+
 Author: Brett Turner (ntounix)
 Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from glassdome.core.config import settings
+from glassdome.core.db_metrics import db_metrics, instrument_engine
+
+
+def _create_engine(name: str, pool_size: int, max_overflow: int):
+    """Create an instrumented async engine with the configured pool settings"""
+    url = make_url(settings.database_url)
+    kwargs = {
+        "echo": settings.debug,
+        "future": True,
+        "query_cache_size": settings.db_statement_cache_size,
+    }
+    capacity = None
+    
+    # SQLite (tests, local dev) uses a single-connection pool without sizing options
+    if not url.get_backend_name().startswith("sqlite"):
+        kwargs.update(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+        )
+        capacity = pool_size + max_overflow
+    
+    if url.get_driver_name() == "asyncpg":
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.db_statement_cache_size)}
+        )
+    
+    async_engine = create_async_engine(url, **kwargs)
+    instrument_engine(async_engine, name, capacity=capacity)
+    return async_engine
 
-# Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True
-)
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+def _session_factory(bind):
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+db_metrics.slow_query_ms = settings.db_slow_query_ms
+
+# Create async engines
+engine = _create_engine("api", settings.db_pool_size, settings.db_max_overflow)
+background_engine = _create_engine(
+    "background", settings.db_background_pool_size, settings.db_background_max_overflow
 )
 
+# Create async session factories
+AsyncSessionLocal = _session_factory(engine)
+BackgroundSessionLocal = _session_factory(background_engine)
+
+# Used by the Celery workers
+async_session_factory = BackgroundSessionLocal
+
 # Base class for models
 Base = declarative_base()
 
@@ -50,7 +99,16 @@ async def init_db():
     from glassdome.reaper.hot_spare import HotSpare
     from glassdome.networking.models import NetworkDefinition, PlatformNetworkMapping, VMInterface, DeployedVM
     from glassdome.whitepawn.models import WhitePawnDeployment, NetworkAlert, MonitoringEvent, ConnectivityMatrix
+    from glassdome.chat.models import ChatConversationRecord, ChatMessageRecord
+    from glassdome.models.lab import Lab, LabTemplate, LabElement
+    from glassdome.models.deployment import Deployment
+    from glassdome.models.platform import Platform
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+
+async def dispose_engines():
+    """Close all pooled connections (on shutdown)"""
+    await engine.dispose()
+    await background_engine.dispose()
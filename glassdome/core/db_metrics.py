@@ -0,0 +1,293 @@
+"""
+Database instrumentation
+
+SQLAlchemy event hooks that record, per route or background task:
+- query counts and a latency histogram
+- the slowest / most frequent statements (N+1 hot spots show up as
+  one statement with a high count per request)
+- queries per request
+- connection pool checkouts and peak usage
+
+Queries are attributed to the current "scope": the route template for API
+requests (set by DBMetricsMiddleware) or a name set with db_scope() /
+set_db_scope() in background loops. Unscoped queries are attributed to
+the engine name.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Latency histogram bucket upper bounds (ms); the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+# Cap on distinct statements tracked per scope
+MAX_STATEMENTS_PER_SCOPE = 200
+
+# Statements longer than this are truncated in reports
+STATEMENT_PREVIEW_CHARS = 300
+
+
+class _RequestQueries:
+    """Per-request buffer; folded into the route's stats when the request ends."""
+    
+    __slots__ = ("queries", "closed")
+    
+    def __init__(self):
+        self.queries: List[tuple] = []  # (statement, elapsed_ms)
+        self.closed = False
+
+
+_scope: ContextVar[Optional[str]] = ContextVar("glassdome_db_scope", default=None)
+_request: ContextVar[Optional[_RequestQueries]] = ContextVar("glassdome_db_request", default=None)
+
+
+class _ScopeStats:
+    """Aggregated query stats for one scope."""
+    
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow_count = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.statements: Dict[str, List[float]] = {}  # stmt -> [count, total_ms, max_ms]
+        self.requests = 0
+        self.request_queries = 0
+        self.max_request_queries = 0
+    
+    def record(self, statement: str, elapsed_ms: float, slow: bool):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.slow_count += slow
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        
+        entry = self.statements.get(statement)
+        if entry is None:
+            if len(self.statements) >= MAX_STATEMENTS_PER_SCOPE:
+                statement = "<other>"
+                entry = self.statements.setdefault(statement, [0, 0.0, 0.0])
+            else:
+                entry = self.statements[statement] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += elapsed_ms
+        entry[2] = max(entry[2], elapsed_ms)
+    
+    def to_dict(self, top: int) -> Dict[str, Any]:
+        histogram = {f"<={b}ms": n for b, n in zip(LATENCY_BUCKETS_MS, self.buckets)}
+        histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] = self.buckets[-1]
+        
+        def stmt_rows(key):
+            rows = sorted(self.statements.items(), key=key, reverse=True)[:top]
+            return [
+                {
+                    "statement": stmt[:STATEMENT_PREVIEW_CHARS],
+                    "count": int(count),
+                    "total_ms": round(total, 2),
+                    "avg_ms": round(total / count, 2),
+                    "max_ms": round(mx, 2),
+                }
+                for stmt, (count, total, mx) in rows
+            ]
+        
+        result = {
+            "queries": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "slow_queries": self.slow_count,
+            "histogram": histogram,
+            "slowest_statements": stmt_rows(lambda item: item[1][2]),
+            "most_frequent_statements": stmt_rows(lambda item: item[1][0]),
+        }
+        if self.requests:
+            result["requests"] = self.requests
+            result["avg_queries_per_request"] = round(self.request_queries / self.requests, 2)
+            result["max_queries_per_request"] = self.max_request_queries
+        return result
+
+
+class DBMetrics:
+    """Process-wide query and pool metrics."""
+    
+    def __init__(self):
+        self.slow_query_ms = 200.0
+        self._lock = threading.Lock()
+        self._scopes: Dict[str, _ScopeStats] = {}
+        self._pools: Dict[str, Dict[str, Any]] = {}
+    
+    def _stats(self, scope: str) -> _ScopeStats:
+        stats = self._scopes.get(scope)
+        if stats is None:
+            stats = self._scopes.setdefault(scope, _ScopeStats())
+        return stats
+    
+    def record_query(self, default_scope: str, statement: str, elapsed_ms: float):
+        request = _request.get()
+        # Tasks spawned during a request inherit its context; once the
+        # request is finished their queries fall back to normal scoping
+        if request is not None and not request.closed:
+            # Attributed to the route once the request completes
+            request.queries.append((statement, elapsed_ms))
+            scope = "request"
+        else:
+            scope = _scope.get() or default_scope
+            slow = elapsed_ms >= self.slow_query_ms
+            with self._lock:
+                self._stats(scope).record(statement, elapsed_ms, slow)
+        
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(
+                f"Slow query ({elapsed_ms:.1f}ms, scope={scope}): "
+                f"{statement[:STATEMENT_PREVIEW_CHARS]}"
+            )
+    
+    def record_request(self, route: str, request: _RequestQueries):
+        with self._lock:
+            stats = self._stats(route)
+            for statement, elapsed_ms in request.queries:
+                stats.record(statement, elapsed_ms, elapsed_ms >= self.slow_query_ms)
+            stats.requests += 1
+            stats.request_queries += len(request.queries)
+            stats.max_request_queries = max(stats.max_request_queries, len(request.queries))
+    
+    def snapshot(self, top: int = 10) -> Dict[str, Any]:
+        with self._lock:
+            scopes = {name: stats.to_dict(top) for name, stats in self._scopes.items()}
+        pools = {}
+        for name, info in self._pools.items():
+            pool = info["pool"]
+            pools[name] = {
+                "status": pool.status(),
+                "checked_out": info["checked_out"],
+                "peak_checked_out": info["peak_checked_out"],
+                "capacity": info["capacity"],
+                "checkouts": info["checkouts"],
+                "connects": info["connects"],
+            }
+        return {"slow_query_ms": self.slow_query_ms, "scopes": scopes, "pools": pools}
+    
+    def reset(self):
+        with self._lock:
+            self._scopes.clear()
+            for info in self._pools.values():
+                info["peak_checked_out"] = info["checked_out"]
+                info["checkouts"] = 0
+                info["connects"] = 0
+
+
+db_metrics = DBMetrics()
+
+
+def instrument_engine(engine, name: str, capacity: Optional[int] = None) -> None:
+    """
+    Attach query timing and pool usage listeners to an engine.
+    
+    Args:
+        engine: AsyncEngine or Engine
+        name: Label for the engine's queries (used when no scope is set)
+        capacity: pool_size + max_overflow, if the pool is bounded
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if starts:
+            elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+            db_metrics.record_query(name, statement, elapsed_ms)
+    
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None:
+            starts = conn.info.get("query_start")
+            if starts:
+                starts.pop()
+    
+    pool_info = {
+        "pool": sync_engine.pool,
+        "capacity": capacity,
+        "checked_out": 0,
+        "peak_checked_out": 0,
+        "checkouts": 0,
+        "connects": 0,
+    }
+    db_metrics._pools[name] = pool_info
+    
+    @event.listens_for(sync_engine.pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        pool_info["connects"] += 1
+    
+    @event.listens_for(sync_engine.pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_info["checkouts"] += 1
+        pool_info["checked_out"] += 1
+        if pool_info["checked_out"] > pool_info["peak_checked_out"]:
+            pool_info["peak_checked_out"] = pool_info["checked_out"]
+        if capacity and pool_info["checked_out"] >= capacity:
+            logger.warning(f"DB pool '{name}' exhausted ({pool_info['checked_out']}/{capacity} in use)")
+    
+    @event.listens_for(sync_engine.pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        pool_info["checked_out"] = max(0, pool_info["checked_out"] - 1)
+
+
+def set_db_scope(name: str):
+    """Attribute this task's queries to `name` (e.g. at the top of a background loop)."""
+    return _scope.set(name)
+
+
+@contextmanager
+def db_scope(name: str):
+    """Attribute queries inside the block to `name`."""
+    token = _scope.set(name)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class DBMetricsMiddleware:
+    """
+    ASGI middleware attributing queries to the matched route template.
+    
+    Queries are buffered per request and folded into the route's stats
+    at the end, so queries-per-request (the N+1 signal) is measured too.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request = _RequestQueries()
+        token = _request.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request.reset(token)
+            request.closed = True
+            if request.queries:
+                route = scope.get("route")
+                # Unmatched paths share one bucket so 404 scans can't grow the table
+                path = getattr(route, "path", None) or "<unmatched>"
+                db_metrics.record_request(f"{scope.get('method', '')} {path}".strip(), request)
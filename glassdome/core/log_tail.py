@@ -0,0 +1,233 @@
+"""
+Shared log file tailer
+
+One LogTailer per file follows it by byte offset and fans new text out to
+any number of subscribers (WebSocket clients) through per-subscriber
+queues, so connected clients cost a queue each rather than their own file
+polling. "Last N lines" is served by seeking backwards from the end of the
+file in blocks instead of reading the whole file.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# Block size for reverse seeking and line counting
+BLOCK_SIZE = 64 * 1024
+
+# How often the follower checks the file for new data (seconds)
+DEFAULT_POLL_INTERVAL = 0.25
+
+# Chunks queued per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+# Upper bound on a single read while following (bytes)
+MAX_READ_BYTES = 1024 * 1024
+
+
+def read_last_lines(path: Union[str, Path], lines: int) -> List[str]:
+    """
+    Return the last `lines` lines of a file, reading backwards in blocks.
+    
+    Only the blocks containing those lines are read, so cost depends on
+    the size of the tail, not the size of the file.
+    """
+    if lines <= 0:
+        return []
+    
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # One extra newline: the final line normally ends with one
+        while position > 0 and data.count(b"\n") <= lines:
+            read_size = min(BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    
+    text = data.decode("utf-8", errors="replace")
+    return text.splitlines(keepends=True)[-lines:]
+
+
+class LogTailer:
+    """
+    Follow a log file and broadcast appended text to subscribers.
+    
+    The follower task runs only while there are subscribers. Truncation
+    and rotation (size shrinks or inode changes) restart from offset 0.
+    """
+    
+    def __init__(self, path: Union[str, Path], poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._offset = 0
+        self._inode: Optional[int] = None
+        
+        # Incremental line count (see total_lines)
+        self._counted_offset = 0
+        self._counted_inode: Optional[int] = None
+        self._line_count = 0
+        self._count_lock = threading.Lock()
+        
+        self.dropped_chunks = 0
+    
+    # -------------------------------------------------------------------------
+    # Tail / line count
+    # -------------------------------------------------------------------------
+    
+    def tail(self, lines: int) -> List[str]:
+        """Last `lines` lines of the file ([] if it does not exist)."""
+        if not self.path.exists():
+            return []
+        return read_last_lines(self.path, lines)
+    
+    def total_lines(self) -> int:
+        """
+        Number of lines in the file.
+        
+        The first call scans the file once; later calls only count the
+        bytes appended since the previous call.
+        """
+        with self._count_lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                self._counted_offset, self._line_count = 0, 0
+                return 0
+            
+            if stat.st_ino != self._counted_inode or stat.st_size < self._counted_offset:
+                self._counted_inode = stat.st_ino
+                self._counted_offset = 0
+                self._line_count = 0
+            
+            if stat.st_size > self._counted_offset:
+                with open(self.path, "rb") as f:
+                    f.seek(self._counted_offset)
+                    while True:
+                        block = f.read(BLOCK_SIZE)
+                        if not block:
+                            break
+                        self._line_count += block.count(b"\n")
+                    self._counted_offset = f.tell()
+            return self._line_count
+    
+    # -------------------------------------------------------------------------
+    # Subscriptions
+    # -------------------------------------------------------------------------
+    
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber; new text arrives on the returned queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._seek_to_end()
+            self._task = asyncio.create_task(self._follow())
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a subscriber; the follower stops with the last one."""
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task and not self._task.done():
+            self._task.cancel()
+            self._task = None
+    
+    def _publish(self, text: str) -> None:
+        for queue in list(self._subscribers):
+            if queue.full():
+                # Slow client: drop its oldest chunk rather than block others
+                queue.get_nowait()
+                self.dropped_chunks += 1
+            queue.put_nowait(text)
+    
+    # -------------------------------------------------------------------------
+    # Follower
+    # -------------------------------------------------------------------------
+    
+    def _seek_to_end(self) -> None:
+        try:
+            stat = self.path.stat()
+            self._offset, self._inode = stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            self._offset, self._inode = 0, None
+    
+    def _read_new(self) -> Optional[str]:
+        """Read text appended since the last call (runs in a worker thread)."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._offset, self._inode = 0, None
+            return None
+        
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Rotated or truncated
+            self._inode = stat.st_ino
+            self._offset = 0
+        
+        if stat.st_size <= self._offset:
+            return None
+        
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(min(stat.st_size - self._offset, MAX_READ_BYTES))
+        
+        # Hold back a trailing partial line until it is complete
+        end = data.rfind(b"\n")
+        if end == -1:
+            if len(data) < MAX_READ_BYTES:
+                return None
+        else:
+            data = data[:end + 1]
+        self._offset += len(data)
+        return data.decode("utf-8", errors="replace")
+    
+    async def _follow(self) -> None:
+        while self._subscribers:
+            try:
+                text = await asyncio.to_thread(self._read_new)
+                if text:
+                    self._publish(text)
+                    continue  # More may be waiting after a capped read
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Log tail error on {self.path}: {e}")
+            await asyncio.sleep(self.poll_interval)
+    
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "path": str(self.path),
+            "subscribers": self.subscriber_count,
+            "following": self._task is not None and not self._task.done(),
+            "offset": self._offset,
+            "dropped_chunks": self.dropped_chunks,
+        }
+
+
+# One tailer per file, shared across requests
+_tailers: Dict[str, LogTailer] = {}
+
+
+def get_log_tailer(path: Union[str, Path]) -> LogTailer:
+    """Get the shared tailer for a log file"""
+    key = str(Path(path).resolve())
+    tailer = _tailers.get(key)
+    if tailer is None:
+        tailer = _tailers[key] = LogTailer(path)
+    return tailer
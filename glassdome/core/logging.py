@@ -19,9 +19,11 @@ import json
 import sys
 import socket
 import os
+import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Deque, List
 import threading
 
 # Thread-local storage for request context
@@ -155,9 +157,10 @@ class LogstashHandler(logging.Handler):
     useful for containerized deployments.
     
     The handler:
-    - Sends JSON-formatted logs over TCP
-    - Automatically reconnects on connection failure
-    - Buffers logs during connection issues
+    - Formats records on the calling thread and enqueues them in O(1)
+    - Ships batches of newline-delimited JSON from a background thread
+    - Reconnects with exponential backoff when Logstash is unreachable
+    - Drops the oldest records (and counts them) when the buffer is full
     - Adds metadata (hostname, application, etc.)
     """
     
@@ -167,18 +170,35 @@ class LogstashHandler(logging.Handler):
         port: int = 5045,
         timeout: float = 5.0,
         max_buffer: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_backoff: float = 30.0,
     ):
         super().__init__()
         self.host = host
         self.port = port
         self.timeout = timeout
         self.max_buffer = max_buffer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backoff = max_backoff
         self.socket: Optional[socket.socket] = None
-        self.buffer: list = []
-        self._lock = threading.Lock()
+        self.buffer: Deque[str] = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._closing = False
+        self._sending = False
+        self._retry_at = 0.0
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
         self._hostname = socket.gethostname()
         self._worker_id = os.getenv("WORKER_ID", "main")
         self._glassdome_mode = os.getenv("GLASSDOME_MODE", "backend")
+        
+        # Delivery counters (see get_stats)
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.failed_sends = 0
+        self.reconnects = 0
     
     def _connect(self) -> bool:
         """Establish connection to Logstash."""
@@ -192,34 +212,83 @@ class LogstashHandler(logging.Handler):
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(self.timeout)
             self.socket.connect((self.host, self.port))
+            self.reconnects += 1
             return True
         except Exception:
             self.socket = None
             return False
     
-    def _send(self, message: str) -> bool:
-        """Send a message to Logstash."""
+    def _send(self, messages: List[str]) -> bool:
+        """Send a batch of messages to Logstash in a single write."""
         if not self.socket:
             if not self._connect():
                 return False
         
         try:
             # Logstash expects newline-delimited JSON
-            data = (message + "\n").encode('utf-8')
+            data = ("\n".join(messages) + "\n").encode('utf-8')
             self.socket.sendall(data)
             return True
         except Exception:
+            try:
+                self.socket.close()
+            except Exception:
+                pass
             self.socket = None
             return False
     
-    def _flush_buffer(self):
-        """Attempt to send buffered messages."""
-        while self.buffer:
-            message = self.buffer[0]
-            if self._send(message):
-                self.buffer.pop(0)
-            else:
-                break
+    def _ensure_worker(self):
+        """Start the sender thread (lazily, so forked workers get their own)."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._sender_loop,
+                    name="logstash-sender",
+                    daemon=True,
+                )
+                self._worker.start()
+    
+    def _sender_loop(self):
+        """Background loop: drain the buffer in batches, backing off on failure."""
+        backoff = 0.0
+        while True:
+            with self._cond:
+                while not self.buffer and not self._closing:
+                    self._cond.wait(self.flush_interval)
+                if not self.buffer and self._closing:
+                    return
+                batch = [self.buffer.popleft() for _ in range(min(self.batch_size, len(self.buffer)))]
+                self._sending = True
+            
+            if self._send(batch):
+                with self._cond:
+                    self.sent_count += len(batch)
+                    self._sending = False
+                    self._retry_at = 0.0
+                backoff = 0.0
+                continue
+            
+            self.failed_sends += 1
+            with self._cond:
+                self._sending = False
+                # Put the batch back at the front, keeping only what fits
+                room = self.max_buffer - len(self.buffer)
+                keep = batch[-room:] if room > 0 else []
+                self.dropped_count += len(batch) - len(keep)
+                self.buffer.extendleft(reversed(keep))
+                
+                if self._closing:
+                    return
+                backoff = min(self.max_backoff, backoff * 2 if backoff else 0.5)
+                # emit() notifies on every record; only close() may cut the wait short
+                self._retry_at = time.monotonic() + backoff
+                while not self._closing:
+                    remaining = self._retry_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
     
     def emit(self, record: logging.LogRecord):
         """Emit a log record to Logstash."""
@@ -267,29 +336,71 @@ class LogstashHandler(logging.Handler):
             
             message = json.dumps(log_entry)
             
-            with self._lock:
-                # Try to flush buffer first
-                self._flush_buffer()
-                
-                # Send current message
-                if not self._send(message):
-                    # Buffer on failure (with limit)
-                    if len(self.buffer) < self.max_buffer:
-                        self.buffer.append(message)
+            with self._cond:
+                if self._closing:
+                    return
+                # Under backpressure drop the oldest record rather than block
+                if len(self.buffer) >= self.max_buffer:
+                    self.buffer.popleft()
+                    self.dropped_count += 1
+                self.buffer.append(message)
+                self._cond.notify()
+            
+            self._ensure_worker()
         
         except Exception:
             # Don't let logging errors break the application
             self.handleError(record)
     
+    def get_stats(self) -> Dict[str, int]:
+        """Get delivery counters for monitoring."""
+        return {
+            "queued": len(self.buffer),
+            "sent": self.sent_count,
+            "dropped": self.dropped_count,
+            "failed_sends": self.failed_sends,
+            "connections": self.reconnects,
+        }
+    
+    def _unreachable(self) -> bool:
+        """True while backing off or reconnecting after a failed send."""
+        # _retry_at is cleared by a successful send
+        return self._retry_at > 0 and (self._retry_at > time.monotonic() or self.socket is None)
+    
+    def flush(self, timeout: float = None):
+        """
+        Wait (up to timeout) for queued and in-flight records to be shipped.
+        
+        Returns at once while Logstash is unreachable: the records stay
+        queued for the sender's next attempt.
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while self._worker is not None and self._worker.is_alive():
+            with self._cond:
+                if not self.buffer and not self._sending:
+                    return
+                if self._unreachable():
+                    return
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(0.01)
+    
     def close(self):
-        """Close the handler and socket."""
-        with self._lock:
-            if self.socket:
-                try:
-                    self.socket.close()
-                except Exception:
-                    pass
-                self.socket = None
+        """Flush what we can, stop the sender thread and close the socket."""
+        # One deadline for flush and join together
+        deadline = time.monotonic() + self.timeout
+        self.flush()
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join(max(0.0, deadline - time.monotonic()))
+        if self.socket:
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
         super().close()
 
 
@@ -16,6 +16,7 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import getpass
 import os
+import time
 
 from glassdome.core.paths import (
     SECRETS_DIR,
@@ -24,12 +25,17 @@ from glassdome.core.paths import (
     SECRETS_REGISTRY_PATH,
     ENV_FILE,
 )
+from glassdome.core.secrets_backend import SecretCache
 
 
 class SecretsManager:
     """
     Manages secrets securely using OS-native keyring.
     Falls back to encrypted file storage if keyring is unavailable.
+    
+    Decrypted values are held in an in-process TTL cache, the fallback file
+    is only re-parsed when its mtime changes, and the Fernet cipher is built
+    once per master key.
     """
     
     SERVICE_NAME = "glassdome"
@@ -38,7 +44,27 @@ class SecretsManager:
     
     def __init__(self):
         self._master_key: Optional[bytes] = None
+        self._fernet: Optional[Fernet] = None
+        self._fernet_key: Optional[bytes] = None
         self._use_keyring = self._check_keyring_available()
+        self._cache = SecretCache()
+        self._fallback_secrets: Optional[Dict[str, str]] = None
+        self._fallback_mtime: Optional[float] = None
+    
+    def _get_fernet(self) -> Fernet:
+        """Get the cipher for the loaded master key (built once per key)."""
+        if self._fernet is None or self._fernet_key != self._master_key:
+            self._fernet = Fernet(self._master_key)
+            self._fernet_key = self._master_key
+        return self._fernet
+    
+    def invalidate_cache(self, key: str = None):
+        """Drop cached secret values (one key, or all when key is None)."""
+        self._cache.invalidate(key)
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """Cache hit/miss counts and backend lookup latency."""
+        return self._cache.stats()
         
     def _check_keyring_available(self) -> bool:
         """Check if keyring backend is available and functional."""
@@ -154,6 +180,7 @@ class SecretsManager:
         if self._use_keyring:
             try:
                 keyring.set_password(self.SERVICE_NAME, key, value)
+                self._cache.invalidate(key)
                 return True
             except Exception as e:
                 print(f"⚠️  Keyring storage failed: {e}, using fallback")
@@ -161,13 +188,14 @@ class SecretsManager:
         
         # Fallback: Encrypted file storage
         self._get_master_key()
-        fernet = Fernet(self._master_key)
+        fernet = self._get_fernet()
         encrypted_value = fernet.encrypt(value.encode())
         
         # Load existing secrets
         secrets = self._load_fallback_secrets()
         secrets[key] = base64.b64encode(encrypted_value).decode()
         self._save_fallback_secrets(secrets)
+        self._cache.invalidate(key)
         
         return True
     
@@ -192,6 +220,20 @@ class SecretsManager:
         if env_value:
             return env_value
         
+        found, value = self._cache.lookup(key)
+        if found:
+            return value
+        
+        start = time.monotonic()
+        value = self._lookup_secret(key)
+        self._cache.record_backend_call(time.monotonic() - start)
+        if value is not None:
+            # Misses aren't cached: the master key may be loaded later in the session
+            self._cache.put(key, value)
+        return value
+    
+    def _lookup_secret(self, key: str) -> Optional[str]:
+        """Look a secret up in keyring, then the encrypted fallback file."""
         if self._use_keyring:
             try:
                 value = keyring.get_password(self.SERVICE_NAME, key)
@@ -226,13 +268,14 @@ class SecretsManager:
                 return None
             
             encrypted_value = base64.b64decode(secrets[key])
-            fernet = Fernet(self._master_key)
-            return fernet.decrypt(encrypted_value).decode()
+            return self._get_fernet().decrypt(encrypted_value).decode()
         except Exception:
             return None
     
     def delete_secret(self, key: str) -> bool:
         """Delete a secret."""
+        self._cache.invalidate(key)
+        
         if self._use_keyring:
             try:
                 keyring.delete_password(self.SERVICE_NAME, key)
@@ -282,13 +325,20 @@ class SecretsManager:
         return sorted(keys)
     
     def _load_fallback_secrets(self) -> Dict[str, str]:
-        """Load secrets from encrypted fallback file."""
-        if not self.FALLBACK_STORE_PATH.exists():
+        """Load secrets from encrypted fallback file (re-read only when it changes)."""
+        try:
+            mtime = self.FALLBACK_STORE_PATH.stat().st_mtime
+        except OSError:
             return {}
         
+        if self._fallback_secrets is not None and mtime == self._fallback_mtime:
+            return dict(self._fallback_secrets)
+        
         try:
             with open(self.FALLBACK_STORE_PATH) as f:
-                return json.load(f)
+                self._fallback_secrets = json.load(f)
+            self._fallback_mtime = mtime
+            return dict(self._fallback_secrets)
         except Exception:
             return {}
     
@@ -297,6 +347,7 @@ class SecretsManager:
         SECRETS_DIR.mkdir(parents=True, exist_ok=True)
         with open(self.FALLBACK_STORE_PATH, 'w') as f:
             json.dump(secrets, f, indent=2)
+        self._fallback_secrets = None
         
         # Update registry
         with open(SECRETS_REGISTRY_PATH, 'w') as f:
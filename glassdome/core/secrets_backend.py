@@ -7,12 +7,84 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Iterable, Tuple
 import os
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Default cache lifetimes (seconds). Missing keys are cached for a shorter
+# period so a newly added secret is picked up reasonably quickly.
+SECRET_CACHE_TTL = 300.0
+SECRET_CACHE_NEGATIVE_TTL = 60.0
+
+
+class SecretCache:
+    """
+    Thread-safe in-process TTL cache for secret values.
+    
+    Also tracks hit/miss counts and backend read latency so callers can
+    see how often the cache saves a round trip.
+    """
+    
+    def __init__(self, ttl: float = SECRET_CACHE_TTL, negative_ttl: float = SECRET_CACHE_NEGATIVE_TTL):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, Tuple[Optional[str], float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.backend_calls = 0
+        self.backend_time = 0.0
+        self.backend_max = 0.0
+    
+    def lookup(self, key: str) -> Tuple[bool, Optional[str]]:
+        """Return (found, value); found is False for absent or expired entries."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self.hits += 1
+            return True, entry[0]
+        self.misses += 1
+        return False, None
+    
+    def put(self, key: str, value: Optional[str]):
+        """Cache a value (None means 'known missing')."""
+        ttl = self.ttl if value is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+    
+    def invalidate(self, key: str = None):
+        """Drop one key, or everything when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+    
+    def record_backend_call(self, elapsed: float):
+        """Record the latency of one backend read."""
+        with self._lock:
+            self.backend_calls += 1
+            self.backend_time += elapsed
+            self.backend_max = max(self.backend_max, elapsed)
+    
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "backend_calls": self.backend_calls,
+            "backend_avg_ms": (self.backend_time / self.backend_calls * 1000) if self.backend_calls else 0.0,
+            "backend_max_ms": self.backend_max * 1000,
+        }
+
 
 class SecretsBackend(ABC):
     """Abstract base class for secrets backends."""
@@ -22,6 +94,14 @@ class SecretsBackend(ABC):
         """Get a secret value by key."""
         pass
     
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get several secrets at once. Backends override this to batch reads."""
+        return {key: self.get(key) for key in keys}
+    
+    def invalidate(self, key: str = None):
+        """Drop cached values (no-op for uncached backends)."""
+        pass
+    
     @abstractmethod
     def set(self, key: str, value: str) -> bool:
         """Set a secret value."""
@@ -103,13 +183,17 @@ class LocalSecretsBackend(SecretsBackend):
     
     def _get_manager(self):
         if self._manager is None:
-            from glassdome.core.secrets import SecretsManager
-            self._manager = SecretsManager()
+            # Share the process-wide manager so its secret cache is shared too
+            from glassdome.core.secrets import get_secrets_manager
+            self._manager = get_secrets_manager()
         return self._manager
     
     def get(self, key: str) -> Optional[str]:
         return self._get_manager().get_secret(key)
     
+    def invalidate(self, key: str = None):
+        self._get_manager().invalidate_cache(key)
+    
     def set(self, key: str, value: str) -> bool:
         return self._get_manager().set_secret(key, value)
     
@@ -139,14 +223,23 @@ class VaultSecretsBackend(SecretsBackend):
         VAULT_ROLE_ID: AppRole role ID
         VAULT_SECRET_ID: AppRole secret ID
         VAULT_MOUNT_POINT: KV secrets engine mount (default: glassdome)
+    
+    Reads are cached in-process for cache_ttl seconds; writes and deletes
+    invalidate the affected key. Each secret lives at its own KV path, so
+    get_many() batches a group of keys by reading their paths concurrently
+    over the one authenticated client.
     """
     
+    # Upper bound on concurrent KV reads issued by get_many()
+    MAX_PARALLEL_READS = 8
+    
     def __init__(self, 
                  addr: str = None,
                  role_id: str = None,
                  secret_id: str = None,
                  mount_point: str = "glassdome",
-                 verify: bool = None):
+                 verify: bool = None,
+                 cache_ttl: float = SECRET_CACHE_TTL):
         self.addr = addr or os.environ.get("VAULT_ADDR")
         self.role_id = role_id or os.environ.get("VAULT_ROLE_ID")
         self.secret_id = secret_id or os.environ.get("VAULT_SECRET_ID")
@@ -158,6 +251,7 @@ class VaultSecretsBackend(SecretsBackend):
         else:
             self.verify = verify
         self._client = None
+        self._cache = SecretCache(ttl=cache_ttl)
     
     def _get_client(self):
         if self._client is None:
@@ -185,17 +279,73 @@ class VaultSecretsBackend(SecretsBackend):
         
         return self._client
     
-    def get(self, key: str) -> Optional[str]:
+    def _read(self, key: str) -> Tuple[bool, Optional[str]]:
+        """
+        Read one secret from Vault.
+        
+        Returns (ok, value); ok is False on errors that shouldn't be cached.
+        """
+        start = time.monotonic()
         try:
             client = self._get_client()
             result = client.secrets.kv.v2.read_secret_version(
                 path=key,
                 mount_point=self.mount_point
             )
-            return result['data']['data'].get('value')
+            return True, result['data']['data'].get('value')
         except Exception as e:
             logger.debug(f"Vault get({key}) failed: {e}")
-            return None
+            # A missing path is a definite answer; anything else may be transient
+            return type(e).__name__ == "InvalidPath", None
+        finally:
+            self._cache.record_backend_call(time.monotonic() - start)
+    
+    def get(self, key: str) -> Optional[str]:
+        found, value = self._cache.lookup(key)
+        if found:
+            return value
+        
+        ok, value = self._read(key)
+        if ok:
+            self._cache.put(key, value)
+        return value
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        results: Dict[str, Optional[str]] = {}
+        pending = []
+        for key in dict.fromkeys(keys):
+            found, value = self._cache.lookup(key)
+            if found:
+                results[key] = value
+            else:
+                pending.append(key)
+        
+        if not pending:
+            return results
+        
+        try:
+            # Authenticate once up front rather than racing in the workers
+            self._get_client()
+        except Exception as e:
+            logger.debug(f"Vault get_many() failed: {e}")
+            results.update({key: None for key in pending})
+            return results
+        
+        workers = min(self.MAX_PARALLEL_READS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for key, (ok, value) in zip(pending, pool.map(self._read, pending)):
+                if ok:
+                    self._cache.put(key, value)
+                results[key] = value
+        
+        return results
+    
+    def invalidate(self, key: str = None):
+        self._cache.invalidate(key)
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """Cache hit/miss counts and Vault read latency."""
+        return self._cache.stats()
     
     def set(self, key: str, value: str) -> bool:
         try:
@@ -205,6 +355,7 @@ class VaultSecretsBackend(SecretsBackend):
                 secret={'value': value},
                 mount_point=self.mount_point
             )
+            self._cache.invalidate(key)
             return True
         except Exception as e:
             logger.error(f"Vault set({key}) failed: {e}")
@@ -217,6 +368,7 @@ class VaultSecretsBackend(SecretsBackend):
                 path=key,
                 mount_point=self.mount_point
             )
+            self._cache.invalidate(key)
             return True
         except Exception as e:
             logger.error(f"Vault delete({key}) failed: {e}")
@@ -283,6 +435,28 @@ class ChainedSecretsBackend(SecretsBackend):
                 continue
         return None
     
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        results: Dict[str, Optional[str]] = {}
+        remaining = list(dict.fromkeys(keys))
+        for backend in self.backends:
+            if not remaining:
+                break
+            try:
+                found = backend.get_many(remaining)
+            except Exception as e:
+                logger.debug(f"Backend {backend.__class__.__name__} failed for batch: {e}")
+                continue
+            for key, value in found.items():
+                if value is not None:
+                    results[key] = value
+            remaining = [key for key in remaining if key not in results]
+        results.update({key: None for key in remaining})
+        return results
+    
+    def invalidate(self, key: str = None):
+        for backend in self.backends:
+            backend.invalidate(key)
+    
     def set(self, key: str, value: str) -> bool:
         # Write to first backend that supports writes
         for backend in self.backends:
@@ -374,6 +548,16 @@ def reset_backend():
 _vault_client: Optional[VaultSecretsBackend] = None
 
 
+def get_vault_backend() -> VaultSecretsBackend:
+    """Get the shared Vault backend (one client and one secret cache per process)."""
+    global _vault_client
+    
+    if _vault_client is None:
+        _vault_client = VaultSecretsBackend()
+    
+    return _vault_client
+
+
 def get_secret(key: str, default: str = None) -> Optional[str]:
     """
     Get a secret from Vault. VAULT ONLY - no env fallback.
@@ -408,6 +592,32 @@ def get_secret(key: str, default: str = None) -> Optional[str]:
     return value
 
 
+def get_secrets(keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Get a group of secrets from Vault in one batched call.
+    
+    Args:
+        keys: Secret keys to fetch
+    
+    Returns:
+        Dict mapping each key to its value (None if not found)
+    """
+    return get_vault_backend().get_many(keys)
+
+
+def invalidate_secret_cache(key: str = None) -> None:
+    """
+    Drop cached secret values so the next read goes to Vault.
+    
+    Args:
+        key: Secret key to drop, or None to clear the whole cache
+    """
+    if _vault_client is not None:
+        _vault_client.invalidate(key)
+    if _backend is not None:
+        _backend.invalidate(key)
+
+
 def set_secret(key: str, value: str) -> bool:
     """
     Store a secret in Vault.
@@ -10,14 +10,14 @@ from __future__ import annotations
 
 import os
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
 # Cache the backend type and Vault client
 _backend_type: Optional[str] = None
 _env_loaded: bool = False
-_vault_backend: Optional[Any] = None  # Cached VaultSecretsBackend instance
+_vault_backend: Optional[Any] = None  # Shared VaultSecretsBackend instance (caches reads)
 
 
 def _load_env_file() -> None:
@@ -79,8 +79,8 @@ def get_secret(key: str) -> Optional[str]:
         # HashiCorp Vault - use cached client
         global _vault_backend
         if _vault_backend is None:
-            from glassdome.core.secrets_backend import VaultSecretsBackend
-            _vault_backend = VaultSecretsBackend()
+            from glassdome.core.secrets_backend import get_vault_backend
+            _vault_backend = get_vault_backend()
         return _vault_backend.get(key)
     
     elif backend_type == "local":
@@ -92,6 +92,28 @@ def get_secret(key: str) -> Optional[str]:
         raise ValueError(f"Unknown SECRETS_BACKEND: {backend_type}")
 
 
+def get_secrets(keys: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Get several secret values in one batched lookup.
+    
+    Args:
+        keys: Secret key names
+        
+    Returns:
+        Dict mapping each key to its value (None if not found)
+    """
+    backend_type = get_backend_type()
+    
+    if backend_type == "vault":
+        global _vault_backend
+        if _vault_backend is None:
+            from glassdome.core.secrets_backend import get_vault_backend
+            _vault_backend = get_vault_backend()
+        return _vault_backend.get_many(keys)
+    
+    return {key: get_secret(key) for key in keys}
+
+
 def ensure_security_context() -> None:
     """
     Ensure secrets are accessible. Called at process startup.
@@ -114,8 +136,8 @@ def ensure_security_context() -> None:
         # Verify Vault is accessible - use cached client
         global _vault_backend
         if _vault_backend is None:
-            from glassdome.core.secrets_backend import VaultSecretsBackend
-            _vault_backend = VaultSecretsBackend()
+            from glassdome.core.secrets_backend import get_vault_backend
+            _vault_backend = get_vault_backend()
         if not _vault_backend.is_available():
             raise RuntimeError(
                 "Vault backend configured but not available.\n"
@@ -6,9 +6,9 @@ Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
-from glassdome.knowledge.query_engine import QueryEngine
+from glassdome.knowledge.query_engine import QueryEngine, get_query_engine
 from glassdome.knowledge.confusion_detector import ConfusionDetector
 from glassdome.knowledge.rag_helper import RAGHelper
 
-__all__ = ["QueryEngine", "ConfusionDetector", "RAGHelper"]
+__all__ = ["QueryEngine", "get_query_engine", "ConfusionDetector", "RAGHelper"]
 
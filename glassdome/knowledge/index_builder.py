@@ -22,6 +22,7 @@ except ImportError:
     print("Install with: pip install sentence-transformers faiss-cpu")
 
 from glassdome.core.paths import PROJECT_ROOT, RAG_INDEX_DIR
+from glassdome.knowledge.vector_store import build_partitions, write_document_store
 
 
 class IndexBuilder:
@@ -96,6 +97,9 @@ class IndexBuilder:
         # Save metadata
         self._save_metadata()
         
+        # Per-type ANN partitions + memory-mapped document store (QueryEngine)
+        self._build_partitions()
+        
         print(f"\n✅ Index built successfully!")
         print(f"   Total documents: {len(self.documents)}")
         print(f"   Index location: {self.index_path}")
@@ -570,6 +574,23 @@ class IndexBuilder:
             }, f, indent=2)
         
         print(f"   💾 Saved metadata to {metadata_file}")
+    
+    def _build_partitions(self):
+        """Build per-type ANN indexes and the memory-mapped document store"""
+        if not self.embeddings:
+            return
+        
+        print("\n🔍 Building partitioned ANN indexes...")
+        write_document_store(self.index_path, self.documents)
+        manifest = build_partitions(
+            self.index_path,
+            np.array(self.embeddings).astype('float32'),
+            [doc['type'] for doc in self.documents],
+            self.model_name,
+            self.dimension,
+        )
+        for name, info in manifest['partitions'].items():
+            print(f"   ✅ {name}: {info['count']} vectors ({info['kind']})")
 
 
 if __name__ == "__main__":
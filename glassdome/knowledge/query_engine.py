@@ -7,62 +7,196 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 try:
-    from sentence_transformers import SentenceTransformer
     import faiss
     import numpy as np
 except ImportError:
-    print("WARNING: sentence-transformers or faiss not installed")
+    print("WARNING: faiss or numpy not installed")
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    # Only needed to load the default model; an injected model works without it
+    print("WARNING: sentence-transformers not installed")
 
 from glassdome.core.paths import PROJECT_ROOT, RAG_INDEX_DIR
+from glassdome.knowledge.vector_store import (
+    ALL_PARTITION,
+    DocumentStore,
+    build_partitions,
+    load_partitions,
+    read_manifest,
+    write_document_store,
+)
+
+# Query embeddings kept in the LRU cache
+EMBEDDING_CACHE_SIZE = 1024
 
 
 class QueryEngine:
-    """Query RAG knowledge base"""
+    """
+    Query RAG knowledge base
+    
+    Searches per-document-type ANN partitions (see vector_store.py), so a
+    type filter always returns up to top_k hits of that type. The embedding
+    model is loaded on first use; repeated queries reuse cached embeddings.
+    """
     
-    def __init__(self, index_path: str = None, project_root: str = None):
+    def __init__(self, index_path: str = None, project_root: str = None, model=None):
         self.project_root = Path(project_root) if project_root else PROJECT_ROOT
         self.index_path = Path(index_path) if index_path else RAG_INDEX_DIR
         
+        self._model = model
+        self._model_lock = threading.Lock()
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
         # Load index and metadata
         self._load_index()
-        self._load_metadata()
-        
+    
     def _load_index(self):
-        """Load FAISS index"""
+        """Load partition indexes and the memory-mapped document store"""
+        manifest = read_manifest(self.index_path)
+        if manifest is None:
+            manifest = self._upgrade_legacy_index()
+        
+        self.model_name = manifest['model_name']
+        self.dimension = manifest['dimension']
+        self.partitions = load_partitions(self.index_path, manifest)
+        self.documents = DocumentStore(self.index_path)
+        print(f"✅ Loaded {len(self.documents)} documents in {len(self.partitions)} partitions")
+    
+    def _upgrade_legacy_index(self) -> Dict[str, Any]:
+        """Convert faiss.index + metadata.json (flat, single index) to partitions"""
         index_file = self.index_path / "faiss.index"
+        metadata_file = self.index_path / "metadata.json"
         
         if not index_file.exists():
             raise FileNotFoundError(
                 f"RAG index not found at {index_file}. "
                 f"Run 'python -m glassdome.knowledge.index_builder' first."
             )
-        
-        self.index = faiss.read_index(str(index_file))
-        print(f"✅ Loaded FAISS index ({self.index.ntotal} vectors)")
-        
-    def _load_metadata(self):
-        """Load document metadata"""
-        metadata_file = self.index_path / "metadata.json"
-        
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata not found at {metadata_file}")
         
+        print("Converting legacy RAG index to partitioned ANN index...")
+        flat = faiss.read_index(str(index_file))
         with open(metadata_file, 'r') as f:
             data = json.load(f)
-            self.documents = data['documents']
-            self.model_name = data['model_name']
-            self.dimension = data['dimension']
         
-        # Load embedding model
-        print(f"Loading embedding model: {self.model_name}...")
-        self.model = SentenceTransformer(self.model_name)
+        documents = data['documents']
+        write_document_store(self.index_path, documents)
+        return build_partitions(
+            self.index_path,
+            flat.reconstruct_n(0, flat.ntotal),
+            [doc['type'] for doc in documents],
+            data['model_name'],
+            data['dimension'],
+        )
+    
+    # ─────────────────────────────────────────────────────
+    # Embeddings
+    # ─────────────────────────────────────────────────────
+    
+    @property
+    def model(self):
+        """Embedding model, loaded on first use"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    print(f"Loading embedding model: {self.model_name}...")
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+    
+    def warm(self):
+        """Load the embedding model now (e.g. in a background thread at startup)"""
+        self.model
+    
+    def encode(self, queries: Sequence[str]) -> "np.ndarray":
+        """
+        Embeddings for queries, one row each
+        
+        Cached embeddings are reused; the rest are encoded in one batch.
+        """
+        vectors: List[Optional[np.ndarray]] = []
+        missing: Dict[str, List[int]] = {}
+        with self._cache_lock:
+            for i, query in enumerate(queries):
+                vector = self._cache.get(query)
+                if vector is not None:
+                    self._cache.move_to_end(query)
+                    self.cache_hits += 1
+                else:
+                    missing.setdefault(query, []).append(i)
+                vectors.append(vector)
         
-        print(f"✅ Loaded {len(self.documents)} documents")
+        if missing:
+            texts = list(missing)
+            encoded = self.model.encode(texts, convert_to_numpy=True).astype('float32')
+            with self._cache_lock:
+                for text, vector in zip(texts, encoded):
+                    self.cache_misses += 1
+                    self._cache[text] = vector
+                    self._cache.move_to_end(text)
+                    for i in missing[text]:
+                        vectors[i] = vector
+                while len(self._cache) > EMBEDDING_CACHE_SIZE:
+                    self._cache.popitem(last=False)
         
+        return np.vstack(vectors).astype('float32')
+    
+    # ─────────────────────────────────────────────────────
+    # Search
+    # ─────────────────────────────────────────────────────
+    
+    def _search_vectors(
+        self,
+        vectors: "np.ndarray",
+        top_k: int,
+        filter_type: Optional[str] = None,
+        min_similarity: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Search one partition with a batch of query vectors"""
+        index = self.partitions.get(filter_type or ALL_PARTITION)
+        if index is None or top_k <= 0:
+            # No documents of this type
+            return [[] for _ in range(len(vectors))]
+        
+        distances, indices = index.search(vectors, top_k)
+        
+        all_results = []
+        for row_distances, row_indices in zip(distances, indices):
+            results = []
+            for dist, idx in zip(row_distances, row_indices):
+                if idx == -1:  # No more results
+                    break
+                
+                # Convert L2 distance to similarity score (0-1)
+                # Lower distance = higher similarity
+                similarity = 1 / (1 + dist)
+                
+                if similarity < min_similarity:
+                    continue
+                
+                doc = self.documents.get(int(idx))
+                results.append({
+                    'content': doc['content'],
+                    'source': doc['source'],
+                    'type': doc['type'],
+                    'metadata': doc['metadata'],
+                    'similarity': float(similarity),
+                    'distance': float(dist)
+                })
+            all_results.append(results)
+        return all_results
+    
     def search(
         self,
         query: str,
@@ -78,49 +212,28 @@ class QueryEngine:
             top_k: Number of results to return
             filter_type: Filter by document type (markdown, code, session_log, git_commit)
             min_similarity: Minimum similarity threshold (0-1)
-            
+        
         Returns:
             List of relevant documents with scores
         """
-        # Generate query embedding
-        query_embedding = self.model.encode(query, convert_to_numpy=True)
-        query_embedding = query_embedding.reshape(1, -1).astype('float32')
-        
-        # Search FAISS index
-        distances, indices = self.index.search(query_embedding, top_k * 2)  # Get more, filter later
-        
-        # Format results
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx == -1:  # No more results
-                break
-            
-            doc = self.documents[idx]
-            
-            # Filter by type if specified
-            if filter_type and doc['type'] != filter_type:
-                continue
-            
-            # Convert L2 distance to similarity score (0-1)
-            # Lower distance = higher similarity
-            similarity = 1 / (1 + dist)
-            
-            if similarity < min_similarity:
-                continue
-            
-            results.append({
-                'content': doc['content'],
-                'source': doc['source'],
-                'type': doc['type'],
-                'metadata': doc['metadata'],
-                'similarity': float(similarity),
-                'distance': float(dist)
-            })
-            
-            if len(results) >= top_k:
-                break
-        
-        return results
+        return self.search_many([query], top_k, filter_type, min_similarity)[0]
+    
+    def search_many(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        filter_type: Optional[str] = None,
+        min_similarity: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries at once
+        
+        All queries are encoded in one batch and searched in one index
+        call. Returns one result list per query, in order.
+        """
+        if not queries:
+            return []
+        return self._search_vectors(self.encode(queries), top_k, filter_type, min_similarity)
     
     def search_by_error(self, error_message: str, top_k: int = 3) -> List[Dict]:
         """
@@ -128,19 +241,13 @@ class QueryEngine:
         
         Focuses on session logs and code that might explain the error.
         """
+        vectors = self.encode([f"Error: {error_message}", error_message])
+        
         # Search session logs first (likely to have error context)
-        log_results = self.search(
-            query=f"Error: {error_message}",
-            top_k=top_k,
-            filter_type="session_log"
-        )
+        log_results = self._search_vectors(vectors[:1], top_k, "session_log")[0]
         
         # Also search code for related functionality
-        code_results = self.search(
-            query=error_message,
-            top_k=top_k // 2,
-            filter_type="code"
-        )
+        code_results = self._search_vectors(vectors[1:], top_k // 2, "code")[0]
         
         # Combine and sort by similarity
         all_results = log_results + code_results
@@ -155,17 +262,9 @@ class QueryEngine:
         Example: "VLAN configuration", "Windows deployment", "static IP"
         """
         # Search all types, prioritize documentation and session logs
-        doc_results = self.search(
-            query=concept,
-            top_k=top_k,
-            filter_type="markdown"
-        )
-        
-        log_results = self.search(
-            query=concept,
-            top_k=top_k,
-            filter_type="session_log"
-        )
+        vector = self.encode([concept])
+        doc_results = self._search_vectors(vector, top_k, "markdown")[0]
+        log_results = self._search_vectors(vector, top_k, "session_log")[0]
         
         # Combine
         all_results = doc_results + log_results
@@ -173,6 +272,19 @@ class QueryEngine:
         
         return all_results[:top_k]
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Index and cache statistics"""
+        return {
+            "documents": len(self.documents),
+            "partitions": {name: index.ntotal for name, index in self.partitions.items()},
+            "model_loaded": self._model is not None,
+            "embedding_cache": {
+                "size": len(self._cache),
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+            },
+        }
+    
     def search_by_vm(self, vm_id: str, top_k: int = 5) -> List[Dict]:
         """
         Search for information about a specific VM
@@ -212,6 +324,21 @@ class QueryEngine:
         return "\n".join(context_parts)
 
 
+# Singleton instance
+_query_engine: Optional[QueryEngine] = None
+_query_engine_lock = threading.Lock()
+
+
+def get_query_engine() -> QueryEngine:
+    """Get the shared QueryEngine (index loaded once per process)"""
+    global _query_engine
+    if _query_engine is None:
+        with _query_engine_lock:
+            if _query_engine is None:
+                _query_engine = QueryEngine()
+    return _query_engine
+
+
 if __name__ == "__main__":
     # Quick test
     engine = QueryEngine()
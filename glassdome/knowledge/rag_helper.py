@@ -7,7 +7,7 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
 from typing import Dict, Any, Optional
-from glassdome.knowledge.query_engine import QueryEngine
+from glassdome.knowledge.query_engine import get_query_engine
 from glassdome.knowledge.confusion_detector import ConfusionDetector
 
 
@@ -15,7 +15,7 @@ class RAGHelper:
     """Simple interface for agents to consult RAG when confused"""
     
     def __init__(self):
-        self.query_engine = QueryEngine()
+        self.query_engine = get_query_engine()  # Shared; index loaded once per process
         self.detector = ConfusionDetector()
         
     def consult_rag(
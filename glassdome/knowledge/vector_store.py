@@ -0,0 +1,165 @@
+"""
+Vector Store module
+
+On-disk layout shared by IndexBuilder (writer) and QueryEngine (reader):
+    
+    documents.jsonl      one JSON document per line (id = line number)
+    documents.offsets    int64 byte offset of each line (memory-mapped)
+    partitions.json      manifest: model, dimension, partition files
+    ann_<name>.index     one FAISS index per document type, plus "all"
+
+Partitions are wrapped in IndexIDMap so hits carry global document ids.
+Small partitions use an exact flat index (as fast as HNSW at that size);
+larger ones use HNSW.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import json
+import mmap
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import faiss
+    import numpy as np
+except ImportError:
+    print("WARNING: faiss or numpy not installed")
+
+DOCUMENTS_FILE = "documents.jsonl"
+OFFSETS_FILE = "documents.offsets"
+MANIFEST_FILE = "partitions.json"
+
+# Partition holding every document (unfiltered searches)
+ALL_PARTITION = "all"
+
+# Partitions smaller than this use an exact flat index
+ANN_MIN_VECTORS = 2048
+
+# HNSW graph degree and build/search breadth
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 80
+HNSW_EF_SEARCH = 128
+
+
+class DocumentStore:
+    """
+    Read-only, memory-mapped document metadata.
+    
+    Documents are read (and JSON-decoded) only when a search returns
+    them, so resident memory does not grow with the size of the corpus.
+    """
+    
+    def __init__(self, index_path: Path):
+        self._file = open(index_path / DOCUMENTS_FILE, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = np.load(index_path / OFFSETS_FILE, mmap_mode="r")
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def get(self, doc_id: int) -> Dict[str, Any]:
+        start = int(self._offsets[doc_id])
+        end = self._data.find(b"\n", start)
+        return json.loads(self._data[start:end if end != -1 else len(self._data)])
+    
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+
+def write_document_store(index_path: Path, documents: Iterable[Dict[str, Any]]) -> int:
+    """Write documents.jsonl and its offset table; returns the document count"""
+    offsets = []
+    position = 0
+    with open(index_path / DOCUMENTS_FILE, "wb") as f:
+        for doc in documents:
+            line = json.dumps(doc, ensure_ascii=False).encode("utf-8") + b"\n"
+            offsets.append(position)
+            f.write(line)
+            position += len(line)
+    
+    # np.save appends .npy unless given a file object
+    with open(index_path / OFFSETS_FILE, "wb") as f:
+        np.save(f, np.array(offsets, dtype=np.int64))
+    return len(offsets)
+
+
+def _build_index(vectors: "np.ndarray", ids: "np.ndarray", dimension: int):
+    if len(ids) >= ANN_MIN_VECTORS:
+        inner = faiss.IndexHNSWFlat(dimension, HNSW_M)
+        inner.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        kind = "hnsw"
+    else:
+        inner = faiss.IndexFlatL2(dimension)
+        kind = "flat"
+    index = faiss.IndexIDMap(inner)
+    index.add_with_ids(vectors, ids)
+    return index, kind
+
+
+def build_partitions(
+    index_path: Path,
+    embeddings: "np.ndarray",
+    doc_types: List[str],
+    model_name: str,
+    dimension: int,
+) -> Dict[str, Any]:
+    """
+    Build and save the "all" partition and one partition per document type.
+    
+    Args:
+        embeddings: float32 matrix, row i = document i
+        doc_types: Type of each document (same order)
+    
+    Returns:
+        The manifest written to partitions.json
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype="float32")
+    all_ids = np.arange(len(doc_types), dtype="int64")
+    
+    groups: Dict[str, List[int]] = {ALL_PARTITION: list(range(len(doc_types)))}
+    for doc_id, doc_type in enumerate(doc_types):
+        groups.setdefault(doc_type, []).append(doc_id)
+    
+    partitions = {}
+    for name, members in groups.items():
+        ids = all_ids[members]
+        index, kind = _build_index(embeddings[ids], ids, dimension)
+        filename = f"ann_{name}.index"
+        faiss.write_index(index, str(index_path / filename))
+        partitions[name] = {"file": filename, "count": len(ids), "kind": kind}
+    
+    manifest = {
+        "model_name": model_name,
+        "dimension": dimension,
+        "total_docs": len(doc_types),
+        "partitions": partitions,
+        "built_at": datetime.now().isoformat(),
+    }
+    with open(index_path / MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_partitions(index_path: Path, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Read the partition indexes listed in a manifest"""
+    partitions = {}
+    for name, info in manifest["partitions"].items():
+        index = faiss.read_index(str(index_path / info["file"]))
+        if info.get("kind") == "hnsw":
+            faiss.downcast_index(index.index).hnsw.efSearch = HNSW_EF_SEARCH
+        partitions[name] = index
+    return partitions
+
+
+def read_manifest(index_path: Path) -> Optional[Dict[str, Any]]:
+    """partitions.json contents, or None if the index predates partitions"""
+    manifest_file = index_path / MANIFEST_FILE
+    if not manifest_file.exists() or not (index_path / OFFSETS_FILE).exists():
+        return None
+    with open(manifest_file, "r") as f:
+        return json.load(f)
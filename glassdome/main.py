@@ -19,7 +19,8 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 
 from glassdome.core.config import settings
-from glassdome.core.database import init_db
+from glassdome.core.database import init_db, dispose_engines
+from glassdome.core.db_metrics import DBMetricsMiddleware
 from glassdome.core.paths import PROJECT_ROOT
 from glassdome.agents.manager import agent_manager
 from glassdome.api.v1 import setup_v1_routes
@@ -48,6 +49,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route query counts and latency (see /api/v1/health/db)
+app.add_middleware(DBMetricsMiddleware)
+
 # Set up all API routes (v1 + legacy)
 setup_v1_routes(app)
 
@@ -100,6 +104,7 @@ async def shutdown_event():
     """Cleanup on shutdown."""
     await _stop_background_services()
     await agent_manager.stop()
+    await dispose_engines()
 
 
 async def _start_background_services():
@@ -127,6 +132,15 @@ async def _start_background_services():
     except Exception as e:
         logger.warning(f"Could not start Network Reconciler: {e}")
     
+    # Network Probes (dashboard link status)
+    try:
+        from glassdome.api.network_probes import get_network_prober
+        prober = get_network_prober(interval=15)
+        asyncio.create_task(prober.start())
+        logger.info("Network Prober starting (15s interval)")
+    except Exception as e:
+        logger.warning(f"Could not start Network Prober: {e}")
+    
     # WhitePawn Orchestrator
     try:
         from glassdome.whitepawn.orchestrator import get_whitepawn_orchestrator
@@ -209,6 +223,21 @@ async def _stop_background_services():
     except Exception as e:
         logger.warning(f"Error stopping Hot Spare Pool Managers: {e}")
     
+    # Reaper mission log buffer
+    try:
+        from glassdome.reaper.mission_log_sink import get_mission_log_sink
+        await get_mission_log_sink().close()
+        logger.info("Mission log sink flushed")
+    except Exception as e:
+        logger.warning(f"Error flushing mission log sink: {e}")
+    
+    # WhiteKnight worker pool
+    try:
+        from glassdome.whiteknight import get_whiteknight_client
+        await get_whiteknight_client().close()
+    except Exception as e:
+        logger.warning(f"Error stopping WhiteKnight workers: {e}")
+    
     # Network Reconciler
     try:
         from glassdome.networking.reconciler import get_network_reconciler
@@ -218,6 +247,13 @@ async def _stop_background_services():
     except Exception as e:
         logger.warning(f"Error stopping Network Reconciler: {e}")
     
+    # Network Prober
+    try:
+        from glassdome.api.network_probes import get_network_prober
+        await get_network_prober().stop()
+    except Exception as e:
+        logger.warning(f"Error stopping Network Prober: {e}")
+    
     # WhitePawn Orchestrator
     try:
         from glassdome.whitepawn.orchestrator import get_whitepawn_orchestrator
@@ -250,6 +286,7 @@ async def _stop_background_services():
         from glassdome.registry.controllers.lab_controller import get_lab_controller
         from glassdome.registry.agents.unifi_agent import get_unifi_agent
         from glassdome.registry.core import get_registry
+        from glassdome.registry.event_hub import get_event_hub
         
         lab_controller = get_lab_controller()
         await lab_controller.stop()
@@ -257,6 +294,8 @@ async def _stop_background_services():
         unifi_agent = get_unifi_agent()
         await unifi_agent.stop()
         
+        await get_event_hub().stop()
+        
         registry = get_registry()
         await registry.disconnect()
         
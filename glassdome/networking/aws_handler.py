@@ -8,6 +8,12 @@ Architecture:
 =============
 User Browser → Guacamole (public subnet) → Kali (attack subnet) → Lab VMs (private subnets)
 
+Provisioning:
+=============
+Lab resources are created and deleted as a dependency graph (see
+ProvisionStep / run_steps): independent boto3 calls run concurrently in a
+thread pool, and resources tagged for the lab are reused on re-deploy.
+
 Author: Brett Turner (ntounix)
 Created: December 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
@@ -15,10 +21,12 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
 from dataclasses import dataclass
 
-import boto3
 from botocore.exceptions import ClientError
 
 from glassdome.networking.orchestrator import PlatformNetworkHandler
@@ -29,9 +37,76 @@ from glassdome.networking.address_allocator import (
     get_address_allocator
 )
 from glassdome.core.config import settings
+from glassdome.platforms.aws_client import get_boto3_session, get_ec2_client
 
 logger = logging.getLogger(__name__)
 
+# Threads for blocking boto3 calls (network setup issues ~20 independent calls)
+MAX_WORKERS = 16
+
+# Security groups per lab: name -> description
+LAB_SECURITY_GROUPS = {
+    'guacamole': 'Guacamole gateway - HTTPS from internet',
+    'attack': 'Attack console - VNC/RDP/SSH from Guacamole only',
+    'lab': 'Lab VMs - All traffic from attack console only',
+}
+
+
+@dataclass
+class ProvisionStep:
+    """One node of a provisioning graph: runs after the steps in `after`"""
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    after: Tuple[str, ...] = ()
+
+
+async def run_steps(steps: List[ProvisionStep], parallel: bool = True) -> Dict[str, float]:
+    """
+    Run steps as soon as their dependencies have finished
+    
+    Steps must be listed after the steps they depend on. If one fails, the
+    steps not yet finished are cancelled and the error is raised. With
+    `parallel=False` the steps run one at a time in list order.
+    
+    Returns:
+        Seconds taken by each step
+    """
+    timings: Dict[str, float] = {}
+    names = set()
+    for step in steps:
+        missing = [dep for dep in step.after if dep not in names]
+        if missing:
+            raise ValueError(f"Step {step.name} depends on unknown or later steps: {missing}")
+        names.add(step.name)
+    
+    async def timed(step: ProvisionStep):
+        started = time.perf_counter()
+        await step.run()
+        timings[step.name] = time.perf_counter() - started
+    
+    if not parallel:
+        for step in steps:
+            await timed(step)
+        return timings
+    
+    tasks: Dict[str, asyncio.Task] = {}
+    
+    async def run(step: ProvisionStep):
+        if step.after:
+            await asyncio.gather(*(tasks[dep] for dep in step.after))
+        await timed(step)
+    
+    for step in steps:
+        tasks[step.name] = asyncio.create_task(run(step))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return timings
+
 
 @dataclass
 class AWSLabInfrastructure:
@@ -51,6 +126,13 @@ class AWSLabInfrastructure:
     # Route Table IDs
     route_tables: Dict[str, str] = None
     
+    # Resources found from a previous deploy instead of created
+    reused: List[str] = None
+    
+    # Network setup wall-clock time, total and per provisioning step
+    setup_seconds: Optional[float] = None
+    step_seconds: Dict[str, float] = None
+    
     def __post_init__(self):
         if self.subnets is None:
             self.subnets = {}
@@ -58,6 +140,10 @@ class AWSLabInfrastructure:
             self.security_groups = {}
         if self.route_tables is None:
             self.route_tables = {}
+        if self.reused is None:
+            self.reused = []
+        if self.step_seconds is None:
+            self.step_seconds = {}
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -68,7 +154,9 @@ class AWSLabInfrastructure:
             "nat_gateway_id": self.nat_gateway_id,
             "subnets": {k.value: v for k, v in self.subnets.items()},
             "security_groups": self.security_groups,
-            "route_tables": self.route_tables
+            "route_tables": self.route_tables,
+            "reused": self.reused,
+            "setup_seconds": self.setup_seconds
         }
 
 
@@ -92,16 +180,19 @@ class AWSNetworkHandler(PlatformNetworkHandler):
                     Lab Subnets (VMs - all traffic from Kali only)
     """
     
-    def __init__(self, region: str = None):
+    def __init__(self, region: str = None, parallel: bool = True):
         """
         Initialize AWS Network Handler.
         
         Args:
             region: AWS region (defaults to settings.aws_region or us-east-1)
+            parallel: Run independent provisioning steps concurrently
         """
         self.region = region or getattr(settings, 'aws_region', None) or "us-east-1"
+        self.parallel = parallel
         self._ec2_client = None
         self._ec2_resource = None
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="aws-network")
         
         # Track created infrastructure per lab
         self._lab_infrastructure: Dict[str, AWSLabInfrastructure] = {}
@@ -110,11 +201,10 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     def ec2_client(self):
         """Lazy-loaded EC2 client"""
         if self._ec2_client is None:
-            self._ec2_client = boto3.client(
-                'ec2',
-                aws_access_key_id=getattr(settings, 'aws_access_key_id', None),
-                aws_secret_access_key=getattr(settings, 'aws_secret_access_key', None),
-                region_name=self.region
+            self._ec2_client = get_ec2_client(
+                getattr(settings, 'aws_access_key_id', None),
+                getattr(settings, 'aws_secret_access_key', None),
+                self.region
             )
         return self._ec2_client
     
@@ -122,12 +212,11 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     def ec2_resource(self):
         """Lazy-loaded EC2 resource"""
         if self._ec2_resource is None:
-            self._ec2_resource = boto3.resource(
-                'ec2',
-                aws_access_key_id=getattr(settings, 'aws_access_key_id', None),
-                aws_secret_access_key=getattr(settings, 'aws_secret_access_key', None),
-                region_name=self.region
+            session = get_boto3_session(
+                getattr(settings, 'aws_access_key_id', None),
+                getattr(settings, 'aws_secret_access_key', None)
             )
+            self._ec2_resource = session.resource('ec2', region_name=self.region)
         return self._ec2_resource
     
     # =========================================================================
@@ -145,6 +234,12 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         This is the main entry point for lab deployment.
         Creates VPC, subnets, security groups, and gateways.
         
+        Resources are created as a dependency graph: everything that only
+        needs the VPC (gateway, subnets, route table, security groups) is
+        created concurrently, and each route / rule as soon as the resources
+        it references exist. Resources already tagged for this lab are
+        reused, so re-running a deploy completes a partial one.
+        
         Args:
             lab_id: Unique lab identifier
             allocation: Network allocation from address allocator
@@ -154,44 +249,81 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         """
         logger.info(f"Creating AWS infrastructure for lab {lab_id} in {self.region}")
         
-        # 1. Create VPC
-        vpc_id = await self._create_vpc(lab_id, allocation.vpc_cidr)
-        
         infra = AWSLabInfrastructure(
             lab_id=lab_id,
             region=self.region,
-            vpc_id=vpc_id
+            vpc_id=None
         )
         
-        # 2. Create Internet Gateway (for public subnet)
-        infra.internet_gateway_id = await self._create_internet_gateway(lab_id, vpc_id)
-        
-        # 3. Create subnets
-        for subnet_type, subnet_alloc in allocation.subnets.items():
-            subnet_id = await self._create_subnet(
-                lab_id=lab_id,
-                vpc_id=vpc_id,
-                cidr=subnet_alloc.cidr,
-                subnet_type=subnet_type,
-                is_public=subnet_alloc.is_public
-            )
-            infra.subnets[subnet_type] = subnet_id
+        async def vpc():
+            infra.vpc_id = await self._create_vpc(infra, allocation.vpc_cidr)
+        
+        async def internet_gateway():
+            infra.internet_gateway_id = await self._create_internet_gateway(infra)
+        
+        def subnet(subnet_type: SubnetType, subnet_alloc):
+            async def create():
+                infra.subnets[subnet_type] = await self._create_subnet(
+                    lab_id=lab_id,
+                    vpc_id=infra.vpc_id,
+                    cidr=subnet_alloc.cidr,
+                    subnet_type=subnet_type,
+                    is_public=subnet_alloc.is_public,
+                    infra=infra
+                )
+            return create
+        
+        def security_group(sg_name: str, description: str):
+            async def create():
+                infra.security_groups[sg_name] = await self._create_security_group(infra, sg_name, description)
+            return create
         
-        # 4. Create route tables
-        await self._setup_route_tables(infra, allocation)
+        async def route_table():
+            infra.route_tables['public'] = await self._create_route_table(infra, 'public')
         
-        # 5. Create security groups
-        await self._create_security_groups(infra)
+        async def internet_route():
+            # Add route to Internet Gateway
+            await self._create_route(infra.route_tables['public'], infra.internet_gateway_id)
+        
+        async def public_association():
+            # Associate public subnet with public route table
+            await self._associate_route_table(infra.route_tables['public'], infra.subnets[SubnetType.PUBLIC])
+        
+        steps = [
+            ProvisionStep("vpc", vpc),
+            ProvisionStep("igw", internet_gateway, ("vpc",)),
+            ProvisionStep("route-table:public", route_table, ("vpc",)),
+            ProvisionStep("route:public", internet_route, ("route-table:public", "igw")),
+        ]
+        steps += [
+            ProvisionStep(f"subnet:{subnet_type.value}", subnet(subnet_type, subnet_alloc), ("vpc",))
+            for subnet_type, subnet_alloc in allocation.subnets.items()
+        ]
+        if SubnetType.PUBLIC in allocation.subnets:
+            steps.append(ProvisionStep(
+                "association:public", public_association,
+                ("route-table:public", f"subnet:{SubnetType.PUBLIC.value}")
+            ))
+        steps += [
+            ProvisionStep(f"sg:{sg_name}", security_group(sg_name, description), ("vpc",))
+            for sg_name, description in LAB_SECURITY_GROUPS.items()
+        ]
+        steps += self._security_rule_steps(infra)
         
-        # 6. Configure security group rules (Guacamole → Kali → Lab chain)
-        await self._configure_security_rules(infra)
+        started = time.perf_counter()
+        infra.step_seconds = await run_steps(steps, parallel=self.parallel)
+        infra.setup_seconds = time.perf_counter() - started
         
         self._lab_infrastructure[lab_id] = infra
         
         logger.info(f"✅ Created AWS infrastructure for lab {lab_id}")
-        logger.info(f"   VPC: {vpc_id}")
+        logger.info(f"   VPC: {infra.vpc_id}")
         logger.info(f"   Subnets: {len(infra.subnets)}")
         logger.info(f"   Security Groups: {len(infra.security_groups)}")
+        logger.info(
+            f"   Network setup: {infra.setup_seconds:.1f}s "
+            f"({len(steps)} steps, {len(infra.reused)} resources reused)"
+        )
         
         return infra
     
@@ -199,7 +331,10 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         """
         Delete all AWS infrastructure for a lab.
         
-        Cleans up in reverse order: instances → NAT → IGW → subnets → SGs → VPC
+        Cleans up in reverse dependency order, with independent deletions
+        running concurrently: NAT → subnets and IGW; SG rules → SGs;
+        subnets → route tables; everything → VPC. Instances are terminated
+        by the caller before this.
         
         Args:
             lab_id: Lab to clean up
@@ -216,79 +351,130 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         logger.info(f"Deleting AWS infrastructure for lab {lab_id}")
         
         try:
-            # Delete in dependency order
-            
-            # 1. Terminate instances (done by caller before this)
-            
-            # 2. Delete NAT Gateway (if exists)
-            if infra.nat_gateway_id:
-                await self._delete_nat_gateway(infra.nat_gateway_id)
-            
-            # 3. Delete subnets
-            for subnet_type, subnet_id in infra.subnets.items():
-                await self._delete_subnet(subnet_id)
-            
-            # 4. Delete security groups (except default)
-            for sg_name, sg_id in infra.security_groups.items():
-                await self._delete_security_group(sg_id)
-            
-            # 5. Detach and delete Internet Gateway
-            if infra.internet_gateway_id:
-                await self._delete_internet_gateway(
-                    infra.internet_gateway_id,
-                    infra.vpc_id
-                )
-            
-            # 6. Delete VPC
-            await self._delete_vpc(infra.vpc_id)
+            started = time.perf_counter()
+            await run_steps(self._teardown_steps(infra), parallel=self.parallel)
             
             # Clean up tracking
-            del self._lab_infrastructure[lab_id]
+            self._lab_infrastructure.pop(lab_id, None)
             
-            logger.info(f"✅ Deleted all AWS infrastructure for lab {lab_id}")
+            logger.info(f"✅ Deleted all AWS infrastructure for lab {lab_id} in {time.perf_counter() - started:.1f}s")
             return True
             
         except Exception as e:
             logger.error(f"Failed to delete infrastructure for lab {lab_id}: {e}")
             return False
     
+    def _teardown_steps(self, infra: AWSLabInfrastructure) -> List["ProvisionStep"]:
+        """Deletion graph for a lab's resources (reverse of creation)"""
+        steps = []
+        
+        if infra.nat_gateway_id:
+            steps.append(ProvisionStep("nat", lambda: self._delete_nat_gateway(infra.nat_gateway_id)))
+        after_nat = ("nat",) if infra.nat_gateway_id else ()
+        
+        subnet_steps = [f"subnet:{subnet_type.value}" for subnet_type in infra.subnets]
+        steps += [
+            ProvisionStep(name, lambda subnet_id=subnet_id: self._delete_subnet(subnet_id), after_nat)
+            for name, subnet_id in zip(subnet_steps, infra.subnets.values())
+        ]
+        
+        # Groups reference each other in their rules: revoke first, then
+        # delete all groups (except default) at once
+        steps.append(ProvisionStep("rules", lambda: self._revoke_security_rules(list(infra.security_groups.values()))))
+        steps += [
+            ProvisionStep(f"sg:{sg_name}", lambda sg_id=sg_id: self._delete_security_group(sg_id), ("rules",))
+            for sg_name, sg_id in infra.security_groups.items()
+        ]
+        
+        # Deleting a subnet removes its route table association
+        steps += [
+            ProvisionStep(f"route-table:{rt_name}", lambda rt_id=rt_id: self._delete_route_table(rt_id), tuple(subnet_steps))
+            for rt_name, rt_id in infra.route_tables.items()
+        ]
+        
+        # Detach and delete Internet Gateway
+        if infra.internet_gateway_id:
+            steps.append(ProvisionStep(
+                "igw",
+                lambda: self._delete_internet_gateway(infra.internet_gateway_id, infra.vpc_id),
+                after_nat
+            ))
+        
+        steps.append(ProvisionStep("vpc", lambda: self._delete_vpc(infra.vpc_id), tuple(step.name for step in steps)))
+        return steps
+    
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+    
+    async def _call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking boto3 call on the handler's thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(fn, *args, **kwargs)
+        )
+    
+    async def _find_existing(
+        self,
+        infra: AWSLabInfrastructure,
+        resource: str,
+        describe: Callable,
+        result_key: str,
+        filters: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """First resource matching the filters (recorded as reused), or None"""
+        response = await self._call(describe, Filters=filters)
+        items = response.get(result_key, [])
+        if items:
+            infra.reused.append(resource)
+            logger.info(f"Reusing existing {resource} for lab {infra.lab_id}")
+            return items[0]
+        return None
+    
+    @staticmethod
+    def _ignore_codes(e: ClientError, *codes: str) -> bool:
+        return e.response.get('Error', {}).get('Code') in codes
+    
     # =========================================================================
     # VPC Operations
     # =========================================================================
     
-    async def _create_vpc(self, lab_id: str, cidr_block: str) -> str:
-        """Create VPC for lab"""
+    async def _create_vpc(self, infra: AWSLabInfrastructure, cidr_block: str) -> str:
+        """Create VPC for lab (or reuse the lab's VPC with the same CIDR)"""
+        lab_id = infra.lab_id
         try:
-            response = self.ec2_client.create_vpc(
-                CidrBlock=cidr_block,
-                TagSpecifications=[{
-                    'ResourceType': 'vpc',
-                    'Tags': [
-                        {'Key': 'Name', 'Value': f'glassdome-{lab_id}'},
-                        {'Key': 'lab_id', 'Value': lab_id},
-                        {'Key': 'ManagedBy', 'Value': 'glassdome'},
-                        {'Key': 'Platform', 'Value': 'glassdome-aws'}
-                    ]
-                }]
+            existing = await self._find_existing(
+                infra, "vpc", self.ec2_client.describe_vpcs, 'Vpcs',
+                [{'Name': 'tag:lab_id', 'Values': [lab_id]}, {'Name': 'cidr', 'Values': [cidr_block]}]
             )
-            
-            vpc_id = response['Vpc']['VpcId']
+            if existing:
+                vpc_id = existing['VpcId']
+            else:
+                response = await self._call(
+                    self.ec2_client.create_vpc,
+                    CidrBlock=cidr_block,
+                    TagSpecifications=[{
+                        'ResourceType': 'vpc',
+                        'Tags': [
+                            {'Key': 'Name', 'Value': f'glassdome-{lab_id}'},
+                            {'Key': 'lab_id', 'Value': lab_id},
+                            {'Key': 'ManagedBy', 'Value': 'glassdome'},
+                            {'Key': 'Platform', 'Value': 'glassdome-aws'}
+                        ]
+                    }]
+                )
+                vpc_id = response['Vpc']['VpcId']
             
             # Wait for VPC to be available
             waiter = self.ec2_client.get_waiter('vpc_available')
-            waiter.wait(VpcIds=[vpc_id])
+            await self._call(waiter.wait, VpcIds=[vpc_id])
             
-            # Enable DNS hostnames and DNS support
-            self.ec2_client.modify_vpc_attribute(
-                VpcId=vpc_id,
-                EnableDnsHostnames={'Value': True}
-            )
-            self.ec2_client.modify_vpc_attribute(
-                VpcId=vpc_id,
-                EnableDnsSupport={'Value': True}
+            # Enable DNS hostnames and DNS support (one attribute per call)
+            await asyncio.gather(
+                self._call(self.ec2_client.modify_vpc_attribute, VpcId=vpc_id, EnableDnsHostnames={'Value': True}),
+                self._call(self.ec2_client.modify_vpc_attribute, VpcId=vpc_id, EnableDnsSupport={'Value': True})
             )
             
-            logger.info(f"Created VPC {vpc_id} for lab {lab_id}")
+            logger.info(f"{'Reused' if existing else 'Created'} VPC {vpc_id} for lab {lab_id}")
             return vpc_id
             
         except ClientError as e:
@@ -298,7 +484,7 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     async def _delete_vpc(self, vpc_id: str) -> None:
         """Delete VPC"""
         try:
-            self.ec2_client.delete_vpc(VpcId=vpc_id)
+            await self._call(self.ec2_client.delete_vpc, VpcId=vpc_id)
             logger.info(f"Deleted VPC {vpc_id}")
         except ClientError as e:
             logger.error(f"Failed to delete VPC {vpc_id}: {e}")
@@ -308,10 +494,19 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     # Internet Gateway Operations
     # =========================================================================
     
-    async def _create_internet_gateway(self, lab_id: str, vpc_id: str) -> str:
-        """Create and attach Internet Gateway"""
+    async def _create_internet_gateway(self, infra: AWSLabInfrastructure) -> str:
+        """Create and attach Internet Gateway (or reuse the attached one)"""
+        lab_id, vpc_id = infra.lab_id, infra.vpc_id
         try:
-            response = self.ec2_client.create_internet_gateway(
+            existing = await self._find_existing(
+                infra, "internet-gateway", self.ec2_client.describe_internet_gateways, 'InternetGateways',
+                [{'Name': 'attachment.vpc-id', 'Values': [vpc_id]}]
+            )
+            if existing:
+                return existing['InternetGatewayId']
+            
+            response = await self._call(
+                self.ec2_client.create_internet_gateway,
                 TagSpecifications=[{
                     'ResourceType': 'internet-gateway',
                     'Tags': [
@@ -325,7 +520,8 @@ class AWSNetworkHandler(PlatformNetworkHandler):
             igw_id = response['InternetGateway']['InternetGatewayId']
             
             # Attach to VPC
-            self.ec2_client.attach_internet_gateway(
+            await self._call(
+                self.ec2_client.attach_internet_gateway,
                 InternetGatewayId=igw_id,
                 VpcId=vpc_id
             )
@@ -340,11 +536,12 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     async def _delete_internet_gateway(self, igw_id: str, vpc_id: str) -> None:
         """Detach and delete Internet Gateway"""
         try:
-            self.ec2_client.detach_internet_gateway(
+            await self._call(
+                self.ec2_client.detach_internet_gateway,
                 InternetGatewayId=igw_id,
                 VpcId=vpc_id
             )
-            self.ec2_client.delete_internet_gateway(InternetGatewayId=igw_id)
+            await self._call(self.ec2_client.delete_internet_gateway, InternetGatewayId=igw_id)
             logger.info(f"Deleted Internet Gateway {igw_id}")
         except ClientError as e:
             logger.error(f"Failed to delete Internet Gateway {igw_id}: {e}")
@@ -359,34 +556,46 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         vpc_id: str,
         cidr: str,
         subnet_type: SubnetType,
-        is_public: bool = False
+        is_public: bool = False,
+        infra: Optional[AWSLabInfrastructure] = None
     ) -> str:
-        """Create subnet within VPC"""
+        """Create subnet within VPC (or reuse the one with the same CIDR)"""
         try:
-            response = self.ec2_client.create_subnet(
-                VpcId=vpc_id,
-                CidrBlock=cidr,
-                TagSpecifications=[{
-                    'ResourceType': 'subnet',
-                    'Tags': [
-                        {'Key': 'Name', 'Value': f'glassdome-{lab_id}-{subnet_type.value}'},
-                        {'Key': 'lab_id', 'Value': lab_id},
-                        {'Key': 'subnet_type', 'Value': subnet_type.value},
-                        {'Key': 'ManagedBy', 'Value': 'glassdome'}
-                    ]
-                }]
-            )
+            existing = None
+            if infra is not None:
+                existing = await self._find_existing(
+                    infra, f"subnet:{subnet_type.value}", self.ec2_client.describe_subnets, 'Subnets',
+                    [{'Name': 'vpc-id', 'Values': [vpc_id]}, {'Name': 'cidr-block', 'Values': [cidr]}]
+                )
             
-            subnet_id = response['Subnet']['SubnetId']
+            if existing:
+                subnet_id = existing['SubnetId']
+            else:
+                response = await self._call(
+                    self.ec2_client.create_subnet,
+                    VpcId=vpc_id,
+                    CidrBlock=cidr,
+                    TagSpecifications=[{
+                        'ResourceType': 'subnet',
+                        'Tags': [
+                            {'Key': 'Name', 'Value': f'glassdome-{lab_id}-{subnet_type.value}'},
+                            {'Key': 'lab_id', 'Value': lab_id},
+                            {'Key': 'subnet_type', 'Value': subnet_type.value},
+                            {'Key': 'ManagedBy', 'Value': 'glassdome'}
+                        ]
+                    }]
+                )
+                subnet_id = response['Subnet']['SubnetId']
             
             # Enable auto-assign public IP for public subnets
-            if is_public:
-                self.ec2_client.modify_subnet_attribute(
+            if is_public and not (existing and existing.get('MapPublicIpOnLaunch')):
+                await self._call(
+                    self.ec2_client.modify_subnet_attribute,
                     SubnetId=subnet_id,
                     MapPublicIpOnLaunch={'Value': True}
                 )
             
-            logger.info(f"Created subnet {subnet_id} ({subnet_type.value}: {cidr})")
+            logger.info(f"{'Reused' if existing else 'Created'} subnet {subnet_id} ({subnet_type.value}: {cidr})")
             return subnet_id
             
         except ClientError as e:
@@ -396,7 +605,7 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     async def _delete_subnet(self, subnet_id: str) -> None:
         """Delete subnet"""
         try:
-            self.ec2_client.delete_subnet(SubnetId=subnet_id)
+            await self._call(self.ec2_client.delete_subnet, SubnetId=subnet_id)
             logger.info(f"Deleted subnet {subnet_id}")
         except ClientError as e:
             logger.error(f"Failed to delete subnet {subnet_id}: {e}")
@@ -405,164 +614,218 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     # Route Table Operations
     # =========================================================================
     
-    async def _setup_route_tables(
-        self,
-        infra: AWSLabInfrastructure,
-        allocation: LabNetworkAllocation
-    ) -> None:
-        """Set up route tables for public and private subnets"""
+    async def _create_route_table(self, infra: AWSLabInfrastructure, rt_name: str) -> str:
+        """Create (or reuse) a tagged route table in the lab VPC"""
+        name = f'glassdome-{infra.lab_id}-{rt_name}-rt'
+        existing = await self._find_existing(
+            infra, f"route-table:{rt_name}", self.ec2_client.describe_route_tables, 'RouteTables',
+            [{'Name': 'vpc-id', 'Values': [infra.vpc_id]}, {'Name': 'tag:Name', 'Values': [name]}]
+        )
+        if existing:
+            return existing['RouteTableId']
         
-        # Create route table for public subnet
-        public_rt = self.ec2_client.create_route_table(
+        response = await self._call(
+            self.ec2_client.create_route_table,
             VpcId=infra.vpc_id,
             TagSpecifications=[{
                 'ResourceType': 'route-table',
                 'Tags': [
-                    {'Key': 'Name', 'Value': f'glassdome-{infra.lab_id}-public-rt'},
+                    {'Key': 'Name', 'Value': name},
                     {'Key': 'lab_id', 'Value': infra.lab_id},
                     {'Key': 'ManagedBy', 'Value': 'glassdome'}
                 ]
             }]
         )
-        public_rt_id = public_rt['RouteTable']['RouteTableId']
-        infra.route_tables['public'] = public_rt_id
-        
-        # Add route to Internet Gateway
-        self.ec2_client.create_route(
-            RouteTableId=public_rt_id,
-            DestinationCidrBlock='0.0.0.0/0',
-            GatewayId=infra.internet_gateway_id
-        )
-        
-        # Associate public subnet with public route table
-        if SubnetType.PUBLIC in infra.subnets:
-            self.ec2_client.associate_route_table(
-                SubnetId=infra.subnets[SubnetType.PUBLIC],
-                RouteTableId=public_rt_id
+        rt_id = response['RouteTable']['RouteTableId']
+        logger.info(f"Created route table {rt_id} for lab {infra.lab_id}")
+        return rt_id
+    
+    async def _create_route(self, rt_id: str, igw_id: str) -> None:
+        """Default route to the Internet Gateway"""
+        try:
+            await self._call(
+                self.ec2_client.create_route,
+                RouteTableId=rt_id,
+                DestinationCidrBlock='0.0.0.0/0',
+                GatewayId=igw_id
             )
-        
-        logger.info(f"Created route tables for lab {infra.lab_id}")
+        except ClientError as e:
+            if not self._ignore_codes(e, 'RouteAlreadyExists'):
+                raise
+    
+    async def _associate_route_table(self, rt_id: str, subnet_id: str) -> None:
+        try:
+            await self._call(
+                self.ec2_client.associate_route_table,
+                SubnetId=subnet_id,
+                RouteTableId=rt_id
+            )
+        except ClientError as e:
+            if not self._ignore_codes(e, 'Resource.AlreadyAssociated'):
+                raise
+    
+    async def _delete_route_table(self, rt_id: str) -> None:
+        """Delete route table"""
+        try:
+            await self._call(self.ec2_client.delete_route_table, RouteTableId=rt_id)
+            logger.info(f"Deleted route table {rt_id}")
+        except ClientError as e:
+            logger.error(f"Failed to delete route table {rt_id}: {e}")
     
     # =========================================================================
     # Security Group Operations
     # =========================================================================
     
-    async def _create_security_groups(self, infra: AWSLabInfrastructure) -> None:
-        """Create security groups for each subnet type"""
+    async def _create_security_group(self, infra: AWSLabInfrastructure, sg_name: str, description: str) -> str:
+        """Create (or reuse) one of the lab's security groups"""
+        group_name = f'glassdome-{infra.lab_id}-{sg_name}'
+        try:
+            existing = await self._find_existing(
+                infra, f"sg:{sg_name}", self.ec2_client.describe_security_groups, 'SecurityGroups',
+                [{'Name': 'vpc-id', 'Values': [infra.vpc_id]}, {'Name': 'group-name', 'Values': [group_name]}]
+            )
+            if existing:
+                return existing['GroupId']
+            
+            response = await self._call(
+                self.ec2_client.create_security_group,
+                GroupName=group_name,
+                Description=description,
+                VpcId=infra.vpc_id,
+                TagSpecifications=[{
+                    'ResourceType': 'security-group',
+                    'Tags': [
+                        {'Key': 'Name', 'Value': group_name},
+                        {'Key': 'lab_id', 'Value': infra.lab_id},
+                        {'Key': 'sg_type', 'Value': sg_name},
+                        {'Key': 'ManagedBy', 'Value': 'glassdome'}
+                    ]
+                }]
+            )
+            
+            logger.info(f"Created security group: {sg_name} ({response['GroupId']})")
+            return response['GroupId']
         
-        sg_configs = [
-            ('guacamole', 'Guacamole gateway - HTTPS from internet'),
-            ('attack', 'Attack console - VNC/RDP/SSH from Guacamole only'),
-            ('lab', 'Lab VMs - All traffic from attack console only'),
-        ]
+        except ClientError as e:
+            logger.error(f"Failed to create security group {sg_name}: {e}")
+            raise
+    
+    async def _authorize_ingress(self, sg_id: str, permissions: List[Dict[str, Any]]) -> None:
+        """
+        Add ingress rules, one call per rule
         
-        for sg_name, description in sg_configs:
+        A single call fails as a whole if any rule already exists; per-rule
+        calls run concurrently and skip the ones a previous deploy added.
+        """
+        async def authorize(permission):
             try:
-                response = self.ec2_client.create_security_group(
-                    GroupName=f'glassdome-{infra.lab_id}-{sg_name}',
-                    Description=description,
-                    VpcId=infra.vpc_id,
-                    TagSpecifications=[{
-                        'ResourceType': 'security-group',
-                        'Tags': [
-                            {'Key': 'Name', 'Value': f'glassdome-{infra.lab_id}-{sg_name}'},
-                            {'Key': 'lab_id', 'Value': infra.lab_id},
-                            {'Key': 'sg_type', 'Value': sg_name},
-                            {'Key': 'ManagedBy', 'Value': 'glassdome'}
-                        ]
-                    }]
+                await self._call(
+                    self.ec2_client.authorize_security_group_ingress,
+                    GroupId=sg_id,
+                    IpPermissions=[permission]
                 )
-                
-                infra.security_groups[sg_name] = response['GroupId']
-                logger.info(f"Created security group: {sg_name} ({response['GroupId']})")
-                
             except ClientError as e:
-                logger.error(f"Failed to create security group {sg_name}: {e}")
-                raise
+                if not self._ignore_codes(e, 'InvalidPermission.Duplicate'):
+                    raise
+        
+        await asyncio.gather(*(authorize(permission) for permission in permissions))
     
-    async def _configure_security_rules(self, infra: AWSLabInfrastructure) -> None:
+    def _security_rule_steps(self, infra: AWSLabInfrastructure) -> List["ProvisionStep"]:
         """
-        Configure security group rules for the Guacamole → Kali → Lab chain.
+        Security group rules for the Guacamole → Kali → Lab chain.
         
         Flow:
         - Internet → Guacamole (443)
         - Guacamole → Attack Console (VNC 5900-5910, RDP 3389, SSH 22)
         - Attack Console → Lab VMs (all traffic)
+        
+        Each rule set is a step that runs once the groups it references exist.
         """
-        sg_guac = infra.security_groups.get('guacamole')
-        sg_attack = infra.security_groups.get('attack')
-        sg_lab = infra.security_groups.get('lab')
+        sgs = infra.security_groups
         
         # 1. Guacamole: HTTPS from anywhere
-        if sg_guac:
-            self.ec2_client.authorize_security_group_ingress(
-                GroupId=sg_guac,
-                IpPermissions=[{
-                    'IpProtocol': 'tcp',
-                    'FromPort': 443,
-                    'ToPort': 443,
-                    'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTPS from internet'}]
-                }, {
-                    'IpProtocol': 'tcp',
-                    'FromPort': 80,
-                    'ToPort': 80,
-                    'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTP redirect'}]
-                }]
-            )
+        async def guacamole():
+            await self._authorize_ingress(sgs['guacamole'], [{
+                'IpProtocol': 'tcp',
+                'FromPort': 443,
+                'ToPort': 443,
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTPS from internet'}]
+            }, {
+                'IpProtocol': 'tcp',
+                'FromPort': 80,
+                'ToPort': 80,
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTP redirect'}]
+            }])
             logger.info("Configured Guacamole SG: HTTPS from internet")
         
         # 2. Attack console: VNC/RDP/SSH from Guacamole only
-        if sg_attack and sg_guac:
-            self.ec2_client.authorize_security_group_ingress(
-                GroupId=sg_attack,
-                IpPermissions=[
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 5900,
-                        'ToPort': 5910,
-                        'UserIdGroupPairs': [{'GroupId': sg_guac, 'Description': 'VNC from Guacamole'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 3389,
-                        'ToPort': 3389,
-                        'UserIdGroupPairs': [{'GroupId': sg_guac, 'Description': 'RDP from Guacamole'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 22,
-                        'ToPort': 22,
-                        'UserIdGroupPairs': [{'GroupId': sg_guac, 'Description': 'SSH from Guacamole'}]
-                    }
-                ]
-            )
+        async def attack():
+            await self._authorize_ingress(sgs['attack'], [
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 5900,
+                    'ToPort': 5910,
+                    'UserIdGroupPairs': [{'GroupId': sgs['guacamole'], 'Description': 'VNC from Guacamole'}]
+                },
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 3389,
+                    'ToPort': 3389,
+                    'UserIdGroupPairs': [{'GroupId': sgs['guacamole'], 'Description': 'RDP from Guacamole'}]
+                },
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 22,
+                    'ToPort': 22,
+                    'UserIdGroupPairs': [{'GroupId': sgs['guacamole'], 'Description': 'SSH from Guacamole'}]
+                }
+            ])
             logger.info("Configured Attack SG: VNC/RDP/SSH from Guacamole")
         
         # 3. Lab VMs: All traffic from attack console
-        if sg_lab and sg_attack:
-            self.ec2_client.authorize_security_group_ingress(
-                GroupId=sg_lab,
-                IpPermissions=[{
-                    'IpProtocol': '-1',  # All traffic
-                    'UserIdGroupPairs': [{'GroupId': sg_attack, 'Description': 'All from attack console'}]
-                }]
-            )
+        # 4. Allow internal communication within lab subnet
+        async def lab():
+            await self._authorize_ingress(sgs['lab'], [{
+                'IpProtocol': '-1',  # All traffic
+                'UserIdGroupPairs': [{'GroupId': sgs['attack'], 'Description': 'All from attack console'}]
+            }, {
+                'IpProtocol': '-1',
+                'UserIdGroupPairs': [{'GroupId': sgs['lab'], 'Description': 'Internal lab traffic'}]
+            }])
             logger.info("Configured Lab SG: All traffic from attack console")
         
-        # 4. Allow internal communication within lab subnet
-        if sg_lab:
-            self.ec2_client.authorize_security_group_ingress(
-                GroupId=sg_lab,
-                IpPermissions=[{
-                    'IpProtocol': '-1',
-                    'UserIdGroupPairs': [{'GroupId': sg_lab, 'Description': 'Internal lab traffic'}]
-                }]
-            )
+        return [
+            ProvisionStep("rules:guacamole", guacamole, ("sg:guacamole",)),
+            ProvisionStep("rules:attack", attack, ("sg:attack", "sg:guacamole")),
+            ProvisionStep("rules:lab", lab, ("sg:lab", "sg:attack")),
+        ]
+    
+    async def _revoke_security_rules(self, sg_ids: List[str]) -> None:
+        """Remove all ingress rules so groups referencing each other can be deleted"""
+        if not sg_ids:
+            return
+        try:
+            response = await self._call(self.ec2_client.describe_security_groups, GroupIds=sg_ids)
+        except ClientError as e:
+            logger.warning(f"Failed to read security group rules: {e}")
+            return
+        
+        async def revoke(sg):
+            try:
+                await self._call(
+                    self.ec2_client.revoke_security_group_ingress,
+                    GroupId=sg['GroupId'],
+                    IpPermissions=sg['IpPermissions']
+                )
+            except ClientError as e:
+                logger.warning(f"Failed to revoke rules of {sg['GroupId']}: {e}")
+        
+        await asyncio.gather(*(revoke(sg) for sg in response.get('SecurityGroups', []) if sg.get('IpPermissions')))
     
     async def _delete_security_group(self, sg_id: str) -> None:
         """Delete security group"""
         try:
-            self.ec2_client.delete_security_group(GroupId=sg_id)
+            await self._call(self.ec2_client.delete_security_group, GroupId=sg_id)
             logger.info(f"Deleted security group {sg_id}")
         except ClientError as e:
             if 'InvalidGroup.NotFound' in str(e):
@@ -586,9 +849,10 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         (e.g., for package installation).
         """
         # Allocate Elastic IP
-        eip = self.ec2_client.allocate_address(Domain='vpc')
+        eip = await self._call(self.ec2_client.allocate_address, Domain='vpc')
         
-        response = self.ec2_client.create_nat_gateway(
+        response = await self._call(
+            self.ec2_client.create_nat_gateway,
             SubnetId=public_subnet_id,
             AllocationId=eip['AllocationId'],
             TagSpecifications=[{
@@ -605,7 +869,7 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         
         # Wait for NAT Gateway to be available
         waiter = self.ec2_client.get_waiter('nat_gateway_available')
-        waiter.wait(NatGatewayIds=[nat_id])
+        await self._call(waiter.wait, NatGatewayIds=[nat_id])
         
         logger.info(f"Created NAT Gateway {nat_id}")
         return nat_id
@@ -614,13 +878,22 @@ class AWSNetworkHandler(PlatformNetworkHandler):
         """Delete NAT Gateway and release EIP"""
         try:
             # Get EIP allocation ID before deleting
-            nat_info = self.ec2_client.describe_nat_gateways(NatGatewayIds=[nat_id])
-            if nat_info['NatGateways']:
-                for addr in nat_info['NatGateways'][0].get('NatGatewayAddresses', []):
-                    if addr.get('AllocationId'):
-                        self.ec2_client.release_address(AllocationId=addr['AllocationId'])
+            nat_info = await self._call(self.ec2_client.describe_nat_gateways, NatGatewayIds=[nat_id])
+            allocation_ids = [
+                addr['AllocationId']
+                for nat in nat_info['NatGateways'][:1]
+                for addr in nat.get('NatGatewayAddresses', [])
+                if addr.get('AllocationId')
+            ]
+            
+            await self._call(self.ec2_client.delete_nat_gateway, NatGatewayId=nat_id)
+            
+            # The address stays associated until the gateway is gone
+            waiter = self.ec2_client.get_waiter('nat_gateway_deleted')
+            await self._call(waiter.wait, NatGatewayIds=[nat_id])
+            for allocation_id in allocation_ids:
+                await self._call(self.ec2_client.release_address, AllocationId=allocation_id)
             
-            self.ec2_client.delete_nat_gateway(NatGatewayId=nat_id)
             logger.info(f"Deleted NAT Gateway {nat_id}")
         except ClientError as e:
             logger.error(f"Failed to delete NAT Gateway {nat_id}: {e}")
@@ -629,11 +902,48 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     # Cleanup by Tag
     # =========================================================================
     
+    async def _discover_lab_infrastructure(self, lab_id: str, vpc_id: str) -> AWSLabInfrastructure:
+        """Rebuild a lab's infrastructure record from its tagged resources"""
+        infra = AWSLabInfrastructure(
+            lab_id=lab_id,
+            region=self.region,
+            vpc_id=vpc_id
+        )
+        in_vpc = [{'Name': 'vpc-id', 'Values': [vpc_id]}]
+        lab_tag = [{'Name': 'tag:lab_id', 'Values': [lab_id]}]
+        
+        subnets, groups, route_tables, gateways, nats = await asyncio.gather(
+            self._call(self.ec2_client.describe_subnets, Filters=in_vpc + lab_tag),
+            self._call(self.ec2_client.describe_security_groups, Filters=in_vpc + lab_tag),
+            self._call(self.ec2_client.describe_route_tables, Filters=in_vpc + lab_tag),
+            self._call(self.ec2_client.describe_internet_gateways, Filters=[{'Name': 'attachment.vpc-id', 'Values': [vpc_id]}]),
+            self._call(self.ec2_client.describe_nat_gateways, Filter=in_vpc + [{'Name': 'state', 'Values': ['pending', 'available']}]),
+        )
+        
+        def tag(resource, key):
+            return next((t['Value'] for t in resource.get('Tags', []) if t['Key'] == key), None)
+        
+        for subnet in subnets.get('Subnets', []):
+            subnet_type = tag(subnet, 'subnet_type')
+            if subnet_type in SubnetType._value2member_map_:
+                infra.subnets[SubnetType(subnet_type)] = subnet['SubnetId']
+        for group in groups.get('SecurityGroups', []):
+            infra.security_groups[tag(group, 'sg_type') or group['GroupName']] = group['GroupId']
+        for route_table in route_tables.get('RouteTables', []):
+            infra.route_tables[tag(route_table, 'Name') or route_table['RouteTableId']] = route_table['RouteTableId']
+        if gateways.get('InternetGateways'):
+            infra.internet_gateway_id = gateways['InternetGateways'][0]['InternetGatewayId']
+        if nats.get('NatGateways'):
+            infra.nat_gateway_id = nats['NatGateways'][0]['NatGatewayId']
+        
+        return infra
+    
     async def _cleanup_lab_by_tag(self, lab_id: str) -> bool:
         """Clean up lab resources by searching for lab_id tag"""
         try:
             # Find VPC by tag
-            vpcs = self.ec2_client.describe_vpcs(
+            vpcs = await self._call(
+                self.ec2_client.describe_vpcs,
                 Filters=[{'Name': 'tag:lab_id', 'Values': [lab_id]}]
             )
             
@@ -641,16 +951,10 @@ class AWSNetworkHandler(PlatformNetworkHandler):
                 vpc_id = vpc['VpcId']
                 logger.info(f"Found VPC {vpc_id} for lab {lab_id}")
                 
-                # Build infrastructure object and delete
-                infra = AWSLabInfrastructure(
-                    lab_id=lab_id,
-                    region=self.region,
-                    vpc_id=vpc_id
-                )
-                
-                # Find associated resources
-                # ... (would need full implementation)
-                
+                # Build infrastructure object from the tagged resources and delete
+                infra = await self._discover_lab_infrastructure(lab_id, vpc_id)
+                await run_steps(self._teardown_steps(infra), parallel=self.parallel)
+            
             return True
             
         except Exception as e:
@@ -721,7 +1025,7 @@ class AWSNetworkHandler(PlatformNetworkHandler):
     ) -> List[Dict[str, Any]]:
         """Get network interfaces for an EC2 instance"""
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[vm_id])
+            response = await self._call(self.ec2_client.describe_instances, InstanceIds=[vm_id])
             
             interfaces = []
             for reservation in response['Reservations']:
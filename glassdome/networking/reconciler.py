@@ -13,7 +13,8 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from glassdome.core.database import AsyncSessionLocal
+from glassdome.core.database import BackgroundSessionLocal
+from glassdome.core.db_metrics import set_db_scope
 from glassdome.networking.models import (
     NetworkDefinition, 
     PlatformNetworkMapping, 
@@ -111,6 +112,7 @@ class NetworkReconciler:
     
     async def _reconcile_loop(self):
         """Main reconciliation loop"""
+        set_db_scope("networking.reconciler")
         while self._running:
             try:
                 await self._run_reconciliation()
@@ -122,7 +124,7 @@ class NetworkReconciler:
     
     async def _run_reconciliation(self):
         """Run a single reconciliation cycle"""
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             results = []
             
             # Reconcile network mappings
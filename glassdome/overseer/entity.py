@@ -13,7 +13,7 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from glassdome.overseer.state import SystemState, VM, Host, Service, PendingRequest, VMStatus, HostStatus
-from glassdome.knowledge import RAGHelper
+from glassdome.overseer.rag_consultant import RAGConsultant
 from glassdome.platforms import ProxmoxClient, ESXiClient, AWSClient, AzureClient
 from glassdome.reaper.engine import MissionEngine
 from glassdome.reaper.planner import VulnerabilityPlanner
@@ -40,7 +40,7 @@ class OverseerEntity:
             settings = get_secure_settings()
         self.settings = settings
         self.state = SystemState()
-        self.rag = RAGHelper()
+        self.rag = RAGConsultant()  # Knowledge lookups off the event loop, cached
         
         # Request queue (approved but not yet executed)
         self.request_queue = asyncio.Queue()
@@ -177,8 +177,7 @@ class OverseerEntity:
                         print(f"  - {issue['severity']}: {issue['description']}")
                     
                     # Attempt to handle
-                    for issue in issues:
-                        await self._handle_issue(issue)
+                    await asyncio.gather(*(self._handle_issue(issue) for issue in issues))
                 
                 # Sleep before next check
                 await asyncio.sleep(30)  # Check every 30 seconds
@@ -246,13 +245,13 @@ class OverseerEntity:
             'severity': issue['severity']
         }
         
-        rag_result = self.rag.consult_rag(rag_context)
+        rag_result = await self.rag.consult(rag_context)
         
         if rag_result:
             print(f"📚 [Monitor] RAG found similar issue:")
-            print(f"  Query: {rag_result['query']}")
-            if rag_result['results']:
-                print(f"  Best match: {rag_result['results'][0]['content'][:200]}...")
+            print(f"  Reason: {rag_result['reason']}")
+            if rag_result['sources']:
+                print(f"  Best match: {rag_result['sources'][0]}")
         
         # TODO: Implement actual resolution strategies
         self.stats['issues_detected'] += 1
@@ -473,12 +472,12 @@ class OverseerEntity:
             'user_message': f"Action: {action}, Params: {params}",
             'task': action
         }
-        rag_result = self.rag.consult_rag(rag_context)
+        rag_result = await self.rag.consult(rag_context)
         
         if rag_result and 'priority' in rag_result and rag_result['priority'] == 'high':
             # RAG flagged this as problematic
             print(f"📚 [Gate] RAG warning: {rag_result['reason']}")
-            print(f"  Context: {rag_result['results'][0]['content'][:150] if rag_result['results'] else 'N/A'}...")
+            print(f"  Context: {rag_result['sources'][0] if rag_result['sources'] else 'N/A'}")
             
             # For now, just warn but still approve
             # In production, might require explicit confirmation
@@ -570,7 +569,8 @@ class OverseerEntity:
             'execution_active': self.execution_active,
             'state': self.state.get_summary(),
             'stats': self.stats,
-            'queue_size': self.request_queue.qsize()
+            'queue_size': self.request_queue.qsize(),
+            'rag': self.rag.get_stats()
         }
     
     def shutdown(self):
@@ -584,7 +584,10 @@ class OverseerEntity:
             print(f"  Stopping Reaper mission: {mission_id}")
             engine.stop()
         
+        self.rag.shutdown()
+        self.state.flush()
         self.state.save()
+        self.state.close()
     
     # ═══════════════════════════════════════════════════
     # Reaper Mission Management
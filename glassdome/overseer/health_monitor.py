@@ -14,9 +14,12 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
 import asyncio
+import bisect
 import logging
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from itertools import islice
+from typing import Dict, Any, Optional, List, Deque
 from enum import Enum
 import httpx
 
@@ -30,6 +33,58 @@ class ServiceStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
+class HealthStats:
+    """
+    Rolling availability and latency statistics over the last N checks.
+    
+    Samples live in a fixed-size ring buffer; a sorted copy of the latencies
+    is maintained incrementally so percentiles are a single index lookup.
+    """
+    
+    def __init__(self, window: int = 100):
+        self.window = window
+        self._samples: Deque[tuple] = deque(maxlen=window)  # (ok, latency_ms)
+        self._sorted_latencies: List[float] = []
+        self._ok_count = 0
+    
+    def record(self, ok: bool, latency_ms: Optional[float] = None):
+        """Add a check result, evicting the oldest sample once the window is full"""
+        if len(self._samples) == self.window:
+            old_ok, old_latency = self._samples[0]
+            self._ok_count -= old_ok
+            if old_latency is not None:
+                idx = bisect.bisect_left(self._sorted_latencies, old_latency)
+                del self._sorted_latencies[idx]
+        
+        self._samples.append((ok, latency_ms))
+        self._ok_count += ok
+        if latency_ms is not None:
+            bisect.insort(self._sorted_latencies, latency_ms)
+    
+    @property
+    def availability(self) -> Optional[float]:
+        """Fraction of checks in the window that were healthy"""
+        if not self._samples:
+            return None
+        return self._ok_count / len(self._samples)
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank latency percentile in milliseconds"""
+        if not self._sorted_latencies:
+            return None
+        idx = min(len(self._sorted_latencies) - 1, int(pct / 100 * len(self._sorted_latencies)))
+        return self._sorted_latencies[idx]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self._samples),
+            "availability": self.availability,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
 class ServiceHealth:
     """Health status of a single service"""
     def __init__(
@@ -48,6 +103,15 @@ class ServiceHealth:
         self.error = error
         self.details = details or {}
         self.consecutive_failures = 0
+        self.stats = HealthStats()
+        
+        # Adaptive scheduling (set by HealthMonitor)
+        self.check_interval: Optional[float] = None
+        self.next_check: float = 0.0
+        
+        # Alert deduplication (set by HealthMonitor)
+        self.alert_level: Optional[str] = None
+        self.last_alert_at: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -57,7 +121,9 @@ class ServiceHealth:
             "last_check": self.last_check.isoformat() if self.last_check else None,
             "error": self.error,
             "details": self.details,
-            "consecutive_failures": self.consecutive_failures
+            "consecutive_failures": self.consecutive_failures,
+            "check_interval": self.check_interval,
+            "stats": self.stats.to_dict()
         }
 
 
@@ -72,23 +138,37 @@ class HealthMonitor:
     - Proxmox cluster nodes
     - PostgreSQL database
     - Redis cache
+    
+    Each service is checked on its own adaptive interval: healthy services
+    back off towards max_interval, failing ones tighten to min_interval.
+    HTTP connections are pooled in one long-lived client per target.
     """
     
+    # Multiplier applied to a healthy service's interval after each check
+    BACKOFF_FACTOR = 1.5
+    
     def __init__(
         self,
         frontend_url: str = "http://localhost:5174",
         backend_url: str = "http://localhost:8000",
         check_interval: int = 30,
-        timeout: int = 10
+        timeout: int = 10,
+        min_interval: Optional[int] = None,
+        max_interval: Optional[int] = None
     ):
         self.frontend_url = frontend_url
         self.backend_url = backend_url
         self.check_interval = check_interval
         self.timeout = timeout
+        self.min_interval = min_interval or max(1, check_interval // 4)
+        self.max_interval = max_interval or check_interval * 4
         
         self._running = False
         self._task: Optional[asyncio.Task] = None
         
+        # Pooled HTTP clients keyed by target base URL
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        
         # Service health states
         self.services: Dict[str, ServiceHealth] = {
             "frontend": ServiceHealth("frontend"),
@@ -99,13 +179,47 @@ class HealthMonitor:
             "database": ServiceHealth("database"),
             "redis": ServiceHealth("redis"),
         }
+        for service in self.services.values():
+            service.check_interval = check_interval
+        
+        # Per-service check coroutines, scheduled independently
+        self._checks = {
+            "frontend": self._check_frontend,
+            "backend": self._check_backend,
+            "whitepawn": self._check_whitepawn,
+            "proxmox_01": lambda: self._check_proxmox_node("proxmox_01"),
+            "proxmox_02": lambda: self._check_proxmox_node("proxmox_02"),
+            "database": self._check_database,
+            "redis": self._check_redis,
+        }
         
         # Alert callbacks
         self._alert_callbacks: List[callable] = []
         
-        # Health history for trends
-        self._health_history: List[Dict[str, Any]] = []
+        # Health history for trends (ring buffer)
         self._max_history = 1000
+        self._health_history: Deque[Dict[str, Any]] = deque(maxlen=self._max_history)
+    
+    def _get_client(self, base_url: str) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for a target, creating it on first use"""
+        client = self._clients.get(base_url)
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+            )
+            self._clients[base_url] = client
+        return client
+    
+    async def close(self):
+        """Close pooled HTTP clients"""
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing health check client: {e}")
     
     def register_alert_callback(self, callback: callable):
         """Register callback for health alerts"""
@@ -130,30 +244,38 @@ class HealthMonitor:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        await self.close()
         logger.info("Health monitor stopped")
     
     async def _monitor_loop(self):
-        """Main monitoring loop"""
+        """Main monitoring loop - wakes up when the next service is due"""
+        loop = asyncio.get_running_loop()
         while self._running:
+            now = loop.time()
+            due = [name for name, svc in self.services.items() if svc.next_check <= now]
+            
             try:
-                await self._run_all_checks()
+                await self._run_checks(due)
             except Exception as e:
                 logger.error(f"Health check error: {e}")
             
-            await asyncio.sleep(self.check_interval)
+            next_due = min(svc.next_check for svc in self.services.values())
+            await asyncio.sleep(max(0.0, next_due - loop.time()))
     
     async def _run_all_checks(self):
         """Run all health checks in parallel"""
-        checks = [
-            self._check_frontend(),
-            self._check_backend(),
-            self._check_whitepawn(),
-            self._check_proxmox(),
-            self._check_database(),
-            self._check_redis(),
-        ]
+        await self._run_checks(list(self._checks))
+    
+    async def _run_checks(self, names: List[str]):
+        """Run the named health checks in parallel and reschedule them"""
+        if not names:
+            return
+        
+        await asyncio.gather(*(self._checks[name]() for name in names), return_exceptions=True)
         
-        await asyncio.gather(*checks, return_exceptions=True)
+        now = asyncio.get_running_loop().time()
+        for name in names:
+            self._record_result(self.services[name], now)
         
         # Record history
         snapshot = {
@@ -162,31 +284,40 @@ class HealthMonitor:
         }
         self._health_history.append(snapshot)
         
-        # Trim history
-        if len(self._health_history) > self._max_history:
-            self._health_history = self._health_history[-self._max_history:]
+        # Check for alerts on the services that were just re-checked
+        await self._check_alerts(names)
+    
+    def _record_result(self, service: ServiceHealth, now: float):
+        """Update rolling stats and adapt the service's check interval"""
+        healthy = service.status == ServiceStatus.HEALTHY
+        service.stats.record(healthy, service.response_time_ms if healthy else None)
         
-        # Check for alerts
-        await self._check_alerts()
+        if healthy:
+            service.check_interval = min(
+                self.max_interval, service.check_interval * self.BACKOFF_FACTOR
+            )
+        else:
+            service.check_interval = self.min_interval
+        service.next_check = now + service.check_interval
     
     async def _check_frontend(self):
         """Check frontend health"""
         service = self.services["frontend"]
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                start = asyncio.get_event_loop().time()
-                resp = await client.get(self.frontend_url)
-                elapsed = (asyncio.get_event_loop().time() - start) * 1000
-                
-                if resp.status_code == 200:
-                    service.status = ServiceStatus.HEALTHY
-                    service.response_time_ms = elapsed
-                    service.error = None
-                    service.consecutive_failures = 0
-                else:
-                    service.status = ServiceStatus.DEGRADED
-                    service.error = f"HTTP {resp.status_code}"
-                    service.consecutive_failures += 1
+            client = self._get_client(self.frontend_url)
+            start = asyncio.get_event_loop().time()
+            resp = await client.get("/")
+            elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            
+            if resp.status_code == 200:
+                service.status = ServiceStatus.HEALTHY
+                service.response_time_ms = elapsed
+                service.error = None
+                service.consecutive_failures = 0
+            else:
+                service.status = ServiceStatus.DEGRADED
+                service.error = f"HTTP {resp.status_code}"
+                service.consecutive_failures += 1
                     
         except Exception as e:
             service.status = ServiceStatus.UNHEALTHY
@@ -199,22 +330,22 @@ class HealthMonitor:
         """Check backend health"""
         service = self.services["backend"]
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                start = asyncio.get_event_loop().time()
-                resp = await client.get(f"{self.backend_url}/api/v1/health")
-                elapsed = (asyncio.get_event_loop().time() - start) * 1000
-                
-                if resp.status_code == 200:
-                    data = resp.json()
-                    service.status = ServiceStatus.HEALTHY
-                    service.response_time_ms = elapsed
-                    service.error = None
-                    service.details = data
-                    service.consecutive_failures = 0
-                else:
-                    service.status = ServiceStatus.DEGRADED
-                    service.error = f"HTTP {resp.status_code}"
-                    service.consecutive_failures += 1
+            client = self._get_client(self.backend_url)
+            start = asyncio.get_event_loop().time()
+            resp = await client.get("/api/v1/health")
+            elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            
+            if resp.status_code == 200:
+                data = resp.json()
+                service.status = ServiceStatus.HEALTHY
+                service.response_time_ms = elapsed
+                service.error = None
+                service.details = data
+                service.consecutive_failures = 0
+            else:
+                service.status = ServiceStatus.DEGRADED
+                service.error = f"HTTP {resp.status_code}"
+                service.consecutive_failures += 1
                     
         except Exception as e:
             service.status = ServiceStatus.UNHEALTHY
@@ -227,28 +358,28 @@ class HealthMonitor:
         """Check WhitePawn status via backend API"""
         service = self.services["whitepawn"]
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                start = asyncio.get_event_loop().time()
-                resp = await client.get(f"{self.backend_url}/api/whitepawn/status")
-                elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            client = self._get_client(self.backend_url)
+            start = asyncio.get_event_loop().time()
+            resp = await client.get("/api/whitepawn/status")
+            elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            
+            if resp.status_code == 200:
+                data = resp.json()
+                active_monitors = data.get("active_monitors", 0)
                 
-                if resp.status_code == 200:
-                    data = resp.json()
-                    active_monitors = data.get("active_monitors", 0)
-                    
-                    if active_monitors > 0:
-                        service.status = ServiceStatus.HEALTHY
-                    else:
-                        service.status = ServiceStatus.DEGRADED
-                    
-                    service.response_time_ms = elapsed
-                    service.error = None
-                    service.details = data
-                    service.consecutive_failures = 0
+                if active_monitors > 0:
+                    service.status = ServiceStatus.HEALTHY
                 else:
                     service.status = ServiceStatus.DEGRADED
-                    service.error = f"HTTP {resp.status_code}"
-                    service.consecutive_failures += 1
+                
+                service.response_time_ms = elapsed
+                service.error = None
+                service.details = data
+                service.consecutive_failures = 0
+            else:
+                service.status = ServiceStatus.DEGRADED
+                service.error = f"HTTP {resp.status_code}"
+                service.consecutive_failures += 1
                     
         except Exception as e:
             service.status = ServiceStatus.UNHEALTHY
@@ -260,63 +391,67 @@ class HealthMonitor:
     async def _check_proxmox(self):
         """Check Proxmox cluster health via backend API"""
         for node in ["proxmox_01", "proxmox_02"]:
-            service = self.services[node]
-            instance = node.split("_")[1]
+            await self._check_proxmox_node(node)
+    
+    async def _check_proxmox_node(self, node: str):
+        """Check a single Proxmox node via backend API"""
+        service = self.services[node]
+        instance = node.split("_")[1]
+        
+        try:
+            client = self._get_client(self.backend_url)
+            start = asyncio.get_event_loop().time()
+            resp = await client.get(f"/api/v1/platforms/proxmox/{instance}")
+            elapsed = (asyncio.get_event_loop().time() - start) * 1000
             
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    start = asyncio.get_event_loop().time()
-                    resp = await client.get(f"{self.backend_url}/api/v1/platforms/proxmox/{instance}")
-                    elapsed = (asyncio.get_event_loop().time() - start) * 1000
-                    
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        if data.get("connected"):
-                            service.status = ServiceStatus.HEALTHY
-                        else:
-                            service.status = ServiceStatus.UNHEALTHY
-                        
-                        service.response_time_ms = elapsed
-                        service.error = None
-                        service.details = data
-                        service.consecutive_failures = 0
-                    else:
-                        service.status = ServiceStatus.DEGRADED
-                        service.error = f"HTTP {resp.status_code}"
-                        service.consecutive_failures += 1
-                        
-            except Exception as e:
-                service.status = ServiceStatus.UNHEALTHY
-                service.error = str(e)
+            if resp.status_code == 200:
+                data = resp.json()
+                if data.get("connected"):
+                    service.status = ServiceStatus.HEALTHY
+                else:
+                    service.status = ServiceStatus.UNHEALTHY
+                
+                service.response_time_ms = elapsed
+                service.error = None
+                service.details = data
+                service.consecutive_failures = 0
+            else:
+                service.status = ServiceStatus.DEGRADED
+                service.error = f"HTTP {resp.status_code}"
                 service.consecutive_failures += 1
-            
-            service.last_check = datetime.now(timezone.utc)
+                    
+        except Exception as e:
+            service.status = ServiceStatus.UNHEALTHY
+            service.error = str(e)
+            service.consecutive_failures += 1
+        
+        service.last_check = datetime.now(timezone.utc)
     
     async def _check_database(self):
         """Check database health via backend API"""
         service = self.services["database"]
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                start = asyncio.get_event_loop().time()
-                resp = await client.get(f"{self.backend_url}/api/v1/health")
-                elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            client = self._get_client(self.backend_url)
+            start = asyncio.get_event_loop().time()
+            resp = await client.get("/api/v1/health")
+            elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            
+            if resp.status_code == 200:
+                data = resp.json()
+                db_status = data.get("database", {})
                 
-                if resp.status_code == 200:
-                    data = resp.json()
-                    db_status = data.get("database", {})
-                    
-                    if db_status.get("connected"):
-                        service.status = ServiceStatus.HEALTHY
-                    else:
-                        service.status = ServiceStatus.UNHEALTHY
-                    
-                    service.response_time_ms = elapsed
-                    service.error = None
-                    service.details = db_status
-                    service.consecutive_failures = 0
+                if db_status.get("connected"):
+                    service.status = ServiceStatus.HEALTHY
                 else:
-                    service.status = ServiceStatus.DEGRADED
-                    service.consecutive_failures += 1
+                    service.status = ServiceStatus.UNHEALTHY
+                
+                service.response_time_ms = elapsed
+                service.error = None
+                service.details = db_status
+                service.consecutive_failures = 0
+            else:
+                service.status = ServiceStatus.DEGRADED
+                service.consecutive_failures += 1
                     
         except Exception as e:
             service.status = ServiceStatus.UNHEALTHY
@@ -329,27 +464,27 @@ class HealthMonitor:
         """Check Redis health via backend API"""
         service = self.services["redis"]
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                start = asyncio.get_event_loop().time()
-                resp = await client.get(f"{self.backend_url}/api/v1/health")
-                elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            client = self._get_client(self.backend_url)
+            start = asyncio.get_event_loop().time()
+            resp = await client.get("/api/v1/health")
+            elapsed = (asyncio.get_event_loop().time() - start) * 1000
+            
+            if resp.status_code == 200:
+                data = resp.json()
+                redis_status = data.get("redis", {})
                 
-                if resp.status_code == 200:
-                    data = resp.json()
-                    redis_status = data.get("redis", {})
-                    
-                    if redis_status.get("connected"):
-                        service.status = ServiceStatus.HEALTHY
-                    else:
-                        service.status = ServiceStatus.UNHEALTHY
-                    
-                    service.response_time_ms = elapsed
-                    service.error = None
-                    service.details = redis_status
-                    service.consecutive_failures = 0
+                if redis_status.get("connected"):
+                    service.status = ServiceStatus.HEALTHY
                 else:
-                    service.status = ServiceStatus.DEGRADED
-                    service.consecutive_failures += 1
+                    service.status = ServiceStatus.UNHEALTHY
+                
+                service.response_time_ms = elapsed
+                service.error = None
+                service.details = redis_status
+                service.consecutive_failures = 0
+            else:
+                service.status = ServiceStatus.DEGRADED
+                service.consecutive_failures += 1
                     
         except Exception as e:
             service.status = ServiceStatus.UNHEALTHY
@@ -358,25 +493,36 @@ class HealthMonitor:
         
         service.last_check = datetime.now(timezone.utc)
     
-    async def _check_alerts(self):
-        """Check for alert conditions and notify"""
-        for name, service in self.services.items():
+    async def _check_alerts(self, names: Optional[List[str]] = None):
+        """
+        Check for alert conditions and notify.
+        
+        Failing services are re-checked every min_interval, so an alert is
+        only sent when a service's alert level changes, and repeated at
+        most once per check_interval while it stays the same.
+        """
+        now = asyncio.get_running_loop().time()
+        for name in names if names is not None else self.services:
+            service = self.services[name]
             # Alert on 3+ consecutive failures
             if service.consecutive_failures >= 3:
-                await self._send_alert(
-                    level="critical",
-                    service=name,
-                    message=f"Service {name} has failed {service.consecutive_failures} consecutive health checks",
-                    error=service.error
-                )
+                level = "critical"
+                message = f"Service {name} has failed {service.consecutive_failures} consecutive health checks"
             # Alert on degraded status
             elif service.status == ServiceStatus.DEGRADED and service.consecutive_failures >= 2:
-                await self._send_alert(
-                    level="warning",
-                    service=name,
-                    message=f"Service {name} is degraded",
-                    error=service.error
-                )
+                level = "warning"
+                message = f"Service {name} is degraded"
+            else:
+                service.alert_level = None
+                service.last_alert_at = None
+                continue
+            
+            if level == service.alert_level and now - service.last_alert_at < self.check_interval:
+                continue
+            
+            service.alert_level = level
+            service.last_alert_at = now
+            await self._send_alert(level=level, service=name, message=message, error=service.error)
     
     async def _send_alert(self, level: str, service: str, message: str, error: Optional[str] = None):
         """Send alert to registered callbacks"""
@@ -423,8 +569,10 @@ class HealthMonitor:
         }
     
     def get_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get health check history"""
-        return self._health_history[-limit:]
+        """Get health check history (oldest first), reading only the last `limit` entries"""
+        recent = list(islice(reversed(self._health_history), max(0, limit)))
+        recent.reverse()
+        return recent
 
 
 # Singleton instance
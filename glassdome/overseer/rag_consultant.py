@@ -0,0 +1,221 @@
+"""
+RAG Consultant module for Overseer
+
+Runs knowledge-base lookups (embedding + FAISS search) off the event loop:
+- a dedicated thread pool with a bounded number of pending lookups;
+  when it is full, lookups are skipped instead of queueing up
+- results cached per normalized issue/query signature with a TTL
+- concurrent identical lookups share one execution (single-flight)
+- callers wait at most `timeout` seconds; a slow lookup keeps running and
+  its result is cached for the next time the same issue comes up
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long results are reused (seconds)
+DEFAULT_CACHE_TTL = 600
+
+# Failed lookups (e.g. no index built) are not retried for this long
+ERROR_CACHE_TTL = 60
+
+# Cached signatures kept
+DEFAULT_CACHE_SIZE = 512
+
+# Lookups queued or running before new ones are skipped
+DEFAULT_MAX_PENDING = 32
+
+# Max seconds a caller waits for a lookup
+DEFAULT_TIMEOUT = 2.0
+
+# ISO-8601 timestamps vary between otherwise identical issues
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(z|[+-]\d{2}:?\d{2})?")
+
+
+def issue_signature(kind: str, payload: Dict[str, Any]) -> str:
+    """
+    Cache key for a lookup: case, whitespace, timestamps and key order
+    don't matter.
+    """
+    parts = [kind]
+    for key in sorted(payload):
+        value = payload[key]
+        if value is None or value == "":
+            continue
+        text = _TIMESTAMP.sub("<ts>", str(value).lower())
+        parts.append(f"{key}={' '.join(text.split())}")
+    return "|".join(parts)
+
+
+class RAGConsultant:
+    """Asynchronous, cached front end to RAGHelper."""
+    
+    def __init__(
+        self,
+        helper_factory: Optional[Callable[[], Any]] = None,
+        max_workers: int = 1,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """
+        Args:
+            helper_factory: Builds the RAGHelper (called once, in the worker
+                thread, so loading the index never blocks the event loop)
+            max_workers: Threads running lookups
+            max_pending: Queued + running lookups before new ones are skipped
+            cache_ttl: Seconds a result is reused
+            cache_size: Max cached signatures
+            timeout: Default max seconds a caller waits
+        """
+        self._helper_factory = helper_factory
+        self._helper = None
+        self._helper_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="overseer-rag")
+        self.max_pending = max_pending
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.timeout = timeout
+        
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self.skipped = 0
+        self.timeouts = 0
+        self.errors = 0
+    
+    def _get_helper(self):
+        """RAGHelper, created on first use (runs in the worker thread)"""
+        if self._helper is None:
+            with self._helper_lock:
+                if self._helper is None:
+                    factory = self._helper_factory
+                    if factory is None:
+                        from glassdome.knowledge import RAGHelper
+                        factory = RAGHelper
+                    self._helper = factory()
+        return self._helper
+    
+    # ─────────────────────────────────────────────────────
+    # Cache / single-flight
+    # ─────────────────────────────────────────────────────
+    
+    def _cached(self, key: str) -> Tuple[bool, Any]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._cache[key]
+            return False, None
+        self._cache.move_to_end(key)
+        return True, value
+    
+    def _store(self, key: str, value: Any, ttl: float):
+        self._cache[key] = (time.monotonic() + ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _finished(self, key: str, future: asyncio.Future):
+        self._inflight.pop(key, None)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.errors += 1
+            logger.warning(f"RAG lookup failed: {error}")
+            self._store(key, None, ERROR_CACHE_TTL)
+        else:
+            self._store(key, future.result(), self.cache_ttl)
+    
+    async def _lookup(self, key: str, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Cached, deduplicated run of fn(*args) in the worker pool"""
+        found, value = self._cached(key)
+        if found:
+            self.hits += 1
+            return value
+        
+        future = self._inflight.get(key)
+        if future is not None:
+            self.deduplicated += 1
+        else:
+            if len(self._inflight) >= self.max_pending:
+                self.skipped += 1
+                logger.debug(f"RAG queue full ({self.max_pending}), skipping lookup")
+                return None
+            self.misses += 1
+            future = asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._finished(key, f))
+        
+        try:
+            # Shielded: a caller timing out doesn't cancel the shared lookup
+            return await asyncio.wait_for(asyncio.shield(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return None
+        except Exception:
+            return None  # Counted and logged in _finished
+    
+    # ─────────────────────────────────────────────────────
+    # Lookups
+    # ─────────────────────────────────────────────────────
+    
+    def _consult(self, context: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self._get_helper().consult_rag(context)
+    
+    def _search(self, query: str, search_type: str) -> str:
+        helper = self._get_helper()
+        if search_type == "error":
+            return helper.search_error(query)
+        return helper.quick_search(query)
+    
+    async def consult(self, context: Dict[str, Any], timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        RAGHelper.consult_rag without blocking the event loop
+        
+        Returns None when RAG has nothing to add, the lookup is still
+        running after `timeout`, or the queue is full.
+        """
+        key = issue_signature("consult", context)
+        return await self._lookup(key, self._consult, context, timeout=timeout)
+    
+    async def search(self, query: str, search_type: str = "general", timeout: Optional[float] = None) -> Optional[str]:
+        """RAGHelper.quick_search / search_error without blocking the event loop"""
+        key = issue_signature("search", {"query": query, "type": search_type})
+        return await self._lookup(key, self._search, query, search_type, timeout=timeout)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache and queue statistics"""
+        return {
+            "cached": len(self._cache),
+            "pending": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "deduplicated": self.deduplicated,
+            "skipped": self.skipped,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+    
+    def shutdown(self):
+        """Stop the worker pool; queued lookups are dropped"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -221,9 +221,10 @@ async def get_health_history(limit: int = 100):
     if not health_monitor:
         raise HTTPException(status_code=503, detail="Health monitor not initialized")
     
+    history = health_monitor.get_history(limit=limit)
     return {
-        "history": health_monitor.get_history(limit=limit),
-        "count": len(health_monitor.get_history(limit=limit))
+        "history": history,
+        "count": len(history)
     }
 
 
@@ -7,6 +7,9 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -16,6 +19,15 @@ from enum import Enum
 from glassdome.core.paths import OVERSEER_STATE_FILE
 
 
+# Journal tuning: records are written through to the OS on every mutation,
+# but fsync is group-committed (by batch size, or by a timer so an idle
+# journal is never left unsynced for long) and the journal is folded into a
+# fresh snapshot once it grows past the compaction threshold.
+JOURNAL_FSYNC_BATCH = 32
+JOURNAL_FSYNC_INTERVAL = 1.0  # seconds
+JOURNAL_COMPACT_THRESHOLD = 1000
+
+
 class VMStatus(Enum):
     RUNNING = "running"
     STOPPED = "stopped"
@@ -107,13 +119,22 @@ class SystemState:
     
     def __init__(self, state_file: str = None):
         self.state_file = Path(state_file) if state_file else OVERSEER_STATE_FILE
+        self.journal_file = self.state_file.with_name(self.state_file.name + ".journal")
         
         self.vms: Dict[str, VM] = {}
         self.hosts: Dict[str, Host] = {}
         self.services: Dict[str, Service] = {}
         self.requests: Dict[str, PendingRequest] = {}
         
-        # Load persisted state if exists
+        # Journal bookkeeping
+        self._journal_lock = threading.Lock()
+        self._journal_fh = None
+        self._journal_entries = 0
+        self._unsynced_entries = 0
+        self._last_fsync = time.monotonic()
+        self._fsync_timer: Optional[threading.Timer] = None
+        
+        # Load persisted state (snapshot + journal tail) if exists
         self.load()
     
     # ═══════════════════════════════════════════════════
@@ -123,7 +144,7 @@ class SystemState:
     def add_vm(self, vm: VM):
         """Register a new VM"""
         self.vms[vm.id] = vm
-        self.save()
+        self._journal_put('vms', vm.id, vm)
     
     def update_vm(self, vm_id: str, **kwargs):
         """Update VM attributes"""
@@ -133,7 +154,7 @@ class SystemState:
                 if hasattr(vm, key):
                     setattr(vm, key, value)
             vm.last_checked = datetime.now().isoformat()
-            self.save()
+            self._journal_put('vms', vm_id, vm)
     
     def get_vm(self, vm_id: str) -> Optional[VM]:
         """Get VM by ID"""
@@ -143,7 +164,7 @@ class SystemState:
         """Remove VM from state"""
         if vm_id in self.vms:
             del self.vms[vm_id]
-            self.save()
+            self._journal_delete('vms', vm_id)
     
     def is_production(self, vm_id: str) -> bool:
         """Check if VM is marked as production"""
@@ -166,7 +187,7 @@ class SystemState:
         """Register a host"""
         key = f"{host.platform}:{host.identifier}"
         self.hosts[key] = host
-        self.save()
+        self._journal_put('hosts', key, host)
     
     def update_host(self, platform: str, identifier: str, **kwargs):
         """Update host attributes"""
@@ -177,7 +198,7 @@ class SystemState:
                 if hasattr(host, k):
                     setattr(host, k, v)
             host.last_checked = datetime.now().isoformat()
-            self.save()
+            self._journal_put('hosts', key, host)
     
     def get_host(self, platform: str, identifier: str) -> Optional[Host]:
         """Get host"""
@@ -196,7 +217,7 @@ class SystemState:
         """Register a service"""
         key = f"{service.vm_id}:{service.name}"
         self.services[key] = service
-        self.save()
+        self._journal_put('services', key, service)
     
     def get_services_on_vm(self, vm_id: str) -> List[Service]:
         """Get all services running on a VM"""
@@ -209,7 +230,7 @@ class SystemState:
     def add_request(self, request: PendingRequest):
         """Add a pending request"""
         self.requests[request.request_id] = request
-        self.save()
+        self._journal_put('requests', request.request_id, request)
     
     def update_request_status(self, request_id: str, status: str, **kwargs):
         """Update request status"""
@@ -219,7 +240,7 @@ class SystemState:
             for k, v in kwargs.items():
                 if hasattr(req, k):
                     setattr(req, k, v)
-            self.save()
+            self._journal_put('requests', request_id, req)
     
     def get_pending_requests(self) -> List[PendingRequest]:
         """Get all pending requests"""
@@ -258,48 +279,169 @@ class SystemState:
     # Persistence
     # ═══════════════════════════════════════════════════
     
-    def save(self):
-        """Persist state to disk"""
-        # Custom serializer for enums
-        def enum_serializer(obj):
-            if isinstance(obj, Enum):
-                return obj.value
-            return str(obj)
+    # Snapshot + append-only journal:
+    #   <state_file>          compacted snapshot, replaced atomically
+    #   <state_file>.journal  one JSON record per mutation since the snapshot
+    
+    _COLLECTIONS = {
+        'vms': VM,
+        'hosts': Host,
+        'services': Service,
+        'requests': PendingRequest,
+    }
+    
+    @staticmethod
+    def _json_default(obj):
+        """Serialize enums to their values"""
+        if isinstance(obj, Enum):
+            return obj.value
+        return str(obj)
+    
+    def _journal_put(self, collection: str, key: str, obj: Any):
+        """Journal an upsert of a single record"""
+        self._append_journal({'op': 'put', 'c': collection, 'k': key, 'v': asdict(obj)})
+    
+    def _journal_delete(self, collection: str, key: str):
+        """Journal the removal of a single record"""
+        self._append_journal({'op': 'del', 'c': collection, 'k': key})
+    
+    def _append_journal(self, record: Dict[str, Any]):
+        """Append a record to the journal with group-committed fsync"""
+        line = json.dumps(record, default=self._json_default, separators=(',', ':'))
+        
+        with self._journal_lock:
+            if self._journal_fh is None:
+                self._journal_fh = open(self.journal_file, 'a', encoding='utf-8')
+            self._journal_fh.write(line + '\n')
+            self._journal_fh.flush()
+            self._journal_entries += 1
+            self._unsynced_entries += 1
+            
+            now = time.monotonic()
+            if (self._unsynced_entries >= JOURNAL_FSYNC_BATCH or
+                    now - self._last_fsync >= JOURNAL_FSYNC_INTERVAL):
+                self._sync_journal_locked()
+            elif self._fsync_timer is None:
+                # No further mutation may come; sync this one on a timer
+                self._fsync_timer = threading.Timer(JOURNAL_FSYNC_INTERVAL, self._timed_sync)
+                self._fsync_timer.daemon = True
+                self._fsync_timer.start()
+            
+            compact = self._journal_entries >= JOURNAL_COMPACT_THRESHOLD
         
+        if compact:
+            self.save()
+    
+    def _sync_journal_locked(self):
+        """Fsync pending journal records (caller holds the lock)"""
+        if self._journal_fh is not None and self._unsynced_entries:
+            os.fsync(self._journal_fh.fileno())
+        self._unsynced_entries = 0
+        self._last_fsync = time.monotonic()
+    
+    def _timed_sync(self):
+        """Timer callback: fsync records that no later append has synced"""
+        with self._journal_lock:
+            self._fsync_timer = None
+            self._sync_journal_locked()
+    
+    def flush(self):
+        """Force any batched journal records to disk"""
+        with self._journal_lock:
+            self._sync_journal_locked()
+    
+    def close(self):
+        """Sync and close the journal (on service shutdown)"""
+        with self._journal_lock:
+            if self._fsync_timer is not None:
+                self._fsync_timer.cancel()
+                self._fsync_timer = None
+            self._sync_journal_locked()
+            if self._journal_fh is not None:
+                self._journal_fh.close()
+                self._journal_fh = None
+    
+    def save(self):
+        """Persist a compacted snapshot to disk and truncate the journal"""
         state = {
-            'vms': {k: asdict(v) for k, v in self.vms.items()},
-            'hosts': {k: asdict(v) for k, v in self.hosts.items()},
-            'services': {k: asdict(v) for k, v in self.services.items()},
-            'requests': {k: asdict(v) for k, v in self.requests.items()},
-            'last_saved': datetime.now().isoformat()
+            name: {k: asdict(v) for k, v in getattr(self, name).items()}
+            for name in self._COLLECTIONS
         }
+        state['last_saved'] = datetime.now().isoformat()
         
-        # Convert enums to their values for JSON serialization
-        state_json = json.loads(json.dumps(state, default=enum_serializer))
-        
-        with open(self.state_file, 'w') as f:
-            json.dump(state_json, f, indent=2)
+        with self._journal_lock:
+            # Write-then-rename so a crash never leaves a half-written snapshot
+            tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2, default=self._json_default)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
+            
+            # Everything journaled so far is now covered by the snapshot
+            if self._journal_fh is not None:
+                self._journal_fh.close()
+                self._journal_fh = None
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+            self._journal_entries = 0
+            self._unsynced_entries = 0
+            self._last_fsync = time.monotonic()
     
     def load(self):
-        """Load state from disk"""
-        if not self.state_file.exists():
-            return
-        
+        """Load state from disk: snapshot first, then replay the journal tail"""
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            if self.state_file.exists():
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                
+                # Reconstruct objects - __post_init__ will handle enum conversion from strings
+                for name, cls in self._COLLECTIONS.items():
+                    setattr(self, name, {k: cls(**v) for k, v in state.get(name, {}).items()})
             
-            # Reconstruct objects - __post_init__ will handle enum conversion from strings
-            self.vms = {k: VM(**v) for k, v in state.get('vms', {}).items()}
-            self.hosts = {k: Host(**v) for k, v in state.get('hosts', {}).items()}
-            self.services = {k: Service(**v) for k, v in state.get('services', {}).items()}
-            self.requests = {k: PendingRequest(**v) for k, v in state.get('requests', {}).items()}
+            replayed, torn = self._replay_journal()
+            if torn:
+                # Fold the intact prefix into a snapshot so new records are
+                # never appended behind a corrupt line
+                self.save()
             
-            print(f"✅ Loaded state: {len(self.vms)} VMs, {len(self.hosts)} hosts, {len(self.services)} services")
+            if self.state_file.exists() or replayed:
+                print(f"✅ Loaded state: {len(self.vms)} VMs, {len(self.hosts)} hosts, "
+                      f"{len(self.services)} services ({replayed} journal entries replayed)")
             
         except Exception as e:
             print(f"⚠️ Could not load state: {e}")
     
+    def _replay_journal(self) -> tuple:
+        """
+        Apply journal records on top of the loaded snapshot.
+        
+        Returns (records replayed, whether a torn record was found).
+        """
+        if not self.journal_file.exists():
+            return 0, False
+        
+        replayed = 0
+        torn = False
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final write from a crash - everything before it is intact
+                    torn = True
+                    break
+                
+                collection = getattr(self, record['c'])
+                if record['op'] == 'put':
+                    collection[record['k']] = self._COLLECTIONS[record['c']](**record['v'])
+                elif record['op'] == 'del':
+                    collection.pop(record['k'], None)
+                replayed += 1
+        
+        self._journal_entries = replayed
+        return replayed, torn
+    
     # ═══════════════════════════════════════════════════
     # Summary / Status
     # ═══════════════════════════════════════════════════
@@ -345,6 +487,7 @@ if __name__ == "__main__":
         vms=["114"]
     )
     state.add_host(host)
+    state.flush()
     
     print("\n" + "="*70)
     print("STATE MANAGEMENT TEST")
@@ -144,13 +144,13 @@ class StateSync:
     
     async def _sync_deployed_vms(self, actual_vmids: Set[int]) -> int:
         """Remove deployed_vms records for VMs that don't exist"""
-        from glassdome.core.database import AsyncSessionLocal
+        from glassdome.core.database import BackgroundSessionLocal
         from glassdome.networking.models import DeployedVM
         from sqlalchemy import select, delete
         
         cleaned = 0
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             # Get all deployed VMs
             result = await session.execute(select(DeployedVM))
             deployed_vms = result.scalars().all()
@@ -178,13 +178,13 @@ class StateSync:
     
     async def _sync_hot_spares(self, actual_vmids: Set[int]) -> int:
         """Remove hot_spares records for VMs that don't exist"""
-        from glassdome.core.database import AsyncSessionLocal
+        from glassdome.core.database import BackgroundSessionLocal
         from glassdome.reaper.hot_spare import HotSpare
         from sqlalchemy import select, delete
         
         cleaned = 0
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             # Get all hot spares
             result = await session.execute(select(HotSpare))
             spares = result.scalars().all()
@@ -207,7 +207,7 @@ class StateSync:
     
     async def _update_vm_ips(self, actual_vms: List[Dict[str, Any]]) -> int:
         """Update IP addresses for VMs from actual Proxmox state"""
-        from glassdome.core.database import AsyncSessionLocal
+        from glassdome.core.database import BackgroundSessionLocal
         from glassdome.networking.models import DeployedVM
         from sqlalchemy import select
         
@@ -226,7 +226,7 @@ class StateSync:
             if vmid and ip:
                 vmid_to_ip[vmid] = ip
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             result = await session.execute(select(DeployedVM))
             deployed_vms = result.scalars().all()
             
@@ -249,13 +249,13 @@ class StateSync:
     
     async def _clean_orphaned_networks(self) -> int:
         """Remove network definitions with no associated VMs"""
-        from glassdome.core.database import AsyncSessionLocal
+        from glassdome.core.database import BackgroundSessionLocal
         from glassdome.networking.models import NetworkDefinition, DeployedVM
         from sqlalchemy import select, delete, func
         
         cleaned = 0
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             # Get lab_ids that have VMs
             result = await session.execute(
                 select(DeployedVM.lab_id).distinct()
@@ -330,6 +330,9 @@ class StateSyncScheduler:
     
     async def _scheduler_loop(self):
         """Main scheduler loop"""
+        from glassdome.core.db_metrics import set_db_scope
+        set_db_scope("overseer.state_sync")
+        
         while self._running:
             try:
                 result = await self.sync.sync_all()
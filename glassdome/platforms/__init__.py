@@ -5,11 +5,27 @@ Author: Brett Turner (ntounix)
 Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
-from glassdome.platforms.base import PlatformClient, VMStatus
-from glassdome.platforms.proxmox_client import ProxmoxClient
-from glassdome.platforms.esxi_client import ESXiClient
-from glassdome.platforms.azure_client import AzureClient
-from glassdome.platforms.aws_client import AWSClient
+
+from typing import TYPE_CHECKING
+
+from glassdome._lazy import lazy_attributes
+
+# Imported on first access so that one client does not pull in every SDK
+_LAZY_IMPORTS = {
+    "PlatformClient": "glassdome.platforms.base",
+    "VMStatus": "glassdome.platforms.base",
+    "ProxmoxClient": "glassdome.platforms.proxmox_client",
+    "ESXiClient": "glassdome.platforms.esxi_client",
+    "AzureClient": "glassdome.platforms.azure_client",
+    "AWSClient": "glassdome.platforms.aws_client",
+}
+
+if TYPE_CHECKING:
+    from glassdome.platforms.base import PlatformClient, VMStatus
+    from glassdome.platforms.proxmox_client import ProxmoxClient
+    from glassdome.platforms.esxi_client import ESXiClient
+    from glassdome.platforms.azure_client import AzureClient
+    from glassdome.platforms.aws_client import AWSClient
 
 __all__ = [
     "PlatformClient",
@@ -20,3 +36,4 @@ __all__ = [
     "AWSClient",
 ]
 
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_IMPORTS)
@@ -7,8 +7,11 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 import boto3
 import asyncio
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple, Union
 import logging
 
 from glassdome.platforms.base import PlatformClient, VMStatus
@@ -44,6 +47,106 @@ UBUNTU_AMIS = {
     }
 }
 
+# Seconds a looked-up AMI is used before it is refreshed in the background
+AMI_CACHE_TTL = 6 * 3600
+
+# Seconds the discovered default VPC / subnet / security group are reused
+NETWORK_CACHE_TTL = 600
+
+# Threads for blocking boto3 calls (shared by all AWSClient instances)
+MAX_WORKERS = 16
+
+# Seconds to wait for the public IPs of launched instances
+IP_WAIT_TIMEOUT = 120
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="aws")
+
+_sessions: Dict[Tuple[str, str], boto3.session.Session] = {}
+_clients: Dict[Tuple[str, str, str], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_boto3_session(access_key_id: str, secret_access_key: str) -> boto3.session.Session:
+    """Shared boto3 session per credential pair"""
+    with _clients_lock:
+        session = _sessions.get((access_key_id, secret_access_key))
+        if session is None:
+            session = boto3.session.Session(
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key
+            )
+            _sessions[(access_key_id, secret_access_key)] = session
+        return session
+
+
+def get_ec2_client(access_key_id: str, secret_access_key: str, region: str):
+    """
+    Shared EC2 client per credentials and region
+    
+    Creating a client loads the service model (tens of ms); clients are
+    thread-safe, so one per region is reused by every AWSClient.
+    """
+    session = get_boto3_session(access_key_id, secret_access_key)
+    with _clients_lock:
+        client = _clients.get((access_key_id, region, 'ec2'))
+        if client is None:
+            client = session.client('ec2', region_name=region)
+            _clients[(access_key_id, region, 'ec2')] = client
+        return client
+
+
+class DiscoveryCache:
+    """
+    TTL cache for AMI and network lookups, shared by all AWSClients
+    
+    An expired entry is still returned while one background task refreshes
+    it, so only the first lookup of a key waits on AWS. Concurrent lookups
+    of a missing key share one load.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[tuple, Tuple[float, Any]] = {}
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+    
+    async def get(self, key: tuple, ttl: float, load: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires <= time.monotonic() and key not in self._inflight:
+                self._load(key, ttl, load)
+            return value
+        
+        task = self._inflight.get(key) or self._load(key, ttl, load)
+        return await asyncio.shield(task)
+    
+    def _load(self, key: tuple, ttl: float, load: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        async def run():
+            try:
+                value = await load()
+                self._entries[key] = (time.monotonic() + ttl, value)
+                return value
+            finally:
+                self._inflight.pop(key, None)
+        
+        task = asyncio.create_task(run())
+        task.add_done_callback(self._log_failure(key))
+        self._inflight[key] = task
+        return task
+    
+    def _log_failure(self, key: tuple):
+        def callback(task: asyncio.Task):
+            if not task.cancelled() and task.exception() and key in self._entries:
+                logger.warning(f"Background refresh of {key} failed, keeping cached value: {task.exception()}")
+        return callback
+    
+    def invalidate(self, *prefix):
+        """Drop entries whose key starts with `prefix` (all if empty)"""
+        for key in [k for k in self._entries if k[:len(prefix)] == prefix]:
+            del self._entries[key]
+
+
+_discovery_cache = DiscoveryCache()
+
 
 class AWSClient(PlatformClient):
     """
@@ -69,24 +172,33 @@ class AWSClient(PlatformClient):
         self.secret_access_key = secret_access_key
         self.default_vpc = default_vpc
         
-        # Initialize EC2 client
-        self.ec2_client = boto3.client(
-            'ec2',
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name=region
-        )
-        
-        # Initialize EC2 resource (higher-level interface)
-        self.ec2_resource = boto3.resource(
-            'ec2',
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name=region
-        )
+        # Shared EC2 client (one per credentials and region)
+        self.ec2_client = get_ec2_client(access_key_id, secret_access_key, region)
+        self._ec2_resource = None
         
         logger.info(f"AWS client initialized for region {region}")
     
+    @property
+    def ec2_resource(self):
+        """Lazy-loaded EC2 resource (higher-level interface)"""
+        if self._ec2_resource is None:
+            session = get_boto3_session(self.access_key_id, self.secret_access_key)
+            self._ec2_resource = session.resource('ec2', region_name=self.region)
+        return self._ec2_resource
+    
+    async def _call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking boto3 call on the shared executor"""
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, partial(fn, *args, **kwargs)
+        )
+    
+    def _cache_key(self, *parts) -> tuple:
+        return (self.access_key_id, self.region) + parts
+    
+    def invalidate_discovery_cache(self):
+        """Forget cached AMIs and network lookups for this account and region"""
+        _discovery_cache.invalidate(self.access_key_id, self.region)
+    
     # =========================================================================
     # CORE VM OPERATIONS (PlatformClient Interface)
     # =========================================================================
@@ -105,19 +217,84 @@ class AWSClient(PlatformClient):
                 - memory: RAM in MB (maps to instance type)
                 - ssh_user: SSH username (default: "ubuntu")
                 - instance_type: Override instance type (optional)
+                - subnet_id: Launch into this subnet (optional, default VPC otherwise)
+                - security_group_ids: Use these groups (optional, glassdome group otherwise)
                 - packages: List of packages to install
                 - users: List of user accounts to create
         
         Returns:
             Dict with vm_id, ip_address, platform, status, ansible_connection
         """
+        spec = await self._prepare_launch(config)
+        
+        logger.info(f"Creating AWS EC2 instance: {spec['name']} ({spec['os_type']}, {spec['instance_type']}) in {self.region}")
+        
+        try:
+            return (await self._launch([spec]))[0]
+        except Exception as e:
+            logger.error(f"Failed to create instance: {e}")
+            raise
+    
+    async def create_vms(self, configs: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Create several EC2 instances, batching identical specs
+        
+        Linux VMs that differ only by name (same AMI, instance type, subnet,
+        security groups and cloud-init) are launched with one run_instances
+        call; their hostnames are set from the Name tag at boot. Windows VMs
+        are launched one per call, since the hostname is part of the user
+        data. All batches run concurrently.
+        
+        Args:
+            configs: VM configurations (see create_vm)
+        
+        Returns:
+            One entry per config, in order: the create_vm result dict, or
+            the exception that made that VM's launch fail
+        """
+        prepared = await asyncio.gather(
+            *(self._prepare_launch(config, batch=True) for config in configs),
+            return_exceptions=True
+        )
+        
+        results: List[Union[Dict[str, Any], Exception]] = list(prepared)
+        groups: Dict[tuple, List[int]] = {}
+        for index, spec in enumerate(prepared):
+            if not isinstance(spec, Exception):
+                groups.setdefault(spec["batch_key"], []).append(index)
+        
+        async def launch(indexes: List[int]):
+            specs = [prepared[i] for i in indexes]
+            try:
+                if len(specs) == 1:
+                    # Nothing to share: keep the hostname in the user data
+                    specs = [await self._prepare_launch(configs[indexes[0]])]
+                logger.info(f"Launching {len(specs)} x {specs[0]['instance_type']} in {self.region}: "
+                            f"{', '.join(spec['name'] for spec in specs)}")
+                launched = await self._launch(specs)
+            except Exception as e:
+                logger.error(f"Failed to create instances {[spec['name'] for spec in specs]}: {e}")
+                launched = [e] * len(specs)
+            for i, result in zip(indexes, launched):
+                results[i] = result
+        
+        await asyncio.gather(*(launch(indexes) for indexes in groups.values()))
+        return results
+    
+    async def _prepare_launch(self, config: Dict[str, Any], batch: bool = False) -> Dict[str, Any]:
+        """
+        Resolve everything run_instances needs for one VM
+        
+        AMI, VPC and security group come from the discovery cache, so
+        preparing many VMs costs a few describe calls in total. With
+        `batch`, the user data does not contain the VM name, so VMs that
+        only differ by name share a `batch_key`.
+        """
         name = config.get("name", f"glassdome-vm-{int(time.time())}")
         os_type = config.get("os_type", "linux")
         os_version = config.get("os_version", "22.04")
         instance_type = config.get("instance_type") or self._map_instance_type(config, os_type)
         
-        logger.info(f"Creating AWS EC2 instance: {name} ({os_type}, {instance_type}) in {self.region}")
-        
         # 1. Get AMI (Linux or Windows)
         if os_type == "windows":
             windows_version = config.get("windows_version", "server2022")
@@ -125,81 +302,130 @@ class AWSClient(PlatformClient):
         else:
             ami_id = await self._get_ubuntu_ami(os_version, instance_type)
         
-        # 2. Get/Create VPC and Subnet
-        vpc_id, subnet_id = await self._get_vpc_and_subnet()
+        # 2. Get/Create VPC, subnet and security group (unless given)
+        subnet_id = config.get("subnet_id")
+        sg_ids = [sg for sg in config.get("security_group_ids") or [] if sg]
+        vpc_id = default_subnet_id = None
+        if not sg_ids:
+            vpc_id, default_subnet_id = await self._get_vpc_and_subnet()
+            sg_ids = [await self._get_or_create_security_group(vpc_id, name, os_type)]
         
-        # 3. Get/Create Security Group
-        sg_id = await self._get_or_create_security_group(vpc_id, name, os_type)
-        
-        # 4. Build user-data (cloud-init for Linux, EC2Launch for Windows)
+        # 3. Build user-data (cloud-init for Linux, EC2Launch for Windows)
+        batched = batch and os_type != "windows"
         if os_type == "windows":
             user_data = self._build_windows_userdata(config)
         else:
-            user_data = self._build_cloud_init(config)
+            user_data = self._build_cloud_init(config, hostname_from_tag=batched)
+        
+        return {
+            "name": name,
+            "config": config,
+            "os_type": os_type,
+            "os_version": os_version,
+            "instance_type": instance_type,
+            "ami_id": ami_id,
+            "vpc_id": vpc_id,
+            "subnet_id": subnet_id,
+            "default_subnet_id": default_subnet_id,
+            "security_group_ids": sg_ids,
+            "user_data": user_data,
+            "hostname_from_tag": batched,
+            "batch_key": (
+                ami_id, instance_type, subnet_id, tuple(sg_ids), user_data,
+                None if batched else name
+            ),
+        }
+    
+    async def _launch(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Launch instances sharing one spec with a single run_instances call
+        
+        Waits for all of them to run and resolves their IPs with one
+        describe_instances per poll.
+        """
+        spec = specs[0]
+        count = len(specs)
+        tags = [
+            {'Key': 'Project', 'Value': 'glassdome'},
+            {'Key': 'ManagedBy', 'Value': 'glassdome-platform'}
+        ]
+        params = {
+            "ImageId": spec["ami_id"],
+            "InstanceType": spec["instance_type"],
+            "MinCount": count,
+            "MaxCount": count,
+            "UserData": spec["user_data"],
+            "SecurityGroupIds": spec["security_group_ids"],
+            "TagSpecifications": [{
+                'ResourceType': 'instance',
+                'Tags': tags if spec["hostname_from_tag"] else [{'Key': 'Name', 'Value': spec["name"]}] + tags
+            }]
+        }
+        # Without a subnet, AWS picks an AZ that supports the instance type
+        if spec["subnet_id"]:
+            params["SubnetId"] = spec["subnet_id"]
+        if spec["hostname_from_tag"]:
+            # Lets cloud-init read the Name tag from instance metadata
+            params["MetadataOptions"] = {'InstanceMetadataTags': 'enabled'}
         
-        # 5. Launch instance
         try:
-            # Don't specify subnet - let AWS choose AZ that supports the instance type
-            response = self.ec2_client.run_instances(
-                ImageId=ami_id,
-                InstanceType=instance_type,
-                MinCount=1,
-                MaxCount=1,
-                UserData=user_data,
-                SecurityGroupIds=[sg_id],
-                TagSpecifications=[{
-                    'ResourceType': 'instance',
-                    'Tags': [
-                        {'Key': 'Name', 'Value': name},
-                        {'Key': 'Project', 'Value': 'glassdome'},
-                        {'Key': 'ManagedBy', 'Value': 'glassdome-platform'}
-                    ]
-                }]
-            )
-            
-            instance = response['Instances'][0]
-            instance_id = instance['InstanceId']
-            
-            logger.info(f"Instance {instance_id} launched, waiting for running state...")
-            
-            # 6. Wait for instance to be running
-            waiter = self.ec2_client.get_waiter('instance_running')
-            waiter.wait(InstanceIds=[instance_id])
-            
-            # 7. Get IP address
-            ip_address = await self.get_vm_ip(instance_id, timeout=120)
-            
-            logger.info(f"✅ AWS instance {instance_id} created @ {ip_address}")
-            
-            return {
+            response = await self._call(self.ec2_client.run_instances, **params)
+        except Exception:
+            # The cached AMI, subnet or security group may have gone away
+            self.invalidate_discovery_cache()
+            raise
+        
+        instance_ids = [instance['InstanceId'] for instance in response['Instances']]
+        
+        if spec["hostname_from_tag"]:
+            await asyncio.gather(*(
+                self._call(
+                    self.ec2_client.create_tags,
+                    Resources=[instance_id],
+                    Tags=[{'Key': 'Name', 'Value': s["name"]}]
+                )
+                for instance_id, s in zip(instance_ids, specs)
+            ))
+        
+        logger.info(f"Instances {', '.join(instance_ids)} launched, waiting for running state...")
+        
+        # Wait for instances to be running (one waiter for all)
+        waiter = self.ec2_client.get_waiter('instance_running')
+        await self._call(waiter.wait, InstanceIds=instance_ids)
+        
+        # Get IP addresses
+        ips = await self._get_vm_ips(instance_ids, timeout=IP_WAIT_TIMEOUT)
+        
+        results = []
+        for instance_id, s in zip(instance_ids, specs):
+            ip_address = ips.get(instance_id)
+            logger.info(f"✅ AWS instance {instance_id} ({s['name']}) created @ {ip_address}")
+            results.append({
                 "vm_id": instance_id,
                 "ip_address": ip_address,
                 "platform": "aws",
                 "status": VMStatus.RUNNING.value,
                 "ansible_connection": {
                     "host": ip_address,
-                    "user": config.get("ssh_user", "ubuntu"),
-                    "ssh_key_path": config.get("ssh_key_path"),
+                    "user": s["config"].get("ssh_user", "ubuntu"),
+                    "ssh_key_path": s["config"].get("ssh_key_path"),
                     "port": 22
                 },
                 "platform_specific": {
                     "region": self.region,
-                    "instance_type": instance_type,
-                    "ami_id": ami_id,
-                    "vpc_id": vpc_id,
-                    "subnet_id": subnet_id,
-                    "security_group_id": sg_id
+                    "instance_type": s["instance_type"],
+                    "ami_id": s["ami_id"],
+                    "vpc_id": s["vpc_id"],
+                    "subnet_id": s["subnet_id"] or s["default_subnet_id"],
+                    "security_group_id": s["security_group_ids"][0]
                 }
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to create instance: {e}")
-            raise
+            })
+        return results
     
     async def start_vm(self, vm_id: str) -> bool:
         """Start a stopped EC2 instance"""
         try:
-            self.ec2_client.start_instances(InstanceIds=[vm_id])
+            await self._call(self.ec2_client.start_instances, InstanceIds=[vm_id])
             logger.info(f"Started instance {vm_id}")
             return True
         except Exception as e:
@@ -210,9 +436,9 @@ class AWSClient(PlatformClient):
         """Stop a running EC2 instance"""
         try:
             if force:
-                self.ec2_client.stop_instances(InstanceIds=[vm_id], Force=True)
+                await self._call(self.ec2_client.stop_instances, InstanceIds=[vm_id], Force=True)
             else:
-                self.ec2_client.stop_instances(InstanceIds=[vm_id])
+                await self._call(self.ec2_client.stop_instances, InstanceIds=[vm_id])
             logger.info(f"Stopped instance {vm_id}")
             return True
         except Exception as e:
@@ -222,7 +448,7 @@ class AWSClient(PlatformClient):
     async def delete_vm(self, vm_id: str) -> bool:
         """Terminate (delete) an EC2 instance"""
         try:
-            self.ec2_client.terminate_instances(InstanceIds=[vm_id])
+            await self._call(self.ec2_client.terminate_instances, InstanceIds=[vm_id])
             logger.info(f"Terminated instance {vm_id}")
             return True
         except Exception as e:
@@ -232,7 +458,7 @@ class AWSClient(PlatformClient):
     async def get_vm_status(self, vm_id: str) -> VMStatus:
         """Get EC2 instance status"""
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[vm_id])
+            response = await self._call(self.ec2_client.describe_instances, InstanceIds=[vm_id])
             state = response['Reservations'][0]['Instances'][0]['State']['Name']
             return self._standardize_vm_status(state)
         except Exception as e:
@@ -245,32 +471,48 @@ class AWSClient(PlatformClient):
         
         Waits up to timeout seconds for IP to be assigned
         """
+        return (await self._get_vm_ips([vm_id], timeout)).get(vm_id)
+    
+    async def _get_vm_ips(self, vm_ids: List[str], timeout: int = 120) -> Dict[str, Optional[str]]:
+        """
+        Public IPs of several instances, one describe_instances per poll
+        
+        Falls back to the private IP for instances without a public one.
+        """
         start_time = time.time()
+        ips: Dict[str, Optional[str]] = {}
         
         while (time.time() - start_time) < timeout:
+            pending = [vm_id for vm_id in vm_ids if vm_id not in ips]
             try:
-                response = self.ec2_client.describe_instances(InstanceIds=[vm_id])
-                instance = response['Reservations'][0]['Instances'][0]
+                response = await self._call(self.ec2_client.describe_instances, InstanceIds=pending)
+                for reservation in response['Reservations']:
+                    for instance in reservation['Instances']:
+                        vm_id = instance['InstanceId']
+                        
+                        # Try public IP first, fallback to private
+                        public_ip = instance.get('PublicIpAddress')
+                        private_ip = instance.get('PrivateIpAddress')
+                        if public_ip:
+                            ips[vm_id] = public_ip
+                        elif private_ip:
+                            logger.warning(f"No public IP for {vm_id}, using private IP: {private_ip}")
+                            ips[vm_id] = private_ip
                 
-                # Try public IP first, fallback to private
-                public_ip = instance.get('PublicIpAddress')
-                if public_ip:
-                    return public_ip
-                
-                private_ip = instance.get('PrivateIpAddress')
-                if private_ip:
-                    logger.warning(f"No public IP for {vm_id}, using private IP: {private_ip}")
-                    return private_ip
+                if len(ips) == len(vm_ids):
+                    return ips
                 
                 # Wait and retry
                 await asyncio.sleep(2)
                 
             except Exception as e:
-                logger.error(f"Error getting IP for {vm_id}: {e}")
+                logger.error(f"Error getting IP for {', '.join(pending)}: {e}")
                 await asyncio.sleep(2)
         
-        logger.warning(f"Timeout waiting for IP address for {vm_id}")
-        return None
+        for vm_id in vm_ids:
+            if vm_id not in ips:
+                logger.warning(f"Timeout waiting for IP address for {vm_id}")
+        return ips
     
     # =========================================================================
     # HELPER METHODS
@@ -317,6 +559,9 @@ class AWSClient(PlatformClient):
         """
         Get Ubuntu AMI ID for the current region
         
+        The latest AMI is looked up once per region, version and
+        architecture and cached for AMI_CACHE_TTL.
+        
         Args:
             version: Ubuntu version (e.g., "22.04")
             instance_type: Instance type to determine architecture
@@ -327,7 +572,14 @@ class AWSClient(PlatformClient):
         # Determine architecture from instance type
         arch = "arm64" if instance_type.startswith("t4g") else "amd64"
         
-        # Always lookup latest AMI (ensures correct architecture)
+        return await _discovery_cache.get(
+            self._cache_key("ami", "ubuntu", version, arch),
+            AMI_CACHE_TTL,
+            lambda: self._lookup_ubuntu_ami(version, arch)
+        )
+    
+    async def _lookup_ubuntu_ami(self, version: str, arch: str) -> str:
+        """Latest Ubuntu AMI from Canonical (always the correct architecture)"""
         logger.info(f"Looking up latest Ubuntu {version} AMI ({arch}) for {self.region}...")
         try:
             # Canonical's owner ID: 099720109477
@@ -344,7 +596,7 @@ class AWSClient(PlatformClient):
                 {'Name': 'architecture', 'Values': ['arm64' if arch == 'arm64' else 'x86_64']}
             ]
             
-            response = self.ec2_client.describe_images(Filters=filters)
+            response = await self._call(self.ec2_client.describe_images, Filters=filters)
             
             if not response['Images']:
                 logger.error(f"No images found. Filters: {filters}")
@@ -364,7 +616,7 @@ class AWSClient(PlatformClient):
     
     async def _get_windows_ami(self, version: str) -> str:
         """
-        Get Windows AMI ID for the current region
+        Get Windows AMI ID for the current region (cached for AMI_CACHE_TTL)
         
         Args:
             version: Windows version ("server2022" or "win11")
@@ -372,6 +624,14 @@ class AWSClient(PlatformClient):
         Returns:
             AMI ID
         """
+        return await _discovery_cache.get(
+            self._cache_key("ami", "windows", version, "x86_64"),
+            AMI_CACHE_TTL,
+            lambda: self._lookup_windows_ami(version)
+        )
+    
+    async def _lookup_windows_ami(self, version: str) -> str:
+        """Latest Amazon Windows AMI for the version"""
         logger.info(f"Looking up Windows {version} AMI for {self.region}...")
         
         try:
@@ -390,7 +650,7 @@ class AWSClient(PlatformClient):
                 {'Name': 'architecture', 'Values': ['x86_64']}
             ]
             
-            response = self.ec2_client.describe_images(Filters=filters)
+            response = await self._call(self.ec2_client.describe_images, Filters=filters)
             
             if not response['Images']:
                 logger.error(f"No Windows images found. Filters: {filters}")
@@ -410,22 +670,30 @@ class AWSClient(PlatformClient):
     
     async def _get_vpc_and_subnet(self) -> tuple:
         """
-        Get VPC and subnet for deployment
+        Get VPC and subnet for deployment (cached for NETWORK_CACHE_TTL)
         
         Returns:
             (vpc_id, subnet_id)
         """
+        return await _discovery_cache.get(
+            self._cache_key("network", self.default_vpc),
+            NETWORK_CACHE_TTL,
+            self._discover_vpc_and_subnet
+        )
+    
+    async def _discover_vpc_and_subnet(self) -> tuple:
+        """Find the VPC and first subnet to deploy into"""
         if self.default_vpc:
             # Use default VPC
             try:
-                vpcs = self.ec2_client.describe_vpcs(Filters=[{'Name': 'isDefault', 'Values': ['true']}])
+                vpcs = await self._call(self.ec2_client.describe_vpcs, Filters=[{'Name': 'isDefault', 'Values': ['true']}])
                 if not vpcs['Vpcs']:
                     raise ValueError("No default VPC found")
                 
                 vpc_id = vpcs['Vpcs'][0]['VpcId']
                 
                 # Get first available subnet
-                subnets = self.ec2_client.describe_subnets(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])
+                subnets = await self._call(self.ec2_client.describe_subnets, Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])
                 if not subnets['Subnets']:
                     raise ValueError(f"No subnets found in VPC {vpc_id}")
                 
@@ -453,12 +721,30 @@ class AWSClient(PlatformClient):
         Returns:
             Security group ID
         """
+        # The group and its RDP rule are checked once per NETWORK_CACHE_TTL
+        sg_id = await _discovery_cache.get(
+            self._cache_key("security-group", vpc_id),
+            NETWORK_CACHE_TTL,
+            lambda: self._find_or_create_security_group(vpc_id)
+        )
+        
+        # Ensure Windows RDP rule exists if os_type is windows
+        if os_type == "windows":
+            rdp_key = self._cache_key("rdp", sg_id)
+            if not await _discovery_cache.get(rdp_key, NETWORK_CACHE_TTL, lambda: self._ensure_rdp_rule(sg_id)):
+                _discovery_cache.invalidate(*rdp_key)
+        
+        return sg_id
+    
+    async def _find_or_create_security_group(self, vpc_id: str) -> str:
+        """Glassdome security group in the VPC, created with an SSH rule if missing"""
         sg_name = f"glassdome-{self.region}"
         sg_description = "Glassdome cyber range security group - SSH/RDP access"
         
         try:
             # Check if security group already exists
-            response = self.ec2_client.describe_security_groups(
+            response = await self._call(
+                self.ec2_client.describe_security_groups,
                 Filters=[
                     {'Name': 'group-name', 'Values': [sg_name]},
                     {'Name': 'vpc-id', 'Values': [vpc_id]}
@@ -468,15 +754,11 @@ class AWSClient(PlatformClient):
             if response['SecurityGroups']:
                 sg_id = response['SecurityGroups'][0]['GroupId']
                 logger.info(f"Using existing security group {sg_id}")
-                
-                # Ensure Windows RDP rule exists if os_type is windows
-                if os_type == "windows":
-                    await self._ensure_rdp_rule(sg_id)
-                
                 return sg_id
             
             # Create new security group
-            response = self.ec2_client.create_security_group(
+            response = await self._call(
+                self.ec2_client.create_security_group,
                 GroupName=sg_name,
                 Description=sg_description,
                 VpcId=vpc_id,
@@ -494,7 +776,8 @@ class AWSClient(PlatformClient):
             logger.info(f"Created security group {sg_id}")
             
             # Add SSH ingress rule (always)
-            self.ec2_client.authorize_security_group_ingress(
+            await self._call(
+                self.ec2_client.authorize_security_group_ingress,
                 GroupId=sg_id,
                 IpPermissions=[{
                     'IpProtocol': 'tcp',
@@ -505,30 +788,27 @@ class AWSClient(PlatformClient):
             )
             logger.info(f"Added SSH rule to security group {sg_id}")
             
-            # Add RDP ingress rule for Windows
-            if os_type == "windows":
-                await self._ensure_rdp_rule(sg_id)
-            
             return sg_id
             
         except Exception as e:
             logger.error(f"Failed to get/create security group: {e}")
             raise
     
-    async def _ensure_rdp_rule(self, sg_id: str):
+    async def _ensure_rdp_rule(self, sg_id: str) -> bool:
         """Ensure RDP port 3389 is open in security group"""
         try:
             # Check if RDP rule already exists
-            response = self.ec2_client.describe_security_groups(GroupIds=[sg_id])
+            response = await self._call(self.ec2_client.describe_security_groups, GroupIds=[sg_id])
             sg = response['SecurityGroups'][0]
             
             for rule in sg['IpPermissions']:
                 if rule.get('FromPort') == 3389 and rule.get('ToPort') == 3389:
                     logger.info(f"RDP rule already exists in security group {sg_id}")
-                    return
+                    return True
             
             # Add RDP rule
-            self.ec2_client.authorize_security_group_ingress(
+            await self._call(
+                self.ec2_client.authorize_security_group_ingress,
                 GroupId=sg_id,
                 IpPermissions=[{
                     'IpProtocol': 'tcp',
@@ -538,16 +818,21 @@ class AWSClient(PlatformClient):
                 }]
             )
             logger.info(f"Added RDP rule to security group {sg_id}")
+            return True
             
         except Exception as e:
             logger.warning(f"Failed to ensure RDP rule: {e}")
+            return False
     
-    def _build_cloud_init(self, config: Dict[str, Any]) -> str:
+    def _build_cloud_init(self, config: Dict[str, Any], hostname_from_tag: bool = False) -> str:
         """
         Build cloud-init user-data script
         
         Args:
             config: VM configuration
+            hostname_from_tag: Set the hostname from the instance's Name tag
+                at boot instead of embedding it (batched launches share
+                one user-data)
         
         Returns:
             Cloud-init user-data string
@@ -556,10 +841,9 @@ class AWSClient(PlatformClient):
         ssh_user = config.get("ssh_user", "ubuntu")
         password = config.get("password", "glassdome123")
         
+        hostname = "" if hostname_from_tag else f"hostname: {name}\nfqdn: {name}.local\n"
         user_data = f"""#cloud-config
-hostname: {name}
-fqdn: {name}.local
-manage_etc_hosts: true
+{hostname}manage_etc_hosts: true
 
 users:
   - name: {ssh_user}
@@ -589,6 +873,17 @@ disable_root: false
 runcmd:
   - echo "Cloud-init completed at $(date)" > /var/log/glassdome-init.log
 """
+        if hostname_from_tag:
+            # Name is tagged right after launch: poll instance metadata for it
+            user_data += """  - |
+    IMDS=http://169.254.169.254/latest
+    TOKEN=$(curl -sX PUT $IMDS/api/token -H "X-aws-ec2-metadata-token-ttl-seconds: 300")
+    for i in $(seq 60); do
+      NAME=$(curl -sf -H "X-aws-ec2-metadata-token: $TOKEN" $IMDS/meta-data/tags/instance/Name) && break
+      sleep 2
+    done
+    [ -n "$NAME" ] && hostnamectl set-hostname "$NAME" && echo "127.0.1.1 $NAME $NAME.local" >> /etc/hosts
+"""
         
         return user_data
     
@@ -656,7 +951,7 @@ Restart-Computer -Force
     async def test_connection(self) -> bool:
         """Test connection to AWS"""
         try:
-            self.ec2_client.describe_regions()
+            await self._call(self.ec2_client.describe_regions)
             logger.info("Successfully connected to AWS")
             return True
         except Exception as e:
@@ -12,13 +12,21 @@ from azure.mgmt.resource import ResourceManagementClient
 from azure.core.exceptions import ResourceNotFoundError
 import asyncio
 import time
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Callable, List, Optional, Tuple
 import logging
 
 from glassdome.platforms.base import PlatformClient, VMStatus
 
 logger = logging.getLogger(__name__)
 
+# Threads for blocking SDK calls made while building the inventory
+INVENTORY_WORKERS = 8
+
+# Seconds NIC / public-IP records of a resource group are reused
+NETWORK_CACHE_TTL = 30
+
 
 class AzureClient(PlatformClient):
     """
@@ -68,6 +76,10 @@ class AzureClient(PlatformClient):
             subscription_id
         )
         
+        # Inventory: bounded pool for SDK calls, cached network records per RG
+        self._executor = ThreadPoolExecutor(max_workers=INVENTORY_WORKERS, thread_name_prefix="azure")
+        self._network_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
         # Auto-register required providers (one-time per subscription)
         self._ensure_providers_registered()
         
@@ -199,6 +211,7 @@ class AzureClient(PlatformClient):
             
             # Get public IP
             ip_address = await self.get_vm_ip(name, timeout=120)
+            self.invalidate_network_cache(self.resource_group_name)
             
             logger.info(f"✅ Azure VM {name} created @ {ip_address}")
             
@@ -269,6 +282,7 @@ class AzureClient(PlatformClient):
                 vm_id
             )
             operation.result()
+            self.invalidate_network_cache(self.resource_group_name)
             logger.info(f"Deleted VM {vm_id}")
             return True
         except Exception as e:
@@ -793,6 +807,171 @@ runcmd:
         """Get platform name"""
         return "azure"
     
+    # =========================================================================
+    # INVENTORY
+    # =========================================================================
+    
+    async def _run_blocking(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking SDK call on the inventory thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(fn, *args, **kwargs)
+        )
+    
+    @staticmethod
+    def _resource_group_of(resource_id: str) -> str:
+        """Resource group from an ARM ID (/subscriptions/{sub}/resourceGroups/{rg}/...)"""
+        parts = resource_id.split('/')
+        lowered = [p.lower() for p in parts]
+        if 'resourcegroups' in lowered:
+            return parts[lowered.index('resourcegroups') + 1]
+        return "unknown"
+    
+    @staticmethod
+    def _power_state(statuses) -> str:
+        for status in statuses or []:
+            if status.code and status.code.startswith('PowerState/'):
+                return status.code.split('/')[-1]
+        return "unknown"
+    
+    def _fetch_network_records(self, rg: str) -> Dict[str, Dict[str, Any]]:
+        """All NICs and public IPs in a resource group (two list calls)"""
+        nics = {nic.id.lower(): nic for nic in self.network_client.network_interfaces.list(rg)}
+        public_ips = list(self.network_client.public_ip_addresses.list(rg))
+        return {
+            "nics": nics,
+            "public_ips": {pip.id.lower(): pip.ip_address for pip in public_ips},
+            "public_ips_by_name": {pip.name: pip.ip_address for pip in public_ips},
+        }
+    
+    async def _network_records(self, resource_groups) -> Dict[str, Dict[str, Any]]:
+        """
+        NIC and public-IP records for each resource group
+        
+        Each group is listed in bulk and cached for NETWORK_CACHE_TTL;
+        groups not in the cache are fetched concurrently.
+        """
+        now = time.monotonic()
+        stale = [
+            rg for rg in set(resource_groups)
+            if rg not in self._network_cache or self._network_cache[rg][0] <= now
+        ]
+        results = await asyncio.gather(
+            *(self._run_blocking(self._fetch_network_records, rg) for rg in stale),
+            return_exceptions=True
+        )
+        for rg, records in zip(stale, results):
+            if isinstance(records, Exception):
+                logger.warning(f"Failed to list network resources in {rg}: {records}")
+                records = {"nics": {}, "public_ips": {}, "public_ips_by_name": {}}
+            self._network_cache[rg] = (now + NETWORK_CACHE_TTL, records)
+        
+        return {rg: self._network_cache[rg][1] for rg in resource_groups}
+    
+    def invalidate_network_cache(self, resource_group: Optional[str] = None):
+        """Drop cached NIC/public-IP records (all groups if none given)"""
+        if resource_group is None:
+            self._network_cache.clear()
+        else:
+            self._network_cache.pop(resource_group, None)
+    
+    def _nic_ids(self, vm) -> List[str]:
+        profile = getattr(vm, 'network_profile', None)
+        if not profile or not profile.network_interfaces:
+            return []
+        return [ref.id for ref in profile.network_interfaces if ref.id]
+    
+    async def _public_ips(self, vms) -> Dict[str, Optional[str]]:
+        """
+        Public IP of each VM (by VM ID)
+        
+        VM -> NIC -> public IP, resolved from the per-group records. A
+        public IP may live in another group than its NIC, so a second round
+        loads those groups. VMs without a NIC reference fall back to
+        the "{name}-ip" naming create_vm uses.
+        """
+        nic_ids = {vm.id: self._nic_ids(vm) for vm in vms}
+        groups = {self._resource_group_of(vm.id) for vm in vms}
+        groups.update(self._resource_group_of(nic_id) for ids in nic_ids.values() for nic_id in ids)
+        records = await self._network_records(groups)
+        
+        pip_ids = {}
+        for vm in vms:
+            pip_ids[vm.id] = []
+            for nic_id in nic_ids[vm.id]:
+                nic = records[self._resource_group_of(nic_id)]["nics"].get(nic_id.lower())
+                for ip_config in (nic.ip_configurations if nic else None) or []:
+                    if ip_config.public_ip_address and ip_config.public_ip_address.id:
+                        pip_ids[vm.id].append(ip_config.public_ip_address.id)
+        
+        extra = {self._resource_group_of(pip_id) for ids in pip_ids.values() for pip_id in ids} - groups
+        if extra:
+            records.update(await self._network_records(extra))
+        
+        ips = {}
+        for vm in vms:
+            ip_address = None
+            for pip_id in pip_ids[vm.id]:
+                ip_address = records[self._resource_group_of(pip_id)]["public_ips"].get(pip_id.lower())
+                if ip_address:
+                    break
+            if ip_address is None and not nic_ids[vm.id]:
+                rg_records = records[self._resource_group_of(vm.id)]
+                ip_address = rg_records["public_ips_by_name"].get(f"{vm.name}-ip")
+            ips[vm.id] = ip_address
+        return ips
+    
+    async def _power_states(self, vms) -> Dict[str, str]:
+        """
+        Power state of each VM (by VM ID)
+        
+        Taken from the instance view returned with the list; VMs listed
+        without one get their instance view fetched on the thread pool.
+        """
+        states = {}
+        missing = []
+        for vm in vms:
+            view = getattr(vm, 'instance_view', None)
+            if view is not None and view.statuses:
+                states[vm.id] = self._power_state(view.statuses)
+            else:
+                missing.append(vm)
+        
+        views = await asyncio.gather(
+            *(
+                self._run_blocking(
+                    self.compute_client.virtual_machines.instance_view,
+                    self._resource_group_of(vm.id), vm.name
+                )
+                for vm in missing
+            ),
+            return_exceptions=True
+        )
+        for vm, view in zip(missing, views):
+            states[vm.id] = "unknown" if isinstance(view, Exception) else self._power_state(view.statuses)
+        return states
+    
+    async def _describe_vms(self, vms) -> List[Dict[str, Any]]:
+        """Inventory dictionaries for listed VMs, with power state and public IP"""
+        power_states, ips = await asyncio.gather(self._power_states(vms), self._public_ips(vms))
+        
+        described = []
+        for vm in vms:
+            try:
+                described.append({
+                    "id": vm.id,
+                    "name": vm.name,
+                    "power_state": power_states[vm.id],
+                    "location": vm.location,
+                    "vm_size": vm.hardware_profile.vm_size if vm.hardware_profile else "Unknown",
+                    "os_type": vm.storage_profile.os_disk.os_type if vm.storage_profile and vm.storage_profile.os_disk else "Unknown",
+                    "ip_address": ips[vm.id],
+                    "resource_group": self._resource_group_of(vm.id),
+                    "tags": dict(vm.tags) if vm.tags else {}
+                })
+            except Exception as e:
+                logger.warning(f"Error getting VM info for {vm.name}: {e}")
+        return described
+    
     async def list_vms(self, resource_group: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all VMs in the subscription or a specific resource group
@@ -807,51 +986,14 @@ runcmd:
         rg = resource_group or self.resource_group_name
         
         try:
-            # Get VMs from the resource group
-            vm_list = self.compute_client.virtual_machines.list(rg)
-            
-            for vm in vm_list:
-                try:
-                    # Get power state from instance view
-                    power_state = "unknown"
-                    try:
-                        instance_view = self.compute_client.virtual_machines.instance_view(rg, vm.name)
-                        if instance_view.statuses:
-                            for status in instance_view.statuses:
-                                if status.code.startswith('PowerState/'):
-                                    power_state = status.code.split('/')[-1]
-                                    break
-                    except Exception:
-                        pass
-                    
-                    # Get public IP if available
-                    ip_address = None
-                    try:
-                        public_ip_name = f"{vm.name}-ip"
-                        public_ip = self.network_client.public_ip_addresses.get(rg, public_ip_name)
-                        ip_address = public_ip.ip_address
-                    except Exception:
-                        pass
-                    
-                    vm_info = {
-                        "id": vm.id,
-                        "name": vm.name,
-                        "power_state": power_state,
-                        "location": vm.location,
-                        "vm_size": vm.hardware_profile.vm_size if vm.hardware_profile else "Unknown",
-                        "os_type": vm.storage_profile.os_disk.os_type if vm.storage_profile and vm.storage_profile.os_disk else "Unknown",
-                        "ip_address": ip_address,
-                        "resource_group": rg,
-                        "tags": dict(vm.tags) if vm.tags else {}
-                    }
-                    vms.append(vm_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Error getting VM info for {vm.name}: {e}")
-                    continue
+            # One paged call returns the VMs with their instance views
+            vm_list = await self._run_blocking(
+                lambda: list(self.compute_client.virtual_machines.list(rg, expand="instanceView"))
+            )
+            vms = await self._describe_vms(vm_list)
             
             logger.info(f"Listed {len(vms)} VMs in Azure resource group {rg}")
-            
+        
         except Exception as e:
             logger.error(f"Failed to list Azure VMs: {e}")
         
@@ -867,58 +1009,15 @@ runcmd:
         vms = []
         
         try:
-            # Get all VMs in the subscription
-            vm_list = self.compute_client.virtual_machines.list_all()
-            
-            for vm in vm_list:
-                try:
-                    # Extract resource group from VM ID
-                    # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/...
-                    parts = vm.id.split('/')
-                    rg_index = parts.index('resourceGroups') + 1 if 'resourceGroups' in parts else -1
-                    rg = parts[rg_index] if rg_index > 0 else "unknown"
-                    
-                    # Get power state
-                    power_state = "unknown"
-                    try:
-                        instance_view = self.compute_client.virtual_machines.instance_view(rg, vm.name)
-                        if instance_view.statuses:
-                            for status in instance_view.statuses:
-                                if status.code.startswith('PowerState/'):
-                                    power_state = status.code.split('/')[-1]
-                                    break
-                    except Exception:
-                        pass
-                    
-                    # Get public IP if available
-                    ip_address = None
-                    try:
-                        public_ip_name = f"{vm.name}-ip"
-                        public_ip = self.network_client.public_ip_addresses.get(rg, public_ip_name)
-                        ip_address = public_ip.ip_address
-                    except Exception:
-                        pass
-                    
-                    vm_info = {
-                        "id": vm.id,
-                        "name": vm.name,
-                        "power_state": power_state,
-                        "location": vm.location,
-                        "vm_size": vm.hardware_profile.vm_size if vm.hardware_profile else "Unknown",
-                        "os_type": vm.storage_profile.os_disk.os_type if vm.storage_profile and vm.storage_profile.os_disk else "Unknown",
-                        "ip_address": ip_address,
-                        "resource_group": rg,
-                        "tags": dict(vm.tags) if vm.tags else {}
-                    }
-                    vms.append(vm_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Error getting VM info: {e}")
-                    continue
+            # One paged call returns the VMs with their instance views
+            vm_list = await self._run_blocking(
+                lambda: list(self.compute_client.virtual_machines.list_all(expand="instanceView"))
+            )
+            vms = await self._describe_vms(vm_list)
             
             logger.info(f"Listed {len(vms)} VMs across all Azure resource groups")
-            
+        
         except Exception as e:
             logger.error(f"Failed to list all Azure VMs: {e}")
         
-        return vms
\ No newline at end of file
+        return vms
@@ -6,12 +6,13 @@ Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 from pyVim.connect import SmartConnect, Disconnect
-from pyVmomi import vim
+from pyVmomi import vim, vmodl
 import ssl
 import atexit
+import threading
 import time
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, Optional
 import logging
 from pathlib import Path
 
@@ -20,6 +21,28 @@ from glassdome.utils.windows_autounattend import generate_autounattend_xml, crea
 
 logger = logging.getLogger(__name__)
 
+# Properties read for list_vms (one RetrievePropertiesEx for all VMs)
+VM_INVENTORY_PROPERTIES = [
+    "name",
+    "runtime.powerState",
+    "summary.quickStats.overallCpuUsage",
+    "summary.quickStats.guestMemoryUsage",
+    "guest.ipAddress",
+    "config.hardware.memoryMB",
+    "config.hardware.numCPU",
+    "config.guestFullName",
+    "config.template",
+]
+
+# Objects per RetrievePropertiesEx page
+PROPERTY_PAGE_SIZE = 500
+
+# Max seconds per WaitForUpdatesEx call (waits are re-issued until done)
+WAIT_UPDATES_SECONDS = 30
+
+# Template snapshot whose disk is the read-only parent of linked clones
+BASE_SNAPSHOT_NAME = "glassdome-linked-clone-base"
+
 
 class ESXiClient(PlatformClient):
     """
@@ -69,6 +92,12 @@ class ESXiClient(PlatformClient):
         self.default_datastore_name = datastore_name
         self.default_network_name = network_name
         
+        # Template hardware + base disk for linked clones, by template moid
+        self._template_descriptors: Dict[str, Dict[str, Any]] = {}
+        # One lock per template, so concurrent clones take its base snapshot once
+        self._template_locks: Dict[str, threading.Lock] = {}
+        self._template_locks_guard = threading.Lock()
+        
         # SSL context (disable verification for self-signed certs)
         if verify_ssl:
             self.ssl_context = ssl.create_default_context()
@@ -113,7 +142,7 @@ class ESXiClient(PlatformClient):
             
             logger.info(f"ESXi client connected to {host}")
             logger.info(f"Using datastore: {self.default_datastore_name}")
-            
+        
         except Exception as e:
             logger.error(f"Failed to connect to ESXi host {host}: {str(e)}")
             raise
@@ -188,11 +217,11 @@ class ESXiClient(PlatformClient):
                 return True
             
             task = vm.PowerOn()
-            self._wait_for_task(task)
+            await self._await_task(task)
             
             logger.info(f"VM {vm_id} powered on")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to start VM {vm_id}: {str(e)}")
             return False
@@ -221,10 +250,10 @@ class ESXiClient(PlatformClient):
                     # Fall back to hard power off
                     task = vm.PowerOff()
             
-            self._wait_for_task(task)
+            await self._await_task(task)
             logger.info(f"VM {vm_id} powered off")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to stop VM {vm_id}: {str(e)}")
             return False
@@ -248,11 +277,11 @@ class ESXiClient(PlatformClient):
             
             # Destroy VM
             task = vm.Destroy()
-            self._wait_for_task(task)
+            await self._await_task(task)
             
             logger.info(f"VM {vm_id} deleted")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to delete VM {vm_id}: {str(e)}")
             return False
@@ -274,43 +303,46 @@ class ESXiClient(PlatformClient):
                 return VMStatus.PAUSED
             else:
                 return VMStatus.UNKNOWN
-                
+        
         except Exception as e:
             logger.error(f"Failed to get status for VM {vm_id}: {str(e)}")
             return VMStatus.ERROR
     
     async def get_vm_ip(self, vm_id: str, timeout: int = 120) -> Optional[str]:
         """Get VM IP address (implements PlatformClient interface)"""
-        vm = self._get_vm_by_name(vm_id)
+        vm = await asyncio.to_thread(self._get_vm_by_name, vm_id)
         if not vm:
             return None
         
-        start_time = time.time()
-        
-        while (time.time() - start_time) < timeout:
-            try:
-                # Get IP from VMware Tools
-                if vm.guest and vm.guest.ipAddress:
-                    ip = vm.guest.ipAddress
-                    if ip and not ip.startswith('127.'):
-                        logger.info(f"VM {vm_id} IP detected: {ip}")
-                        return ip
-                
-                # Alternative: check network adapters
-                if vm.guest and vm.guest.net:
-                    for net in vm.guest.net:
-                        if net.ipAddress:
-                            for ip in net.ipAddress:
-                                if not ip.startswith('127.') and not ip.startswith('fe80'):
-                                    logger.info(f"VM {vm_id} IP detected: {ip}")
-                                    return ip
-                
-            except Exception as e:
-                logger.debug(f"Waiting for VM {vm_id} IP... ({int(time.time() - start_time)}s)")
-            
-            await asyncio.sleep(5)
+        # ESXi pushes guest changes (WaitForUpdatesEx) instead of us re-reading the VM
+        try:
+            props = await asyncio.to_thread(
+                self._wait_for_updates,
+                vm,
+                ["guest.ipAddress", "guest.net"],
+                lambda props: self._guest_ip(props) is not None,
+                timeout
+            )
+        except TimeoutError:
+            logger.warning(f"Timeout waiting for VM {vm_id} IP address")
+            return None
         
-        logger.warning(f"Timeout waiting for VM {vm_id} IP address")
+        ip = self._guest_ip(props)
+        logger.info(f"VM {vm_id} IP detected: {ip}")
+        return ip
+    
+    @staticmethod
+    def _guest_ip(props: Dict[str, Any]) -> Optional[str]:
+        """First usable IP from guest.ipAddress / guest.net (VMware Tools)"""
+        ip = props.get("guest.ipAddress")
+        if ip and not ip.startswith('127.'):
+            return ip
+        
+        # Alternative: check network adapters
+        for net in props.get("guest.net") or []:
+            for ip in net.ipAddress or []:
+                if not ip.startswith('127.') and not ip.startswith('fe80'):
+                    return ip
         return None
     
     async def test_connection(self) -> bool:
@@ -349,59 +381,46 @@ class ESXiClient(PlatformClient):
         """
         vms = []
         try:
-            container = self.content.viewManager.CreateContainerView(
-                self.content.rootFolder,
-                [vim.VirtualMachine],
-                True
+            # All VMs and properties in one paged RetrievePropertiesEx,
+            # instead of a round trip per property per VM
+            vm_properties = await asyncio.to_thread(
+                self._retrieve_properties, vim.VirtualMachine, VM_INVENTORY_PROPERTIES
             )
-            
-            for vm in container.view:
-                try:
-                    # Get power state
-                    power_state = "unknown"
-                    if vm.runtime.powerState == vim.VirtualMachinePowerState.poweredOn:
-                        power_state = "running"
-                    elif vm.runtime.powerState == vim.VirtualMachinePowerState.poweredOff:
-                        power_state = "stopped"
-                    elif vm.runtime.powerState == vim.VirtualMachinePowerState.suspended:
-                        power_state = "suspended"
-                    
-                    # Get resource usage (only if powered on)
-                    cpu_usage = 0
-                    memory_mb = 0
-                    if power_state == "running" and vm.summary.quickStats:
-                        cpu_usage = vm.summary.quickStats.overallCpuUsage or 0
-                        memory_mb = vm.summary.quickStats.guestMemoryUsage or 0
-                    
-                    # Get IP address
-                    ip_address = None
-                    if vm.guest and vm.guest.ipAddress:
-                        ip_address = vm.guest.ipAddress
-                    
-                    vm_info = {
-                        "moid": str(vm._moId),
-                        "name": vm.name,
-                        "power_state": power_state,
-                        "cpu_usage": cpu_usage,
-                        "memory_mb": memory_mb,
-                        "memory_max_mb": vm.config.hardware.memoryMB if vm.config else 0,
-                        "num_cpus": vm.config.hardware.numCPU if vm.config else 0,
-                        "guest_os": vm.config.guestFullName if vm.config else "Unknown",
-                        "ip_address": ip_address,
-                        "template": vm.config.template if vm.config else False
-                    }
-                    vms.append(vm_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Error getting VM info for {vm.name}: {e}")
-                    continue
-            
-            container.Destroy()
-            logger.info(f"Listed {len(vms)} VMs on ESXi host {self.host}")
-            
         except Exception as e:
             logger.error(f"Failed to list VMs: {e}")
-        
+            return vms
+        
+        for props in vm_properties:
+            # Get power state
+            power_state = "unknown"
+            if props.get("runtime.powerState") == vim.VirtualMachinePowerState.poweredOn:
+                power_state = "running"
+            elif props.get("runtime.powerState") == vim.VirtualMachinePowerState.poweredOff:
+                power_state = "stopped"
+            elif props.get("runtime.powerState") == vim.VirtualMachinePowerState.suspended:
+                power_state = "suspended"
+            
+            # Get resource usage (only if powered on)
+            cpu_usage = 0
+            memory_mb = 0
+            if power_state == "running":
+                cpu_usage = props.get("summary.quickStats.overallCpuUsage") or 0
+                memory_mb = props.get("summary.quickStats.guestMemoryUsage") or 0
+            
+            vms.append({
+                "moid": str(props["obj"]._moId),
+                "name": props.get("name"),
+                "power_state": power_state,
+                "cpu_usage": cpu_usage,
+                "memory_mb": memory_mb,
+                "memory_max_mb": props.get("config.hardware.memoryMB", 0),
+                "num_cpus": props.get("config.hardware.numCPU", 0),
+                "guest_os": props.get("config.guestFullName", "Unknown"),
+                "ip_address": props.get("guest.ipAddress"),
+                "template": props.get("config.template", False)
+            })
+        
+        logger.info(f"Listed {len(vms)} VMs on ESXi host {self.host}")
         return vms
     
     # =========================================================================
@@ -422,6 +441,10 @@ class ESXiClient(PlatformClient):
         
         logger.debug(f"Template found: {template.name}, power state: {template.runtime.powerState}")
         
+        # Standalone hosts have no Clone API: skip straight to the host-side methods
+        if self.content.about.apiType == "HostAgent":
+            return await self._clone_standalone(template, vm_name, config)
+        
         # ESXi standalone doesn't support cloning like vCenter does
         # We'll use a simpler approach: Create a linked clone by copying the VM
         try:
@@ -445,7 +468,7 @@ class ESXiClient(PlatformClient):
                 spec=clone_spec
             )
             
-            self._wait_for_task(task)
+            await self._await_task(task)
             
             # Get cloned VM
             vm = self._get_vm_by_name(vm_name)
@@ -456,16 +479,168 @@ class ESXiClient(PlatformClient):
                 await self._reconfigure_vm(vm, config)
             
             return vm
-            
+        
         except Exception as e:
             logger.error(f"Clone failed, error: {str(e)}")
             # If cloning is not supported, fall back to manual VMDK copy
             if "not supported" in str(e).lower():
-                logger.warning(f"Cloning not supported on standalone ESXi, using VMDK copy method instead")
-                return await self._clone_via_vmdk_copy(template, vm_name, config)
+                logger.warning(f"Cloning not supported on standalone ESXi, using host-side clone instead")
+                return await self._clone_standalone(template, vm_name, config)
             else:
                 raise
     
+    async def _clone_standalone(self, template: vim.VirtualMachine, vm_name: str, config: Dict[str, Any]) -> vim.VirtualMachine:
+        """
+        Clone on standalone ESXi
+        
+        clone_mode "linked" (default) creates a delta disk on top of the
+        template's base snapshot; "full" copies the template VMDK. A failed
+        linked clone falls back to a full copy.
+        """
+        if config.get("clone_mode", "linked") == "linked":
+            try:
+                return await self._clone_via_delta_disk(template, vm_name, config)
+            except Exception as e:
+                logger.warning(f"Linked clone failed ({e}), using VMDK copy method instead")
+        return await self._clone_via_vmdk_copy(template, vm_name, config)
+    
+    async def _clone_via_delta_disk(self, template: vim.VirtualMachine, vm_name: str, config: Dict[str, Any]) -> vim.VirtualMachine:
+        """
+        Linked clone for standalone ESXi
+        
+        The new VM's disk is a delta VMDK whose parent is the template's
+        base snapshot disk. Nothing is copied, so a clone takes seconds and
+        starts at a few MB on the datastore regardless of template size.
+        """
+        descriptor = await asyncio.to_thread(self._template_descriptor, template)
+        logger.info(f"Linked clone {vm_name} from {descriptor['name']} (base disk: {descriptor['base_disk']})")
+        
+        vm_config_spec = vim.vm.ConfigSpec(
+            name=vm_name,
+            memoryMB=config.get("memory", descriptor["memory_mb"]),
+            numCPUs=config.get("cores", descriptor["num_cpus"]),
+            guestId=descriptor["guest_id"],
+            files=vim.vm.FileInfo(
+                vmPathName=f"[{self.default_datastore_name}] {vm_name}"
+            )
+        )
+        if descriptor["firmware"]:
+            vm_config_spec.firmware = descriptor["firmware"]
+        
+        # Same controller type as the template, so the guest finds its disk
+        controller_spec = vim.vm.device.VirtualDeviceSpec()
+        controller_spec.operation = vim.vm.device.VirtualDeviceSpec.Operation.add
+        controller_spec.device = descriptor["controller_type"]()
+        controller_spec.device.key = 1000
+        controller_spec.device.sharedBus = vim.vm.device.VirtualSCSIController.Sharing.noSharing
+        controller_spec.device.busNumber = 0
+        
+        # New child disk backed by the read-only base disk
+        disk_spec = vim.vm.device.VirtualDeviceSpec()
+        disk_spec.operation = vim.vm.device.VirtualDeviceSpec.Operation.add
+        disk_spec.fileOperation = vim.vm.device.VirtualDeviceSpec.FileOperation.create
+        disk_spec.device = vim.vm.device.VirtualDisk()
+        disk_spec.device.controllerKey = 1000
+        disk_spec.device.unitNumber = 0
+        disk_spec.device.capacityInKB = descriptor["capacity_kb"]
+        disk_spec.device.backing = vim.vm.device.VirtualDisk.FlatVer2BackingInfo()
+        disk_spec.device.backing.fileName = f"[{self.default_datastore_name}] {vm_name}/{vm_name}.vmdk"
+        disk_spec.device.backing.diskMode = 'persistent'
+        disk_spec.device.backing.parent = vim.vm.device.VirtualDisk.FlatVer2BackingInfo(
+            fileName=descriptor["base_disk"],
+            diskMode='persistent'
+        )
+        
+        device_changes = [controller_spec, disk_spec]
+        network = self._get_network(config.get("network", self.default_network_name))
+        if network:
+            device_changes.append(self._create_network_spec(network))
+        vm_config_spec.deviceChange = device_changes
+        
+        task = self.datacenter.vmFolder.CreateVM_Task(
+            config=vm_config_spec,
+            pool=self.resource_pool
+        )
+        await self._await_task(task)
+        
+        vm = task.info.result
+        logger.info(f"VM created successfully as linked clone: {vm_name}")
+        return vm
+    
+    def _template_descriptor(self, template: vim.VirtualMachine) -> Dict[str, Any]:
+        """
+        Hardware and base disk of a template, for building linked clones
+        
+        The first call for a template takes its base snapshot (the snapshot
+        disk becomes read-only and is shared by every linked clone). The
+        result is cached, so later clones don't read the template again.
+        """
+        key = str(template._moId)
+        descriptor = self._template_descriptors.get(key)
+        if descriptor:
+            return descriptor
+        
+        with self._template_locks_guard:
+            lock = self._template_locks.setdefault(key, threading.Lock())
+        with lock:
+            # Another clone may have finished the descriptor while we waited
+            descriptor = self._template_descriptors.get(key)
+            if descriptor:
+                return descriptor
+            descriptor = self._read_template_descriptor(template)
+            self._template_descriptors[key] = descriptor
+            return descriptor
+    
+    def _read_template_descriptor(self, template: vim.VirtualMachine) -> Dict[str, Any]:
+        """Find or take the base snapshot and read the template's hardware from it"""
+        snapshot = self._find_snapshot(template, BASE_SNAPSHOT_NAME)
+        if snapshot is None:
+            logger.info(f"Creating base snapshot of template {template.name} for linked clones")
+            task = template.CreateSnapshot_Task(
+                name=BASE_SNAPSHOT_NAME,
+                description="Read-only base disk for Glassdome linked clones",
+                memory=False,
+                quiesce=False
+            )
+            self._wait_for_task(task)
+            snapshot = task.info.result
+        
+        snapshot_config = snapshot.config
+        devices = {device.key: device for device in snapshot_config.hardware.device}
+        disk = next(
+            (d for d in snapshot_config.hardware.device if isinstance(d, vim.vm.device.VirtualDisk)),
+            None
+        )
+        if not disk:
+            raise Exception(f"Template {template.name} has no disk!")
+        
+        controller = devices.get(disk.controllerKey)
+        return {
+            "name": template.name,
+            "guest_id": snapshot_config.guestId,
+            "memory_mb": snapshot_config.hardware.memoryMB,
+            "num_cpus": snapshot_config.hardware.numCPU,
+            "firmware": snapshot_config.firmware,
+            "base_disk": disk.backing.fileName,
+            "capacity_kb": disk.capacityInKB,
+            "controller_type": (
+                type(controller) if isinstance(controller, vim.vm.device.VirtualSCSIController)
+                else vim.vm.device.ParaVirtualSCSIController
+            ),
+        }
+    
+    @staticmethod
+    def _find_snapshot(vm: vim.VirtualMachine, name: str) -> Optional[vim.vm.Snapshot]:
+        """Snapshot of a VM by name, or None"""
+        snapshot_info = vm.snapshot
+        pending = list(snapshot_info.rootSnapshotList) if snapshot_info else []
+        while pending:
+            tree = pending.pop()
+            if tree.name == name:
+                return tree.snapshot
+            pending.extend(tree.childSnapshotList)
+        return None
+    
     async def _clone_via_vmdk_copy(self, template: vim.VirtualMachine, vm_name: str, config: Dict[str, Any]) -> vim.VirtualMachine:
         """
         Clone a VM by copying its VMDK files (workaround for standalone ESXi)
@@ -512,9 +687,9 @@ class ESXiClient(PlatformClient):
                 force=True
             )
             
-            self._wait_for_task(task)
+            await self._await_task(task)
             logger.info(f"VMDK copied and converted successfully")
-            
+        
         except Exception as e:
             logger.error(f"Failed to copy VMDK: {str(e)}")
             # If copy fails completely, fall back to creating empty VM
@@ -581,7 +756,7 @@ class ESXiClient(PlatformClient):
             pool=self.resource_pool
         )
         
-        self._wait_for_task(task)
+        await self._await_task(task)
         
         # Get the created VM
         vm = self._get_vm_by_name(vm_name)
@@ -620,7 +795,7 @@ class ESXiClient(PlatformClient):
             pool=self.resource_pool
         )
         
-        self._wait_for_task(task)
+        await self._await_task(task)
         
         vm = self._get_vm_by_name(vm_name)
         logger.info(f"VM created successfully: {vm_name}")
@@ -638,7 +813,7 @@ class ESXiClient(PlatformClient):
             spec.memoryMB = config["memory"]
         
         task = vm.Reconfigure(spec)
-        self._wait_for_task(task)
+        await self._await_task(task)
         
         logger.info(f"VM {vm.name} reconfigured")
     
@@ -648,7 +823,7 @@ class ESXiClient(PlatformClient):
             return
         
         task = vm.PowerOn()
-        self._wait_for_task(task)
+        await self._await_task(task)
         logger.info(f"VM {vm.name} powered on")
     
     def _get_datacenter(self) -> vim.Datacenter:
@@ -667,19 +842,99 @@ class ESXiClient(PlatformClient):
     
     def _get_vm_by_name(self, name: str) -> Optional[vim.VirtualMachine]:
         """Get VM by name"""
-        container = self.content.viewManager.CreateContainerView(
-            self.content.rootFolder,
-            [vim.VirtualMachine],
-            True
-        )
+        for props in self._retrieve_properties(vim.VirtualMachine, ["name"]):
+            if props.get("name") == name:
+                return props["obj"]
+        return None
+    
+    def _retrieve_properties(self, obj_type: type, paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read property paths of every object of a type with RetrievePropertiesEx
         
-        for vm in container.view:
-            if vm.name == name:
-                container.Destroy()
-                return vm
+        One round trip per PROPERTY_PAGE_SIZE objects. Returns one dict per
+        object, keyed by property path, with the managed object under "obj".
+        Unset properties are missing from the dict.
+        """
+        pc = vmodl.query.PropertyCollector
+        view = self.content.viewManager.CreateContainerView(self.content.rootFolder, [obj_type], True)
+        try:
+            spec = pc.FilterSpec(
+                objectSet=[pc.ObjectSpec(
+                    obj=view,
+                    skip=True,
+                    selectSet=[pc.TraversalSpec(name="traverseView", path="view", skip=False, type=vim.view.ContainerView)]
+                )],
+                propSet=[pc.PropertySpec(type=obj_type, pathSet=paths, all=False)]
+            )
+            collector = self.content.propertyCollector
+            result = collector.RetrievePropertiesEx([spec], pc.RetrieveOptions(maxObjects=PROPERTY_PAGE_SIZE))
+            
+            objects = []
+            while result:
+                for content in result.objects:
+                    props = {prop.name: prop.val for prop in content.propSet}
+                    props["obj"] = content.obj
+                    objects.append(props)
+                if not result.token:
+                    break
+                result = collector.ContinueRetrievePropertiesEx(result.token)
+            return objects
+        finally:
+            view.Destroy()
+    
+    def _wait_for_updates(
+        self,
+        obj: vim.ManagedObject,
+        paths: List[str],
+        done: Callable[[Dict[str, Any]], bool],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Block until done(properties) is true, using WaitForUpdatesEx
         
-        container.Destroy()
-        return None
+        The host returns only changed properties since the last version, and
+        holds the call open until something changes, so nothing is polled.
+        A private PropertyCollector keeps concurrent waits independent.
+        
+        Raises:
+            TimeoutError: done() still false after `timeout` seconds
+        """
+        pc = vmodl.query.PropertyCollector
+        collector = self.content.propertyCollector.CreatePropertyCollector()
+        property_filter = None
+        try:
+            property_filter = collector.CreateFilter(pc.FilterSpec(
+                objectSet=[pc.ObjectSpec(obj=obj, skip=False)],
+                propSet=[pc.PropertySpec(type=type(obj), pathSet=paths, all=False)]
+            ), partialUpdates=False)
+            
+            props: Dict[str, Any] = {}
+            version = ""
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            while True:
+                wait = WAIT_UPDATES_SECONDS
+                if deadline is not None:
+                    wait = max(1, min(wait, int(deadline - time.monotonic())))
+                
+                update = collector.WaitForUpdatesEx(version, pc.WaitOptions(maxWaitSeconds=wait))
+                if update is not None:
+                    version = update.version
+                    for filter_update in update.filterSet:
+                        for object_update in filter_update.objectSet:
+                            for change in object_update.changeSet:
+                                if change.op == "remove":
+                                    props.pop(change.name, None)
+                                else:
+                                    props[change.name] = change.val
+                    if done(props):
+                        return props
+                
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out after {timeout}s waiting for {obj}")
+        finally:
+            if property_filter is not None:
+                property_filter.Destroy()
+            collector.Destroy()
     
     def _get_datastore(self, name: str) -> vim.Datastore:
         """Get datastore by name"""
@@ -748,12 +1003,20 @@ class ESXiClient(PlatformClient):
         return specs
     
     def _wait_for_task(self, task: vim.Task) -> None:
-        """Wait for a vSphere task to complete"""
-        while task.info.state not in [vim.TaskInfo.State.success, vim.TaskInfo.State.error]:
-            time.sleep(0.5)
+        """Wait for a vSphere task to complete (blocking; see _await_task)"""
+        finished = (vim.TaskInfo.State.success, vim.TaskInfo.State.error)
+        props = self._wait_for_updates(
+            task,
+            ["info.state", "info.error"],
+            lambda props: props.get("info.state") in finished
+        )
         
-        if task.info.state == vim.TaskInfo.State.error:
-            raise Exception(f"Task failed: {task.info.error.msg}")
+        if props["info.state"] == vim.TaskInfo.State.error:
+            raise Exception(f"Task failed: {props['info.error'].msg}")
+    
+    async def _await_task(self, task: vim.Task) -> None:
+        """Wait for a vSphere task without blocking the event loop"""
+        await asyncio.to_thread(self._wait_for_task, task)
     
     async def create_windows_vm_from_iso(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -912,7 +1175,7 @@ class ESXiClient(PlatformClient):
             pool=self.resource_pool
         )
         
-        self._wait_for_task(task)
+        await self._await_task(task)
         logger.info(f"VM {name} created")
         
         # Get the VM object
@@ -6,12 +6,18 @@ Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
+import hashlib
+import json
 import os
+import shutil
 import subprocess
 import tempfile
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import requests
 import urllib3
 
@@ -21,6 +27,51 @@ from pyVmomi import vim
 urllib3.disable_warnings()
 logger = logging.getLogger(__name__)
 
+# Read/write block size for downloads, hashing and uploads
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Parallel ranged parts for large downloads
+DOWNLOAD_PARTS = 4
+
+# Attempts per download part / upload before giving up
+MAX_TRANSFER_ATTEMPTS = 4
+
+# Written next to the template on the datastore after a build
+REMOTE_MANIFEST = "glassdome-artifacts.json"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "glassdome" / "esxi-artifacts"
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in large blocks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(STREAM_CHUNK_SIZE)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _ChunkReader:
+    """
+    Upload body that reads in STREAM_CHUNK_SIZE blocks
+    
+    http.client/urllib3 would otherwise send a file in 8-16 KiB writes.
+    __len__ lets requests send a Content-Length (ESXi rejects chunked PUTs).
+    """
+    
+    def __init__(self, f, size: int):
+        self._f = f
+        self._size = size
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def read(self, size: int = -1) -> bytes:
+        return self._f.read(STREAM_CHUNK_SIZE)
+
 
 class ESXiTemplateBuilder:
     """
@@ -33,6 +84,10 @@ class ESXiTemplateBuilder:
     4. Upload to ESXi
     5. Convert to ESXi-native (vmkfstools via SSH)
     6. Template ready for cloning
+    
+    Steps 1-3 go through a local artifact cache keyed by checksum, and
+    steps 4-5 are skipped for artifacts the datastore already has (see
+    REMOTE_MANIFEST), so rebuilding an unchanged template is nearly free.
     """
     
     def __init__(
@@ -42,7 +97,8 @@ class ESXiTemplateBuilder:
         esxi_password: str,
         datastore: str,
         network: str = "VM Network",
-        verify_ssl: bool = False
+        verify_ssl: bool = False,
+        cache_dir: Optional[Path] = None
     ):
         self.esxi_host = esxi_host
         self.esxi_user = esxi_user
@@ -62,60 +118,165 @@ class ESXiTemplateBuilder:
         
         self.working_dir = Path(tempfile.gettempdir()) / "glassdome-esxi-template"
         self.working_dir.mkdir(exist_ok=True)
+        
+        # Content-addressed: images/<sha256>.vmdk, converted/<sha256>/, seeds/<sha256>.iso
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def download_cloud_image(self, ubuntu_version: str = "22.04") -> Path:
         """
-        Download Ubuntu cloud image.
+        Download Ubuntu cloud image into the artifact cache.
+        
+        The image is stored under its SHA-256 from the release's SHA256SUMS,
+        so an image that hasn't changed upstream is not downloaded again.
         
         Args:
             ubuntu_version: Ubuntu version (22.04, 24.04, etc.)
-            
+        
         Returns:
-            Path to downloaded VMDK
+            Path to downloaded VMDK (verified; file name is its SHA-256)
         """
         logger.info(f"Downloading Ubuntu {ubuntu_version} cloud image...")
         
         # Use jammy (22.04) as default
         codename = "jammy" if ubuntu_version == "22.04" else "noble"
-        url = f"https://cloud-images.ubuntu.com/{codename}/current/{codename}-server-cloudimg-amd64.vmdk"
-        
-        output_file = self.working_dir / f"ubuntu-{ubuntu_version}-cloud.vmdk"
-        
-        if output_file.exists():
-            logger.info(f"Cloud image already exists: {output_file}")
-            return output_file
-        
-        response = requests.get(url, stream=True, timeout=300)
-        response.raise_for_status()
-        
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
-        
-        with open(output_file, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total_size > 0:
-                    percent = (downloaded / total_size) * 100
-                    if downloaded % (10 * 1024 * 1024) == 0:  # Log every 10MB
-                        logger.info(f"Download progress: {percent:.1f}%")
-        
-        logger.info(f"Downloaded: {output_file} ({downloaded / 1024 / 1024:.1f} MB)")
+        base_url = f"https://cloud-images.ubuntu.com/{codename}/current"
+        filename = f"{codename}-server-cloudimg-amd64.vmdk"
+        
+        images_dir = self.cache_dir / "images"
+        images_dir.mkdir(exist_ok=True)
+        
+        expected = self._upstream_checksum(base_url, filename)
+        if expected:
+            cached = images_dir / f"{expected}.vmdk"
+            if cached.exists():
+                logger.info(f"Cloud image unchanged upstream, using cache: {cached}")
+                return cached
+        
+        partial = images_dir / f"{filename}.{expected or 'unverified'}.part"
+        if not expected:
+            # Without a checksum, leftover parts may belong to an older image
+            for stale in images_dir.glob(f"{partial.name}*"):
+                stale.unlink()
+        self._download(f"{base_url}/{filename}", partial)
+        
+        actual = file_sha256(partial)
+        if expected and actual != expected:
+            partial.unlink()
+            raise RuntimeError(f"Checksum mismatch for {filename}: expected {expected}, got {actual}")
+        
+        output_file = images_dir / f"{actual}.vmdk"
+        partial.replace(output_file)
+        
+        logger.info(f"Downloaded: {output_file} ({output_file.stat().st_size / 1024 / 1024:.1f} MB)")
         return output_file
     
+    def _upstream_checksum(self, base_url: str, filename: str) -> Optional[str]:
+        """SHA-256 of a release file from its SHA256SUMS, or None if unavailable"""
+        try:
+            response = requests.get(f"{base_url}/SHA256SUMS", timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"Could not fetch SHA256SUMS ({e}), image will not be verified")
+            return None
+        
+        for line in response.text.splitlines():
+            parts = line.split()
+            if len(parts) == 2 and parts[1].lstrip("*") == filename:
+                return parts[0].lower()
+        return None
+    
+    def _download(self, url: str, dest: Path) -> None:
+        """
+        Download a file as parallel ranged parts
+        
+        Parts are kept on disk until the whole file is assembled, so an
+        interrupted download resumes where each part stopped.
+        """
+        head = requests.head(url, allow_redirects=True, timeout=30)
+        head.raise_for_status()
+        total = int(head.headers.get("content-length", 0))
+        ranged = head.headers.get("accept-ranges") == "bytes" and total > 0
+        
+        if ranged:
+            parts = DOWNLOAD_PARTS if total >= DOWNLOAD_PARTS * STREAM_CHUNK_SIZE else 1
+            ranges = [(i * total // parts, (i + 1) * total // parts - 1) for i in range(parts)]
+        else:
+            ranges = [(0, None)]
+        part_files = [dest.with_name(f"{dest.name}{i}") for i in range(len(ranges))]
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            list(pool.map(lambda args: self._download_range(url, *args), zip(part_files, ranges)))
+        
+        with open(dest, "wb") as out:
+            for part_file in part_files:
+                with open(part_file, "rb") as f:
+                    shutil.copyfileobj(f, out, STREAM_CHUNK_SIZE)
+        for part_file in part_files:
+            part_file.unlink()
+    
+    def _download_range(self, url: str, part_file: Path, byte_range: Tuple[int, Optional[int]]) -> None:
+        """Download one byte range (end None = whole file), resuming a partial part file"""
+        start, end = byte_range
+        for attempt in range(1, MAX_TRANSFER_ATTEMPTS + 1):
+            have = part_file.stat().st_size if part_file.exists() else 0
+            headers = {}
+            if end is not None:
+                if have >= end - start + 1:
+                    return
+                headers["Range"] = f"bytes={start + have}-{end}"
+            elif have:
+                part_file.unlink()  # Can't resume without range support
+            
+            try:
+                with requests.get(url, headers=headers, stream=True, timeout=(30, 300)) as response:
+                    response.raise_for_status()
+                    if end is not None and response.status_code != 206:
+                        raise RuntimeError(f"Server ignored range request for {url}")
+                    with open(part_file, "ab") as f:
+                        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                            f.write(chunk)
+                if end is None or part_file.stat().st_size >= end - start + 1:
+                    return
+            except requests.RequestException as e:
+                if attempt == MAX_TRANSFER_ATTEMPTS:
+                    raise
+                logger.warning(f"Download of {part_file.name} interrupted ({e}), resuming")
+                time.sleep(2 ** attempt)
+        
+        raise RuntimeError(f"Download of {part_file.name} incomplete after {MAX_TRANSFER_ATTEMPTS} attempts")
+    
     def convert_vmdk(self, source_vmdk: Path) -> Path:
         """
         Convert cloud VMDK to monolithicFlat format for ESXi.
         
+        Results are cached by the source image's checksum, so an image is
+        converted once no matter how many templates are built from it.
+        
         Args:
             source_vmdk: Path to source VMDK
-            
+        
         Returns:
             Path to converted VMDK descriptor
         """
+        # Images from download_cloud_image are already named by checksum
+        cache_key = source_vmdk.stem
+        if len(cache_key) != 64:
+            cache_key = self._checksum(source_vmdk)["sha256"]
+        
+        output_dir = self.cache_dir / "converted" / cache_key
+        output_vmdk = output_dir / "ubuntu-flat.vmdk"
+        if output_dir.exists():
+            logger.info(f"Using cached conversion: {output_vmdk}")
+            return output_vmdk
+        
         logger.info("Converting VMDK to ESXi-compatible format...")
         
-        output_vmdk = self.working_dir / "ubuntu-flat.vmdk"
+        # Convert into a staging dir; the rename marks the conversion complete
+        staging_dir = output_dir.with_name(f"{cache_key}.tmp")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir(parents=True)
+        staged_vmdk = staging_dir / output_vmdk.name
         
         cmd = [
             "qemu-img", "convert",
@@ -123,7 +284,7 @@ class ESXiTemplateBuilder:
             "-O", "vmdk",
             "-o", "adapter_type=lsilogic,subformat=monolithicFlat",
             str(source_vmdk),
-            str(output_vmdk)
+            str(staged_vmdk)
         ]
         
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
@@ -131,15 +292,31 @@ class ESXiTemplateBuilder:
         if result.returncode != 0:
             raise RuntimeError(f"VMDK conversion failed: {result.stderr}")
         
-        logger.info(f"Converted VMDK: {output_vmdk}")
-        
         # Verify both descriptor and flat file exist
-        flat_file = output_vmdk.parent / f"{output_vmdk.stem}-flat.vmdk"
-        if not output_vmdk.exists() or not flat_file.exists():
-            raise FileNotFoundError(f"Conversion incomplete. Expected: {output_vmdk} and {flat_file}")
+        flat_file = staging_dir / f"{staged_vmdk.stem}-flat.vmdk"
+        if not staged_vmdk.exists() or not flat_file.exists():
+            raise FileNotFoundError(f"Conversion incomplete. Expected: {staged_vmdk} and {flat_file}")
         
+        staging_dir.rename(output_dir)
+        logger.info(f"Converted VMDK: {output_vmdk}")
         return output_vmdk
     
+    def _checksum(self, path: Path) -> Dict[str, Any]:
+        """SHA-256 and size of a local artifact (computed once, kept in a sidecar file)"""
+        sidecar = path.with_name(f"{path.name}.sha256")
+        stat = path.stat()
+        if sidecar.exists():
+            try:
+                cached = json.loads(sidecar.read_text())
+                if cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime:
+                    return {"sha256": cached["sha256"], "size": cached["size"]}
+            except (ValueError, KeyError):
+                pass
+        
+        sha256 = file_sha256(path)
+        sidecar.write_text(json.dumps({"sha256": sha256, "size": stat.st_size, "mtime": stat.st_mtime}))
+        return {"sha256": sha256, "size": stat.st_size}
+    
     def create_cloud_init_iso(
         self,
         hostname: str = "glassdome-template",
@@ -155,7 +332,7 @@ class ESXiTemplateBuilder:
             username: Default user
             password: Default password (plain text)
             ssh_authorized_keys: Optional list of SSH public keys
-            
+        
         Returns:
             Path to seed.iso
         """
@@ -220,12 +397,20 @@ runcmd:
 local-hostname: {hostname}
 """
         
+        # Cached by content: genisoimage embeds timestamps, so the same
+        # settings would otherwise produce a "new" ISO on every build
+        seed_key = hashlib.sha256(f"{user_data}\0{meta_data}".encode()).hexdigest()
+        iso_file = self.cache_dir / "seeds" / f"{seed_key}.iso"
+        if iso_file.exists():
+            logger.info(f"Using cached seed.iso: {iso_file}")
+            return iso_file
+        iso_file.parent.mkdir(exist_ok=True)
+        
         # Write files
         (seed_dir / "user-data").write_text(user_data)
         (seed_dir / "meta-data").write_text(meta_data)
         
         # Create ISO
-        iso_file = self.working_dir / "seed.iso"
         
         cmd = [
             "genisoimage",
@@ -252,32 +437,94 @@ local-hostname: {hostname}
         """
         Upload file to ESXi datastore via HTTP.
         
+        Streams in large blocks and retries with backoff. The datastore
+        /folder endpoint only accepts whole-file PUTs, so a retry re-sends
+        the file, unless the datastore already has all of its bytes.
+        
         Args:
             local_file: Local file path
             remote_path: Remote path (e.g., "templates/ubuntu/file.vmdk")
-            
+        
         Returns:
             True if successful
         """
         logger.info(f"Uploading {local_file.name} to ESXi...")
         
-        url = f"https://{self.esxi_host}/folder/{remote_path}?dcPath=ha-datacenter&dsName={self.datastore}"
-        
-        with open(local_file, 'rb') as f:
-            response = requests.put(
-                url,
-                data=f,
+        size = local_file.stat().st_size
+        for attempt in range(1, MAX_TRANSFER_ATTEMPTS + 1):
+            try:
+                with open(local_file, 'rb') as f:
+                    response = requests.put(
+                        self._datastore_url(remote_path),
+                        data=_ChunkReader(f, size),
+                        auth=(self.esxi_user, self.esxi_password),
+                        verify=self.verify_ssl,
+                        headers={'Content-Type': 'application/octet-stream'},
+                        timeout=(30, 600)
+                    )
+                if response.status_code in [200, 201]:
+                    logger.info(f"Uploaded: {remote_path}")
+                    return True
+                error = f"Upload failed ({response.status_code}): {response.text[:200]}"
+                if response.status_code < 500:
+                    raise RuntimeError(error)
+            except requests.RequestException as e:
+                # The connection may drop after the host stored the whole file
+                if self._remote_size(remote_path) == size:
+                    logger.info(f"Uploaded: {remote_path}")
+                    return True
+                error = str(e)
+            
+            if attempt == MAX_TRANSFER_ATTEMPTS:
+                raise RuntimeError(f"{error} (after {attempt} attempts)")
+            logger.warning(f"Upload of {local_file.name} failed ({error}), retrying")
+            time.sleep(2 ** attempt)
+        return False
+    
+    def _datastore_url(self, remote_path: str) -> str:
+        return f"https://{self.esxi_host}/folder/{remote_path}?dcPath=ha-datacenter&dsName={self.datastore}"
+    
+    def _remote_size(self, remote_path: str) -> Optional[int]:
+        """Size of a datastore file, or None if it doesn't exist"""
+        try:
+            response = requests.head(
+                self._datastore_url(remote_path),
                 auth=(self.esxi_user, self.esxi_password),
                 verify=self.verify_ssl,
-                headers={'Content-Type': 'application/octet-stream'},
-                timeout=600
+                timeout=30
             )
-        
+        except requests.RequestException:
+            return None
+        if response.status_code != 200 or "content-length" not in response.headers:
+            return None
+        return int(response.headers["content-length"])
+    
+    def _remote_manifest(self, template_name: str) -> Dict[str, Any]:
+        """Checksums of the artifacts last uploaded for a template ({} if none)"""
+        try:
+            response = requests.get(
+                self._datastore_url(f"{template_name}/{REMOTE_MANIFEST}"),
+                auth=(self.esxi_user, self.esxi_password),
+                verify=self.verify_ssl,
+                timeout=30
+            )
+            if response.status_code == 200:
+                return response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.debug(f"No artifact manifest for {template_name}: {e}")
+        return {}
+    
+    def _write_remote_manifest(self, template_name: str, manifest: Dict[str, Any]) -> None:
+        response = requests.put(
+            self._datastore_url(f"{template_name}/{REMOTE_MANIFEST}"),
+            data=json.dumps(manifest, indent=2).encode(),
+            auth=(self.esxi_user, self.esxi_password),
+            verify=self.verify_ssl,
+            headers={'Content-Type': 'application/json'},
+            timeout=30
+        )
         if response.status_code not in [200, 201]:
-            raise RuntimeError(f"Upload failed ({response.status_code}): {response.text[:200]}")
-        
-        logger.info(f"Uploaded: {remote_path}")
-        return True
+            logger.warning(f"Could not write artifact manifest ({response.status_code})")
     
     def convert_to_esxi_native(
         self,
@@ -290,7 +537,7 @@ local-hostname: {hostname}
         Args:
             remote_vmdk_path: Source VMDK path on ESXi (without datastore brackets)
             output_vmdk_path: Output VMDK path on ESXi (without datastore brackets)
-            
+        
         Returns:
             True if successful
         """
@@ -307,7 +554,16 @@ local-hostname: {hostname}
             raise RuntimeError("sshpass not installed. Run: sudo apt-get install sshpass")
         
         # Build vmkfstools command
-        vmkfs_cmd = f"vmkfstools -i /vmfs/volumes/{self.datastore}/{remote_vmdk_path} /vmfs/volumes/{self.datastore}/{output_vmdk_path} -d thin"
+        # Clone into a staging name and rename when complete, so the output
+        # only ever exists fully converted. The output itself is never removed:
+        # VMs built from a template attach that disk directly.
+        source = f"/vmfs/volumes/{self.datastore}/{remote_vmdk_path}"
+        output = f"/vmfs/volumes/{self.datastore}/{output_vmdk_path}"
+        staging = f"{output[:-len('.vmdk')]}-partial.vmdk"
+        vmkfs_cmd = (
+            f"if [ -f {staging} ]; then vmkfstools -U {staging}; fi; "
+            f"vmkfstools -i {source} {staging} -d thin && vmkfstools -E {staging} {output}"
+        )
         
         # Execute via SSH
         ssh_cmd = [
@@ -353,7 +609,7 @@ local-hostname: {hostname}
             username: Default username
             password: Default password
             ssh_keys: Optional SSH public keys
-            
+        
         Returns:
             Dict with template information
         """
@@ -375,34 +631,84 @@ local-hostname: {hostname}
                 ssh_authorized_keys=ssh_keys
             )
             
-            # Step 4: Upload to ESXi
-            self.upload_to_esxi(flat_vmdk, f"{template_name}/ubuntu-flat.vmdk")
-            self.upload_to_esxi(flat_data, f"{template_name}/ubuntu-flat-flat.vmdk")
-            self.upload_to_esxi(seed_iso, f"{template_name}/seed.iso")
+            artifacts = {
+                f"{template_name}/ubuntu-flat.vmdk": flat_vmdk,
+                f"{template_name}/ubuntu-flat-flat.vmdk": flat_data,
+                f"{template_name}/seed.iso": seed_iso,
+            }
+            checksums = {remote: self._checksum(path) for remote, path in artifacts.items()}
+            disk_sha256 = checksums[f"{template_name}/ubuntu-flat-flat.vmdk"]["sha256"]
+            # Versioned by disk content: a rebuild after an image change
+            # converts into a new file and leaves disks in use untouched
+            native_vmdk = f"{template_name}/{template_name}-{disk_sha256[:16]}.vmdk"
             
-            # Step 5: Convert to ESXi-native
-            self.convert_to_esxi_native(
-                f"{template_name}/ubuntu-flat.vmdk",
-                f"{template_name}/{template_name}.vmdk"
-            )
+            remote_manifest = self._remote_manifest(template_name)
+            remote_files = remote_manifest.get("files", {})
+            
+            # Step 4: Upload to ESXi (only what the datastore doesn't already have)
+            pending = [
+                remote for remote in artifacts
+                if remote_files.get(remote) != checksums[remote]
+                or self._remote_size(remote) != checksums[remote]["size"]
+            ]
+            uploaded, upload_error = self._upload_all({remote: artifacts[remote] for remote in pending})
+            
+            # Step 5: Convert to ESXi-native (only when the disk changed)
+            converted = native_ready = False
+            try:
+                if upload_error:
+                    raise upload_error
+                if self._remote_size(native_vmdk) is None:
+                    self.convert_to_esxi_native(f"{template_name}/ubuntu-flat.vmdk", native_vmdk)
+                    converted = True
+                else:
+                    logger.info("ESXi-native VMDK is up to date, skipping vmkfstools")
+                native_ready = True
+            finally:
+                # Record what made it to the datastore, so a failed build resumes from there
+                if uploaded or converted or (native_ready and remote_manifest.get("native_vmdk") != native_vmdk):
+                    self._write_remote_manifest(template_name, {
+                        "files": {**remote_files, **{remote: checksums[remote] for remote in uploaded}},
+                        "native_source_sha256": disk_sha256 if native_ready else remote_manifest.get("native_source_sha256"),
+                        "native_vmdk": native_vmdk if native_ready else remote_manifest.get("native_vmdk"),
+                        "updated_at": datetime.now().isoformat()
+                    })
             
             result = {
                 "template_name": template_name,
-                "vmdk_path": f"[{self.datastore}] {template_name}/{template_name}.vmdk",
+                "vmdk_path": f"[{self.datastore}] {native_vmdk}",
                 "iso_path": f"[{self.datastore}] {template_name}/seed.iso",
                 "username": username,
                 "password": password,
                 "ubuntu_version": ubuntu_version,
-                "status": "ready"
+                "status": "ready",
+                "reused": not uploaded and not converted
             }
             
             logger.info(f"✅ Template ready: {template_name}")
             return result
-            
+        
         except Exception as e:
             logger.error(f"Template build failed: {e}")
             raise
     
+    def _upload_all(self, files: Dict[str, Path]) -> Tuple[List[str], Optional[BaseException]]:
+        """
+        Upload files in parallel
+        
+        Returns:
+            (remote paths uploaded, first upload error or None)
+        """
+        if not files:
+            return [], None
+        
+        with ThreadPoolExecutor(max_workers=len(files)) as pool:
+            futures = {remote: pool.submit(self.upload_to_esxi, path, remote) for remote, path in files.items()}
+        
+        uploaded = [remote for remote, future in futures.items() if future.exception() is None]
+        errors = [future.exception() for future in futures.values() if future.exception() is not None]
+        return uploaded, errors[0] if errors else None
+    
     def create_vm_from_template(
         self,
         vm_name: str,
@@ -418,7 +724,7 @@ local-hostname: {hostname}
             template_info: Template info from build_template()
             cores: Number of CPU cores
             memory_mb: Memory in MB
-            
+        
         Returns:
             Dict with VM information
         """
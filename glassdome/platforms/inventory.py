@@ -0,0 +1,322 @@
+"""
+Platform Inventory module
+
+Concurrent status collection for the platform dashboards:
+- every Proxmox instance, AWS region and Azure subscription is a separate
+  source, queried at the same time with its own timeout
+- a source that fails or times out is reported as such; the others are
+  still returned (partial results)
+- results are cached briefly and shared, so frequent dashboard refreshes
+  and concurrent viewers cost one round of API calls per TTL; a round with
+  a failed source is only kept for a couple of seconds, so a recovered
+  source shows up on the next refresh
+
+The platform SDKs used here (proxmoxer, boto3, azure-mgmt) are blocking,
+so each source runs in a worker thread.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a collected inventory is served from cache
+DEFAULT_CACHE_TTL = 15
+
+# Seconds an inventory with a failed or timed out source is served from
+# cache (enough to absorb concurrent viewers, not to hide a recovery)
+DEFAULT_FAILURE_TTL = 2
+
+# Max seconds for one source (instance / region / subscription)
+DEFAULT_SOURCE_TIMEOUT = 10
+
+# Regions shown on the AWS dashboard
+AWS_STATUS_REGIONS = ("us-east-1", "us-west-2")  # Virginia and Oregon
+
+# Threads for blocking SDK calls
+MAX_WORKERS = 16
+
+
+@dataclass
+class SourceResult:
+    """Outcome of querying one source"""
+    source: str
+    ok: bool
+    data: Any = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+
+class PlatformInventory:
+    """Concurrent, cached platform status collection"""
+    
+    def __init__(
+        self,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        source_timeout: float = DEFAULT_SOURCE_TIMEOUT,
+        failure_ttl: float = DEFAULT_FAILURE_TTL
+    ):
+        self.cache_ttl = cache_ttl
+        self.failure_ttl = failure_ttl
+        self.source_timeout = source_timeout
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="inventory")
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._aws_clients: Dict[Tuple[str, str], Any] = {}
+        self._aws_lock = threading.Lock()
+    
+    async def _run_blocking(self, fn: Callable, *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    # ─────────────────────────────────────────────────────
+    # Cache / concurrency helpers
+    # ─────────────────────────────────────────────────────
+    
+    async def cached(self, key: str, fetch: Callable[[], Awaitable[Any]], refresh: bool = False) -> Any:
+        """
+        Return the cached value for `key`, or run `fetch` once
+        
+        Concurrent callers for the same key share one fetch. `refresh`
+        skips the cache but still joins a fetch already in progress.
+        Results with a failed source are kept for `failure_ttl` only.
+        """
+        entry = self._cache.get(key)
+        if entry and not refresh and entry[0] > time.monotonic():
+            return entry[1]
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            
+            def done(f: asyncio.Future):
+                self._inflight.pop(key, None)
+                if f.cancelled() or f.exception() is not None:
+                    return
+                ttl = self.failure_ttl if self._has_failures(f.result()) else self.cache_ttl
+                if ttl > 0:
+                    self._cache[key] = (time.monotonic() + ttl, f.result())
+            
+            future.add_done_callback(done)
+        
+        # Shielded: one caller disconnecting doesn't cancel the shared fetch
+        return await asyncio.shield(future)
+    
+    @staticmethod
+    def _has_failures(value: Any) -> bool:
+        """True for a run_sources() result where any source failed"""
+        return isinstance(value, dict) and any(
+            isinstance(result, SourceResult) and not result.ok for result in value.values()
+        )
+    
+    async def run_sources(
+        self,
+        sources: Dict[str, Callable[[], Awaitable[Any]]],
+        timeout: Optional[float] = None
+    ) -> Dict[str, SourceResult]:
+        """Run all sources concurrently, each with its own timeout"""
+        timeout = timeout or self.source_timeout
+        
+        async def run(name: str, fetch: Callable[[], Awaitable[Any]]) -> SourceResult:
+            start = time.perf_counter()
+            try:
+                data = await asyncio.wait_for(fetch(), timeout)
+                result = SourceResult(source=name, ok=True, data=data)
+            except asyncio.TimeoutError:
+                logger.warning(f"Inventory source {name} timed out after {timeout}s")
+                result = SourceResult(source=name, ok=False, error=f"Timed out after {timeout}s")
+            except Exception as e:
+                logger.warning(f"Inventory source {name} failed: {e}")
+                result = SourceResult(source=name, ok=False, error=str(e))
+            result.elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            return result
+        
+        results = await asyncio.gather(*(run(name, fetch) for name, fetch in sources.items()))
+        return {result.source: result for result in results}
+    
+    # ─────────────────────────────────────────────────────
+    # Proxmox
+    # ─────────────────────────────────────────────────────
+    
+    async def _proxmox_instance(self, instance_id: str) -> Dict[str, Any]:
+        """Nodes and VMs of one Proxmox cluster"""
+        from glassdome.platforms.proxmox_factory import get_proxmox_client
+        
+        client = await self._run_blocking(get_proxmox_client, instance_id)
+        api = client.client
+        
+        # Two calls per cluster: nodes, and every VM via cluster/resources
+        nodes, resources = await asyncio.gather(
+            self._run_blocking(api.nodes.get),
+            self._run_blocking(lambda: api.cluster.resources.get(type="vm")),
+            return_exceptions=True
+        )
+        if isinstance(nodes, Exception):
+            raise nodes
+        
+        if isinstance(resources, Exception):
+            # Token without cluster-wide audit rights: fall back to per-node listing
+            logger.debug(f"cluster/resources unavailable on {instance_id}: {resources}")
+            per_node = await asyncio.gather(*(
+                self._run_blocking(api.nodes(node["node"]).qemu.get) for node in nodes
+            ))
+            vms = [
+                {**vm, "node": node["node"]}
+                for node, node_vms in zip(nodes, per_node)
+                for vm in node_vms
+            ]
+        else:
+            vms = [vm for vm in resources if vm.get("type", "qemu") == "qemu"]
+        
+        return {"nodes": nodes, "vms": vms}
+    
+    async def proxmox(self, instance_ids: List[str], refresh: bool = False) -> Dict[str, SourceResult]:
+        """Status of the given Proxmox instances, queried concurrently"""
+        async def fetch():
+            return await self.run_sources({
+                instance_id: (lambda iid=instance_id: self._proxmox_instance(iid))
+                for instance_id in instance_ids
+            })
+        
+        return await self.cached(f"proxmox:{','.join(instance_ids)}", fetch, refresh)
+    
+    # ─────────────────────────────────────────────────────
+    # AWS
+    # ─────────────────────────────────────────────────────
+    
+    def _aws_client(self, region: str, access_key: str, secret_key: str):
+        """EC2 client per region, reused (boto3 clients are thread-safe)"""
+        with self._aws_lock:
+            client = self._aws_clients.get((region, access_key))
+            if client is None:
+                import boto3
+                client = boto3.client(
+                    'ec2',
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=region
+                )
+                self._aws_clients[(region, access_key)] = client
+            return client
+    
+    def _describe_region(self, region: str, access_key: str, secret_key: str) -> List[Dict[str, Any]]:
+        """All instances in a region (every page)"""
+        paginator = self._aws_client(region, access_key, secret_key).get_paginator('describe_instances')
+        return [
+            instance
+            for page in paginator.paginate(PaginationConfig={"PageSize": 1000})
+            for reservation in page.get('Reservations', [])
+            for instance in reservation.get('Instances', [])
+        ]
+    
+    async def aws(
+        self,
+        access_key: str,
+        secret_key: str,
+        regions: Tuple[str, ...] = AWS_STATUS_REGIONS,
+        refresh: bool = False
+    ) -> Dict[str, SourceResult]:
+        """EC2 instances in each region, queried concurrently"""
+        async def fetch():
+            return await self.run_sources({
+                region: (lambda r=region: self._run_blocking(self._describe_region, r, access_key, secret_key))
+                for region in regions
+            })
+        
+        return await self.cached(f"aws:{access_key}:{','.join(regions)}", fetch, refresh)
+    
+    # ─────────────────────────────────────────────────────
+    # Azure
+    # ─────────────────────────────────────────────────────
+    
+    def _azure_subscription(self, subscription_id: str, tenant_id: str, client_id: str, client_secret: str) -> List[Dict[str, Any]]:
+        """VMs with power state in one subscription"""
+        from azure.identity import ClientSecretCredential
+        from azure.mgmt.compute import ComputeManagementClient
+        
+        credential = ClientSecretCredential(
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret
+        )
+        compute_client = ComputeManagementClient(credential, subscription_id)
+        
+        def power_state(statuses) -> str:
+            for status in statuses or []:
+                if status.code and status.code.startswith("PowerState/"):
+                    return status.code.split("/")[1]
+            return "unknown"
+        
+        # statusOnly returns the instance view with the list, instead of one
+        # instance_view call per VM
+        vms = list(compute_client.virtual_machines.list_all(status_only="true"))
+        
+        missing = [vm for vm in vms if not getattr(vm, "instance_view", None)]
+        views = {}
+        if missing:
+            # Older API versions ignore statusOnly: fetch the views in parallel
+            def view(vm):
+                try:
+                    return compute_client.virtual_machines.instance_view(vm.id.split('/')[4], vm.name).statuses
+                except Exception:
+                    return None
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                views = dict(zip((vm.id for vm in missing), pool.map(view, missing)))
+        
+        return [
+            {
+                "name": vm.name,
+                "vm_id": vm.vm_id,
+                "location": vm.location,
+                "subscription_id": subscription_id,
+                "power_state": power_state(
+                    vm.instance_view.statuses if getattr(vm, "instance_view", None) else views.get(vm.id)
+                ),
+            }
+            for vm in vms
+        ]
+    
+    async def azure(
+        self,
+        subscription_ids: List[str],
+        tenant_id: str,
+        client_id: str,
+        client_secret: str,
+        refresh: bool = False
+    ) -> Dict[str, SourceResult]:
+        """VMs in each Azure subscription, queried concurrently"""
+        async def fetch():
+            return await self.run_sources({
+                sub: (lambda s=sub: self._run_blocking(
+                    self._azure_subscription, s, tenant_id, client_id, client_secret
+                ))
+                for sub in subscription_ids
+            })
+        
+        return await self.cached(f"azure:{','.join(subscription_ids)}", fetch, refresh)
+    
+    def invalidate(self, prefix: str = ""):
+        """Drop cached results (e.g. after a VM action)"""
+        for key in [k for k in self._cache if k.startswith(prefix)]:
+            del self._cache[key]
+
+
+# Singleton instance
+_inventory: Optional[PlatformInventory] = None
+
+
+def get_platform_inventory() -> PlatformInventory:
+    """Get the shared platform inventory"""
+    global _inventory
+    if _inventory is None:
+        _inventory = PlatformInventory()
+    return _inventory
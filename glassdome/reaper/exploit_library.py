@@ -169,7 +169,7 @@ class ExploitMission(Base):
     error_message = Column(Text, nullable=True)
     
     # Timing
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=func.now(), index=True)  # History keyset pagination
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     
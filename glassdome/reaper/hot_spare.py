@@ -15,6 +15,7 @@ import asyncio
 import logging
 
 from glassdome.core.database import Base
+from glassdome.core.db_metrics import set_db_scope
 
 logger = logging.getLogger(__name__)
 
@@ -173,11 +174,12 @@ class HotSparePool:
     
     async def _pool_manager_loop(self):
         """Background loop to maintain pool"""
-        from glassdome.core.database import AsyncSessionLocal
+        set_db_scope("reaper.hot_spare")
+        from glassdome.core.database import BackgroundSessionLocal
         
         while self._running:
             try:
-                async with AsyncSessionLocal() as session:
+                async with BackgroundSessionLocal() as session:
                     await self._maintain_pool(session)
                     await self._health_check_spares(session)
             except Exception as e:
@@ -285,10 +287,10 @@ class HotSparePool:
     async def _clone_spare_vm(self, spare_id: int, pve_config: Dict, assigned_ip: str, vmid: int = None):
         """Clone and configure a spare VM (runs in background)"""
         from glassdome.platforms.proxmox_client import ProxmoxClient
-        from glassdome.core.database import AsyncSessionLocal
+        from glassdome.core.database import BackgroundSessionLocal
         from sqlalchemy import select
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             result = await session.execute(select(HotSpare).where(HotSpare.id == spare_id))
             spare = result.scalar_one_or_none()
             if not spare:
@@ -428,13 +430,13 @@ class HotSparePool:
         Called immediately when a spare is acquired to maintain pool levels.
         Runs in background - doesn't block the mission.
         """
-        from glassdome.core.database import AsyncSessionLocal
+        from glassdome.core.database import BackgroundSessionLocal
         from glassdome.core.config import Settings
         
         try:
             logger.info(f"🔄 Dispatching replacement spare for {os_type}")
             
-            async with AsyncSessionLocal() as session:
+            async with BackgroundSessionLocal() as session:
                 # Check if we need a replacement (might have enough provisioning already)
                 from sqlalchemy import select, func
                 
@@ -0,0 +1,209 @@
+"""
+Buffered Mission Log Sink
+
+Collects MissionLog entries in memory per mission and writes them as bulk
+inserts (one commit per batch) once a mission's buffer reaches
+`max_batch` entries or `flush_interval` seconds have passed. Callers flush
+a mission explicitly when it completes or fails so nothing is lost.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from glassdome.reaper.exploit_library import MissionLog
+
+logger = logging.getLogger(__name__)
+
+# Flush a mission once this many entries are buffered
+DEFAULT_MAX_BATCH = 50
+
+# Flush everything at least this often (seconds)
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+# Entries kept per mission while the database is unavailable
+MAX_PENDING_PER_MISSION = 5000
+
+
+class MissionLogSink:
+    """
+    Group-commit writer for MissionLog rows.
+    
+    log() is synchronous and never touches the database; writes happen in
+    flush(), either from the background timer, when a mission's buffer is
+    full, or explicitly at mission completion/failure.
+    """
+    
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """
+        Args:
+            session_factory: async_sessionmaker to write with
+                (default: the background engine's BackgroundSessionLocal)
+            max_batch: Buffered entries per mission that trigger a flush
+            flush_interval: Max seconds an entry waits before being written
+        """
+        self._session_factory = session_factory
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._write_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._pending_flushes: set = set()
+        
+        # Stats
+        self.commits = 0
+        self.rows_written = 0
+        self.failed_flushes = 0
+    
+    def _get_session_factory(self):
+        if self._session_factory is None:
+            from glassdome.core.database import BackgroundSessionLocal
+            self._session_factory = BackgroundSessionLocal
+        return self._session_factory
+    
+    def log(
+        self,
+        mission_id: str,
+        message: str,
+        level: str = "INFO",
+        step: Optional[str] = None,
+        exploit_id: Optional[int] = None,
+        details: Optional[Dict] = None,
+    ) -> None:
+        """Buffer a log entry for a mission (non-blocking)."""
+        buffer = self._buffers.setdefault(mission_id, [])
+        buffer.append({
+            "mission_id": mission_id,
+            "level": level,
+            "message": message,
+            "step": step,
+            "exploit_id": exploit_id,
+            "details": details,
+            "timestamp": datetime.utcnow(),  # Naive UTC, matches the column
+        })
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: entries wait for an explicit flush()
+        
+        if self._timer is None or self._timer.done():
+            self._timer = loop.create_task(self._flush_loop())
+        
+        if len(buffer) >= self.max_batch:
+            task = loop.create_task(self.flush(mission_id))
+            self._pending_flushes.add(task)
+            task.add_done_callback(self._pending_flushes.discard)
+    
+    def pending(self, mission_id: Optional[str] = None) -> int:
+        """Number of buffered (unwritten) entries."""
+        if mission_id is not None:
+            return len(self._buffers.get(mission_id, ()))
+        return sum(len(b) for b in self._buffers.values())
+    
+    async def flush(self, mission_id: Optional[str] = None) -> int:
+        """
+        Write buffered entries in a single transaction.
+        
+        Args:
+            mission_id: Flush only this mission (default: all missions)
+        
+        Returns:
+            Number of rows written
+        """
+        async with self._write_lock:
+            if mission_id is not None:
+                rows = self._buffers.pop(mission_id, [])
+            else:
+                rows = [row for buffer in self._buffers.values() for row in buffer]
+                self._buffers.clear()
+            
+            if not rows:
+                return 0
+            
+            try:
+                async with self._get_session_factory()() as session:
+                    await session.execute(insert(MissionLog), rows)
+                    await session.commit()
+            except Exception as e:
+                self.failed_flushes += 1
+                logger.warning(f"Mission log flush failed ({len(rows)} entries kept for retry): {e}")
+                self._requeue(rows)
+                return 0
+            
+            self.commits += 1
+            self.rows_written += len(rows)
+            return len(rows)
+    
+    def _requeue(self, rows: List[Dict[str, Any]]) -> None:
+        """Put unwritten rows back ahead of anything logged since."""
+        by_mission: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_mission.setdefault(row["mission_id"], []).append(row)
+        for mission_id, failed in by_mission.items():
+            merged = failed + self._buffers.get(mission_id, [])
+            if len(merged) > MAX_PENDING_PER_MISSION:
+                logger.warning(
+                    f"Dropping {len(merged) - MAX_PENDING_PER_MISSION} oldest log entries for {mission_id}"
+                )
+                merged = merged[-MAX_PENDING_PER_MISSION:]
+            self._buffers[mission_id] = merged
+    
+    async def _flush_loop(self):
+        """Time-based flush; exits once the buffers stay empty."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._buffers:
+                return
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Mission log flush loop error: {e}")
+    
+    async def close(self) -> None:
+        """Stop the timer and write everything still buffered."""
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+        self._timer = None
+        if self._pending_flushes:
+            await asyncio.gather(*self._pending_flushes, return_exceptions=True)
+        await self.flush()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Sink statistics"""
+        return {
+            "pending": self.pending(),
+            "missions_buffered": len(self._buffers),
+            "commits": self.commits,
+            "rows_written": self.rows_written,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+# Singleton instance
+_sink: Optional[MissionLogSink] = None
+
+
+def get_mission_log_sink() -> MissionLogSink:
+    """Get the process-wide mission log sink"""
+    global _sink
+    if _sink is None:
+        _sink = MissionLogSink()
+    return _sink
@@ -8,6 +8,7 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Set
 
@@ -21,14 +22,22 @@ from glassdome.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+FULL_POLL_INTERVAL = 60.0  # Safety net; changes normally arrive via the change feed
+TASK_POLL_INTERVAL = 1.0   # Cluster task log tail
+
+# Tasks whose "id" does not identify the VM that changed (clones report
+# the source VM, migrations move the VM between nodes): re-list everything
+FULL_POLL_TASK_TYPES = {"qmclone", "qmigrate", "qmrestore"}
+
 
 class ProxmoxAgent(BaseAgent):
     """
     Agent for monitoring Proxmox VMs.
     
     Features:
-    - Fast polling for lab VMs (Tier 1)
-    - Standard polling for all VMs (Tier 2)
+    - Full poll of every node at poll_interval (safety cadence)
+    - Targeted refreshes between full polls, driven by the cluster task log
+      and webhook hints from the change feed
     - VM state tracking (running/stopped/paused)
     - Name drift detection
     - IP address tracking via QEMU guest agent
@@ -40,7 +49,8 @@ class ProxmoxAgent(BaseAgent):
         tier: int = 1,
         poll_interval: float = 1.0,
         registry: LabRegistry = None,
-        track_lab_vms_only: bool = False
+        track_lab_vms_only: bool = False,
+        task_poll_interval: float = TASK_POLL_INTERVAL
     ):
         """
         Initialize Proxmox agent.
@@ -48,19 +58,30 @@ class ProxmoxAgent(BaseAgent):
         Args:
             instance_id: Proxmox instance ID (01, 02, etc.)
             tier: Update tier (1 = lab VMs, 2 = all VMs)
-            poll_interval: Seconds between polls
+            poll_interval: Seconds between full polls
             registry: Registry instance
             track_lab_vms_only: If True, only track VMs with lab_id
+            task_poll_interval: Seconds between cluster task log checks
         """
         name = f"proxmox-{instance_id}"
         super().__init__(name=name, tier=tier, poll_interval=poll_interval, registry=registry)
         
         self.instance_id = instance_id
         self.track_lab_vms_only = track_lab_vms_only
+        self.task_poll_interval = task_poll_interval
         self._client: Optional[ProxmoxClient] = None
         self._nodes: List[str] = []
         self._known_vms: Set[str] = set()  # Track known VM IDs for deletion detection
         
+        # Change feed state
+        self._wakeup = asyncio.Event()
+        self._pending: Dict[int, Optional[str]] = {}  # vmid -> node hint
+        self._tail_requested = False
+        self._full_poll_requested = False
+        self._task_status: Optional[Dict[str, bool]] = None  # upid -> finished
+        self._refresh_count = 0
+        self._refreshed_vms = 0
+        
     async def _get_client(self) -> ProxmoxClient:
         """Get or create Proxmox client"""
         if self._client is None:
@@ -151,6 +172,175 @@ class ProxmoxAgent(BaseAgent):
         
         return resources
     
+    # =========================================================================
+    # Change Feed
+    # =========================================================================
+    
+    def request_refresh(self, vmid: Optional[int] = None, node: Optional[str] = None):
+        """
+        Ask for a refresh before the next scheduled check.
+        
+        Args:
+            vmid: VM that changed; without one the task log is checked instead
+            node: Node the VM is on, if known
+        """
+        if vmid is None:
+            self._tail_requested = True
+        else:
+            self._pending[int(vmid)] = node or self._pending.get(int(vmid))
+        self._wakeup.set()
+    
+    async def _poll_loop(self):
+        """
+        Full poll at poll_interval; in between, refresh only the VMs named
+        by webhook hints or by tasks finishing in the cluster task log.
+        """
+        logger.info(f"Agent {self.name} poll loop starting")
+        feed = get_change_feed()
+        feed.attach(self)
+        next_full_poll = 0.0
+        
+        try:
+            while self._running:
+                try:
+                    if self._full_poll_requested or time.monotonic() >= next_full_poll:
+                        self._full_poll_requested = False
+                        await self._do_poll()
+                        self._task_status = None  # Re-baseline the task log
+                        next_full_poll = time.monotonic() + self.poll_interval
+                    else:
+                        await self._do_refresh()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    self._error_count += 1
+                    self._last_error = str(e)
+                    logger.error(f"Agent {self.name} poll error: {e}")
+                
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.task_poll_interval)
+                except asyncio.TimeoutError:
+                    self._tail_requested = True
+        finally:
+            feed.detach(self)
+    
+    async def _do_refresh(self):
+        """Refresh the VMs that changed since the last check"""
+        self._wakeup.clear()
+        targets, self._pending = self._pending, {}
+        tail, self._tail_requested = self._tail_requested, False
+        
+        client = await self._get_client()
+        if tail:
+            for vmid, node in (await self._changed_vms_from_tasks(client)).items():
+                targets.setdefault(vmid, node)
+        
+        if self._full_poll_requested:
+            self._wakeup.set()  # Covers the targets too; run it now
+            return
+        if not targets:
+            return
+        
+        self._refresh_count += 1
+        for vmid, node in targets.items():
+            try:
+                await self._refresh_vm(client, vmid, node)
+                self._refreshed_vms += 1
+            except Exception as e:
+                logger.warning(f"Targeted refresh of VM {vmid} failed: {e}")
+                self._full_poll_requested = True
+                self._wakeup.set()
+    
+    async def _changed_vms_from_tasks(self, client: ProxmoxClient) -> Dict[int, Optional[str]]:
+        """
+        Read the cluster task log and return the VMs whose tasks finished
+        since the last read. The first read after a full poll only records
+        where the log stands.
+        """
+        tasks = await asyncio.wait_for(
+            asyncio.to_thread(client.client.cluster.tasks.get),
+            timeout=5.0
+        )
+        
+        previous = self._task_status
+        self._task_status = {}
+        changed: Dict[int, Optional[str]] = {}
+        
+        for task in tasks:
+            upid = task.get("upid")
+            if not upid:
+                continue
+            finished = bool(task.get("endtime") or task.get("status"))
+            self._task_status[upid] = finished
+            
+            if previous is None or not finished or previous.get(upid):
+                continue
+            if task.get("type") in FULL_POLL_TASK_TYPES:
+                self._full_poll_requested = True
+                continue
+            vmid = str(task.get("id") or "")
+            if vmid.isdigit():
+                changed[int(vmid)] = task.get("node")
+        
+        return changed
+    
+    async def _refresh_vm(self, client: ProxmoxClient, vmid: int, node: Optional[str] = None):
+        """Re-read one VM and update or remove it in the registry"""
+        found_node, vm = await self._fetch_vm_status(client, vmid, node)
+        
+        if vm is None:
+            # Deleted: drop whichever resource ID we knew it by
+            for known in [k for k in self._known_vms if k.endswith(f":{vmid}")]:
+                self._known_vms.discard(known)
+                await self._handle_deleted_vm(known)
+            return
+        
+        resource = await self._vm_to_resource(found_node, vm)
+        if not resource or (self.tier == 1 and self.track_lab_vms_only and not resource.lab_id):
+            return
+        
+        resource.tier = self.tier
+        await self.registry.register(resource)
+        self._known_vms.add(resource.id)
+    
+    async def _fetch_vm_status(self, client: ProxmoxClient, vmid: int, node: Optional[str] = None) -> tuple:
+        """
+        Get a VM's current status, trying the hinted node first.
+        
+        Returns:
+            (node, vm dict), or (None, None) if no node has the VM
+        """
+        nodes = [node] + [n for n in self._nodes if n != node] if node in self._nodes else list(self._nodes)
+        errors = []
+        
+        for candidate in nodes:
+            try:
+                vm = await asyncio.wait_for(
+                    asyncio.to_thread(lambda n=candidate: client.client.nodes(n).qemu(vmid).status.current.get()),
+                    timeout=5.0
+                )
+            except asyncio.TimeoutError:
+                errors.append(f"{candidate}: timeout")
+                continue
+            except Exception as e:
+                if "does not exist" not in str(e):
+                    errors.append(f"{candidate}: {e}")
+                continue
+            if vm:
+                return candidate, {"vmid": vmid, "name": vm.get("name", f"vm-{vmid}"), **vm}
+        
+        if errors:
+            raise RuntimeError("; ".join(errors))
+        return None, None
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get agent status, including change feed activity"""
+        status = super().get_status()
+        status["task_poll_interval"] = self.task_poll_interval
+        status["targeted_refreshes"] = self._refresh_count
+        status["refreshed_vms"] = self._refreshed_vms
+        return status
+    
     async def _vm_to_resource(self, node: str, vm: Dict[str, Any]) -> Optional[Resource]:
         """
         Convert Proxmox VM data to Resource model.
@@ -191,6 +381,14 @@ class ProxmoxAgent(BaseAgent):
         }
         state = state_map.get(status, ResourceState.UNKNOWN)
         
+        # Build resource ID
+        resource_id = Resource.make_id(
+            platform="proxmox",
+            resource_type=resource_type.value,
+            platform_id=str(vmid),
+            instance=self.instance_id
+        )
+        
         # Extract lab_id from VM name if present
         # Lab VMs named like: lab{short}-{element} where short is first 6-8 chars of lab_id
         # We can't fully recover lab_id from name, so we look it up from registry
@@ -204,14 +402,6 @@ class ProxmoxAgent(BaseAgent):
             except:
                 pass
         
-        # Build resource ID
-        resource_id = Resource.make_id(
-            platform="proxmox",
-            resource_type=resource_type.value,
-            platform_id=str(vmid),
-            instance=self.instance_id
-        )
-        
         # Get additional config
         config = {
             "node": node,
@@ -301,20 +491,14 @@ class ProxmoxAgent(BaseAgent):
         vmid = parts[-1]
         client = await self._get_client()
         
-        for node in self._nodes:
-            try:
-                vm = client.client.nodes(node).qemu(int(vmid)).status.current.get()
-                if vm:
-                    return await self._vm_to_resource(node, {
-                        "vmid": int(vmid),
-                        "name": vm.get("name", f"vm-{vmid}"),
-                        "status": vm.get("status"),
-                        **vm
-                    })
-            except Exception:
-                continue
+        try:
+            node, vm = await self._fetch_vm_status(client, int(vmid))
+        except Exception:
+            return None
         
-        return None
+        if vm is None:
+            return None
+        return await self._vm_to_resource(node, vm)
     
     # =========================================================================
     # Actions (for reconciliation)
@@ -360,6 +544,57 @@ class ProxmoxAgent(BaseAgent):
             return False
 
 
+# =============================================================================
+# Change Feed
+# =============================================================================
+
+class ProxmoxChangeFeed:
+    """
+    Routes change hints (webhook notifications) to the running agents
+    that watch the node they name.
+    """
+    
+    def __init__(self):
+        self._agents: List[ProxmoxAgent] = []
+        self.hint_count = 0
+    
+    def attach(self, agent: ProxmoxAgent):
+        if agent not in self._agents:
+            self._agents.append(agent)
+    
+    def detach(self, agent: ProxmoxAgent):
+        if agent in self._agents:
+            self._agents.remove(agent)
+    
+    def notify(self, vmid: Optional[int] = None, node: Optional[str] = None) -> int:
+        """
+        Hint that something changed.
+        
+        Args:
+            vmid: VM that changed, if known; otherwise agents check the task log
+            node: Node the change happened on; unknown nodes go to every agent
+        
+        Returns:
+            Number of agents notified
+        """
+        self.hint_count += 1
+        agents = [a for a in self._agents if node and node in a._nodes] or self._agents
+        for agent in agents:
+            agent.request_refresh(vmid=vmid, node=node)
+        return len(agents)
+
+
+_change_feed: Optional[ProxmoxChangeFeed] = None
+
+
+def get_change_feed() -> ProxmoxChangeFeed:
+    """Get or create the change feed singleton"""
+    global _change_feed
+    if _change_feed is None:
+        _change_feed = ProxmoxChangeFeed()
+    return _change_feed
+
+
 # =============================================================================
 # Factory Functions
 # =============================================================================
@@ -368,9 +603,10 @@ def create_proxmox_agents() -> List[ProxmoxAgent]:
     """
     Create agents for all configured Proxmox instances.
     
-    Note: We only create Tier 2 agents (10s polling) to avoid overwhelming
-    the Proxmox API. Lab VMs are tracked at the same frequency - 
-    fast updates can come via webhooks when implemented.
+    Each agent lists every VM only at the slow FULL_POLL_INTERVAL. State
+    changes are picked up within about a second from the cluster task log
+    (one API call per check), or immediately from webhook hints, and only
+    the VMs involved are re-read.
     
     Returns:
         List of ProxmoxAgent instances
@@ -381,13 +617,14 @@ def create_proxmox_agents() -> List[ProxmoxAgent]:
         config = settings.get_proxmox_config(instance_id)
         
         if config.get("host"):
-            # Create single agent per instance - 10s polling for all VMs
-            # This prevents API overload while still providing good visibility
+            # Create single agent per instance - full polls are the safety net,
+            # the change feed provides the fast updates
             agent = ProxmoxAgent(
                 instance_id=instance_id,
                 tier=2,
-                poll_interval=10.0,  # 10 seconds for all VMs
+                poll_interval=FULL_POLL_INTERVAL,
                 track_lab_vms_only=False,
+                task_poll_interval=TASK_POLL_INTERVAL,
             )
             agents.append(agent)
             logger.info(f"Created Proxmox agent for instance {instance_id}")
@@ -22,6 +22,33 @@ from glassdome.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def parse_event_id(event_id: str) -> tuple:
+    """Split a stream entry ID ("<ms>-<seq>") into a comparable tuple"""
+    ms, _, seq = str(event_id).partition("-")
+    return int(ms), int(seq or 0)
+
+
+# Returns [total, lab_id, [field, value, ...], lab_id, [...], ...] for one page
+# of the lab index, so a listing is a single round trip however many labs.
+LIST_LAB_SUMMARIES_SCRIPT = """
+local result = {redis.call('ZCARD', KEYS[1])}
+for _, lab_id in ipairs(redis.call('ZRANGE', KEYS[1], ARGV[1], ARGV[2])) do
+    table.insert(result, lab_id)
+    table.insert(result, redis.call('HGETALL', ARGV[3] .. lab_id .. ARGV[4]))
+end
+return result
+"""
+
+# Adds a resource to (SADD) or removes it from (SREM) a lab's drift set and
+# stores the set's size as the summary's drift_count in the same step, so
+# concurrent detect/resolve calls can never leave the count off (or negative).
+UPDATE_DRIFT_SCRIPT = """
+local changed = redis.call(ARGV[1], KEYS[1], ARGV[2])
+redis.call('HSET', KEYS[2], 'drift_count', redis.call('SCARD', KEYS[1]))
+return changed
+"""
+
+
 class LabRegistry:
     """
     Central registry for all lab and infrastructure resources.
@@ -37,12 +64,18 @@ class LabRegistry:
     RESOURCE_PREFIX = "registry:resource:"
     LAB_PREFIX = "registry:lab:"
     EVENT_CHANNEL = "registry:events"
+    EVENT_STREAM = f"{EVENT_CHANNEL}:stream"
+    EVENT_STREAM_MAXLEN = 10000  # Approximate; also bounds how far clients can resume
     AGENT_PREFIX = "registry:agent:"
+    LAB_INDEX = "registry:labs"  # Sorted set of lab IDs, scored by first registration
+    SUMMARY_SUFFIX = ":summary"  # registry:lab:{lab_id}:summary hash
     
     def __init__(self, redis_url: str = None):
         self.redis_url = redis_url or settings.redis_url
         self._redis: Optional[redis.Redis] = None
         self._pubsub: Optional[redis.client.PubSub] = None
+        self._list_summaries_script = None
+        self._drift_script = None
         self._running = False
         self._event_handlers: List[callable] = []
         
@@ -64,6 +97,8 @@ class LabRegistry:
             await self._redis.close()
         self._redis = None
         self._pubsub = None
+        self._list_summaries_script = None
+        self._drift_script = None
     
     # =========================================================================
     # Resource CRUD
@@ -78,18 +113,18 @@ class LabRegistry:
         
         key = f"{self.RESOURCE_PREFIX}{resource.id}"
         
-        # Check if exists (for event type)
-        existing_json = await self._redis.get(key)
-        existing = Resource.from_json(existing_json) if existing_json else None
-        
         # Update timestamps
-        resource.updated_at = datetime.now(timezone.utc)
-        resource.last_seen = datetime.now(timezone.utc)
-        if not existing:
-            resource.created_at = datetime.now(timezone.utc)
-        
-        # Store in Redis
-        await self._redis.set(key, resource.to_json())
+        now = datetime.now(timezone.utc)
+        resource.updated_at = now
+        resource.last_seen = now
+        if resource.created_at.tzinfo is None:
+            resource.created_at = resource.created_at.replace(tzinfo=timezone.utc)
+        
+        # Store and read back the replaced version in one command (SET ... GET).
+        # Concurrent registers each see the version they actually replaced, so
+        # their summary deltas and event types add up.
+        existing_json = await self._redis.set(key, resource.to_json(), get=True)
+        existing = Resource.from_json(existing_json) if existing_json else None
         
         # Add to type index
         type_key = f"registry:index:type:{resource.resource_type.value}"
@@ -100,6 +135,8 @@ class LabRegistry:
             lab_key = f"{self.LAB_PREFIX}{resource.lab_id}:resources"
             await self._redis.sadd(lab_key, resource.id)
         
+        await self._update_lab_summary(existing, resource)
+        
         # Publish event
         event_type = EventType.UPDATED if existing else EventType.CREATED
         if existing and existing.state != resource.state:
@@ -133,12 +170,12 @@ class LabRegistry:
         """Delete a resource from the registry"""
         await self.connect()
         
-        resource = await self.get(resource_id)
-        if not resource:
+        # GETDEL claims the stored version, so only one concurrent delete
+        # removes it from the indexes and summary
+        data = await self._redis.getdel(f"{self.RESOURCE_PREFIX}{resource_id}")
+        if not data:
             return False
-        
-        key = f"{self.RESOURCE_PREFIX}{resource_id}"
-        await self._redis.delete(key)
+        resource = Resource.from_json(data)
         
         # Remove from indexes
         type_key = f"registry:index:type:{resource.resource_type.value}"
@@ -148,6 +185,8 @@ class LabRegistry:
             lab_key = f"{self.LAB_PREFIX}{resource.lab_id}:resources"
             await self._redis.srem(lab_key, resource_id)
         
+        await self._update_lab_summary(resource, None)
+        
         # Publish event
         await self.publish_event(StateChange(
             event_type=EventType.DELETED,
@@ -246,6 +285,15 @@ class LabRegistry:
         """List all lab IDs in the registry"""
         await self.connect()
         
+        labs = await self._redis.zrange(self.LAB_INDEX, 0, -1)
+        if labs:
+            return list(labs)
+        
+        # Index not built yet (registry written by an older version)
+        return await self._scan_labs()
+    
+    async def _scan_labs(self) -> List[str]:
+        """Find lab IDs by scanning for lab resource indexes"""
         labs = set()
         async for key in self._redis.scan_iter(match=f"{self.LAB_PREFIX}*:resources"):
             # Extract lab_id from key
@@ -255,28 +303,176 @@ class LabRegistry:
         
         return list(labs)
     
+    # =========================================================================
+    # Lab Summaries
+    # =========================================================================
+    
+    def _summary_key(self, lab_id: str) -> str:
+        return f"{self.LAB_PREFIX}{lab_id}{self.SUMMARY_SUFFIX}"
+    
+    async def _update_lab_summary(self, old: Optional[Resource], new: Optional[Resource]):
+        """
+        Apply the difference between two versions of a resource to its
+        lab's summary hash. Steady-state re-registrations change nothing
+        and cost no extra round trips.
+        """
+        deltas: Dict[tuple, int] = {}
+        for sign, resource in ((-1, old), (1, new)):
+            if resource and resource.lab_id and resource.resource_type == ResourceType.LAB_VM:
+                running = 1 if resource.state == ResourceState.RUNNING else 0
+                for field, value in (("total_vms", 1), ("running_vms", running)):
+                    key = (resource.lab_id, field)
+                    deltas[key] = deltas.get(key, 0) + sign * value
+        
+        for (lab_id, field), delta in deltas.items():
+            if delta:
+                await self._redis.hincrby(self._summary_key(lab_id), field, delta)
+        
+        if new and new.lab_id:
+            if not old or old.lab_id != new.lab_id:
+                await self._redis.zadd(self.LAB_INDEX, {new.lab_id: new.created_at.timestamp()}, nx=True)
+            if new.resource_type == ResourceType.LAB and (
+                not old or old.name != new.name or old.lab_id != new.lab_id
+            ):
+                await self._redis.hset(self._summary_key(new.lab_id), mapping={
+                    "name": new.name,
+                    "created_at": new.created_at.isoformat(),
+                })
+        
+        if old and old.lab_id and (not new or new.lab_id != old.lab_id):
+            if old.resource_type == ResourceType.LAB:
+                await self._redis.hdel(self._summary_key(old.lab_id), "name", "created_at")
+            remaining = await self._redis.scard(f"{self.LAB_PREFIX}{old.lab_id}:resources")
+            if remaining == 0:
+                await self._redis.delete(self._summary_key(old.lab_id))
+                await self._redis.zrem(self.LAB_INDEX, old.lab_id)
+    
+    async def list_lab_summaries(self, offset: int = 0, limit: int = 100) -> tuple:
+        """
+        Get one page of lab summaries in a single round trip.
+        
+        Returns:
+            (summaries, total) where summaries are dicts with lab_id, name,
+            total_vms, running_vms, healthy and drift_count.
+        """
+        await self.connect()
+        
+        if self._list_summaries_script is None:
+            self._list_summaries_script = self._redis.register_script(LIST_LAB_SUMMARIES_SCRIPT)
+        
+        result = await self._list_summaries_script(
+            keys=[self.LAB_INDEX],
+            args=[offset, offset + limit - 1, self.LAB_PREFIX, self.SUMMARY_SUFFIX],
+        )
+        
+        summaries = []
+        for lab_id, flat in zip(result[1::2], result[2::2]):
+            fields = dict(zip(flat[::2], flat[1::2]))
+            total_vms = int(fields.get("total_vms", 0))
+            running_vms = int(fields.get("running_vms", 0))
+            drift_count = int(fields.get("drift_count", 0))
+            summaries.append({
+                "lab_id": lab_id,
+                "name": fields.get("name"),
+                "total_vms": total_vms,
+                "running_vms": running_vms,
+                "healthy": drift_count == 0 and running_vms == total_vms,
+                "drift_count": drift_count,
+            })
+        
+        return summaries, int(result[0])
+    
+    async def rebuild_lab_summaries(self) -> int:
+        """
+        Recompute the lab index and every summary from the stored resources.
+        Used to backfill registries written before summaries existed, and
+        safe to run at any time to correct counts. Returns the lab count.
+        """
+        await self.connect()
+        
+        labs = await self._scan_labs()
+        for lab_id in labs:
+            snapshot = await self.get_lab_snapshot(lab_id)
+            if not snapshot:
+                continue
+            summary = {
+                "total_vms": snapshot.total_vms,
+                "running_vms": snapshot.running_vms,
+                "drift_count": snapshot.drift_count,
+            }
+            if snapshot.name:
+                summary["name"] = snapshot.name
+            if snapshot.created_at:
+                summary["created_at"] = snapshot.created_at.isoformat()
+            
+            key = self._summary_key(lab_id)
+            await self._redis.delete(key)
+            await self._redis.hset(key, mapping=summary)
+            score = (snapshot.created_at or datetime.now(timezone.utc)).timestamp()
+            await self._redis.zadd(self.LAB_INDEX, {lab_id: score}, nx=True)
+        
+        logger.info(f"Rebuilt registry summaries for {len(labs)} labs")
+        return len(labs)
+    
     # =========================================================================
     # Event System
     # =========================================================================
     
     async def publish_event(self, event: StateChange):
-        """Publish a state change event"""
+        """Append a state change event to the event stream"""
         await self.connect()
         
-        # Publish to general channel
-        await self._redis.publish(self.EVENT_CHANNEL, event.to_json())
+        # Filter fields sit beside the payload so readers can match
+        # events without decoding them
+        await self._redis.xadd(
+            self.EVENT_STREAM,
+            {
+                "event": event.to_json(),
+                "event_type": event.event_type.value,
+                "resource_type": event.resource_type.value,
+                "lab_id": event.lab_id or "",
+            },
+            maxlen=self.EVENT_STREAM_MAXLEN,
+            approximate=True,
+        )
         
-        # Also publish to lab-specific channel if applicable
-        if event.lab_id:
-            lab_channel = f"registry:events:lab:{event.lab_id}"
-            await self._redis.publish(lab_channel, event.to_json())
+        logger.debug(f"Published event: {event.event_type.value} for {event.resource_id}")
+    
+    async def read_events(self, after_id: str, block_ms: int = 5000, count: int = 500) -> List[tuple]:
+        """
+        Read events newer than after_id, waiting up to block_ms for one.
         
-        # Store recent events (last 1000)
-        event_list_key = "registry:events:recent"
-        await self._redis.lpush(event_list_key, event.to_json())
-        await self._redis.ltrim(event_list_key, 0, 999)
+        Returns:
+            List of (event_id, fields) tuples, oldest first
+        """
+        await self.connect()
         
-        logger.debug(f"Published event: {event.event_type.value} for {event.resource_id}")
+        response = await self._redis.xread({self.EVENT_STREAM: after_id}, count=count, block=block_ms)
+        if not response:
+            return []
+        if isinstance(response, dict):  # RESP3
+            return list(response[self.EVENT_STREAM][0])
+        return list(response[0][1])
+    
+    async def events_since(self, after_id: str, count: int = None) -> List[tuple]:
+        """
+        Get stored events newer than after_id, for clients resuming a stream.
+        Events trimmed from the stream are not returned.
+        """
+        await self.connect()
+        
+        ms, seq = parse_event_id(after_id)
+        return await self._redis.xrange(
+            self.EVENT_STREAM, min=f"{ms}-{seq + 1}", max="+",
+            count=count or self.EVENT_STREAM_MAXLEN,
+        )
+    
+    async def last_event_id(self) -> str:
+        """ID of the newest stored event, or "0-0" when there is none"""
+        await self.connect()
+        
+        entries = await self._redis.xrevrange(self.EVENT_STREAM, count=1)
+        return entries[0][0] if entries else "0-0"
     
     async def subscribe_events(self, lab_id: str = None) -> AsyncIterator[StateChange]:
         """
@@ -285,42 +481,32 @@ class LabRegistry:
         Args:
             lab_id: If provided, only receive events for this lab
         """
-        await self.connect()
-        
-        pubsub = self._redis.pubsub()
+        from glassdome.registry.event_hub import EventFilter, get_event_hub
         
-        if lab_id:
-            channel = f"registry:events:lab:{lab_id}"
-        else:
-            channel = self.EVENT_CHANNEL
-        
-        await pubsub.subscribe(channel)
+        hub = get_event_hub()
+        subscription = await hub.subscribe(EventFilter(lab_id=lab_id))
         
         try:
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    try:
-                        event = StateChange.from_dict(json.loads(message["data"]))
-                        yield event
-                    except Exception as e:
-                        logger.error(f"Failed to parse event: {e}")
+            async for _, message in subscription:
+                try:
+                    yield StateChange.from_dict(json.loads(message))
+                except Exception as e:
+                    logger.error(f"Failed to parse event: {e}")
         finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.close()
+            hub.unsubscribe(subscription)
     
     async def get_recent_events(self, limit: int = 100, lab_id: str = None) -> List[StateChange]:
         """Get recent events"""
         await self.connect()
         
-        event_list_key = "registry:events:recent"
-        events_json = await self._redis.lrange(event_list_key, 0, limit - 1)
+        entries = await self._redis.xrevrange(self.EVENT_STREAM, count=limit)
         
         events = []
-        for ej in events_json:
+        for _, fields in entries:
+            if lab_id is not None and fields.get("lab_id") != lab_id:
+                continue
             try:
-                event = StateChange.from_dict(json.loads(ej))
-                if lab_id is None or event.lab_id == lab_id:
-                    events.append(event)
+                events.append(StateChange.from_dict(json.loads(fields["event"])))
             except Exception:
                 continue
         
@@ -397,7 +583,7 @@ class LabRegistry:
         await self._redis.sadd("registry:drift:active", drift.resource_id)
         
         if drift.lab_id:
-            await self._redis.sadd(f"registry:drift:lab:{drift.lab_id}", drift.resource_id)
+            await self._update_lab_drift(drift.lab_id, "SADD", drift.resource_id)
         
         # Publish drift event
         await self.publish_event(StateChange(
@@ -423,7 +609,7 @@ class LabRegistry:
             # Move to resolved
             await self._redis.srem("registry:drift:active", resource_id)
             if drift.lab_id:
-                await self._redis.srem(f"registry:drift:lab:{drift.lab_id}", resource_id)
+                await self._update_lab_drift(drift.lab_id, "SREM", resource_id)
             
             await self._redis.delete(drift_key)
             
@@ -431,10 +617,19 @@ class LabRegistry:
             await self.publish_event(StateChange(
                 event_type=EventType.DRIFT_RESOLVED,
                 resource_id=resource_id,
-                resource_type=drift.resource_type,
+                resource_type=ResourceType(drift.resource_type),
                 lab_id=drift.lab_id,
             ))
     
+    async def _update_lab_drift(self, lab_id: str, command: str, resource_id: str) -> int:
+        """Change a lab's drift set and its summary count atomically"""
+        if self._drift_script is None:
+            self._drift_script = self._redis.register_script(UPDATE_DRIFT_SCRIPT)
+        return await self._drift_script(
+            keys=[f"registry:drift:lab:{lab_id}", self._summary_key(lab_id)],
+            args=[command, resource_id],
+        )
+    
     async def get_drifts(self, lab_id: str = None) -> List[Drift]:
         """Get all active drifts"""
         await self.connect()
@@ -518,7 +713,7 @@ class LabRegistry:
                 type_counts[rt.value] = count
         
         # Count labs
-        labs = await self.list_labs()
+        lab_count = await self._redis.zcard(self.LAB_INDEX)
         
         # Count active drifts
         drift_count = await self._redis.scard("registry:drift:active")
@@ -530,7 +725,7 @@ class LabRegistry:
             "connected": self._redis is not None,
             "resource_counts": type_counts,
             "total_resources": sum(type_counts.values()),
-            "lab_count": len(labs),
+            "lab_count": lab_count,
             "active_drifts": drift_count,
             "agents": len(agents),
             "agent_names": [a["name"] for a in agents],
@@ -556,5 +751,7 @@ async def init_registry() -> LabRegistry:
     """Initialize and connect the registry"""
     registry = get_registry()
     await registry.connect()
+    if not await registry._redis.exists(LabRegistry.LAB_INDEX):
+        await registry.rebuild_lab_summaries()
     return registry
 
@@ -0,0 +1,182 @@
+"""
+Event Hub module
+
+One reader follows the registry event stream and fans each event out to
+every in-process subscriber (WebSocket clients), filtering on the server.
+Redis connections and JSON encoding stay constant however many
+dashboards are open.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from glassdome.registry.core import LabRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+READ_BLOCK_MS = 5000
+READ_COUNT = 500
+SUBSCRIBER_QUEUE_SIZE = 1000
+RETRY_DELAY = 1.0
+
+
+class SubscriptionOverflow(Exception):
+    """A subscriber fell too far behind and was dropped; it should resume"""
+
+
+@dataclass
+class EventFilter:
+    """Server-side event filter; empty criteria match everything"""
+    lab_id: Optional[str] = None
+    resource_types: Optional[Set[str]] = None
+    event_types: Optional[Set[str]] = None
+    
+    def matches(self, fields: Dict[str, str]) -> bool:
+        if self.lab_id and fields.get("lab_id") != self.lab_id:
+            return False
+        if self.resource_types and fields.get("resource_type") not in self.resource_types:
+            return False
+        if self.event_types and fields.get("event_type") not in self.event_types:
+            return False
+        return True
+
+
+class Subscription:
+    """
+    Queue of (event_id, message) pairs for one subscriber.
+    
+    Messages are event dicts with an added "event_id", already encoded
+    as JSON text.
+    """
+    
+    def __init__(self, event_filter: EventFilter, maxsize: int = SUBSCRIBER_QUEUE_SIZE):
+        self.filter = event_filter
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> tuple:
+        # Overflow only happens on a full queue, so everything delivered
+        # before it is drained first
+        if self.overflowed and self.queue.empty():
+            raise SubscriptionOverflow()
+        return await self.queue.get()
+
+
+class EventHub:
+    """
+    Single reader of the registry event stream.
+    
+    The reader starts with the first subscriber and keeps its position
+    across Redis errors, so no event is skipped while it retries.
+    """
+    
+    def __init__(self, registry: LabRegistry = None):
+        self.registry = registry or get_registry()
+        self._subscribers: List[Subscription] = []
+        self._task: Optional[asyncio.Task] = None
+        self._last_id: Optional[str] = None
+        self._started = asyncio.Event()
+    
+    async def subscribe(self, event_filter: EventFilter = None) -> Subscription:
+        """Add a subscriber; it receives events published from now on"""
+        subscription = Subscription(event_filter or EventFilter())
+        self._subscribers.append(subscription)
+        
+        if self._task is None or self._task.done():
+            self._started.clear()
+            self._task = asyncio.create_task(self._read_loop())
+        await self._started.wait()
+        
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription):
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+    
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+    
+    async def replay(self, after_id: str, event_filter: EventFilter) -> List[tuple]:
+        """Stored events after after_id that match the filter, oldest first"""
+        entries = await self.registry.events_since(after_id)
+        return [
+            (event_id, self._encode(event_id, fields))
+            for event_id, fields in entries
+            if event_filter.matches(fields)
+        ]
+    
+    async def stop(self):
+        """Stop the reader"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+    
+    @staticmethod
+    def _encode(event_id: str, fields: Dict[str, str]) -> str:
+        return json.dumps({"event_id": event_id, **json.loads(fields["event"])})
+    
+    def _dispatch(self, event_id: str, fields: Dict[str, str]):
+        message = None
+        for subscription in list(self._subscribers):
+            if not subscription.filter.matches(fields):
+                continue
+            if message is None:
+                message = self._encode(event_id, fields)
+            try:
+                subscription.queue.put_nowait((event_id, message))
+            except asyncio.QueueFull:
+                logger.warning("Dropping slow event subscriber; it can resume from its last event")
+                subscription.overflowed = True
+                self.unsubscribe(subscription)
+    
+    async def _read_loop(self):
+        """Follow the stream until stopped"""
+        while True:
+            try:
+                if self._last_id is None:
+                    self._last_id = await self.registry.last_event_id()
+                self._started.set()
+                
+                entries = await self.registry.read_events(self._last_id, READ_BLOCK_MS, READ_COUNT)
+                for event_id, fields in entries:
+                    self._last_id = event_id
+                    try:
+                        self._dispatch(event_id, fields)
+                    except Exception as e:
+                        logger.error(f"Failed to dispatch event {event_id}: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Event stream read failed: {e}")
+                self._started.set()
+                await asyncio.sleep(RETRY_DELAY)
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_event_hub: Optional[EventHub] = None
+
+
+def get_event_hub() -> EventHub:
+    """Get or create the event hub singleton"""
+    global _event_hub
+    if _event_hub is None:
+        _event_hub = EventHub()
+    return _event_hub
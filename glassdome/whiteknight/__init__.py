@@ -6,7 +6,8 @@ Created: November 2025
 Copyright (c) 2025 Brett Turner. All rights reserved.
 """
 
-from .client import WhiteKnightClient, ValidationResult
+from .client import WhiteKnightClient, ValidationResult, get_whiteknight_client
+from .pool import WhiteKnightPool
 
-__all__ = ["WhiteKnightClient", "ValidationResult"]
+__all__ = ["WhiteKnightClient", "ValidationResult", "WhiteKnightPool", "get_whiteknight_client"]
 
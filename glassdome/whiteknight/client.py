@@ -9,12 +9,14 @@ Copyright (c) 2025 Brett Turner. All rights reserved.
 import asyncio
 import json
 import logging
-import subprocess
-from typing import Dict, Any, Optional, List
+import shutil
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+from .pool import DEFAULT_POOL_SIZE, WhiteKnightPool
+
 logger = logging.getLogger(__name__)
 
 # Path to WhiteKnight directory
@@ -57,31 +59,79 @@ class ValidationResult:
         )
 
 
+async def _run_command(cmd, timeout: float, shell: bool = False) -> Tuple[int, str, str]:
+    """
+    Run a command without blocking the event loop.
+    
+    Returns:
+        (returncode, stdout, stderr)
+    
+    Raises:
+        asyncio.TimeoutError: Command exceeded timeout (it is killed)
+    """
+    if shell:
+        process = await asyncio.create_subprocess_shell(
+            cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    else:
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+        raise
+    return (
+        process.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
 class WhiteKnightClient:
     """
     Client for running WhiteKnight validations.
     
-    Can run in two modes:
-    1. Docker mode - Runs WhiteKnight in a container (production)
-    2. Local mode - Runs validation scripts directly (development)
+    Can run in three modes:
+    1. Pooled mode - Warm, long-lived WhiteKnight containers take jobs over
+       stdin/stdout (production default, see pool.py)
+    2. Docker one-shot mode - `docker run --rm` per validation (pool_size=0)
+    3. Local mode - Runs validation tools directly (development)
+    
+    `agent_command` runs the pool against any agent process speaking the
+    --serve protocol instead of Docker (e.g. a local agent for testing).
     """
     
     CONTAINER_IMAGE = "whiteknight:latest"
     
-    def __init__(self, use_docker: bool = True):
+    # Concurrent validations in local/one-shot mode
+    LOCAL_CONCURRENCY = 4
+    
+    def __init__(
+        self,
+        use_docker: bool = True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        agent_command: Optional[List[str]] = None
+    ):
         self.use_docker = use_docker
+        self.pool_size = pool_size
+        self.agent_command = agent_command
         self._docker_available = None
+        self._image_ready = False
+        self._pool: Optional[WhiteKnightPool] = None
+        self._pool_lock = asyncio.Lock()
     
     async def is_docker_available(self) -> bool:
         """Check if Docker is available"""
         if self._docker_available is None:
             try:
-                result = subprocess.run(
-                    ["docker", "info"],
-                    capture_output=True,
-                    timeout=5
-                )
-                self._docker_available = result.returncode == 0
+                returncode, _, _ = await _run_command(["docker", "info"], timeout=5)
+                self._docker_available = returncode == 0
             except Exception:
                 self._docker_available = False
         return self._docker_available
@@ -89,13 +139,10 @@ class WhiteKnightClient:
     async def is_image_built(self) -> bool:
         """Check if WhiteKnight image exists"""
         try:
-            result = subprocess.run(
-                ["docker", "images", "-q", self.CONTAINER_IMAGE],
-                capture_output=True,
-                text=True,
-                timeout=10
+            _, stdout, _ = await _run_command(
+                ["docker", "images", "-q", self.CONTAINER_IMAGE], timeout=10
             )
-            return bool(result.stdout.strip())
+            return bool(stdout.strip())
         except Exception:
             return False
     
@@ -104,26 +151,53 @@ class WhiteKnightClient:
         logger.info("Building WhiteKnight Docker image...")
         
         try:
-            result = subprocess.run(
+            returncode, _, stderr = await _run_command(
                 ["docker", "build", "-t", self.CONTAINER_IMAGE, str(WHITEKNIGHT_DIR)],
-                capture_output=True,
-                text=True,
                 timeout=600  # 10 minutes for build
             )
             
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.info("WhiteKnight image built successfully")
                 return True
             else:
-                logger.error(f"Failed to build WhiteKnight image: {result.stderr}")
+                logger.error(f"Failed to build WhiteKnight image: {stderr}")
                 return False
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.error("WhiteKnight image build timed out")
             return False
         except Exception as e:
             logger.error(f"Error building WhiteKnight image: {e}")
             return False
     
+    async def _ensure_image(self) -> bool:
+        """Build the image if missing (checked once per client)"""
+        if not self._image_ready:
+            self._image_ready = await self.is_image_built() or await self.build_image()
+        return self._image_ready
+    
+    def _use_pool(self) -> bool:
+        return bool(self.agent_command) or self.pool_size > 0
+    
+    async def _get_pool(self) -> WhiteKnightPool:
+        """Create (and warm) the worker pool on first use"""
+        async with self._pool_lock:
+            if self._pool is None:
+                command = self.agent_command or [
+                    "docker", "run", "--rm", "-i",
+                    "--network", "host",  # Use host network to reach VMs
+                    self.CONTAINER_IMAGE,
+                    "--serve"
+                ]
+                self._pool = WhiteKnightPool(command, size=max(1, self.pool_size))
+                await self._pool.warm()
+            return self._pool
+    
+    async def close(self):
+        """Stop pooled workers"""
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
+    
     async def validate(
         self,
         target_ip: str,
@@ -142,32 +216,61 @@ class WhiteKnightClient:
                 - username/password: For credential tests
                 - verify_command: Optional custom command
             timeout: Timeout in seconds
-            
+        
         Returns:
             ValidationResult with status and evidence
         """
+        if self.agent_command:
+            return await self._validate_pooled(target_ip, exploit_config, timeout)
         if self.use_docker and await self.is_docker_available():
+            if not await self._ensure_image():
+                return ValidationResult(
+                    status=ValidationStatus.ERROR,
+                    exploit_type=exploit_config.get("exploit_type", "UNKNOWN"),
+                    target_ip=target_ip,
+                    evidence="Failed to build WhiteKnight image"
+                )
+            if self.pool_size > 0:
+                return await self._validate_pooled(target_ip, exploit_config, timeout)
             return await self._validate_docker(target_ip, exploit_config, timeout)
         else:
             return await self._validate_local(target_ip, exploit_config, timeout)
     
-    async def _validate_docker(
+    async def _validate_pooled(
         self,
         target_ip: str,
         exploit_config: Dict[str, Any],
         timeout: int
     ) -> ValidationResult:
-        """Run validation in Docker container"""
+        """Run validation on a warm pooled agent"""
+        logger.info(f"Running pooled WhiteKnight validation for {target_ip}")
         
-        # Ensure image is built
-        if not await self.is_image_built():
-            if not await self.build_image():
-                return ValidationResult(
-                    status=ValidationStatus.ERROR,
-                    exploit_type=exploit_config.get("exploit_type", "UNKNOWN"),
-                    target_ip=target_ip,
-                    evidence="Failed to build WhiteKnight image"
-                )
+        try:
+            pool = await self._get_pool()
+            result = await pool.run(target_ip, exploit_config, timeout)
+            return ValidationResult.from_dict(result)
+        except asyncio.TimeoutError:
+            return ValidationResult(
+                status=ValidationStatus.TIMEOUT,
+                exploit_type=exploit_config.get("exploit_type", "UNKNOWN"),
+                target_ip=target_ip,
+                evidence=f"Validation timed out after {timeout}s"
+            )
+        except Exception as e:
+            return ValidationResult(
+                status=ValidationStatus.ERROR,
+                exploit_type=exploit_config.get("exploit_type", "UNKNOWN"),
+                target_ip=target_ip,
+                evidence=str(e)
+            )
+    
+    async def _validate_docker(
+        self,
+        target_ip: str,
+        exploit_config: Dict[str, Any],
+        timeout: int
+    ) -> ValidationResult:
+        """Run validation in a one-shot Docker container"""
         
         # Build docker command
         config_json = json.dumps(exploit_config)
@@ -184,27 +287,22 @@ class WhiteKnightClient:
         logger.info(f"Running WhiteKnight validation for {target_ip}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            returncode, stdout, stderr = await _run_command(cmd, timeout=timeout)
             
             # Parse JSON output
             try:
-                output = json.loads(result.stdout)
+                output = json.loads(stdout)
                 return ValidationResult.from_dict(output)
             except json.JSONDecodeError:
                 # Couldn't parse output
                 return ValidationResult(
-                    status=ValidationStatus.SUCCESS if result.returncode == 0 else ValidationStatus.FAILED,
+                    status=ValidationStatus.SUCCESS if returncode == 0 else ValidationStatus.FAILED,
                     exploit_type=exploit_config.get("exploit_type", "UNKNOWN"),
                     target_ip=target_ip,
-                    evidence=result.stdout[:1000] if result.stdout else result.stderr[:1000]
+                    evidence=stdout[:1000] if stdout else stderr[:1000]
                 )
-                
-        except subprocess.TimeoutExpired:
+        
+        except asyncio.TimeoutError:
             return ValidationResult(
                 status=ValidationStatus.TIMEOUT,
                 exploit_type=exploit_config.get("exploit_type", "UNKNOWN"),
@@ -255,9 +353,7 @@ class WhiteKnightClient:
         password = config.get("password", "password123")
         
         # Check if sshpass is available
-        try:
-            subprocess.run(["which", "sshpass"], capture_output=True, check=True)
-        except subprocess.CalledProcessError:
+        if not shutil.which("sshpass"):
             return ValidationResult(
                 status=ValidationStatus.ERROR,
                 exploit_type="CREDENTIAL",
@@ -268,11 +364,9 @@ class WhiteKnightClient:
         cmd = f"sshpass -p '{password}' ssh -o StrictHostKeyChecking=no -o ConnectTimeout=10 {username}@{target_ip} 'echo SUCCESS'"
         
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=min(30, timeout)
-            )
+            returncode, stdout, _ = await _run_command(cmd, timeout=min(30, timeout), shell=True)
             
-            success = "SUCCESS" in result.stdout
+            success = "SUCCESS" in stdout
             return ValidationResult(
                 status=ValidationStatus.SUCCESS if success else ValidationStatus.FAILED,
                 exploit_type="CREDENTIAL",
@@ -280,7 +374,7 @@ class WhiteKnightClient:
                 evidence=f"SSH {'succeeded' if success else 'failed'} with {username}:{password}",
                 details={"username": username, "method": "sshpass"}
             )
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return ValidationResult(
                 status=ValidationStatus.TIMEOUT,
                 exploit_type="CREDENTIAL",
@@ -290,9 +384,7 @@ class WhiteKnightClient:
     
     async def _local_smb_check(self, target_ip: str, timeout: int) -> ValidationResult:
         """Local SMB check"""
-        try:
-            subprocess.run(["which", "smbclient"], capture_output=True, check=True)
-        except subprocess.CalledProcessError:
+        if not shutil.which("smbclient"):
             return ValidationResult(
                 status=ValidationStatus.ERROR,
                 exploit_type="NETWORK",
@@ -303,18 +395,16 @@ class WhiteKnightClient:
         cmd = f"smbclient -L //{target_ip} -N 2>&1"
         
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=min(30, timeout)
-            )
+            returncode, stdout, _ = await _run_command(cmd, timeout=min(30, timeout), shell=True)
             
-            has_shares = "Disk" in result.stdout or "Sharename" in result.stdout
+            has_shares = "Disk" in stdout or "Sharename" in stdout
             return ValidationResult(
                 status=ValidationStatus.SUCCESS if has_shares else ValidationStatus.FAILED,
                 exploit_type="NETWORK",
                 target_ip=target_ip,
-                evidence=result.stdout[:500]
+                evidence=stdout[:500]
             )
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return ValidationResult(
                 status=ValidationStatus.TIMEOUT,
                 exploit_type="NETWORK",
@@ -334,11 +424,9 @@ class WhiteKnightClient:
         cmd = f"curl -s --connect-timeout 10 -o /dev/null -w '%{{http_code}}' http://{target_ip}:{port}/"
         
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=min(20, timeout)
-            )
+            returncode, stdout, _ = await _run_command(cmd, timeout=min(20, timeout), shell=True)
             
-            status_code = result.stdout.strip()
+            status_code = stdout.strip()
             success = status_code.startswith("2") or status_code.startswith("3")
             
             return ValidationResult(
@@ -348,7 +436,7 @@ class WhiteKnightClient:
                 evidence=f"HTTP status: {status_code}",
                 details={"port": port, "status_code": status_code}
             )
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return ValidationResult(
                 status=ValidationStatus.TIMEOUT,
                 exploit_type="WEB",
@@ -361,17 +449,15 @@ class WhiteKnightClient:
         cmd = f"ping -c 1 -W 5 {target_ip}"
         
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=min(10, timeout)
-            )
+            returncode, stdout, _ = await _run_command(cmd, timeout=min(10, timeout), shell=True)
             
             return ValidationResult(
-                status=ValidationStatus.SUCCESS if result.returncode == 0 else ValidationStatus.FAILED,
+                status=ValidationStatus.SUCCESS if returncode == 0 else ValidationStatus.FAILED,
                 exploit_type="UNKNOWN",
                 target_ip=target_ip,
-                evidence="Target reachable" if result.returncode == 0 else "Target unreachable"
+                evidence="Target reachable" if returncode == 0 else "Target unreachable"
             )
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return ValidationResult(
                 status=ValidationStatus.TIMEOUT,
                 exploit_type="UNKNOWN",
@@ -388,20 +474,42 @@ class WhiteKnightClient:
         """
         Validate multiple exploits on a target.
         
+        Validations run concurrently, up to the pool size (or
+        LOCAL_CONCURRENCY without a pool).
+        
         Returns dict mapping exploit name/id to ValidationResult
         """
-        results = {}
+        concurrency = self.pool_size if self._use_pool() else self.LOCAL_CONCURRENCY
+        semaphore = asyncio.Semaphore(max(1, concurrency))
         
-        for exploit in exploits:
-            exploit_id = exploit.get("id") or exploit.get("name", "unknown")
-            result = await self.validate(target_ip, exploit, timeout_per_exploit)
-            results[str(exploit_id)] = result
+        async def run_one(exploit: Dict[str, Any]) -> ValidationResult:
+            async with semaphore:
+                result = await self.validate(target_ip, exploit, timeout_per_exploit)
             
             # Log progress
             status_icon = "✅" if result.status == ValidationStatus.SUCCESS else "❌"
+            exploit_id = exploit.get("id") or exploit.get("name", "unknown")
             logger.info(f"{status_icon} {exploit.get('name', exploit_id)}: {result.status.value}")
+            return result
+        
+        validated = await asyncio.gather(*(run_one(exploit) for exploit in exploits))
         
-        return results
+        return {
+            str(exploit.get("id") or exploit.get("name", "unknown")): result
+            for exploit, result in zip(exploits, validated)
+        }
+
+
+# Shared client (keeps one warm pool per process)
+_client: Optional[WhiteKnightClient] = None
+
+
+def get_whiteknight_client() -> WhiteKnightClient:
+    """Get the shared WhiteKnight client"""
+    global _client
+    if _client is None:
+        _client = WhiteKnightClient(use_docker=True)
+    return _client
 
 
 # Convenience function
@@ -411,6 +519,9 @@ async def validate_exploit(
     use_docker: bool = True
 ) -> ValidationResult:
     """Quick validation helper"""
-    client = WhiteKnightClient(use_docker=use_docker)
+    if use_docker:
+        # Shared client: reuses its warm pool instead of starting one per call
+        return await get_whiteknight_client().validate(target_ip, exploit_config)
+    client = WhiteKnightClient(use_docker=False, pool_size=0)
     return await client.validate(target_ip, exploit_config)
 
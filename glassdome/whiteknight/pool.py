@@ -0,0 +1,221 @@
+"""
+WhiteKnight worker pool
+
+Keeps a set of long-lived WhiteKnight agents (`main.py --serve`, normally
+`docker run -i ... whiteknight --serve`) warm and sends them validation
+jobs as JSON lines over stdin/stdout, so a validation costs one round trip
+instead of a container start.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Workers kept warm by default
+DEFAULT_POOL_SIZE = 4
+
+# Seconds to wait for a worker's {"ready": true} line
+WORKER_START_TIMEOUT = 60
+
+# Max bytes of one protocol line (results carry truncated evidence)
+MAX_LINE_BYTES = 1024 * 1024
+
+
+class WorkerError(Exception):
+    """A pooled worker died or answered with an error."""
+
+
+class AgentWorker:
+    """One long-lived agent process, handling one job at a time."""
+    
+    _ids = itertools.count(1)
+    
+    def __init__(self, command: List[str]):
+        self.command = command
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.jobs_completed = 0
+    
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+    
+    async def start(self, timeout: float = WORKER_START_TIMEOUT):
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=MAX_LINE_BYTES,
+        )
+        try:
+            while True:
+                message = await asyncio.wait_for(self._read_message(), timeout)
+                if message.get("ready"):
+                    return
+        except Exception:
+            await self.stop()
+            raise
+    
+    async def _read_message(self) -> Dict[str, Any]:
+        """Next JSON object from stdout, skipping any non-protocol output."""
+        while True:
+            line = await self.process.stdout.readline()
+            if not line:
+                await self.process.wait()
+                raise WorkerError(f"Worker exited (code {self.process.returncode})")
+            line = line.strip()
+            if not line.startswith(b"{"):
+                continue
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                continue
+    
+    async def run(self, target_ip: str, config: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one job and wait for its result dict."""
+        job_id = str(next(self._ids))
+        job = {"id": job_id, "target": target_ip, "config": config}
+        self.process.stdin.write((json.dumps(job) + "\n").encode())
+        await self.process.stdin.drain()
+        
+        async def wait_for_reply():
+            while True:
+                message = await self._read_message()
+                if message.get("id") == job_id:
+                    return message
+        
+        message = await asyncio.wait_for(wait_for_reply(), timeout)
+        if "error" in message:
+            raise WorkerError(message["error"])
+        self.jobs_completed += 1
+        return message["result"]
+    
+    async def stop(self, kill: bool = False):
+        """Close stdin and let the agent exit, or kill it right away."""
+        if not self.process:
+            return
+        if self.process.returncode is None:
+            if not kill:
+                self.process.stdin.close()
+                try:
+                    await asyncio.wait_for(self.process.wait(), 5)
+                except asyncio.TimeoutError:
+                    kill = True
+            if kill:
+                try:
+                    self.process.kill()
+                except ProcessLookupError:
+                    pass
+                await self.process.wait()
+        self.process = None
+
+
+class WhiteKnightPool:
+    """
+    Pool of warm WhiteKnight agents.
+    
+    Up to `size` jobs run concurrently, one per worker. A worker that times
+    out or dies is discarded and replaced on the next acquire.
+    """
+    
+    def __init__(self, command: List[str], size: int = DEFAULT_POOL_SIZE):
+        self.command = command
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(size)
+        self._workers: List[AgentWorker] = []
+        self._closed = False
+        
+        # Stats
+        self.jobs = 0
+        self.workers_started = 0
+        self.workers_replaced = 0
+    
+    async def warm(self, count: Optional[int] = None):
+        """Start workers ahead of time (default: fill the pool)."""
+        count = min(count or self.size, self.size - len(self._workers))
+        workers = await asyncio.gather(
+            *(self._start_worker() for _ in range(count)),
+            return_exceptions=True,
+        )
+        for worker in workers:
+            if isinstance(worker, AgentWorker):
+                self._idle.put_nowait(worker)
+            else:
+                logger.warning(f"WhiteKnight worker failed to start: {worker}")
+    
+    async def _start_worker(self) -> AgentWorker:
+        worker = AgentWorker(self.command)
+        await worker.start()
+        self._workers.append(worker)
+        self.workers_started += 1
+        return worker
+    
+    async def _acquire(self) -> AgentWorker:
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker.alive:
+                return worker
+            self._discard(worker)
+        return await self._start_worker()
+    
+    def _discard(self, worker: AgentWorker):
+        if worker in self._workers:
+            self._workers.remove(worker)
+            self.workers_replaced += 1
+    
+    async def run(self, target_ip: str, config: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Run a validation job on a pooled worker.
+        
+        Raises:
+            asyncio.TimeoutError: Job exceeded `timeout` (worker is replaced)
+            WorkerError: Worker died or reported an error
+        """
+        if self._closed:
+            raise WorkerError("WhiteKnight pool is closed")
+        
+        async with self._slots:
+            worker = await self._acquire()
+            try:
+                result = await worker.run(target_ip, config, timeout)
+            except WorkerError:
+                # Job-level error from a healthy worker: keep it
+                if worker.alive:
+                    self._idle.put_nowait(worker)
+                else:
+                    self._discard(worker)
+                    await worker.stop()
+                raise
+            except BaseException:
+                # State of an interrupted worker is unknown; don't reuse it
+                self._discard(worker)
+                await worker.stop(kill=True)
+                raise
+            self.jobs += 1
+            self._idle.put_nowait(worker)
+            return result
+    
+    async def close(self):
+        """Stop all workers."""
+        self._closed = True
+        workers, self._workers = self._workers, []
+        await asyncio.gather(*(w.stop() for w in workers), return_exceptions=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "workers": len(self._workers),
+            "idle": self._idle.qsize(),
+            "jobs": self.jobs,
+            "workers_started": self.workers_started,
+            "workers_replaced": self.workers_replaced,
+        }
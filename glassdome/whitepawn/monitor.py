@@ -15,7 +15,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from glassdome.core.database import AsyncSessionLocal
+from glassdome.core.database import BackgroundSessionLocal
+from glassdome.core.db_metrics import set_db_scope
 from glassdome.whitepawn.models import (
     WhitePawnDeployment,
     NetworkAlert,
@@ -125,6 +126,7 @@ class WhitePawnMonitor:
     
     async def _monitor_loop(self):
         """Main monitoring loop"""
+        set_db_scope("whitepawn.monitor")
         # Load initial targets
         await self._refresh_targets()
         
@@ -171,7 +173,7 @@ class WhitePawnMonitor:
     
     async def _refresh_targets(self):
         """Refresh the list of targets to monitor"""
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             # Get deployment
             result = await session.execute(
                 select(WhitePawnDeployment).where(
@@ -429,7 +431,7 @@ class WhitePawnMonitor:
         if not self._last_matrix:
             return
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             # Get lab_id
             result = await session.execute(
                 select(WhitePawnDeployment).where(
@@ -469,7 +471,7 @@ class WhitePawnMonitor:
     
     async def _update_heartbeat(self):
         """Update deployment heartbeat"""
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             result = await session.execute(
                 select(WhitePawnDeployment).where(
                     WhitePawnDeployment.id == self.deployment_id
@@ -494,7 +496,7 @@ class WhitePawnMonitor:
         details: Optional[Dict] = None
     ):
         """Log a monitoring event"""
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             event = MonitoringEvent(
                 deployment_id=self.deployment_id,
                 event_type=event_type,
@@ -534,7 +536,7 @@ class WhitePawnMonitor:
         self._last_alerts[cooldown_key] = datetime.now(timezone.utc)
         self._alert_count += 1
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             alert = NetworkAlert(
                 deployment_id=self.deployment_id,
                 alert_type=alert_type.value,
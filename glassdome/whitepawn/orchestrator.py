@@ -13,7 +13,8 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from glassdome.core.database import AsyncSessionLocal
+from glassdome.core.database import AsyncSessionLocal, BackgroundSessionLocal
+from glassdome.core.db_metrics import set_db_scope
 from glassdome.whitepawn.models import (
     WhitePawnDeployment,
     NetworkAlert,
@@ -79,6 +80,7 @@ class WhitePawnOrchestrator:
     
     async def _guardian_loop(self):
         """Guardian loop that monitors monitor health"""
+        set_db_scope("whitepawn.guardian")
         while self._running:
             try:
                 await self._check_monitor_health()
@@ -91,7 +93,7 @@ class WhitePawnOrchestrator:
     
     async def _check_monitor_health(self):
         """Check health of all monitors, restart if needed"""
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             # Get all active deployments
             result = await session.execute(
                 select(WhitePawnDeployment).where(
@@ -118,7 +120,7 @@ class WhitePawnOrchestrator:
     
     async def _restore_monitors(self):
         """Restore monitors for existing active deployments"""
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             result = await session.execute(
                 select(WhitePawnDeployment).where(
                     WhitePawnDeployment.status == "active"
@@ -145,7 +147,7 @@ class WhitePawnOrchestrator:
         await monitor.start()
         
         # Update status
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             result = await session.execute(
                 select(WhitePawnDeployment).where(
                     WhitePawnDeployment.id == deployment.id
@@ -163,7 +165,7 @@ class WhitePawnOrchestrator:
             await monitor.stop()
             del self._monitors[deployment_id]
         
-        async with AsyncSessionLocal() as session:
+        async with BackgroundSessionLocal() as session:
             result = await session.execute(
                 select(WhitePawnDeployment).where(
                     WhitePawnDeployment.id == deployment_id
@@ -176,6 +178,8 @@ class WhitePawnOrchestrator:
     # =========================================================================
     # Public API
     # =========================================================================
+    # Called from request handlers: these use the API pool (AsyncSessionLocal),
+    # the guardian and monitor restarts above use the background pool.
     
     async def deploy_for_lab(
         self,
@@ -46,11 +46,11 @@ def _deploy_vm_sync(
 
 async def _allocate_network_async(lab_id: str) -> Dict[str, Any]:
     """Async network allocation logic"""
-    from glassdome.core.database import AsyncSessionLocal
+    from glassdome.core.database import BackgroundSessionLocal
     from glassdome.networking.models import NetworkDefinition
     from sqlalchemy import select, func
     
-    async with AsyncSessionLocal() as session:
+    async with BackgroundSessionLocal() as session:
         # Find next available VLAN in range 100-170
         result = await session.execute(
             select(func.max(NetworkDefinition.vlan_id)).where(
@@ -209,7 +209,7 @@ async def _deploy_vm_async(
     from glassdome.core.config import Settings
     from glassdome.platforms.proxmox_client import ProxmoxClient
     from glassdome.reaper.hot_spare import get_hot_spare_pool
-    from glassdome.core.database import AsyncSessionLocal
+    from glassdome.core.database import BackgroundSessionLocal
     
     settings = Settings()
     element_id = vm_node.get("elementId", "ubuntu")
@@ -230,7 +230,7 @@ async def _deploy_vm_async(
     os_type = OS_TYPE_MAPPING.get(element_id, "ubuntu")
     vm_name = f"lab-{lab_id[:8]}-{element_id}-{node_id[-4:]}"
     
-    async with AsyncSessionLocal() as session:
+    async with BackgroundSessionLocal() as session:
         # Try hot spare pool first
         pool = get_hot_spare_pool()
         acquired_spare = await pool.acquire_spare(session, os_type=os_type, mission_id=lab_id)
@@ -303,14 +303,14 @@ def allocate_lab_network(self, lab_id: str) -> Dict[str, Any]:
 
 async def _allocate_network_async(lab_id: str) -> Dict[str, Any]:
     """Async VLAN allocation"""
-    from glassdome.core.database import AsyncSessionLocal
+    from glassdome.core.database import BackgroundSessionLocal
     from glassdome.networking.models import NetworkDefinition
     from sqlalchemy import select
     
     VLAN_POOL_START = 100
     VLAN_POOL_END = 170
     
-    async with AsyncSessionLocal() as session:
+    async with BackgroundSessionLocal() as session:
         # Get used VLANs
         result = await session.execute(
             select(NetworkDefinition.vlan_id).where(NetworkDefinition.vlan_id.isnot(None))
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+AWS Lab Network Benchmark
+
+Runs AWSNetworkHandler's lab network setup and teardown against an
+in-memory EC2 stub, once with the steps one after another (the old
+behaviour) and once as a dependency graph, then re-deploys the same lab
+to show resource reuse.
+
+Every stub API call blocks for --latency-ms and every waiter for
+--waiter-s, so the numbers are modelled wall-clock time, not measurements
+of AWS; adjust both to what you see in CloudTrail.
+
+Usage:
+    python3 scripts/benchmark_aws_network.py [--latency-ms 150] [--waiter-s 1]
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import argparse
+import asyncio
+import itertools
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add glassdome to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from botocore.exceptions import ClientError
+
+from glassdome.networking.address_allocator import LabNetworkAllocation, SubnetAllocation, SubnetType
+from glassdome.networking.aws_handler import AWSNetworkHandler
+
+LAB_ID = "bench-lab"
+
+
+class StubEC2:
+    """Enough of the EC2 API for lab network setup, with modelled latency"""
+    
+    def __init__(self, latency: float, waiter_seconds: float):
+        self.latency = latency
+        self.waiter_seconds = waiter_seconds
+        self.calls = 0
+        self.created = 0
+        self.resources = {}  # kind -> list of dicts
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def _api(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+    
+    def _add(self, kind, prefix, **fields):
+        with self._lock:
+            self.created += 1
+            item = {f"{prefix}Id" if prefix else "Id": f"{kind}-{next(self._ids)}", **fields}
+            self.resources.setdefault(kind, []).append(item)
+            return item
+    
+    def _tags(self, TagSpecifications=None, **_):
+        return TagSpecifications[0]['Tags'] if TagSpecifications else []
+    
+    def _describe(self, kind, key, Filters=None, **_):
+        self._api()
+        
+        def matches(item, f):
+            name, values = f['Name'], f['Values']
+            if name.startswith('tag:'):
+                return any(t['Key'] == name[4:] and t['Value'] in values for t in item.get('Tags', []))
+            field = {
+                'vpc-id': 'VpcId', 'cidr': 'CidrBlock', 'cidr-block': 'CidrBlock',
+                'group-name': 'GroupName', 'attachment.vpc-id': 'AttachedVpcId',
+            }[name]
+            return item.get(field) in values
+        
+        return {key: [i for i in self.resources.get(kind, []) if all(matches(i, f) for f in Filters or [])]}
+    
+    def get_waiter(self, name):
+        return SimpleNamespace(wait=lambda **kw: time.sleep(self.waiter_seconds))
+    
+    def describe_vpcs(self, **kw):
+        return self._describe('vpc', 'Vpcs', **kw)
+    
+    def describe_subnets(self, **kw):
+        return self._describe('subnet', 'Subnets', **kw)
+    
+    def describe_internet_gateways(self, **kw):
+        return self._describe('igw', 'InternetGateways', **kw)
+    
+    def describe_route_tables(self, **kw):
+        return self._describe('rtb', 'RouteTables', **kw)
+    
+    def describe_security_groups(self, **kw):
+        return self._describe('sg', 'SecurityGroups', **kw)
+    
+    def create_vpc(self, CidrBlock, **kw):
+        self._api()
+        return {'Vpc': self._add('vpc', 'Vpc', CidrBlock=CidrBlock, Tags=self._tags(**kw))}
+    
+    def create_internet_gateway(self, **kw):
+        self._api()
+        return {'InternetGateway': self._add('igw', 'InternetGateway', Tags=self._tags(**kw))}
+    
+    def attach_internet_gateway(self, InternetGatewayId, VpcId):
+        self._api()
+        for igw in self.resources['igw']:
+            if igw['InternetGatewayId'] == InternetGatewayId:
+                igw['AttachedVpcId'] = VpcId
+    
+    def create_subnet(self, VpcId, CidrBlock, **kw):
+        self._api()
+        return {'Subnet': self._add('subnet', 'Subnet', VpcId=VpcId, CidrBlock=CidrBlock, Tags=self._tags(**kw))}
+    
+    def create_route_table(self, VpcId, **kw):
+        self._api()
+        return {'RouteTable': self._add('rtb', 'RouteTable', VpcId=VpcId, Tags=self._tags(**kw))}
+    
+    def create_security_group(self, GroupName, Description, VpcId, **kw):
+        self._api()
+        sg = self._add('sg', 'Group', GroupName=GroupName, VpcId=VpcId, Tags=self._tags(**kw), Rules=[])
+        return {'GroupId': sg['GroupId']}
+    
+    def authorize_security_group_ingress(self, GroupId, IpPermissions):
+        self._api()
+        sg = next(sg for sg in self.resources['sg'] if sg['GroupId'] == GroupId)
+        for permission in IpPermissions:
+            if permission in sg['Rules']:
+                raise ClientError({'Error': {'Code': 'InvalidPermission.Duplicate'}}, 'AuthorizeSecurityGroupIngress')
+            sg['Rules'].append(permission)
+    
+    def _noop(self, *args, **kwargs):
+        self._api()
+        return {}
+    
+    modify_vpc_attribute = modify_subnet_attribute = create_route = associate_route_table = _noop
+    delete_subnet = delete_security_group = delete_route_table = delete_vpc = _noop
+    detach_internet_gateway = delete_internet_gateway = revoke_security_group_ingress = _noop
+
+
+def make_allocation() -> LabNetworkAllocation:
+    subnets = {
+        subnet_type: SubnetAllocation(
+            subnet_type=subnet_type,
+            cidr=f"10.100.{index}.0/24",
+            gateway=f"10.100.{index}.1",
+            dhcp_start=f"10.100.{index}.100",
+            dhcp_end=f"10.100.{index}.200",
+            is_public=subnet_type == SubnetType.PUBLIC
+        )
+        for index, subnet_type in enumerate(
+            [SubnetType.PUBLIC, SubnetType.ATTACK, SubnetType.DMZ, SubnetType.INTERNAL], start=1
+        )
+    }
+    return LabNetworkAllocation(lab_id=LAB_ID, lab_number=1, vpc_cidr="10.100.0.0/16", subnets=subnets)
+
+
+async def run_mode(parallel: bool, latency: float, waiter_seconds: float) -> list:
+    ec2 = StubEC2(latency, waiter_seconds)
+    handler = AWSNetworkHandler(region="us-east-1", parallel=parallel)
+    handler._ec2_client = ec2
+    allocation = make_allocation()
+    rows = []
+    
+    for run in ("setup", "re-deploy"):
+        calls, created = ec2.calls, ec2.created
+        infra = await handler.create_lab_infrastructure(LAB_ID, allocation)
+        rows.append((run, infra.setup_seconds, ec2.calls - calls, ec2.created - created))
+    
+    calls = ec2.calls
+    started = time.perf_counter()
+    await handler.delete_lab_infrastructure(LAB_ID)
+    rows.append(("teardown", time.perf_counter() - started, ec2.calls - calls, 0))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AWS lab network setup")
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--waiter-s", type=float, default=1)
+    args = parser.parse_args()
+    
+    print(f"\nLab network with 4 subnets and 3 security groups "
+          f"(API latency {args.latency_ms:g} ms, waiter {args.waiter_s:g} s, modelled)")
+    print(f"{'mode':<12} {'phase':<10} {'seconds':>8} {'calls':>6} {'created':>8}")
+    for mode, parallel in (("sequential", False), ("graph", True)):
+        for phase, seconds, calls, created in asyncio.run(
+            run_mode(parallel, args.latency_ms / 1000, args.waiter_s)
+        ):
+            print(f"{mode:<12} {phase:<10} {seconds:>8.2f} {calls:>6} {created:>8}")
+
+
+if __name__ == "__main__":
+    main()
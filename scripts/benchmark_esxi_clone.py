@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+ESXi Clone Benchmark
+
+Runs ESXiClient's standalone clone paths (full VMDK copy vs linked clone)
+against a stubbed vSphere API. The stub models the host: a disk copy
+takes template_size / copy throughput, creating a VM or snapshot takes a
+fixed time, and the datastore grows by the size of every file created.
+
+The numbers are therefore modelled host time and datastore growth (plus
+the number of API calls the client made), not measurements of a real
+host; adjust --copy-mbps and --template-gb to match your hardware.
+
+Usage:
+    python3 scripts/benchmark_esxi_clone.py [--clones 10] [--template-gb 20] [--copy-mbps 250]
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add glassdome to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pyVmomi import vim
+
+from glassdome.platforms.esxi_client import ESXiClient
+
+DATASTORE = "datastore1"
+
+# Modelled host costs
+CREATE_VM_SECONDS = 1.5
+SNAPSHOT_SECONDS = 2.0
+DELTA_DISK_MB = 16  # Initial size of an empty sparse delta disk
+
+
+class StubHost:
+    """Minimal standalone ESXi host: VMs, disks and a modelled clock."""
+    
+    def __init__(self, template_gb: float, copy_mbps: float):
+        self.template_mb = template_gb * 1024
+        self.copy_mbps = copy_mbps
+        self.seconds = 0.0
+        self.datastore_mb = self.template_mb
+        self.calls = 0
+        self.vms = {}
+        self.template = self._make_template()
+        self.vms[self.template.name] = self.template
+    
+    def task(self, seconds: float, result=None):
+        self.calls += 1
+        self.seconds += seconds
+        return SimpleNamespace(info=SimpleNamespace(state="success", result=result))
+    
+    def _make_template(self):
+        controller = vim.vm.device.ParaVirtualSCSIController(key=1000, busNumber=0)
+        disk = vim.vm.device.VirtualDisk(
+            key=2000,
+            controllerKey=1000,
+            unitNumber=0,
+            capacityInKB=int(self.template_mb * 1024),
+            backing=vim.vm.device.VirtualDisk.FlatVer2BackingInfo(
+                fileName=f"[{DATASTORE}] ubuntu-template/ubuntu-template.vmdk",
+                diskMode="persistent"
+            )
+        )
+        config = SimpleNamespace(
+            guestId="ubuntu64Guest",
+            firmware="bios",
+            hardware=SimpleNamespace(memoryMB=2048, numCPU=2, device=[controller, disk])
+        )
+        template = SimpleNamespace(
+            name="ubuntu-template",
+            _moId="vm-1",
+            config=config,
+            snapshot=None,
+            runtime=SimpleNamespace(powerState="poweredOff")
+        )
+        
+        def create_snapshot(name, description, memory, quiesce):
+            snapshot = SimpleNamespace(config=config)
+            template.snapshot = SimpleNamespace(rootSnapshotList=[
+                SimpleNamespace(name=name, snapshot=snapshot, childSnapshotList=[])
+            ])
+            self.datastore_mb += DELTA_DISK_MB  # Template's own delta
+            return self.task(SNAPSHOT_SECONDS, snapshot)
+        
+        template.CreateSnapshot_Task = create_snapshot
+        return template
+    
+    def copy_virtual_disk(self, **kwargs):
+        self.datastore_mb += self.template_mb
+        return self.task(self.template_mb / self.copy_mbps)
+    
+    def create_vm(self, config, pool):
+        disk = next(
+            change.device for change in config.deviceChange
+            if isinstance(change.device, vim.vm.device.VirtualDisk)
+        )
+        if disk.backing.parent is not None:
+            self.datastore_mb += DELTA_DISK_MB
+        vm = SimpleNamespace(name=config.name)
+        self.vms[config.name] = vm
+        return self.task(CREATE_VM_SECONDS, vm)
+
+
+def make_client(host: StubHost) -> ESXiClient:
+    """ESXiClient wired to the stub instead of a SOAP connection"""
+    client = ESXiClient.__new__(ESXiClient)
+    client.host = "stub-esxi"
+    client.default_datastore_name = DATASTORE
+    client.default_network_name = "VM Network"
+    client.resource_pool = None
+    client._template_descriptors = {}
+    client.content = SimpleNamespace(
+        about=SimpleNamespace(apiType="HostAgent"),
+        virtualDiskManager=SimpleNamespace(CopyVirtualDisk_Task=host.copy_virtual_disk)
+    )
+    client.datacenter = SimpleNamespace(vmFolder=SimpleNamespace(CreateVM_Task=host.create_vm))
+    client.compute_resource = SimpleNamespace(network=[])
+    client._get_vm_by_name = lambda name: host.vms.get(name)
+    client._wait_for_task = lambda task: None
+    
+    async def await_task(task):
+        return None
+    client._await_task = await_task
+    return client
+
+
+async def run_mode(mode: str, clones: int, template_gb: float, copy_mbps: float) -> dict:
+    host = StubHost(template_gb, copy_mbps)
+    client = make_client(host)
+    base_mb = host.datastore_mb
+    
+    for i in range(clones):
+        await client._clone_from_template({
+            "template_id": host.template.name,
+            "name": f"glassdome-bench-{mode}-{i}",
+            "clone_mode": mode,
+        })
+    
+    return {
+        "mode": mode,
+        "seconds_per_clone": host.seconds / clones,
+        "total_seconds": host.seconds,
+        "mb_per_clone": (host.datastore_mb - base_mb) / clones,
+        "calls": host.calls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ESXi standalone cloning")
+    parser.add_argument("--clones", type=int, default=10)
+    parser.add_argument("--template-gb", type=float, default=20)
+    parser.add_argument("--copy-mbps", type=float, default=250)
+    args = parser.parse_args()
+    
+    results = [
+        asyncio.run(run_mode(mode, args.clones, args.template_gb, args.copy_mbps))
+        for mode in ("full", "linked")
+    ]
+    
+    print(f"\n{args.clones} clones of a {args.template_gb:g} GB template "
+          f"(copy {args.copy_mbps:g} MB/s, modelled host time)")
+    print(f"{'mode':<8} {'s/clone':>9} {'total (s)':>10} {'MB/clone':>10} {'tasks':>6}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['seconds_per_clone']:>9.1f} {r['total_seconds']:>10.1f} "
+              f"{r['mb_per_clone']:>10.1f} {r['calls']:>6}")
+
+
+if __name__ == "__main__":
+    main()
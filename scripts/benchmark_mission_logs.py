@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Mission Log Write Benchmark
+
+Compares per-line commits (the old add_mission_log behaviour) with the
+buffered MissionLogSink for a simulated exploit mission. Reports commits
+per mission and total time spent writing logs.
+
+Usage:
+    python3 scripts/benchmark_mission_logs.py [--missions 20] [--lines 120] [--db sqlite+aiosqlite:///...]
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add glassdome to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from glassdome.core.database import Base
+from glassdome.reaper.exploit_library import ExploitMission, MissionLog
+from glassdome.reaper.mission_log_sink import MissionLogSink
+
+PHASES = ("deploying_vm", "injecting", "verifying", "completed")
+
+
+async def run_per_line(session_factory, mission_id: str, lines: int):
+    """One session + commit per log line."""
+    for i in range(lines):
+        async with session_factory() as session:
+            session.add(MissionLog(
+                mission_id=mission_id,
+                message=f"line {i}",
+                step=PHASES[i * len(PHASES) // lines],
+            ))
+            await session.commit()
+        await asyncio.sleep(0)  # Mission work between lines
+
+
+async def run_buffered(sink: MissionLogSink, mission_id: str, lines: int):
+    """Buffered sink with a synchronous flush at mission completion."""
+    for i in range(lines):
+        sink.log(mission_id, f"line {i}", step=PHASES[i * len(PHASES) // lines])
+        await asyncio.sleep(0)
+    await sink.flush(mission_id)
+
+
+async def benchmark(db_url: str, missions: int, lines: int):
+    engine = create_async_engine(db_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    commits = {"count": 0}
+    
+    @event.listens_for(engine.sync_engine, "commit")
+    def _count_commit(conn):
+        commits["count"] += 1
+    
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    async with session_factory() as session:
+        for mode in ("per-line", "buffered"):
+            for m in range(missions):
+                session.add(ExploitMission(
+                    mission_id=f"{mode}-{m}", name=f"bench {m}",
+                    platform="proxmox", exploit_ids=[1],
+                ))
+        await session.commit()
+    
+    results = {}
+    
+    commits["count"] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_per_line(session_factory, f"per-line-{m}", lines) for m in range(missions)
+    ))
+    results["per-line"] = (commits["count"], time.perf_counter() - start)
+    
+    sink = MissionLogSink(session_factory=session_factory)
+    commits["count"] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_buffered(sink, f"buffered-{m}", lines) for m in range(missions)
+    ))
+    await sink.close()
+    results["buffered"] = (commits["count"], time.perf_counter() - start)
+    
+    await engine.dispose()
+    
+    print(f"{missions} concurrent missions x {lines} log lines ({db_url.split(':')[0]})")
+    print(f"{'mode':<10} {'commits/mission':>16} {'total (s)':>10} {'ms/mission':>11}")
+    for mode, (count, elapsed) in results.items():
+        print(f"{mode:<10} {count / missions:>16.1f} {elapsed:>10.3f} {elapsed * 1000 / missions:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark mission log writes")
+    parser.add_argument("--missions", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=120)
+    parser.add_argument("--db", help="Async database URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+    
+    if args.db:
+        asyncio.run(benchmark(args.db, args.missions, args.lines))
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        asyncio.run(benchmark(f"sqlite+aiosqlite:///{db_path}", args.missions, args.lines))
+
+
+if __name__ == "__main__":
+    main()
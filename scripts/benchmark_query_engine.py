@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+RAG Query Engine Benchmark
+
+Compares the legacy search path (one exact IndexFlatL2, metadata.json
+loaded into memory, type filters applied after fetching top_k*2) with the
+partitioned ANN QueryEngine on a synthetic corpus. Each mode runs in its
+own process so memory numbers are not mixed.
+
+Reports p50/p99 query latency, recall against exact search, how often a
+query returned fewer than top_k hits, and process memory after loading.
+
+Embeddings come from a deterministic fake encoder so the benchmark does
+not need to download a model; encoding cost is therefore excluded.
+
+Usage:
+    python3 scripts/benchmark_query_engine.py [--docs 50000] [--queries 500] [--top-k 5]
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+Copyright (c) 2025 Brett Turner. All rights reserved.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add glassdome to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import faiss
+import numpy as np
+
+from glassdome.knowledge.query_engine import QueryEngine
+from glassdome.knowledge.vector_store import build_partitions, write_document_store
+
+DIMENSION = 384
+MODEL_NAME = "fake-encoder"
+
+# Skewed like a real index: lots of code, few commits
+DOC_TYPES = ("code", "markdown", "session_log", "config", "git_commit")
+TYPE_WEIGHTS = (0.55, 0.2, 0.15, 0.07, 0.03)
+
+# Half unfiltered queries, half filtered by type
+FILTERS = (None, None, None, "session_log", "markdown", "git_commit")
+
+
+class FakeEncoder:
+    """Deterministic embeddings: a vector seeded by the text's hash."""
+    
+    def encode(self, texts, convert_to_numpy=True):
+        if isinstance(texts, str):
+            texts = [texts]
+        rows = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "little")
+            rows.append(np.random.default_rng(seed).standard_normal(DIMENSION))
+        return np.array(rows, dtype="float32")
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB"""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1e6
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_corpus(index_path: Path, docs: int):
+    """Write both the legacy files and the partitioned index"""
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((docs, DIMENSION)).astype("float32")
+    types = rng.choice(DOC_TYPES, size=docs, p=TYPE_WEIGHTS)
+    documents = [
+        {
+            "id": i,
+            "content": f"document {i} " + "lorem ipsum " * 60,
+            "source": f"src/file_{i % 500}.py",
+            "type": str(types[i]),
+            "metadata": {"chunk": i},
+            "indexed_at": datetime.now().isoformat(),
+        }
+        for i in range(docs)
+    ]
+    
+    flat = faiss.IndexFlatL2(DIMENSION)
+    flat.add(embeddings)
+    faiss.write_index(flat, str(index_path / "faiss.index"))
+    with open(index_path / "metadata.json", "w") as f:
+        json.dump({"documents": documents, "model_name": MODEL_NAME, "dimension": DIMENSION}, f)
+    
+    np.save(index_path / "bench_types.npy", types)
+    
+    write_document_store(index_path, documents)
+    build_partitions(index_path, embeddings, [d["type"] for d in documents], MODEL_NAME, DIMENSION)
+
+
+def legacy_search(index, documents, vector, top_k, filter_type):
+    """The pre-partition QueryEngine.search, minus encoding"""
+    distances, indices = index.search(vector, top_k * 2)
+    results = []
+    for dist, idx in zip(distances[0], indices[0]):
+        if idx == -1:
+            break
+        doc = documents[idx]
+        if filter_type and doc["type"] != filter_type:
+            continue
+        results.append({"id": int(idx), "similarity": float(1 / (1 + dist))})
+        if len(results) >= top_k:
+            break
+    return results
+
+
+def exact_ids(flat, types, vector, top_k, filter_type):
+    """Ground truth: exact search over the whole index, then filter"""
+    _, indices = flat.search(vector, flat.ntotal if filter_type else top_k)
+    ids = [int(i) for i in indices[0] if i != -1 and (not filter_type or types[i] == filter_type)]
+    return set(ids[:top_k])
+
+
+def run_mode(mode: str, index_path: Path, queries: int, top_k: int) -> dict:
+    encoder = FakeEncoder()
+    base_rss = rss_mb()
+    
+    start = time.perf_counter()
+    if mode == "legacy":
+        index = faiss.read_index(str(index_path / "faiss.index"))
+        with open(index_path / "metadata.json") as f:
+            documents = json.load(f)["documents"]
+        
+        def search(vector, filter_type):
+            return [r["id"] for r in legacy_search(index, documents, vector, top_k, filter_type)]
+    else:
+        engine = QueryEngine(index_path=str(index_path), model=encoder)
+        
+        def search(vector, filter_type):
+            return [r["metadata"]["chunk"] for r in engine._search_vectors(vector, top_k, filter_type)[0]]
+    load_s = time.perf_counter() - start
+    loaded_rss = rss_mb()
+    load_peak_rss = peak_rss_mb()
+    
+    # Ground truth from the flat index (not timed, loaded after the memory readings)
+    flat = faiss.read_index(str(index_path / "faiss.index"))
+    types = np.load(index_path / "bench_types.npy")
+    
+    latencies, recalls, short = [], [], 0
+    for q in range(queries):
+        filter_type = FILTERS[q % len(FILTERS)]
+        vector = encoder.encode([f"query {q}"])
+        start = time.perf_counter()
+        ids = search(vector, filter_type)
+        latencies.append((time.perf_counter() - start) * 1000)
+        
+        truth = exact_ids(flat, types, vector, top_k, filter_type)
+        recalls.append(len(truth & set(ids)) / max(1, len(truth)))
+        short += len(ids) < top_k
+    
+    latencies.sort()
+    return {
+        "mode": mode,
+        "load_s": load_s,
+        "p50_ms": latencies[len(latencies) // 2],
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "recall": sum(recalls) / len(recalls),
+        "short_results": short,
+        "rss_after_load_mb": loaded_rss - base_rss,
+        "peak_rss_mb": load_peak_rss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RAG query engine")
+    parser.add_argument("--docs", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--mode", choices=("legacy", "ann"), help=argparse.SUPPRESS)
+    parser.add_argument("--index-path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.mode:
+        # Child process: one mode against an existing corpus
+        result = run_mode(args.mode, Path(args.index_path), args.queries, args.top_k)
+        print(json.dumps(result))
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building synthetic corpus: {args.docs} docs x {DIMENSION} dims...")
+        build_corpus(Path(tmp), args.docs)
+        
+        results = []
+        for mode in ("legacy", "ann"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--index-path", tmp,
+                 "--queries", str(args.queries), "--top-k", str(args.top_k)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    
+    print(f"\n{args.queries} queries, top_k={args.top_k} (half unfiltered, half type-filtered)")
+    print(f"{'mode':<8} {'load (s)':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'recall':>7} "
+          f"{'short':>6} {'RSS load (MB)':>14} {'peak RSS (MB)':>14}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['load_s']:>9.2f} {r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+              f"{r['recall']:>7.3f} {r['short_results']:>6} {r['rss_after_load_mb']:>14.1f} "
+              f"{r['peak_rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -66,6 +66,7 @@ async def async_engine():
     from glassdome.whitepawn.models import (
         WhitePawnDeployment, NetworkAlert, MonitoringEvent, ConnectivityMatrix
     )
+    from glassdome.chat.models import ChatConversationRecord, ChatMessageRecord
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,107 @@
+"""
+AWS Client Unit Tests
+
+Tests for cached AMI / network discovery and batched instance launches.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from glassdome.platforms import aws_client
+from glassdome.platforms.aws_client import AWSClient, DiscoveryCache
+
+
+@pytest.fixture
+def ec2():
+    """EC2 client stub answering the describe/run calls AWSClient makes"""
+    client = MagicMock()
+    client.describe_images.return_value = {"Images": [
+        {"ImageId": "ami-old", "Name": "ubuntu-old", "CreationDate": "2024-01-01"},
+        {"ImageId": "ami-new", "Name": "ubuntu-new", "CreationDate": "2025-01-01"},
+    ]}
+    client.describe_vpcs.return_value = {"Vpcs": [{"VpcId": "vpc-1"}]}
+    client.describe_subnets.return_value = {"Subnets": [{"SubnetId": "subnet-1"}]}
+    client.describe_security_groups.return_value = {"SecurityGroups": [{"GroupId": "sg-1", "IpPermissions": []}]}
+    client.run_instances.side_effect = lambda **kw: {
+        "Instances": [{"InstanceId": f"i-{client.run_instances.call_count}-{n}"} for n in range(kw["MinCount"])]
+    }
+    client.describe_instances.side_effect = lambda InstanceIds: {"Reservations": [
+        {"Instances": [{"InstanceId": i, "PublicIpAddress": "198.51.100.1"} for i in InstanceIds]}
+    ]}
+    return client
+
+
+@pytest.fixture
+def client(ec2):
+    """AWSClient on the stub, with an empty discovery cache"""
+    with patch.object(aws_client, "get_ec2_client", return_value=ec2), \
+         patch.object(aws_client, "_discovery_cache", DiscoveryCache()):
+        yield AWSClient("AKIATEST", "secret", region="us-east-1")
+
+
+class TestAWSClient:
+    """Tests for AWSClient"""
+    
+    @pytest.mark.asyncio
+    async def test_lab_deploy_batches_identical_specs(self, client, ec2):
+        """Ten identical Linux VMs: one launch and a handful of describe calls"""
+        configs = [{"name": f"lab-web-{i}", "instance_type": "t4g.micro"} for i in range(10)]
+        
+        results = await client.create_vms(configs)
+        
+        assert all(result["ip_address"] == "198.51.100.1" for result in results)
+        assert len({result["vm_id"] for result in results}) == 10
+        ec2.run_instances.assert_called_once()
+        launch = ec2.run_instances.call_args.kwargs
+        assert launch["MinCount"] == launch["MaxCount"] == 10
+        assert launch["ImageId"] == "ami-new"
+        assert "hostname:" not in launch["UserData"]
+        assert ec2.create_tags.call_count == 10
+        assert ec2.describe_images.call_count == 1
+        assert ec2.describe_vpcs.call_count == 1
+        assert ec2.describe_security_groups.call_count == 1
+        assert ec2.describe_instances.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_single_vm_keeps_hostname_and_given_network(self, client, ec2):
+        """A lone VM embeds its hostname; a given subnet and groups skip discovery"""
+        result = await client.create_vm({
+            "name": "gateway",
+            "instance_type": "t4g.small",
+            "subnet_id": "subnet-lab",
+            "security_group_ids": ["sg-lab"],
+        })
+        
+        launch = ec2.run_instances.call_args.kwargs
+        assert "hostname: gateway" in launch["UserData"]
+        assert launch["SubnetId"] == "subnet-lab"
+        assert launch["SecurityGroupIds"] == ["sg-lab"]
+        assert result["platform_specific"]["subnet_id"] == "subnet-lab"
+        ec2.describe_vpcs.assert_not_called()
+        ec2.describe_security_groups.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_discovery_cache_refreshes_in_background(self):
+        """Expired entries are served while one refresh runs"""
+        cache = DiscoveryCache()
+        calls = 0
+        
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+        
+        results = await asyncio.gather(*(cache.get(("k",), 0, load) for _ in range(5)))
+        assert results == [1] * 5
+        
+        # TTL 0: the stale value comes back immediately, refresh runs behind it
+        assert await cache.get(("k",), 0, load) == 1
+        await asyncio.sleep(0.1)
+        assert await cache.get(("k",), 60, load) == 2
+        assert calls == 2
@@ -0,0 +1,138 @@
+"""
+AWS Network Handler Unit Tests
+
+Tests for graph-based lab network provisioning and resource reuse.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from glassdome.networking.address_allocator import LabNetworkAllocation, SubnetAllocation, SubnetType
+from glassdome.networking.aws_handler import AWSNetworkHandler, ProvisionStep, run_steps
+
+
+def make_allocation():
+    subnets = {
+        subnet_type: SubnetAllocation(
+            subnet_type=subnet_type,
+            cidr=f"10.9.{index}.0/24",
+            gateway=f"10.9.{index}.1",
+            dhcp_start=f"10.9.{index}.100",
+            dhcp_end=f"10.9.{index}.200",
+            is_public=subnet_type == SubnetType.PUBLIC
+        )
+        for index, subnet_type in enumerate([SubnetType.PUBLIC, SubnetType.DMZ], start=1)
+    }
+    return LabNetworkAllocation(lab_id="lab-1", lab_number=9, vpc_cidr="10.9.0.0/16", subnets=subnets)
+
+
+@pytest.fixture
+def handler():
+    h = AWSNetworkHandler(region="us-east-1")
+    h._ec2_client = MagicMock()
+    h._ec2_client.get_waiter.return_value = SimpleNamespace(wait=lambda **kw: None)
+    return h
+
+
+class TestRunSteps:
+    """Tests for the provisioning graph runner"""
+    
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        """Steps wait for their dependencies only"""
+        order = []
+        
+        def step(name, *after):
+            async def run():
+                order.append(f"{name}:start")
+                await asyncio.sleep(0.1)
+                order.append(f"{name}:end")
+            return ProvisionStep(name, run, after)
+        
+        start = time.perf_counter()
+        timings = await run_steps([step("vpc"), step("a", "vpc"), step("b", "vpc"), step("c", "a", "b")])
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 0.35  # three levels, not four steps
+        assert order.index("vpc:end") < order.index("a:start")
+        assert order.index("b:end") < order.index("c:start")
+        assert set(timings) == {"vpc", "a", "b", "c"}
+    
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending_steps(self):
+        """A failed step stops its dependents and is raised"""
+        ran = []
+        
+        async def fail():
+            raise RuntimeError("limit exceeded")
+        
+        async def dependent():
+            ran.append("dependent")
+        
+        with pytest.raises(RuntimeError):
+            await run_steps([ProvisionStep("vpc", fail), ProvisionStep("subnet", dependent, ("vpc",))])
+        assert ran == []
+    
+    @pytest.mark.asyncio
+    async def test_unknown_dependency_rejected(self):
+        """Dependencies must be listed before the steps that need them"""
+        with pytest.raises(ValueError):
+            await run_steps([ProvisionStep("subnet", asyncio.sleep, ("vpc",))])
+
+
+class TestAWSNetworkHandler:
+    """Tests for AWSNetworkHandler lab provisioning"""
+    
+    @pytest.mark.asyncio
+    async def test_new_lab_creates_every_resource(self, handler):
+        """An empty account gets the full lab network"""
+        ec2 = handler.ec2_client
+        for describe in ("describe_vpcs", "describe_subnets", "describe_internet_gateways",
+                         "describe_route_tables", "describe_security_groups"):
+            getattr(ec2, describe).return_value = {}
+        ec2.create_vpc.return_value = {"Vpc": {"VpcId": "vpc-1"}}
+        ec2.create_internet_gateway.return_value = {"InternetGateway": {"InternetGatewayId": "igw-1"}}
+        ec2.create_subnet.side_effect = lambda **kw: {"Subnet": {"SubnetId": f"subnet-{kw['CidrBlock']}"}}
+        ec2.create_route_table.return_value = {"RouteTable": {"RouteTableId": "rtb-1"}}
+        ec2.create_security_group.side_effect = lambda **kw: {"GroupId": kw["GroupName"]}
+        
+        infra = await handler.create_lab_infrastructure("lab-1", make_allocation())
+        
+        assert infra.vpc_id == "vpc-1"
+        assert infra.subnets[SubnetType.DMZ] == "subnet-10.9.2.0/24"
+        assert set(infra.security_groups) == {"guacamole", "attack", "lab"}
+        assert infra.reused == []
+        assert infra.setup_seconds is not None
+        ec2.create_route.assert_called_once_with(RouteTableId="rtb-1", DestinationCidrBlock="0.0.0.0/0", GatewayId="igw-1")
+        ec2.associate_route_table.assert_called_once_with(SubnetId="subnet-10.9.1.0/24", RouteTableId="rtb-1")
+        # One call per rule: 2 guacamole + 3 attack + 2 lab
+        assert ec2.authorize_security_group_ingress.call_count == 7
+    
+    @pytest.mark.asyncio
+    async def test_redeploy_reuses_tagged_resources(self, handler):
+        """Resources found for the lab are reused instead of recreated"""
+        ec2 = handler.ec2_client
+        ec2.describe_vpcs.return_value = {"Vpcs": [{"VpcId": "vpc-1"}]}
+        ec2.describe_internet_gateways.return_value = {"InternetGateways": [{"InternetGatewayId": "igw-1"}]}
+        ec2.describe_subnets.side_effect = lambda Filters: {"Subnets": [
+            {"SubnetId": f"subnet-{Filters[1]['Values'][0]}", "MapPublicIpOnLaunch": True}
+        ]}
+        ec2.describe_route_tables.return_value = {"RouteTables": [{"RouteTableId": "rtb-1"}]}
+        ec2.describe_security_groups.side_effect = lambda Filters: {"SecurityGroups": [
+            {"GroupId": Filters[1]["Values"][0]}
+        ]}
+        
+        infra = await handler.create_lab_infrastructure("lab-1", make_allocation())
+        
+        assert infra.vpc_id == "vpc-1"
+        assert len(infra.reused) == 1 + 1 + 2 + 1 + 3
+        for create in ("create_vpc", "create_internet_gateway", "create_subnet",
+                       "create_route_table", "create_security_group", "modify_subnet_attribute"):
+            getattr(ec2, create).assert_not_called()
@@ -0,0 +1,128 @@
+"""
+Azure Inventory Unit Tests
+
+Tests for batched VM listing and cached NIC / public-IP resolution.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from glassdome.platforms.azure_client import AzureClient
+
+SUB = "/subscriptions/sub"
+
+
+def rid(rg, kind, name):
+    return f"{SUB}/resourceGroups/{rg}/providers/{kind}/{name}"
+
+
+def make_vm(name, rg="lab-rg", state="running", nic=True):
+    return SimpleNamespace(
+        id=rid(rg, "Microsoft.Compute/virtualMachines", name),
+        name=name,
+        location="eastus",
+        tags=None,
+        hardware_profile=SimpleNamespace(vm_size="Standard_B1s"),
+        storage_profile=SimpleNamespace(os_disk=SimpleNamespace(os_type="Linux")),
+        network_profile=SimpleNamespace(network_interfaces=[
+            SimpleNamespace(id=rid(rg, "Microsoft.Network/networkInterfaces", f"{name}-nic"))
+        ] if nic else []),
+        instance_view=SimpleNamespace(statuses=[
+            SimpleNamespace(code="ProvisioningState/succeeded"),
+            SimpleNamespace(code=f"PowerState/{state}"),
+        ]) if state else None,
+    )
+
+
+def make_nic(name, rg="lab-rg", pip_rg="lab-rg"):
+    return SimpleNamespace(
+        id=rid(rg, "Microsoft.Network/networkInterfaces", f"{name}-nic"),
+        ip_configurations=[SimpleNamespace(
+            public_ip_address=SimpleNamespace(id=rid(pip_rg, "Microsoft.Network/publicIPAddresses", f"{name}-pip"))
+        )],
+    )
+
+
+def make_pip(name, ip, rg="lab-rg"):
+    return SimpleNamespace(id=rid(rg, "Microsoft.Network/publicIPAddresses", name), name=name, ip_address=ip)
+
+
+@pytest.fixture
+def client():
+    """AzureClient without credentials, with mocked management clients"""
+    c = AzureClient.__new__(AzureClient)
+    c.subscription_id = "sub"
+    c.region = "eastus"
+    c.resource_group_name = "lab-rg"
+    c.compute_client = MagicMock()
+    c.network_client = MagicMock()
+    c._executor = ThreadPoolExecutor(max_workers=4)
+    c._network_cache = {}
+    yield c
+    c._executor.shutdown()
+
+
+class TestAzureInventory:
+    """Tests for AzureClient VM listing"""
+    
+    @pytest.mark.asyncio
+    async def test_list_all_vms_uses_bulk_calls(self, client):
+        """Power state comes with the list; NICs and IPs are listed once per group"""
+        vms = [make_vm(f"vm{i}") for i in range(50)]
+        client.compute_client.virtual_machines.list_all.return_value = vms
+        client.network_client.network_interfaces.list.return_value = [make_nic(vm.name) for vm in vms]
+        client.network_client.public_ip_addresses.list.return_value = [
+            make_pip(f"{vm.name}-pip", f"20.0.0.{i}") for i, vm in enumerate(vms)
+        ]
+        
+        result = await client.list_all_vms()
+        
+        assert len(result) == 50
+        assert result[7]["power_state"] == "running"
+        assert result[7]["ip_address"] == "20.0.0.7"
+        assert result[7]["resource_group"] == "lab-rg"
+        client.compute_client.virtual_machines.list_all.assert_called_once_with(expand="instanceView")
+        client.compute_client.virtual_machines.instance_view.assert_not_called()
+        client.network_client.network_interfaces.list.assert_called_once_with("lab-rg")
+        client.network_client.public_ip_addresses.list.assert_called_once_with("lab-rg")
+        client.network_client.public_ip_addresses.get.assert_not_called()
+        
+        # Network records are reused within the TTL
+        await client.list_all_vms()
+        client.network_client.network_interfaces.list.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_missing_instance_view_and_cross_group_ip(self, client):
+        """Views missing from the list are fetched; IPs in other groups are resolved"""
+        vm = make_vm("web", state=None)
+        client.compute_client.virtual_machines.list.return_value = [vm]
+        client.compute_client.virtual_machines.instance_view.return_value = SimpleNamespace(
+            statuses=[SimpleNamespace(code="PowerState/deallocated")]
+        )
+        nics = {"lab-rg": [make_nic("web", pip_rg="shared-rg")], "shared-rg": []}
+        pips = {"lab-rg": [], "shared-rg": [make_pip("web-pip", "52.1.2.3", rg="shared-rg")]}
+        client.network_client.network_interfaces.list.side_effect = nics.get
+        client.network_client.public_ip_addresses.list.side_effect = pips.get
+        
+        result = await client.list_vms()
+        
+        assert result[0]["power_state"] == "deallocated"
+        assert result[0]["ip_address"] == "52.1.2.3"
+        client.compute_client.virtual_machines.instance_view.assert_called_once_with("lab-rg", "web")
+    
+    @pytest.mark.asyncio
+    async def test_vm_without_nic_reference_uses_ip_name(self, client):
+        """VMs listed without a NIC reference fall back to the "{name}-ip" convention"""
+        client.compute_client.virtual_machines.list.return_value = [make_vm("old", nic=False)]
+        client.network_client.network_interfaces.list.return_value = []
+        client.network_client.public_ip_addresses.list.return_value = [make_pip("old-ip", "40.0.0.1")]
+        
+        result = await client.list_vms()
+        
+        assert result[0]["ip_address"] == "40.0.0.1"
@@ -0,0 +1,225 @@
+"""
+Overseer Chat Agent Unit Tests
+
+Tests for concurrent tool execution, per-tool timeouts, streamed
+responses and the token-budgeted, persistent conversation history, using
+a scripted fake LLM provider.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from glassdome.chat import agent as agent_module
+from glassdome.chat.agent import MessageRole, OverseerChatAgent
+from glassdome.chat.context_builder import ContextBuilder, message_tokens
+from glassdome.chat.conversation_store import ConversationStore
+from glassdome.chat.llm_service import LLMProvider, LLMResponse, ToolCall
+
+
+class FakeProvider(LLMProvider):
+    """Returns scripted responses; streams text word by word."""
+    
+    def __init__(self, script):
+        super().__init__(api_key="test", model="fake")
+        self.script = list(script)
+    
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+    
+    async def complete(self, messages, tools=None, temperature=0.7, max_tokens=4096):
+        return self.script.pop(0)
+    
+    async def stream(self, messages, temperature=0.7, max_tokens=4096):
+        yield (await self.complete(messages)).content
+    
+    async def stream_complete(self, messages, tools=None, temperature=0.7, max_tokens=4096):
+        response = self.script.pop(0)
+        for word in response.content.split():
+            await asyncio.sleep(0.05)
+            yield word + " "
+        yield response
+
+
+def make_agent(script, store=None):
+    agent = OverseerChatAgent()
+    agent.store = store
+    agent.llm._providers = {"fake": FakeProvider(script)}
+    agent.llm.default_provider = "fake"
+    agent.llm.fallback_providers = []
+    return agent
+
+
+def tool_response(*names):
+    return LLMResponse(
+        content="",
+        tool_calls=[ToolCall(id=f"call_{i}", name=name, arguments={}) for i, name in enumerate(names)],
+        finish_reason="tool_calls",
+    )
+
+
+class TestChatAgentTools:
+    """Tool execution"""
+    
+    async def test_read_only_tools_run_concurrently(self):
+        agent = make_agent([tool_response("get_status", "list_resources", "get_platform_status"),
+                            LLMResponse(content="All good")])
+        
+        async def slow_tool(conversation, name, args):
+            await asyncio.sleep(0.3)
+            return {"tool": name}
+        agent._execute_tool = slow_tool
+        
+        conversation = agent.create_conversation()
+        start = time.perf_counter()
+        result = await agent.process_message(conversation.conversation_id, "status?")
+        elapsed = time.perf_counter() - start
+        
+        assert result["response"] == "All good"
+        assert [r["tool"] for r in result["tool_results"]] == ["get_status", "list_resources", "get_platform_status"]
+        assert elapsed < 0.6  # Serial would be 0.9s
+        
+        # Tool messages follow the call order
+        tool_ids = [m.tool_call_id for m in conversation.messages if m.role.value == "tool"]
+        assert tool_ids == ["call_0", "call_1", "call_2"]
+    
+    async def test_tool_timeout_returns_error(self, monkeypatch):
+        monkeypatch.setitem(agent_module.TOOL_TIMEOUTS, "get_status", 0.1)
+        agent = make_agent([tool_response("get_status", "list_resources"),
+                            LLMResponse(content="Partial results")])
+        
+        async def tool(conversation, name, args):
+            await asyncio.sleep(5 if name == "get_status" else 0)
+            return {"ok": True}
+        agent._execute_tool = tool
+        
+        conversation = agent.create_conversation()
+        start = time.perf_counter()
+        result = await agent.process_message(conversation.conversation_id, "status?")
+        
+        assert time.perf_counter() - start < 1
+        assert "timed out" in result["tool_results"][0]["error"]
+        assert result["tool_results"][1]["result"] == {"ok": True}
+
+
+class TestChatAgentStreaming:
+    """Streamed responses"""
+    
+    async def test_stream_message_yields_chunks_before_completion(self):
+        agent = make_agent([tool_response("get_status"),
+                            LLMResponse(content="one two three four five six")])
+        
+        async def tool(conversation, name, args):
+            return {"status": "ok"}
+        agent._execute_tool = tool
+        
+        conversation = agent.create_conversation()
+        start = time.perf_counter()
+        first_chunk_at = None
+        events = []
+        async for event in agent.stream_message(conversation.conversation_id, "status?"):
+            if event["type"] == "chunk" and first_chunk_at is None:
+                first_chunk_at = time.perf_counter() - start
+            events.append(event)
+        total = time.perf_counter() - start
+        
+        types = [e["type"] for e in events]
+        assert types[:2] == ["tool_calls", "tool_results"]
+        assert types[-1] == "complete"
+        assert events[-1]["response"] == "one two three four five six"
+        assert events[-1]["tool_results"][0]["result"] == {"status": "ok"}
+        assert first_chunk_at < total / 2
+        assert conversation.messages[-1].content == "one two three four five six"
+
+
+class TestConversationContext:
+    """Token-budgeted context and conversation persistence"""
+    
+    def long_conversation(self, turns):
+        agent = make_agent([])
+        conversation = agent.create_conversation()
+        for i in range(turns):
+            conversation.add_message(MessageRole.USER, f"question {i} " + "x" * 400)
+            conversation.add_message(
+                MessageRole.ASSISTANT, "",
+                tool_calls=[{"id": f"call_{i}", "type": "function",
+                             "function": {"name": "get_status", "arguments": "{}"}}]
+            )
+            conversation.add_message(MessageRole.TOOL, "r" * 20000, tool_call_id=f"call_{i}")
+            conversation.add_message(MessageRole.ASSISTANT, f"answer {i} " + "y" * 400)
+        return conversation
+    
+    async def test_prompt_stays_within_budget(self):
+        summaries = []
+        
+        async def summarizer(previous, messages, max_tokens):
+            summaries.append(len(messages))
+            return f"{previous} +{len(messages)}"
+        
+        builder = ContextBuilder(max_tokens=2000, summary_tokens=200,
+                                 tool_result_tokens=100, summarizer=summarizer)
+        
+        for turns in (5, 50, 200):
+            conversation = self.long_conversation(turns)
+            messages = await builder.build(conversation)
+            assert sum(message_tokens(m) for m in messages) <= 2000
+            
+            assert messages[0].role == "system"
+            assert messages[1].content.startswith("Summary of the earlier conversation")
+            # Recent turns verbatim, starting at a user message
+            assert messages[2].role == "user"
+            assert messages[-1].content.startswith(f"answer {turns - 1}")
+            # Tool results truncated
+            assert all(len(m.content) < 1000 for m in messages if m.role == "tool")
+        
+        # Summary is cached: a second build with no new turns doesn't resummarize
+        calls = len(summaries)
+        await builder.build(conversation)
+        assert len(summaries) == calls
+    
+    async def test_summary_keeps_system_prompt_for_anthropic(self):
+        """The summary is appended to the Anthropic system prompt, not substituted for it"""
+        from glassdome.chat.llm_service import AnthropicProvider
+        
+        builder = ContextBuilder(max_tokens=2000, summary_tokens=200, tool_result_tokens=100)
+        conversation = self.long_conversation(20)
+        messages = await builder.build(conversation)
+        assert conversation.summary
+        
+        provider = AnthropicProvider.__new__(AnthropicProvider)
+        system, converted = provider._convert_messages(messages)
+        
+        assert system.startswith(conversation.messages[0].content)
+        assert "Summary of the earlier conversation" in system
+        assert all(m["role"] != "system" for m in converted)
+    
+    async def test_conversation_survives_eviction(self, async_engine):
+        session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+        store = ConversationStore(session_factory=session_factory)
+        agent = make_agent([LLMResponse(content="first answer"), LLMResponse(content="second answer")],
+                           store=store)
+        
+        conversation = agent.create_conversation()
+        conv_id = conversation.conversation_id
+        await agent.process_message(conv_id, "hello")
+        assert conversation.persisted_count == 3
+        
+        assert agent.evict_idle_conversations(max_idle=0, force=True) == 1
+        assert agent.get_conversation(conv_id) is None
+        
+        result = await agent.process_message(conv_id, "again")
+        assert result["response"] == "second answer"
+        
+        reloaded = await ConversationStore(session_factory=session_factory).load(conv_id)
+        assert [m.content for m in reloaded.messages[1:]] == ["hello", "first answer", "again", "second answer"]
+        assert reloaded.messages[0].role == MessageRole.SYSTEM
+        
+        assert await agent.delete_conversation(conv_id)
+        assert await store.load(conv_id) is None
@@ -0,0 +1,68 @@
+"""
+Database Metrics Unit Tests
+
+Tests for SQLAlchemy query/pool instrumentation.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from glassdome.core.db_metrics import DBMetrics, db_metrics, db_scope, instrument_engine
+
+
+@pytest.fixture
+def engine():
+    eng = create_engine("sqlite://")
+    instrument_engine(eng, "test-engine")
+    db_metrics.reset()
+    yield eng
+    eng.dispose()
+    db_metrics._pools.pop("test-engine", None)
+    db_metrics.reset()
+
+
+class TestDBMetrics:
+    """Tests for query instrumentation"""
+    
+    def test_queries_attributed_to_scope(self, engine):
+        """Test queries land in the active scope, else the engine name"""
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with db_scope("reaper.hot_spare"):
+                conn.execute(text("SELECT 2"))
+                conn.execute(text("SELECT 2"))
+        
+        snapshot = db_metrics.snapshot()
+        assert snapshot["scopes"]["test-engine"]["queries"] == 1
+        scoped = snapshot["scopes"]["reaper.hot_spare"]
+        assert scoped["queries"] == 2
+        assert scoped["most_frequent_statements"][0]["statement"] == "SELECT 2"
+        assert scoped["most_frequent_statements"][0]["count"] == 2
+    
+    def test_pool_usage_tracked(self, engine):
+        """Test checkouts and peak usage are recorded"""
+        with engine.connect():
+            pass
+        
+        pool = db_metrics.snapshot()["pools"]["test-engine"]
+        assert pool["checkouts"] >= 1
+        assert pool["peak_checked_out"] >= 1
+        assert pool["checked_out"] == 0
+    
+    def test_request_queries_per_request(self):
+        """Test per-request buffers feed queries-per-request stats"""
+        from glassdome.core.db_metrics import _RequestQueries
+        
+        metrics = DBMetrics()
+        for n in (1, 5):
+            request = _RequestQueries()
+            request.queries = [("SELECT * FROM labs WHERE id = ?", 0.5)] * n
+            metrics.record_request("GET /api/v1/labs/{lab_id}", request)
+        
+        stats = metrics.snapshot()["scopes"]["GET /api/v1/labs/{lab_id}"]
+        assert stats["requests"] == 2
+        assert stats["avg_queries_per_request"] == 3.0
+        assert stats["max_queries_per_request"] == 5
@@ -0,0 +1,267 @@
+"""
+ESXi Client Unit Tests
+
+Tests for PropertyCollector paging, WaitForUpdatesEx based task waits and
+linked clones, against a stubbed collector.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pyVmomi import vim
+
+from glassdome.platforms import esxi_client
+from glassdome.platforms.esxi_client import ESXiClient
+
+SUCCESS = vim.TaskInfo.State.success
+ERROR = vim.TaskInfo.State.error
+RUNNING = vim.TaskInfo.State.running
+
+
+def page(names, token=None):
+    """One RetrievePropertiesEx result page"""
+    return SimpleNamespace(
+        objects=[
+            SimpleNamespace(obj=f"vm-{name}", propSet=[SimpleNamespace(name="name", val=name)])
+            for name in names
+        ],
+        token=token,
+    )
+
+
+def update(version, **changes):
+    """One WaitForUpdatesEx UpdateSet for a single object"""
+    change_set = [
+        SimpleNamespace(name=name.replace("__", "."), op="remove" if val is None else "assign", val=val)
+        for name, val in changes.items()
+    ]
+    return SimpleNamespace(
+        version=version,
+        filterSet=[SimpleNamespace(objectSet=[SimpleNamespace(changeSet=change_set)])],
+    )
+
+
+@pytest.fixture
+def client():
+    """Client without a host connection; content is a stub"""
+    c = ESXiClient.__new__(ESXiClient)
+    c.content = MagicMock()
+    c.content.viewManager.CreateContainerView.return_value = MagicMock(spec=vim.view.ContainerView)
+    c._template_descriptors = {}
+    c._template_locks = {}
+    c._template_locks_guard = threading.Lock()
+    c.default_datastore_name = "datastore1"
+    c.default_network_name = "VM Network"
+    c.datacenter = MagicMock()
+    c.resource_pool = MagicMock(spec=vim.ResourcePool)
+    c.compute_resource = SimpleNamespace(network=[])
+    return c
+
+
+@pytest.fixture
+def waiter(client):
+    """The private collector used by _wait_for_updates"""
+    collector = client.content.propertyCollector.CreatePropertyCollector.return_value
+    collector.CreateFilter.return_value = MagicMock(name="filter")
+    return collector
+
+
+def template_with_base_disk(controller):
+    """Template whose base snapshot has one disk on the given controller"""
+    controller.key = 1000
+    disk = vim.vm.device.VirtualDisk(
+        key=2000,
+        controllerKey=1000,
+        capacityInKB=16 * 1024 * 1024,
+        backing=vim.vm.device.VirtualDisk.FlatVer2BackingInfo(
+            fileName="[datastore1] ubuntu-template/ubuntu-template-000001.vmdk",
+            diskMode="persistent",
+        ),
+    )
+    snapshot = SimpleNamespace(config=SimpleNamespace(
+        guestId="ubuntu64Guest",
+        firmware="efi",
+        hardware=SimpleNamespace(memoryMB=4096, numCPU=2, device=[controller, disk]),
+    ))
+    template = MagicMock()
+    template._moId = "vm-42"
+    template.name = "ubuntu-template"
+    template.snapshot = None
+    template.CreateSnapshot_Task.return_value = SimpleNamespace(info=SimpleNamespace(result=snapshot))
+    return template
+
+
+class TestRetrieveProperties:
+    """Tests for RetrievePropertiesEx paging"""
+    
+    def test_pages_through_continuation_tokens(self, client):
+        """Every page is read by following the token until none is returned"""
+        collector = client.content.propertyCollector
+        collector.RetrievePropertiesEx.return_value = page(["a", "b"], token="t1")
+        collector.ContinueRetrievePropertiesEx.side_effect = [page(["c"], token="t2"), page(["d"])]
+        
+        objects = client._retrieve_properties(vim.VirtualMachine, ["name"])
+        
+        assert [o["name"] for o in objects] == ["a", "b", "c", "d"]
+        assert objects[0]["obj"] == "vm-a"
+        options = collector.RetrievePropertiesEx.call_args.args[1]
+        assert options.maxObjects == esxi_client.PROPERTY_PAGE_SIZE
+        assert [c.args[0] for c in collector.ContinueRetrievePropertiesEx.call_args_list] == ["t1", "t2"]
+        client.content.viewManager.CreateContainerView.return_value.Destroy.assert_called_once()
+    
+    def test_view_destroyed_when_paging_fails(self, client):
+        """The container view is released even if a page read fails"""
+        collector = client.content.propertyCollector
+        collector.RetrievePropertiesEx.return_value = page(["a"], token="t1")
+        collector.ContinueRetrievePropertiesEx.side_effect = vim.fault.InvalidState()
+        
+        with pytest.raises(vim.fault.InvalidState):
+            client._retrieve_properties(vim.VirtualMachine, ["name"])
+        client.content.viewManager.CreateContainerView.return_value.Destroy.assert_called_once()
+
+
+class TestWaitForUpdates:
+    """Tests for WaitForUpdatesEx waits and task completion"""
+    
+    def test_versions_are_threaded_through_waits(self, client, waiter):
+        """Each wait resumes from the last version; empty waits keep it"""
+        waiter.WaitForUpdatesEx.side_effect = [
+            update("1", info__state=RUNNING),
+            None,  # maxWaitSeconds elapsed with no change
+            update("2", info__state=SUCCESS),
+        ]
+        task = MagicMock(spec=vim.Task)
+        
+        client._wait_for_task(task)
+        
+        assert [c.args[0] for c in waiter.WaitForUpdatesEx.call_args_list] == ["", "1", "1"]
+        waiter.CreateFilter.return_value.Destroy.assert_called_once()
+        waiter.Destroy.assert_called_once()
+    
+    def test_removed_properties_are_dropped(self, client, waiter):
+        """A "remove" change deletes the property from the view"""
+        waiter.WaitForUpdatesEx.side_effect = [
+            update("1", guest__ipAddress="10.0.0.5", runtime__powerState="poweredOn"),
+            update("2", guest__ipAddress=None),
+        ]
+        seen = []
+        
+        def done(props):
+            seen.append(dict(props))
+            return len(seen) == 2
+        
+        props = client._wait_for_updates(MagicMock(spec=vim.VirtualMachine), ["guest.ipAddress"], done)
+        
+        assert seen[0]["guest.ipAddress"] == "10.0.0.5"
+        assert props == {"runtime.powerState": "poweredOn"}
+    
+    def test_timeout_raises_and_cleans_up(self, client, waiter, monkeypatch):
+        """done() never true: TimeoutError after the deadline, filter destroyed"""
+        clock = iter([0.0, 0.0, 1.0, 1.0, 3.0])
+        monkeypatch.setattr(esxi_client.time, "monotonic", lambda: next(clock))
+        waiter.WaitForUpdatesEx.return_value = None
+        
+        with pytest.raises(TimeoutError):
+            client._wait_for_updates(MagicMock(spec=vim.Task), ["info.state"], lambda props: False, timeout=2)
+        
+        assert [c.args[1].maxWaitSeconds for c in waiter.WaitForUpdatesEx.call_args_list] == [2, 1]
+        waiter.CreateFilter.return_value.Destroy.assert_called_once()
+        waiter.Destroy.assert_called_once()
+    
+    def test_error_task_raises_with_fault_message(self, client, waiter):
+        """A task that ends in error raises with the fault's message"""
+        waiter.WaitForUpdatesEx.return_value = update(
+            "1", info__state=ERROR, info__error=SimpleNamespace(msg="Insufficient disk space"),
+        )
+        
+        with pytest.raises(Exception, match="Task failed: Insufficient disk space"):
+            client._wait_for_task(MagicMock(spec=vim.Task))
+        waiter.CreateFilter.return_value.Destroy.assert_called_once()
+        waiter.Destroy.assert_called_once()
+    
+    def test_collector_destroyed_when_wait_fails(self, client, waiter):
+        """Errors from the host still release the filter and the collector"""
+        waiter.WaitForUpdatesEx.side_effect = vim.fault.InvalidState()
+        
+        with pytest.raises(vim.fault.InvalidState):
+            client._wait_for_task(MagicMock(spec=vim.Task))
+        waiter.CreateFilter.return_value.Destroy.assert_called_once()
+        waiter.Destroy.assert_called_once()
+    
+    def test_collector_destroyed_when_filter_creation_fails(self, client, waiter):
+        """A rejected filter spec still releases the collector"""
+        waiter.CreateFilter.side_effect = vim.fault.InvalidState()
+        
+        with pytest.raises(vim.fault.InvalidState):
+            client._wait_for_task(MagicMock(spec=vim.Task))
+        waiter.Destroy.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_await_task_runs_off_the_event_loop(self, client, waiter):
+        """_await_task waits in a worker thread and propagates failures"""
+        waiter.WaitForUpdatesEx.return_value = update("1", info__state=SUCCESS)
+        await client._await_task(MagicMock(spec=vim.Task))
+        
+        waiter.WaitForUpdatesEx.return_value = update("2", info__state=ERROR, info__error=SimpleNamespace(msg="boom"))
+        with pytest.raises(Exception, match="boom"):
+            await client._await_task(MagicMock(spec=vim.Task))
+
+
+class TestLinkedClone:
+    """Tests for delta-disk linked clones"""
+    
+    def test_concurrent_clones_take_one_base_snapshot(self, client):
+        """Racing first clones of a template share one base snapshot"""
+        template = template_with_base_disk(vim.vm.device.ParaVirtualSCSIController())
+        client._wait_for_task = lambda task: time.sleep(0.05)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            descriptors = list(pool.map(lambda _: client._template_descriptor(template), range(4)))
+        
+        assert template.CreateSnapshot_Task.call_count == 1
+        assert template.CreateSnapshot_Task.call_args.kwargs["name"] == esxi_client.BASE_SNAPSHOT_NAME
+        assert all(d is descriptors[0] for d in descriptors)
+    
+    @pytest.mark.asyncio
+    async def test_delta_disk_spec_uses_snapshot_disk_as_parent(self, client):
+        """The clone's disk is a new child of the base snapshot disk, on the template's controller type"""
+        template = template_with_base_disk(vim.vm.device.VirtualLsiLogicController())
+        client._wait_for_task = MagicMock()
+        client._await_task = AsyncMock()
+        task = client.datacenter.vmFolder.CreateVM_Task.return_value
+        
+        vm = await client._clone_via_delta_disk(template, "web-01", {"memory": 2048})
+        
+        assert vm is task.info.result
+        spec = client.datacenter.vmFolder.CreateVM_Task.call_args.kwargs["config"]
+        assert (spec.memoryMB, spec.numCPUs, spec.guestId, spec.firmware) == (2048, 2, "ubuntu64Guest", "efi")
+        controller_spec, disk_spec = spec.deviceChange
+        assert isinstance(controller_spec.device, vim.vm.device.VirtualLsiLogicController)
+        assert disk_spec.fileOperation == vim.vm.device.VirtualDeviceSpec.FileOperation.create
+        assert disk_spec.device.controllerKey == controller_spec.device.key
+        assert disk_spec.device.capacityInKB == 16 * 1024 * 1024
+        backing = disk_spec.device.backing
+        assert backing.fileName == "[datastore1] web-01/web-01.vmdk"
+        assert backing.parent.fileName == "[datastore1] ubuntu-template/ubuntu-template-000001.vmdk"
+        client._await_task.assert_awaited_once_with(task)
+    
+    @pytest.mark.asyncio
+    async def test_failed_linked_clone_falls_back_to_full_copy(self, client):
+        """A linked clone error falls back to a VMDK copy; "full" goes there directly"""
+        template = template_with_base_disk(vim.vm.device.ParaVirtualSCSIController())
+        template.CreateSnapshot_Task.side_effect = vim.fault.InvalidState()
+        client._clone_via_vmdk_copy = AsyncMock(return_value="copied-vm")
+        
+        assert await client._clone_standalone(template, "web-01", {}) == "copied-vm"
+        assert await client._clone_standalone(template, "web-02", {"clone_mode": "full"}) == "copied-vm"
+        
+        assert template.CreateSnapshot_Task.call_count == 1
+        assert client._template_descriptors == {}
+        assert [c.args[1] for c in client._clone_via_vmdk_copy.call_args_list] == ["web-01", "web-02"]
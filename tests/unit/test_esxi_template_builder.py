@@ -0,0 +1,183 @@
+"""
+ESXi Template Builder Unit Tests
+
+Tests for artifact caching, upload skipping and resumable downloads.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from glassdome.platforms.esxi_template_builder import MAX_TRANSFER_ATTEMPTS, ESXiTemplateBuilder
+
+
+@pytest.fixture
+def builder(tmp_path):
+    """Builder without an ESXi connection, with local artifacts stubbed"""
+    b = ESXiTemplateBuilder.__new__(ESXiTemplateBuilder)
+    b.esxi_host = "esxi.test"
+    b.esxi_user = "root"
+    b.esxi_password = "secret"
+    b.datastore = "datastore1"
+    b.verify_ssl = False
+    b.working_dir = tmp_path / "work"
+    b.cache_dir = tmp_path / "cache"
+    b.working_dir.mkdir()
+    b.cache_dir.mkdir()
+    
+    converted = b.cache_dir / "converted" / "abc"
+    converted.mkdir(parents=True)
+    (converted / "ubuntu-flat.vmdk").write_text("descriptor")
+    (converted / "ubuntu-flat-flat.vmdk").write_bytes(b"\0" * 1024)
+    seed = b.cache_dir / "seed.iso"
+    seed.write_bytes(b"iso")
+    
+    b.download_cloud_image = MagicMock(return_value=b.cache_dir / "image.vmdk")
+    b.convert_vmdk = MagicMock(return_value=converted / "ubuntu-flat.vmdk")
+    b.create_cloud_init_iso = MagicMock(return_value=seed)
+    b.upload_to_esxi = MagicMock(return_value=True)
+    b.convert_to_esxi_native = MagicMock(return_value=True)
+    b._write_remote_manifest = MagicMock()
+    return b
+
+
+def local_manifest(builder, name):
+    artifacts = {
+        f"{name}/ubuntu-flat.vmdk": builder.convert_vmdk.return_value,
+        f"{name}/ubuntu-flat-flat.vmdk": builder.convert_vmdk.return_value.with_name("ubuntu-flat-flat.vmdk"),
+        f"{name}/seed.iso": builder.create_cloud_init_iso.return_value,
+    }
+    files = {remote: builder._checksum(path) for remote, path in artifacts.items()}
+    disk_sha256 = files[f"{name}/ubuntu-flat-flat.vmdk"]["sha256"]
+    return {
+        "files": files,
+        "native_source_sha256": disk_sha256,
+        "native_vmdk": f"{name}/{name}-{disk_sha256[:16]}.vmdk",
+    }
+
+
+class TestESXiTemplateBuilder:
+    """Tests for ESXiTemplateBuilder"""
+    
+    def test_unchanged_rebuild_is_noop(self, builder):
+        """Nothing is uploaded or converted when the datastore already matches"""
+        manifest = local_manifest(builder, "tpl")
+        sizes = {remote: info["size"] for remote, info in manifest["files"].items()}
+        sizes[manifest["native_vmdk"]] = 1024
+        builder._remote_manifest = MagicMock(return_value=manifest)
+        builder._remote_size = MagicMock(side_effect=sizes.get)
+        
+        result = builder.build_template(template_name="tpl")
+        
+        assert result["reused"] is True
+        assert result["vmdk_path"] == f"[datastore1] {manifest['native_vmdk']}"
+        builder.upload_to_esxi.assert_not_called()
+        builder.convert_to_esxi_native.assert_not_called()
+        builder._write_remote_manifest.assert_not_called()
+    
+    def test_failed_upload_records_completed_files(self, builder):
+        """A failed build records what was uploaded so the next one resumes"""
+        builder._remote_manifest = MagicMock(return_value={})
+        builder._remote_size = MagicMock(return_value=None)
+        
+        def upload(path, remote):
+            if remote.endswith("seed.iso"):
+                raise RuntimeError("connection reset")
+            return True
+        builder.upload_to_esxi.side_effect = upload
+        
+        with pytest.raises(RuntimeError):
+            builder.build_template(template_name="tpl")
+        
+        builder.convert_to_esxi_native.assert_not_called()
+        manifest = builder._write_remote_manifest.call_args[0][1]
+        assert set(manifest["files"]) == {"tpl/ubuntu-flat.vmdk", "tpl/ubuntu-flat-flat.vmdk"}
+        assert manifest["native_source_sha256"] is None
+        assert manifest["native_vmdk"] is None
+    
+    def test_changed_disk_converts_to_new_versioned_vmdk(self, builder):
+        """A new image gets a new native disk; the one existing VMs use is kept"""
+        manifest = local_manifest(builder, "tpl")
+        current = manifest["native_vmdk"]
+        old = {**manifest, "native_source_sha256": "0" * 64, "native_vmdk": "tpl/tpl-0000000000000000.vmdk"}
+        sizes = {remote: info["size"] for remote, info in manifest["files"].items()}
+        sizes[old["native_vmdk"]] = 1024
+        builder._remote_manifest = MagicMock(return_value=old)
+        builder._remote_size = MagicMock(side_effect=sizes.get)
+        
+        result = builder.build_template(template_name="tpl")
+        
+        builder.convert_to_esxi_native.assert_called_once_with("tpl/ubuntu-flat.vmdk", current)
+        assert result["vmdk_path"] == f"[datastore1] {current}"
+        written = builder._write_remote_manifest.call_args[0][1]
+        assert written["native_vmdk"] == current
+        assert written["native_source_sha256"] == manifest["native_source_sha256"]
+    
+    def test_native_conversion_never_removes_output(self, builder):
+        """vmkfstools clones to a staging disk and renames; only the staging disk is unlinked"""
+        del builder.convert_to_esxi_native
+        ok = MagicMock(returncode=0, stdout="Clone: 100% done.", stderr="")
+        
+        with patch("glassdome.platforms.esxi_template_builder.subprocess.run", return_value=ok) as run:
+            builder.convert_to_esxi_native("tpl/ubuntu-flat.vmdk", "tpl/tpl-abc.vmdk")
+        
+        command = run.call_args_list[-1][0][0][-1]
+        output = "/vmfs/volumes/datastore1/tpl/tpl-abc.vmdk"
+        staging = "/vmfs/volumes/datastore1/tpl/tpl-abc-partial.vmdk"
+        assert f"vmkfstools -U {staging}" in command
+        assert f"vmkfstools -U {output}" not in command
+        assert command.endswith(f"vmkfstools -E {staging} {output}")
+    
+    def test_download_range_resumes(self, builder, tmp_path):
+        """An interrupted part continues from its current size"""
+        part = tmp_path / "image.part0"
+        part.write_bytes(b"x" * 10)
+        
+        response = MagicMock(status_code=206)
+        response.iter_content.return_value = [b"y" * 90]
+        response.__enter__.return_value = response
+        
+        with patch("glassdome.platforms.esxi_template_builder.requests.get", return_value=response) as get:
+            builder._download_range("https://example/image", part, (0, 99))
+        
+        assert get.call_args.kwargs["headers"] == {"Range": "bytes=10-99"}
+        assert part.stat().st_size == 100
+    
+    def test_download_range_completed_on_last_attempt(self, builder, tmp_path):
+        """A part finished by the final attempt is not reported incomplete"""
+        part = tmp_path / "image.part0"
+        
+        response = MagicMock(status_code=206)
+        response.iter_content.return_value = [b"y" * 100]
+        response.__enter__.return_value = response
+        failures = [requests.ConnectionError("reset")] * (MAX_TRANSFER_ATTEMPTS - 1)
+        
+        with patch("glassdome.platforms.esxi_template_builder.requests.get", side_effect=failures + [response]) as get, \
+                patch("glassdome.platforms.esxi_template_builder.time.sleep"):
+            builder._download_range("https://example/image", part, (0, 99))
+        
+        assert get.call_count == MAX_TRANSFER_ATTEMPTS
+        assert part.stat().st_size == 100
+    
+    def test_unverified_download_discards_leftover_parts(self, builder):
+        """Without SHA256SUMS, stale parts are deleted instead of resumed"""
+        images = builder.cache_dir / "images"
+        images.mkdir()
+        stale = images / "jammy-server-cloudimg-amd64.vmdk.unverified.part0"
+        stale.write_bytes(b"old image")
+        
+        def download(url, dest):
+            assert not stale.exists()
+            dest.write_bytes(b"new image")
+        
+        builder._upstream_checksum = MagicMock(return_value=None)
+        builder._download = MagicMock(side_effect=download)
+        
+        path = ESXiTemplateBuilder.download_cloud_image(builder)
+        
+        assert path.read_bytes() == b"new image"
+        assert list(images.glob("*.part*")) == []
@@ -0,0 +1,67 @@
+"""
+Import Time Unit Tests
+
+Guards CLI and worker startup: the package surface must stay lazy, so
+importing it loads no cloud SDKs or database models.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules whose entry points must stay cheap to import
+LIGHT_MODULES = ("glassdome", "glassdome.cli")
+
+HEAVY_MODULES = ("boto3", "botocore", "azure", "proxmoxer", "pyVmomi", "sqlalchemy", "fastapi")
+
+
+def imported_modules(module: str) -> set:
+    """Import a module in a fresh interpreter; return every module it loaded"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        modules.add(line.split("|")[-1].strip())
+    return modules
+
+
+class TestImportTime:
+    """Tests for package import cost"""
+    
+    @pytest.mark.parametrize("module", LIGHT_MODULES)
+    def test_import_skips_heavy_modules(self, module):
+        """Importing the package or the CLI skips the heavy dependencies"""
+        modules = imported_modules(module)
+        
+        heavy = sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES))
+        assert heavy == [], f"import {module} loaded {heavy}"
+    
+    def test_public_names_still_resolve(self):
+        """Lazy names load their module on first access"""
+        import glassdome
+        
+        from glassdome.platforms.proxmox_client import ProxmoxClient
+        
+        assert glassdome.ProxmoxClient is ProxmoxClient
+        assert "AWSClient" in dir(glassdome)
+        assert set(glassdome.__all__) - {"__version__", "__author__", "__email__"} <= set(dir(glassdome))
+        with pytest.raises(AttributeError):
+            glassdome.NotAName
@@ -0,0 +1,164 @@
+"""
+Knowledge Query Unit Tests
+
+Tests for the partitioned vector store and QueryEngine, on a tiny real
+FAISS index with a stub embedding model.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+faiss = pytest.importorskip("faiss")
+
+from glassdome.knowledge import query_engine
+from glassdome.knowledge.query_engine import QueryEngine
+from glassdome.knowledge.vector_store import (
+    DOCUMENTS_FILE,
+    MANIFEST_FILE,
+    DocumentStore,
+    build_partitions,
+    write_document_store,
+)
+
+DIMENSION = 4
+
+
+class FakeModel:
+    """Embeds known texts to fixed vectors, recording each batch"""
+    
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.batches = []
+    
+    def encode(self, texts, convert_to_numpy=True):
+        self.batches.append(list(texts))
+        return np.array([self.vectors.get(t, [0.0] * DIMENSION) for t in texts], dtype="float32")
+
+
+def document(n, doc_type):
+    return {"content": f"doc {n}", "source": f"{doc_type}/{n}", "type": doc_type, "metadata": {"n": n}}
+
+
+def corpus():
+    """Twenty code docs close to the origin, three markdown docs far from it"""
+    documents, vectors = [], []
+    for n in range(20):
+        documents.append(document(n, "code"))
+        vectors.append([n * 0.01, 0.0, 0.0, 0.0])
+    for n in range(20, 23):
+        documents.append(document(n, "markdown"))
+        vectors.append([0.0, 0.0, 10.0 + n, 0.0])
+    return documents, np.array(vectors, dtype="float32")
+
+
+@pytest.fixture
+def model():
+    return FakeModel({
+        "near code": [0.0, 0.0, 0.0, 0.0],
+        "near markdown": [0.0, 0.0, 32.0, 0.0],
+        "near doc 7": [0.07, 0.0, 0.0, 0.0],
+    })
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    documents, vectors = corpus()
+    write_document_store(tmp_path, documents)
+    build_partitions(tmp_path, vectors, [d["type"] for d in documents], "fake-model", DIMENSION)
+    return tmp_path
+
+
+class TestVectorStore:
+    """Tests for the on-disk document store"""
+    
+    def test_get_reads_each_line_including_unterminated_last(self, tmp_path):
+        """Offsets address every document, even without a final newline"""
+        documents = [document(n, "code") for n in range(3)]
+        documents[1]["content"] = "multi-byte ✓ content"
+        assert write_document_store(tmp_path, documents) == 3
+        
+        path = tmp_path / DOCUMENTS_FILE
+        path.write_bytes(path.read_bytes().rstrip(b"\n"))
+        
+        store = DocumentStore(tmp_path)
+        try:
+            assert len(store) == 3
+            assert [store.get(n) for n in (2, 0, 1)] == [documents[2], documents[0], documents[1]]
+        finally:
+            store.close()
+
+
+class TestQueryEngine:
+    """Tests for QueryEngine search and embedding cache"""
+    
+    def test_type_filter_returns_top_k_of_that_type(self, index_path, model):
+        """A filtered search is not crowded out by closer docs of other types"""
+        engine = QueryEngine(index_path=str(index_path), model=model)
+        
+        unfiltered = engine.search("near code", top_k=3)
+        assert [r["type"] for r in unfiltered] == ["code"] * 3
+        
+        markdown = engine.search("near code", top_k=2, filter_type="markdown")
+        assert [r["source"] for r in markdown] == ["markdown/20", "markdown/21"]
+        assert len(engine.search("near code", top_k=10, filter_type="markdown")) == 3
+        assert len(engine.search("near markdown", top_k=10, filter_type="code")) == 10
+    
+    def test_unknown_type_returns_nothing(self, index_path, model):
+        """Filtering on a type with no documents returns no hits"""
+        engine = QueryEngine(index_path=str(index_path), model=model)
+        
+        assert engine.search("near code", top_k=5, filter_type="session_log") == []
+        assert engine.search_many(["near code", "near markdown"], filter_type="session_log") == [[], []]
+    
+    def test_legacy_index_is_converted(self, tmp_path, model):
+        """faiss.index plus metadata.json is upgraded to partitions on load"""
+        documents, vectors = corpus()
+        flat = faiss.IndexFlatL2(DIMENSION)
+        flat.add(vectors)
+        faiss.write_index(flat, str(tmp_path / "faiss.index"))
+        (tmp_path / "metadata.json").write_text(json.dumps({
+            "documents": documents, "model_name": "fake-model", "dimension": DIMENSION,
+        }))
+        
+        engine = QueryEngine(index_path=str(tmp_path), model=model)
+        
+        assert (tmp_path / MANIFEST_FILE).exists()
+        assert engine.model_name == "fake-model"
+        assert engine.get_stats()["partitions"] == {"all": 23, "code": 20, "markdown": 3}
+        assert engine.search("near doc 7", top_k=1)[0]["metadata"] == {"n": 7}
+        
+        # The next load reads the partitions directly
+        reloaded = QueryEngine(index_path=str(tmp_path), model=model)
+        assert len(reloaded.documents) == 23
+    
+    def test_search_many_keeps_query_order(self, index_path, model):
+        """One batch encode, one result list per query in order"""
+        engine = QueryEngine(index_path=str(index_path), model=model)
+        
+        results = engine.search_many(["near markdown", "near doc 7", "near code"], top_k=1)
+        
+        assert [r[0]["source"] for r in results] == ["markdown/22", "code/7", "code/0"]
+        assert model.batches == [["near markdown", "near doc 7", "near code"]]
+        assert engine.search_many([]) == []
+    
+    def test_embedding_cache_is_lru_with_counters(self, index_path, model, monkeypatch):
+        """Repeat queries hit the cache; the least recently used is evicted"""
+        monkeypatch.setattr(query_engine, "EMBEDDING_CACHE_SIZE", 2)
+        engine = QueryEngine(index_path=str(index_path), model=model)
+        
+        engine.encode(["near code", "near markdown", "near code"])
+        assert (engine.cache_hits, engine.cache_misses) == (0, 2)
+        assert model.batches == [["near code", "near markdown"]]
+        
+        engine.encode(["near code"])  # hit; "near markdown" is now least recent
+        engine.encode(["near doc 7"])  # evicts "near markdown"
+        engine.encode(["near code", "near markdown"])
+        
+        assert (engine.cache_hits, engine.cache_misses) == (2, 4)
+        assert model.batches[1:] == [["near doc 7"], ["near markdown"]]
+        assert engine.get_stats()["embedding_cache"] == {"size": 2, "hits": 2, "misses": 4}
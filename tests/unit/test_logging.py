@@ -0,0 +1,220 @@
+"""
+Logging Unit Tests
+
+Tests for the queue-based Logstash handler.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import logging
+import socket
+import threading
+import time
+
+import pytest
+
+from glassdome.core.logging import LogstashHandler
+
+
+def _make_record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("glassdome.test", logging.INFO, __file__, 1, msg, None, None)
+
+
+def _unused_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestLogstashHandler:
+    """Tests for LogstashHandler"""
+    
+    def test_emit_ships_batched_ndjson(self):
+        """Test records reach Logstash as newline-delimited JSON"""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        received = []
+        
+        def accept():
+            conn, _ = server.accept()
+            with conn:
+                data = b""
+                while data.count(b"\n") < 5:
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+                received.append(data)
+        
+        t = threading.Thread(target=accept, daemon=True)
+        t.start()
+        
+        handler = LogstashHandler(host="127.0.0.1", port=server.getsockname()[1], timeout=2)
+        for i in range(5):
+            handler.emit(_make_record(f"message {i}"))
+        t.join(5)
+        handler.close()
+        server.close()
+        
+        lines = received[0].decode().strip().split("\n")
+        assert len(lines) == 5
+        assert '"message": "message 0"' in lines[0]
+        assert handler.get_stats()["sent"] == 5
+    
+    def test_emit_does_not_block_when_unreachable(self):
+        """Test emit stays fast and drops oldest records under backpressure"""
+        handler = LogstashHandler(host="127.0.0.1", port=_unused_port(), timeout=0.2, max_buffer=10)
+        
+        start = time.monotonic()
+        for i in range(50):
+            handler.emit(_make_record(f"message {i}"))
+        elapsed = time.monotonic() - start
+        
+        assert elapsed < 0.5
+        assert len(handler.buffer) <= 10
+        assert handler.get_stats()["dropped"] > 0
+        assert handler.get_stats()["sent"] == 0
+        handler.close()
+    
+    def test_backoff_ignores_new_records(self):
+        """Test a steady stream of records does not cut the reconnect backoff short"""
+        handler = LogstashHandler(host="127.0.0.1", port=_unused_port(), timeout=0.2)
+        attempts = []
+        connect = handler._connect
+        
+        def counting_connect():
+            attempts.append(time.monotonic())
+            return connect()
+        
+        handler._connect = counting_connect
+        end = time.monotonic() + 1.2
+        while time.monotonic() < end:
+            handler.emit(_make_record("message"))
+            time.sleep(0.005)
+        handler.close()
+        
+        # Backoff of 0.5s then 1s allows two or three attempts, not hundreds
+        assert 1 <= len(attempts) <= 3
+    
+    def test_flush_waits_for_first_connect(self):
+        """Test flush drains the queue even before a connection exists"""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        handler = LogstashHandler(host="127.0.0.1", port=server.getsockname()[1], timeout=2)
+        
+        for i in range(3):
+            handler.emit(_make_record(f"message {i}"))
+        handler.flush()
+        
+        assert handler.get_stats()["queued"] == 0
+        assert handler.get_stats()["sent"] == 3
+        handler.close()
+        server.close()
+    
+    def test_flush_and_close_return_quickly_when_unreachable(self):
+        """Test shutdown doesn't wait out the timeout while Logstash is down"""
+        handler = LogstashHandler(host="127.0.0.1", port=_unused_port(), timeout=5)
+        handler.emit(_make_record("message"))
+        end = time.monotonic() + 2
+        while handler.failed_sends == 0 and time.monotonic() < end:
+            time.sleep(0.01)
+        
+        start = time.monotonic()
+        handler.flush()
+        handler.close()
+        
+        assert time.monotonic() - start < 1
+        assert not handler._worker.is_alive()
+        assert handler.get_stats()["queued"] == 1
+    
+    def test_close_has_one_deadline(self):
+        """Test flush plus join never take longer than the timeout"""
+        handler = LogstashHandler(host="127.0.0.1", port=_unused_port(), timeout=0.5)
+        release = threading.Event()
+        
+        def stuck_send(messages):
+            release.wait(5)
+            return True
+        
+        handler._send = stuck_send
+        handler.emit(_make_record("message"))
+        
+        start = time.monotonic()
+        handler.close()
+        elapsed = time.monotonic() - start
+        release.set()
+        
+        assert 0.4 < elapsed < 0.9
+    
+    def test_concurrent_emit_starts_one_worker(self):
+        """Test racing first records start a single sender thread"""
+        handler = LogstashHandler(host="127.0.0.1", port=_unused_port(), timeout=0.2)
+        barrier = threading.Barrier(8)
+        
+        def log():
+            barrier.wait()
+            handler.emit(_make_record("message"))
+        
+        threads = [threading.Thread(target=log) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        senders = [t for t in threading.enumerate() if t.name == "logstash-sender"]
+        handler.close()
+        assert len(senders) == 1
+
+
+class TestLogTailer:
+    """Tests for the shared log tailer"""
+    
+    def test_read_last_lines_spans_blocks(self, tmp_path, monkeypatch):
+        """Test reverse block reads return exactly the last N lines"""
+        from glassdome.core import log_tail
+        
+        monkeypatch.setattr(log_tail, "BLOCK_SIZE", 16)
+        path = tmp_path / "app.log"
+        path.write_text("".join(f"line {i}\n" for i in range(100)))
+        
+        assert log_tail.read_last_lines(path, 3) == ["line 97\n", "line 98\n", "line 99\n"]
+        assert len(log_tail.read_last_lines(path, 500)) == 100
+    
+    def test_total_lines_is_incremental(self, tmp_path):
+        """Test line counts follow appends and truncation"""
+        from glassdome.core.log_tail import LogTailer
+        
+        path = tmp_path / "app.log"
+        path.write_text("a\nb\n")
+        tailer = LogTailer(path)
+        assert tailer.total_lines() == 2
+        
+        with open(path, "a") as f:
+            f.write("c\n")
+        assert tailer.total_lines() == 3
+        
+        path.write_text("z\n")
+        assert tailer.total_lines() == 1
+    
+    async def test_broadcasts_new_lines_to_all_subscribers(self, tmp_path):
+        """Test appended lines reach every subscriber once"""
+        import asyncio
+        from glassdome.core.log_tail import LogTailer
+        
+        path = tmp_path / "app.log"
+        path.write_text("old line\n")
+        tailer = LogTailer(path, poll_interval=0.01)
+        first, second = tailer.subscribe(), tailer.subscribe()
+        
+        with open(path, "a") as f:
+            f.write("new line\npartial")
+        
+        assert await asyncio.wait_for(first.get(), 2) == "new line\n"
+        assert await asyncio.wait_for(second.get(), 2) == "new line\n"
+        
+        tailer.unsubscribe(first)
+        tailer.unsubscribe(second)
+        assert tailer.get_stats()["following"] is False
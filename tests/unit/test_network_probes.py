@@ -0,0 +1,77 @@
+"""
+Network Prober Unit Tests
+
+Tests for the background network probe sweeps.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from glassdome.api import network_probes
+from glassdome.api.network_probes import NETWORK_PROBES, NetworkProber
+
+
+class TestNetworkProber:
+    """Tests for NetworkProber"""
+    
+    @pytest.mark.asyncio
+    async def test_sweep_pings_concurrently(self):
+        """A sweep takes as long as the slowest probe, not the sum"""
+        calls = []
+        
+        async def fake_ping(host):
+            calls.append(host)
+            await asyncio.sleep(0.2)
+            return host != "10.30.0.1", 1.5
+        
+        prober = NetworkProber()
+        with patch.object(network_probes, "ping_host", fake_ping):
+            start = time.perf_counter()
+            snapshot = await prober.snapshot()
+            elapsed = time.perf_counter() - start
+            
+            # Served from the last sweep: no more pings
+            await prober.snapshot()
+        
+        assert elapsed < 0.2 * len(NETWORK_PROBES)
+        assert len(calls) == len(NETWORK_PROBES)
+        assert snapshot["mxwest"].status == "down"
+        assert snapshot["mxwest-gateway"].status == "up"
+        assert not snapshot["mxwest"].stale
+        assert snapshot["mxwest"].age_seconds is not None
+    
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        """History is a ring buffer of the most recent results"""
+        async def fake_ping(host):
+            return True, 1.0
+        
+        prober = NetworkProber(history_size=3)
+        with patch.object(network_probes, "ping_host", fake_ping):
+            for _ in range(5):
+                await prober.sweep()
+        
+        assert len(prober.history("mxwest")) == 3
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_a_sweep(self):
+        """Requests arriving before the first sweep finishes don't start another"""
+        calls = 0
+        
+        async def fake_ping(host):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return True, 1.0
+        
+        prober = NetworkProber()
+        with patch.object(network_probes, "ping_host", fake_ping):
+            await asyncio.gather(*(prober.snapshot() for _ in range(5)))
+        
+        assert calls == len(NETWORK_PROBES)
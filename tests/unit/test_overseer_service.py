@@ -8,12 +8,15 @@ Created: December 2025
 """
 
 import asyncio
+import os
+import time
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from glassdome.overseer.health_monitor import (
     HealthMonitor,
+    HealthStats,
     ServiceHealth,
     ServiceStatus,
     get_health_monitor
@@ -25,6 +28,8 @@ from glassdome.overseer.state_sync import (
     get_state_sync,
     get_sync_scheduler
 )
+from glassdome.overseer.state import SystemState, VM, VMStatus
+from glassdome.overseer.rag_consultant import RAGConsultant, issue_signature
 
 
 # =============================================================================
@@ -83,6 +88,31 @@ class TestServiceHealth:
 # HealthMonitor Tests
 # =============================================================================
 
+class TestHealthStats:
+    """Tests for rolling HealthStats"""
+    
+    def test_availability_and_percentiles(self):
+        """Test rolling stats over a full window"""
+        stats = HealthStats(window=4)
+        for latency in (10.0, 20.0, 30.0):
+            stats.record(True, latency)
+        stats.record(False)
+        
+        assert stats.availability == 0.75
+        assert stats.percentile(50) == 20.0
+        assert stats.percentile(99) == 30.0
+    
+    def test_window_evicts_oldest(self):
+        """Test old samples drop out of the stats"""
+        stats = HealthStats(window=2)
+        stats.record(False)
+        stats.record(True, 100.0)
+        stats.record(True, 5.0)
+        
+        assert stats.availability == 1.0
+        assert stats.percentile(0) == 5.0
+
+
 class TestHealthMonitor:
     """Tests for HealthMonitor class"""
     
@@ -161,6 +191,64 @@ class TestHealthMonitor:
         status = monitor.get_status()
         assert status["overall"] == "unhealthy"
     
+    def test_adaptive_interval_backs_off_and_tightens(self):
+        """Test healthy services back off and failing ones tighten"""
+        monitor = HealthMonitor(check_interval=30, min_interval=5, max_interval=60)
+        service = monitor.services["backend"]
+        
+        service.status = ServiceStatus.HEALTHY
+        monitor._record_result(service, now=0.0)
+        assert service.check_interval == 45
+        monitor._record_result(service, now=0.0)
+        assert service.check_interval == 60
+        
+        service.status = ServiceStatus.UNHEALTHY
+        monitor._record_result(service, now=100.0)
+        assert service.check_interval == 5
+        assert service.next_check == 105.0
+    
+    def test_history_is_bounded_ring_buffer(self):
+        """Test history keeps only the newest entries"""
+        monitor = HealthMonitor()
+        for i in range(monitor._max_history + 10):
+            monitor._health_history.append({"i": i})
+        
+        assert len(monitor._health_history) == monitor._max_history
+        assert [h["i"] for h in monitor.get_history(limit=3)] == [
+            monitor._max_history + 7, monitor._max_history + 8, monitor._max_history + 9
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_alerts_sent_on_change_or_once_per_interval(self, monkeypatch):
+        """Test a failing service is not re-alerted on every tightened check"""
+        monitor = HealthMonitor(check_interval=30)
+        alerts = []
+        monitor.register_alert_callback(alerts.append)
+        clock = [0.0]
+        monkeypatch.setattr(asyncio.get_running_loop(), "time", lambda: clock[0])
+        service = monitor.services["redis"]
+        service.status = ServiceStatus.UNHEALTHY
+        
+        for _ in range(8):  # failing checks every min_interval (7s)
+            service.consecutive_failures += 1
+            await monitor._check_alerts(["redis"])
+            clock[0] += monitor.min_interval
+        assert [a["level"] for a in alerts] == ["critical", "critical"]
+        
+        service.status = ServiceStatus.DEGRADED
+        service.consecutive_failures = 2
+        await monitor._check_alerts(["redis"])
+        assert alerts[-1]["level"] == "warning"
+        
+        # Recovery clears the state, so a new failure alerts straight away
+        service.status = ServiceStatus.HEALTHY
+        service.consecutive_failures = 0
+        await monitor._check_alerts(["redis"])
+        service.status = ServiceStatus.UNHEALTHY
+        service.consecutive_failures = 3
+        await monitor._check_alerts(["redis"])
+        assert [a["level"] for a in alerts] == ["critical", "critical", "warning", "critical"]
+    
     def test_health_monitor_singleton(self):
         """Test singleton pattern"""
         monitor1 = get_health_monitor()
@@ -307,7 +395,7 @@ class TestHealthMonitorChecks:
         with patch('httpx.AsyncClient') as mock_client:
             mock_response = AsyncMock()
             mock_response.status_code = 200
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
             
             await monitor._check_frontend()
             
@@ -319,7 +407,7 @@ class TestHealthMonitorChecks:
         monitor = HealthMonitor(frontend_url="http://localhost:5174")
         
         with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
+            mock_client.return_value.get = AsyncMock(
                 side_effect=Exception("Connection refused")
             )
             
@@ -327,6 +415,22 @@ class TestHealthMonitorChecks:
             
             assert monitor.services["frontend"].status == ServiceStatus.UNHEALTHY
             assert monitor.services["frontend"].consecutive_failures == 1
+    
+    @pytest.mark.asyncio
+    async def test_client_reused_across_checks(self):
+        """Test checks against the same target share one pooled client"""
+        monitor = HealthMonitor(frontend_url="http://localhost:5174")
+        
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_response = AsyncMock()
+            mock_response.status_code = 200
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            
+            await monitor._check_frontend()
+            await monitor._check_frontend()
+            
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.get.await_count == 2
 
 
 class TestStateSyncOperations:
@@ -357,3 +461,184 @@ class TestStateSyncOperations:
         assert result.success is False
         assert len(result.errors) > 0
 
+
+
+# =============================================================================
+# SystemState Persistence Tests
+# =============================================================================
+
+class TestSystemStateJournal:
+    """Tests for snapshot + journal persistence"""
+    
+    def _vm(self, vm_id: str) -> VM:
+        return VM(id=vm_id, name=f"vm-{vm_id}", platform="proxmox", status=VMStatus.RUNNING)
+    
+    def test_mutations_append_to_journal(self, tmp_path):
+        """Test mutations are journaled instead of rewriting the snapshot"""
+        state = SystemState(state_file=str(tmp_path / "state.json"))
+        state.add_vm(self._vm("100"))
+        state.update_vm("100", ip="10.0.0.5")
+        state.flush()
+        
+        assert not state.state_file.exists()
+        assert len(state.journal_file.read_text().splitlines()) == 2
+    
+    def test_load_replays_snapshot_and_journal(self, tmp_path):
+        """Test reload reconstructs state from snapshot plus journal tail"""
+        state_file = str(tmp_path / "state.json")
+        state = SystemState(state_file=state_file)
+        state.add_vm(self._vm("100"))
+        state.add_vm(self._vm("101"))
+        state.save()
+        state.update_vm("100", status=VMStatus.STOPPED)
+        state.remove_vm("101")
+        state.flush()
+        
+        reloaded = SystemState(state_file=state_file)
+        
+        assert set(reloaded.vms) == {"100"}
+        assert reloaded.vms["100"].status == VMStatus.STOPPED
+    
+    def test_save_compacts_journal(self, tmp_path):
+        """Test snapshot truncates the journal"""
+        state = SystemState(state_file=str(tmp_path / "state.json"))
+        state.add_vm(self._vm("100"))
+        state.save()
+        
+        assert state.state_file.exists()
+        assert not state.journal_file.exists()
+    
+    def test_torn_journal_record_is_ignored(self, tmp_path):
+        """Test a partially written final record does not break loading"""
+        state_file = str(tmp_path / "state.json")
+        state = SystemState(state_file=state_file)
+        state.add_vm(self._vm("100"))
+        state.flush()
+        with open(state.journal_file, "a") as f:
+            f.write('{"op":"put","c":"vms","k":"1')
+        
+        reloaded = SystemState(state_file=state_file)
+        
+        assert set(reloaded.vms) == {"100"}
+        assert not reloaded.journal_file.exists()
+    
+    def test_records_written_through_and_synced_on_timer(self, tmp_path, monkeypatch):
+        """Test each record reaches the file at once and an idle journal is fsynced"""
+        import glassdome.overseer.state as state_module
+        
+        monkeypatch.setattr(state_module, "JOURNAL_FSYNC_INTERVAL", 0.05)
+        synced = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(state_module.os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+        
+        state = SystemState(state_file=str(tmp_path / "state.json"))
+        state.add_vm(self._vm("100"))
+        
+        assert len(state.journal_file.read_text().splitlines()) == 1
+        assert synced == []
+        deadline = time.monotonic() + 2
+        while state._unsynced_entries and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert state._unsynced_entries == 0
+        assert len(synced) == 1
+        state.close()
+    
+    def test_close_syncs_pending_records(self, tmp_path):
+        """Test closing the state syncs the journal and stops the timer"""
+        state = SystemState(state_file=str(tmp_path / "state.json"))
+        state.add_vm(self._vm("100"))
+        state.close()
+        
+        assert state._unsynced_entries == 0
+        assert state._fsync_timer is None
+        assert set(SystemState(state_file=str(state.state_file)).vms) == {"100"}
+
+
+# =============================================================================
+# RAGConsultant Tests
+# =============================================================================
+
+class FakeRAGHelper:
+    """Blocking consult_rag, like embedding + FAISS search"""
+    
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.calls = 0
+    
+    def consult_rag(self, context):
+        import time
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"should_use_rag": True, "reason": "seen before", "sources": ["notes.md"]}
+
+
+class TestRAGConsultant:
+    """Tests for the async, cached RAG front end"""
+    
+    def test_signature_normalization(self):
+        """Test volatile formatting doesn't change the signature"""
+        a = issue_signature("consult", {"error_message": "VM 114  is DOWN at 2025-12-01T10:00:00Z", "severity": "critical"})
+        b = issue_signature("consult", {"severity": "critical", "error_message": "vm 114 is down at 2025-12-02 11:30"})
+        c = issue_signature("consult", {"error_message": "VM 115 is DOWN", "severity": "critical"})
+        
+        assert a == b
+        assert a != c
+    
+    async def test_event_loop_not_blocked(self):
+        """Test lookups run off the loop and repeats come from the cache"""
+        helper = FakeRAGHelper(delay=0.2)
+        rag = RAGConsultant(helper_factory=lambda: helper)
+        context = {"error_message": "VM 114 is DOWN", "issue_type": "host_down"}
+        
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        task = asyncio.create_task(ticker())
+        result = await rag.consult(context)
+        task.cancel()
+        
+        assert result["reason"] == "seen before"
+        assert ticks >= 10  # Loop kept running during the 0.2s lookup
+        
+        start = asyncio.get_running_loop().time()
+        assert await rag.consult(dict(context)) == result
+        assert asyncio.get_running_loop().time() - start < 0.01
+        assert helper.calls == 1
+        assert rag.get_stats()["hits"] == 1
+        rag.shutdown()
+    
+    async def test_single_flight(self):
+        """Test concurrent identical lookups run once"""
+        helper = FakeRAGHelper(delay=0.2)
+        rag = RAGConsultant(helper_factory=lambda: helper, max_workers=4)
+        context = {"error_message": "VM 114 is DOWN"}
+        
+        results = await asyncio.gather(*(rag.consult(context) for _ in range(10)))
+        
+        assert all(r == results[0] for r in results)
+        assert helper.calls == 1
+        assert rag.get_stats()["deduplicated"] == 9
+        rag.shutdown()
+    
+    async def test_timeout_and_full_queue_do_not_wait(self):
+        """Test slow lookups time out, keep running, and the queue is bounded"""
+        helper = FakeRAGHelper(delay=0.3)
+        rag = RAGConsultant(helper_factory=lambda: helper, max_pending=1, timeout=0.05)
+        
+        assert await rag.consult({"error_message": "slow"}) is None
+        assert rag.get_stats()["timeouts"] == 1
+        
+        # Queue full: skipped immediately
+        assert await rag.consult({"error_message": "other"}) is None
+        assert rag.get_stats()["skipped"] == 1
+        
+        # The timed-out lookup finishes in the background and is cached
+        await asyncio.sleep(0.4)
+        assert (await rag.consult({"error_message": "slow"}))["reason"] == "seen before"
+        assert helper.calls == 1
+        rag.shutdown()
@@ -0,0 +1,128 @@
+"""
+Platform Inventory Unit Tests
+
+Tests for concurrent, cached platform status collection.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from glassdome.platforms.inventory import PlatformInventory
+
+
+class TestPlatformInventory:
+    """Tests for PlatformInventory"""
+    
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently_with_partial_results(self):
+        """Slow and failing sources don't hold up or hide the others"""
+        inventory = PlatformInventory(source_timeout=0.3)
+        
+        async def ok(delay, value):
+            await asyncio.sleep(delay)
+            return value
+        
+        async def broken():
+            raise RuntimeError("connection refused")
+        
+        start = time.perf_counter()
+        results = await inventory.run_sources({
+            "a": lambda: ok(0.2, [1]),
+            "b": lambda: ok(0.2, [2]),
+            "slow": lambda: ok(5, [3]),
+            "down": broken,
+        })
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 0.6  # max(source timeout), not the sum
+        assert results["a"].ok and results["a"].data == [1]
+        assert results["b"].ok and results["b"].data == [2]
+        assert not results["slow"].ok and "Timed out" in results["slow"].error
+        assert not results["down"].ok and results["down"].error == "connection refused"
+    
+    @pytest.mark.asyncio
+    async def test_cache_and_single_flight(self):
+        """Concurrent and repeated requests share one fetch until the TTL expires"""
+        inventory = PlatformInventory(cache_ttl=60)
+        calls = 0
+        
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+        
+        results = await asyncio.gather(*(inventory.cached("k", fetch) for _ in range(5)))
+        assert results == [1] * 5
+        assert await inventory.cached("k", fetch) == 1
+        assert calls == 1
+        
+        assert await inventory.cached("k", fetch, refresh=True) == 2
+        
+        inventory.invalidate("k")
+        assert await inventory.cached("k", fetch) == 3
+    
+    @pytest.mark.asyncio
+    async def test_failed_sources_use_short_ttl(self, monkeypatch):
+        """A round with a failed source is refetched after failure_ttl, not cache_ttl"""
+        from glassdome.platforms import inventory as inventory_module
+        
+        now = [100.0]
+        monkeypatch.setattr(inventory_module.time, "monotonic", lambda: now[0])
+        inventory = PlatformInventory(cache_ttl=60, failure_ttl=2)
+        rounds = 0
+        
+        async def down():
+            raise RuntimeError("connection refused")
+        
+        async def up():
+            return ["vm"]
+        
+        async def fetch():
+            nonlocal rounds
+            rounds += 1
+            return await inventory.run_sources({"01": down if rounds == 1 else up})
+        
+        first = await inventory.cached("k", fetch)
+        assert not first["01"].ok
+        assert await inventory.cached("k", fetch) is first
+        
+        now[0] += 3
+        second = await inventory.cached("k", fetch)
+        assert second["01"].ok and rounds == 2
+        
+        now[0] += 30
+        assert await inventory.cached("k", fetch) is second
+        
+        inventory.failure_ttl = 0
+        inventory.invalidate()
+        rounds = 0
+        await inventory.cached("k", fetch)
+        assert "k" not in inventory._cache
+    
+    @pytest.mark.asyncio
+    async def test_proxmox_uses_cluster_resources(self):
+        """One cluster/resources call per instance, LXC containers dropped"""
+        api = MagicMock()
+        api.nodes.get.return_value = [{"node": "pve01"}]
+        api.cluster.resources.get.return_value = [
+            {"type": "qemu", "vmid": 100, "name": "web", "node": "pve01", "status": "running"},
+            {"type": "lxc", "vmid": 200, "name": "ct", "node": "pve01", "status": "running"},
+        ]
+        client = SimpleNamespace(client=api)
+        
+        inventory = PlatformInventory()
+        with patch("glassdome.platforms.proxmox_factory.get_proxmox_client", return_value=client):
+            results = await inventory.proxmox(["01"])
+        
+        assert results["01"].ok
+        assert [vm["vmid"] for vm in results["01"].data["vms"]] == [100]
+        api.cluster.resources.get.assert_called_once_with(type="vm")
+        api.nodes.return_value.qemu.get.assert_not_called()
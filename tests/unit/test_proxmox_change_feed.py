@@ -0,0 +1,158 @@
+"""
+Proxmox Change Feed Unit Tests
+
+Tests for task-log and webhook driven refreshes in ProxmoxAgent.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+import time
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from glassdome.registry.agents.proxmox_agent import ProxmoxAgent, get_change_feed
+from glassdome.registry.models import Resource, ResourceState, ResourceType
+
+
+class FakeProxmox:
+    """Just enough of the proxmoxer API, counting calls"""
+    
+    def __init__(self, vms):
+        self.vms = vms  # vmid -> (node, status dict)
+        self.tasks = []
+        self.calls = Counter()
+        self.cluster = SimpleNamespace(tasks=SimpleNamespace(get=self._tasks))
+    
+    def _tasks(self):
+        self.calls["tasks"] += 1
+        return list(self.tasks)
+    
+    def nodes(self, node):
+        fake = self
+        
+        def status(vmid):
+            fake.calls[f"status:{vmid}"] += 1
+            vm_node, vm = fake.vms.get(vmid, (None, None))
+            if vm_node != node:
+                raise Exception(f"Configuration file 'qemu-server/{vmid}.conf' does not exist")
+            return vm
+        
+        def agent_get(*args):
+            raise Exception("QEMU guest agent is not running")
+        
+        class Qemu:
+            def get(self):
+                fake.calls[f"list:{node}"] += 1
+                return [{"vmid": vmid, **vm} for vmid, (n, vm) in fake.vms.items() if n == node]
+            
+            def __call__(self, vmid):
+                return SimpleNamespace(
+                    status=SimpleNamespace(current=SimpleNamespace(get=lambda: status(vmid))),
+                    agent=SimpleNamespace(get=agent_get),
+                )
+        
+        return SimpleNamespace(qemu=Qemu())
+
+
+def task(upid, vmid, node="pve1", task_type="qmstart", finished=True):
+    data = {"upid": upid, "id": str(vmid), "node": node, "type": task_type}
+    if finished:
+        data.update(endtime=1, status="OK")
+    return data
+
+
+@pytest.fixture
+def proxmox():
+    return FakeProxmox({
+        101: ("pve1", {"name": "web", "status": "stopped"}),
+        105: ("pve2", {"name": "db", "status": "stopped"}),
+    })
+
+
+@pytest.fixture
+def agent(proxmox):
+    registry = AsyncMock()
+    registry.get = AsyncMock(return_value=None)
+    a = ProxmoxAgent(instance_id="01", tier=2, poll_interval=3600, registry=registry, task_poll_interval=3600)
+    a._client = SimpleNamespace(client=proxmox)
+    a._nodes = ["pve1", "pve2"]
+    return a
+
+
+class TestProxmoxChangeFeed:
+    """Tests for ProxmoxAgent targeted refreshes"""
+    
+    @pytest.mark.asyncio
+    async def test_task_log_refreshes_only_finished_task_vms(self, agent, proxmox):
+        """One task log read per check; only VMs with finished tasks are re-read"""
+        proxmox.tasks = [task("UPID:old", 101)]
+        agent.request_refresh()
+        await agent._do_refresh()  # baseline
+        
+        proxmox.vms[105][1]["status"] = "running"
+        proxmox.tasks += [task("UPID:a", 105, node="pve2"), task("UPID:b", 101, finished=False)]
+        agent.request_refresh()
+        await agent._do_refresh()
+        
+        registered = [c.args[0] for c in agent.registry.register.call_args_list]
+        assert [(r.id, r.state) for r in registered] == [("proxmox:01:vm:105", ResourceState.RUNNING)]
+        assert proxmox.calls["tasks"] == 2
+        assert proxmox.calls["status:105"] == 1
+        assert proxmox.calls["status:101"] == 0
+        assert not any(key.startswith("list:") for key in proxmox.calls)
+        
+        # The running task is picked up when it finishes
+        proxmox.tasks[-1] = task("UPID:b", 101)
+        agent.request_refresh()
+        await agent._do_refresh()
+        assert proxmox.calls["status:101"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_webhook_hint_refreshes_without_waiting(self, agent, proxmox):
+        """A hint wakes the agent between full polls"""
+        await agent.start()
+        await asyncio.sleep(0.05)  # initial full poll
+        assert proxmox.calls["list:pve1"] == 1
+        agent.registry.register.reset_mock()
+        
+        proxmox.vms[101][1]["status"] = "running"
+        started = time.perf_counter()
+        assert get_change_feed().notify(vmid=101, node="pve1") == 1
+        while not agent.registry.register.called and time.perf_counter() - started < 1:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - started
+        await agent.stop()
+        
+        assert elapsed < 0.5
+        resource = agent.registry.register.call_args.args[0]
+        assert resource.state == ResourceState.RUNNING
+        assert proxmox.calls["list:pve1"] == 1  # no extra full poll
+        assert proxmox.calls["tasks"] == 0
+        assert get_change_feed().notify(vmid=101) == 0  # detached on stop
+    
+    @pytest.mark.asyncio
+    async def test_deleted_vm_and_clone_task(self, agent, proxmox):
+        """Missing VMs are removed; clones fall back to a full poll"""
+        agent._known_vms = {"proxmox:01:vm:105"}
+        agent.registry.get = AsyncMock(return_value=Resource(
+            id="proxmox:01:vm:105", resource_type=ResourceType.VM, name="db", platform="proxmox",
+        ))
+        del proxmox.vms[105]
+        
+        agent.request_refresh(vmid=105, node="pve2")
+        await agent._do_refresh()
+        
+        agent.registry.delete.assert_called_once_with("proxmox:01:vm:105")
+        assert agent._known_vms == set()
+        
+        agent.request_refresh()
+        await agent._do_refresh()  # baseline
+        proxmox.tasks = [task("UPID:c", 101, task_type="qmclone")]
+        agent.request_refresh()
+        await agent._do_refresh()
+        assert agent._full_poll_requested
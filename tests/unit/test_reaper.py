@@ -701,3 +701,142 @@ class TestMissionTypes:
         )
         
         assert mission.mission_type == "incident-response-lab"
+
+
+# =============================================================================
+# Reaper API Query Tests
+# =============================================================================
+
+class TestReaperStatsAndHistory:
+    """Tests for the aggregated stats and paginated history endpoints"""
+    
+    @pytest.fixture
+    async def seeded_session(self, db_session):
+        from datetime import timedelta
+        from glassdome.reaper.exploit_library import (
+            Exploit, ExploitMission, MissionLog, ValidationResult
+        )
+        
+        db_session.add_all([
+            Exploit(name="sqli", display_name="SQLi", exploit_type="web", severity="high",
+                    enabled=True, verified=True),
+            Exploit(name="xss", display_name="XSS", exploit_type="web", severity="medium",
+                    enabled=True, verified=False),
+            Exploit(name="weak-ssh", display_name="Weak SSH", exploit_type="credential",
+                    severity="high", enabled=False, verified=False),
+        ])
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for i in range(5):
+            db_session.add(ExploitMission(
+                mission_id=f"m-{i}", name=f"Mission {i}", platform="proxmox",
+                exploit_ids=[1], status="completed" if i % 2 else "failed",
+                created_at=now - timedelta(minutes=i),
+            ))
+        db_session.add_all([
+            MissionLog(mission_id="m-0", message="start"),
+            MissionLog(mission_id="m-0", message="done"),
+            ValidationResult(mission_id="m-0", test_name="ssh", test_type="credential", status="success"),
+            ValidationResult(mission_id="m-0", test_name="web", test_type="web", status="failed"),
+        ])
+        await db_session.commit()
+        return db_session
+    
+    async def test_stats_aggregates(self, seeded_session):
+        """Test stats are computed from grouped counts"""
+        from glassdome.api.reaper import get_reaper_stats
+        
+        stats = await get_reaper_stats(session=seeded_session, current_user=None)
+        
+        assert stats["exploits"]["total"] == 3
+        assert stats["exploits"]["enabled"] == 2
+        assert stats["exploits"]["verified"] == 1
+        assert stats["exploits"]["by_type"] == {"web": 2, "credential": 1}
+        assert stats["exploits"]["by_severity"] == {"high": 2, "medium": 1}
+        assert stats["missions"] == {"total": 5, "by_status": {"completed": 2, "failed": 3}}
+    
+    async def test_history_keyset_pagination(self, seeded_session):
+        """Test history pages follow the cursor and carry log/validation summaries"""
+        from glassdome.api.reaper import get_mission_history
+        
+        first = await get_mission_history(days=14, limit=2, cursor=None,
+                                          session=seeded_session, current_user=None)
+        assert [m["mission_id"] for m in first["history"]] == ["m-0", "m-1"]
+        assert first["history"][0]["log_count"] == 2
+        assert first["history"][0]["validation_summary"] == {"success": 1, "failed": 1}
+        assert first["history"][1]["validation_summary"] is None
+        
+        seen = [m["mission_id"] for m in first["history"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = await get_mission_history(days=14, limit=2, cursor=cursor,
+                                             session=seeded_session, current_user=None)
+            seen.extend(m["mission_id"] for m in page["history"])
+            cursor = page["next_cursor"]
+        
+        assert seen == [f"m-{i}" for i in range(5)]
+
+
+class TestMissionLogSink:
+    """Tests for the buffered mission log writer"""
+    
+    @pytest.fixture
+    def session_factory(self, async_engine):
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+        return async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    
+    async def _log_rows(self, session_factory, mission_id):
+        from sqlalchemy import select
+        from glassdome.reaper.exploit_library import MissionLog
+        
+        async with session_factory() as session:
+            result = await session.execute(
+                select(MissionLog.message)
+                .where(MissionLog.mission_id == mission_id)
+                .order_by(MissionLog.id)
+            )
+            return list(result.scalars())
+    
+    async def test_buffers_until_flush(self, session_factory):
+        """Test entries are held in memory and written in one commit"""
+        from glassdome.reaper.mission_log_sink import MissionLogSink
+        
+        sink = MissionLogSink(session_factory=session_factory, max_batch=100, flush_interval=60)
+        for i in range(10):
+            sink.log("m-1", f"line {i}", step="injecting")
+        
+        assert sink.pending("m-1") == 10
+        assert await self._log_rows(session_factory, "m-1") == []
+        
+        assert await sink.flush("m-1") == 10
+        assert sink.commits == 1
+        assert await self._log_rows(session_factory, "m-1") == [f"line {i}" for i in range(10)]
+        await sink.close()
+    
+    async def test_size_threshold_triggers_flush(self, session_factory):
+        """Test a full buffer is written without an explicit flush"""
+        from glassdome.reaper.mission_log_sink import MissionLogSink
+        
+        sink = MissionLogSink(session_factory=session_factory, max_batch=5, flush_interval=60)
+        for i in range(5):
+            sink.log("m-2", f"line {i}")
+        await asyncio.sleep(0.05)
+        
+        assert sink.pending("m-2") == 0
+        assert len(await self._log_rows(session_factory, "m-2")) == 5
+        await sink.close()
+    
+    async def test_failed_flush_keeps_entries(self):
+        """Test entries survive a database error and are retried"""
+        from glassdome.reaper.mission_log_sink import MissionLogSink
+        
+        def broken_factory():
+            raise RuntimeError("database unavailable")
+        
+        sink = MissionLogSink(session_factory=broken_factory, flush_interval=60)
+        sink.log("m-3", "first")
+        sink.log("m-3", "second")
+        
+        assert await sink.flush() == 0
+        assert sink.pending("m-3") == 2
+        assert sink.failed_flushes == 1
+        sink._timer.cancel()
@@ -335,7 +335,7 @@ class TestLabRegistryConnection:
         """Create a mock Redis client"""
         mock = AsyncMock()
         mock.get = AsyncMock(return_value=None)
-        mock.set = AsyncMock(return_value=True)
+        mock.set = AsyncMock(return_value=None)  # SET ... GET of a new key
         mock.delete = AsyncMock(return_value=1)
         mock.sadd = AsyncMock(return_value=1)
         mock.srem = AsyncMock(return_value=1)
@@ -378,7 +378,7 @@ class TestLabRegistryResourceOps:
         """Create a mock Redis client"""
         mock = AsyncMock()
         mock.get = AsyncMock(return_value=None)
-        mock.set = AsyncMock(return_value=True)
+        mock.set = AsyncMock(return_value=None)  # SET ... GET of a new key
         mock.delete = AsyncMock(return_value=1)
         mock.sadd = AsyncMock(return_value=1)
         mock.srem = AsyncMock(return_value=1)
@@ -429,7 +429,7 @@ class TestLabRegistryResourceOps:
             name="test-vm",
             platform="proxmox"
         )
-        mock_redis.get = AsyncMock(return_value=resource.to_json())
+        mock_redis.getdel = AsyncMock(return_value=resource.to_json())
         
         result = await registry.delete("proxmox:vm:100")
         
@@ -448,7 +448,7 @@ class TestLabRegistryLabOps:
     def mock_redis(self):
         mock = AsyncMock()
         mock.get = AsyncMock(return_value=None)
-        mock.set = AsyncMock(return_value=True)
+        mock.set = AsyncMock(return_value=None)  # SET ... GET of a new key
         mock.smembers = AsyncMock(return_value=set())
         mock.sadd = AsyncMock(return_value=1)
         mock.publish = AsyncMock(return_value=1)
@@ -528,7 +528,7 @@ class TestLabRegistryEvents:
         mock = AsyncMock()
         mock.publish = AsyncMock(return_value=1)
         mock.get = AsyncMock(return_value=None)
-        mock.set = AsyncMock(return_value=True)
+        mock.set = AsyncMock(return_value=None)  # SET ... GET of a new key
         mock.sadd = AsyncMock(return_value=1)
         return mock
     
@@ -549,7 +549,7 @@ class TestLabRegistryEvents:
         
         await registry.publish_event(event)
         
-        mock_redis.publish.assert_called()
+        mock_redis.xadd.assert_called_once()
 
 
 # =============================================================================
@@ -656,7 +656,7 @@ class TestLabRegistryIntegration:
         """Create comprehensive mock Redis"""
         mock = AsyncMock()
         mock.get = AsyncMock(return_value=None)
-        mock.set = AsyncMock(return_value=True)
+        mock.set = AsyncMock(return_value=None)  # SET ... GET of a new key
         mock.delete = AsyncMock(return_value=1)
         mock.sadd = AsyncMock(return_value=1)
         mock.srem = AsyncMock(return_value=1)
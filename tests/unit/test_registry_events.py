@@ -0,0 +1,146 @@
+"""
+Registry Event Hub Unit Tests
+
+Tests for the stream-backed event hub: fan-out, filtering, resume and
+slow subscribers.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from glassdome.registry.core import LabRegistry, parse_event_id
+from glassdome.registry.event_hub import EventFilter, EventHub, Subscription, SubscriptionOverflow
+from glassdome.registry.models import EventType, ResourceType, StateChange
+
+
+def stream_entry(n, event_type=EventType.CREATED, resource_type=ResourceType.LAB_VM, lab_id="lab-1"):
+    event = StateChange(event_type=event_type, resource_id=f"vm-{n}", resource_type=resource_type, lab_id=lab_id)
+    return f"{1000 + n}-0", {
+        "event": event.to_json(),
+        "event_type": event_type.value,
+        "resource_type": resource_type.value,
+        "lab_id": lab_id or "",
+    }
+
+
+class FakeStreamRegistry:
+    """Registry stand-in whose stream is fed by the test"""
+    
+    def __init__(self, stored=None):
+        self.stored = list(stored or [])
+        self.incoming = asyncio.Queue()
+        self.reads = 0
+    
+    async def last_event_id(self):
+        return self.stored[-1][0] if self.stored else "0-0"
+    
+    async def read_events(self, after_id, block_ms, count):
+        self.reads += 1
+        entry = await self.incoming.get()
+        self.stored.append(entry)
+        return [entry]
+    
+    async def events_since(self, after_id):
+        return [e for e in self.stored if parse_event_id(e[0]) > parse_event_id(after_id)]
+
+
+async def drain(subscription):
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(await subscription.__anext__())
+    return messages
+
+
+class TestEventHub:
+    """Tests for EventHub"""
+    
+    @pytest.mark.asyncio
+    async def test_one_reader_fans_out_filtered_events(self):
+        """Every subscriber shares one read and one encoding per event"""
+        registry = FakeStreamRegistry()
+        hub = EventHub(registry)
+        everything = await hub.subscribe()
+        lab_2 = await hub.subscribe(EventFilter(lab_id="lab-2"))
+        deletes = await hub.subscribe(EventFilter(event_types={"deleted"}, resource_types={"lab_vm"}))
+        
+        for entry in (stream_entry(1), stream_entry(2, lab_id="lab-2"), stream_entry(3, EventType.DELETED)):
+            registry.incoming.put_nowait(entry)
+        await asyncio.sleep(0.01)
+        await hub.stop()
+        
+        received = await drain(everything)
+        assert [i for i, _ in received] == ["1001-0", "1002-0", "1003-0"]
+        assert [i for i, _ in await drain(lab_2)] == ["1002-0"]
+        (event_id, message), = await drain(deletes)
+        assert message is received[2][1]
+        assert json.loads(message)["event_id"] == "1003-0"
+        assert json.loads(message)["resource_id"] == "vm-3"
+        assert registry.reads == 4  # three events, then waiting for the next
+    
+    @pytest.mark.asyncio
+    async def test_replay_returns_missed_matching_events(self):
+        """Resuming clients get stored events after their last ID"""
+        registry = FakeStreamRegistry(stored=[
+            stream_entry(1), stream_entry(2, lab_id="lab-2"), stream_entry(3), stream_entry(4),
+        ])
+        hub = EventHub(registry)
+        
+        replayed = await hub.replay("1001-0", EventFilter(lab_id="lab-1"))
+        
+        assert [event_id for event_id, _ in replayed] == ["1003-0", "1004-0"]
+    
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_dropped_after_backlog(self):
+        """A full queue drops the subscriber once its backlog is delivered"""
+        hub = EventHub(FakeStreamRegistry())
+        slow = Subscription(EventFilter(), maxsize=2)
+        hub._subscribers.append(slow)
+        
+        for n in range(3):
+            hub._dispatch(*stream_entry(n))
+        
+        assert hub.subscriber_count == 0
+        assert len(await drain(slow)) == 2
+        with pytest.raises(SubscriptionOverflow):
+            await slow.__anext__()
+
+
+class TestEventStream:
+    """Tests for LabRegistry event stream storage"""
+    
+    @pytest.mark.asyncio
+    async def test_publish_appends_once_with_filter_fields(self):
+        """Events go to one bounded stream, with filter fields beside the payload"""
+        registry = LabRegistry()
+        registry._redis = AsyncMock()
+        
+        await registry.publish_event(StateChange(
+            event_type=EventType.STATE_CHANGED, resource_id="vm-1",
+            resource_type=ResourceType.LAB_VM, lab_id="lab-1",
+        ))
+        
+        registry._redis.xadd.assert_called_once()
+        args, kwargs = registry._redis.xadd.call_args
+        assert args[0] == LabRegistry.EVENT_STREAM
+        assert args[1]["lab_id"] == "lab-1"
+        assert args[1]["event_type"] == "state_changed"
+        assert kwargs == {"maxlen": LabRegistry.EVENT_STREAM_MAXLEN, "approximate": True}
+        registry._redis.publish.assert_not_called()
+        registry._redis.lpush.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_events_since_starts_after_given_id(self):
+        """Resume reads start just past the last seen entry"""
+        registry = LabRegistry()
+        registry._redis = AsyncMock()
+        registry._redis.xrange.return_value = []
+        
+        await registry.events_since("1700000000000-4")
+        
+        assert registry._redis.xrange.call_args.kwargs["min"] == "1700000000000-5"
@@ -0,0 +1,245 @@
+"""
+Registry Lab Summary Unit Tests
+
+Tests for incrementally maintained lab summaries and the paged listing.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import asyncio
+import fnmatch
+
+import pytest
+
+from glassdome.registry.core import LIST_LAB_SUMMARIES_SCRIPT, LabRegistry
+from glassdome.registry.models import Drift, DriftType, Resource, ResourceState, ResourceType
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the registry uses"""
+    
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+    
+    async def get(self, key):
+        await asyncio.sleep(0)  # Let concurrent callers interleave, as over a network
+        return self.data.get(key)
+    
+    async def set(self, key, value, get=False):
+        await asyncio.sleep(0)
+        old = self.data.get(key)
+        self.data[key] = value
+        return old if get else True
+    
+    async def getdel(self, key):
+        return self.data.pop(key, None)
+    
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+    
+    async def exists(self, key):
+        return int(key in self.data)
+    
+    async def sadd(self, key, member):
+        members = self.data.setdefault(key, set())
+        added = member not in members
+        members.add(member)
+        return int(added)
+    
+    async def srem(self, key, member):
+        members = self.data.get(key, set())
+        removed = member in members
+        members.discard(member)
+        if not members:
+            self.data.pop(key, None)  # Redis drops empty sets
+        return int(removed)
+    
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+    
+    async def scard(self, key):
+        return len(self.data.get(key, set()))
+    
+    async def hincrby(self, key, field, amount):
+        h = self.data.setdefault(key, {})
+        h[field] = str(int(h.get(field, 0)) + amount)
+    
+    async def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+    
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.data.get(key, {}).pop(field, None)
+    
+    async def zadd(self, key, mapping, nx=False):
+        z = self.data.setdefault(key, {})
+        for member, score in mapping.items():
+            if not (nx and member in z):
+                z[member] = score
+    
+    async def zrem(self, key, member):
+        self.data.get(key, {}).pop(member, None)
+    
+    async def zcard(self, key):
+        return len(self.data.get(key, {}))
+    
+    async def zrange(self, key, start, end):
+        return self._zrange(key, start, end)
+    
+    def _zrange(self, key, start, end):
+        members = sorted(self.data.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+        return [m for m, _ in members[start:None if end == -1 else end + 1]]
+    
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+    
+    async def xadd(self, key, fields, maxlen=None, approximate=True):
+        pass
+    
+    def register_script(self, script):
+        """Run the registry's scripts in Python, counting each call as one round trip"""
+        async def update_drift(keys, args):
+            command, member = args
+            changed = await (self.sadd if command == "SADD" else self.srem)(keys[0], member)
+            await self.hset(keys[1], mapping={"drift_count": await self.scard(keys[0])})
+            return changed
+        
+        async def run(keys, args):
+            self.round_trips += 1
+            start, end, prefix, suffix = args
+            result = [len(self.data.get(keys[0], {}))]
+            for lab_id in self._zrange(keys[0], int(start), int(end)):
+                flat = []
+                for field, value in self.data.get(f"{prefix}{lab_id}{suffix}", {}).items():
+                    flat += [field, value]
+                result += [lab_id, flat]
+            return result
+        return run if script == LIST_LAB_SUMMARIES_SCRIPT else update_drift
+
+
+def lab_vm(lab_id, vmid, state=ResourceState.RUNNING):
+    return Resource(
+        id=f"proxmox:lab_vm:{lab_id}-{vmid}",
+        resource_type=ResourceType.LAB_VM,
+        name=f"{lab_id}-vm{vmid}",
+        platform="proxmox",
+        state=state,
+        lab_id=lab_id,
+    )
+
+
+@pytest.fixture
+def registry():
+    reg = LabRegistry(redis_url="redis://localhost:6379/0")
+    reg._redis = FakeRedis()
+    return reg
+
+
+class TestLabSummaries:
+    """Tests for LabRegistry lab summaries"""
+    
+    @pytest.mark.asyncio
+    async def test_summary_follows_register_delete_and_drift(self, registry):
+        """Counts track VM state changes, deletions and drift"""
+        await registry.register(Resource(
+            id="glassdome:lab:lab-1", resource_type=ResourceType.LAB, name="Red Team",
+            platform="glassdome", lab_id="lab-1",
+        ))
+        for vmid in range(3):
+            await registry.register(lab_vm("lab-1", vmid))
+        await registry.register(lab_vm("lab-1", 1, ResourceState.STOPPED))
+        await registry.register(lab_vm("lab-1", 1, ResourceState.STOPPED))  # no-op re-poll
+        
+        labs, total = await registry.list_lab_summaries()
+        assert total == 1
+        assert labs[0] == {
+            "lab_id": "lab-1", "name": "Red Team", "total_vms": 3,
+            "running_vms": 2, "healthy": False, "drift_count": 0,
+        }
+        
+        drift = Drift(
+            resource_id="proxmox:lab_vm:lab-1-1", resource_type=ResourceType.LAB_VM,
+            drift_type=DriftType.STATE_MISMATCH, expected="running", actual="stopped", lab_id="lab-1",
+        )
+        await registry.record_drift(drift)
+        await registry.record_drift(drift)
+        assert (await registry.list_lab_summaries())[0][0]["drift_count"] == 1
+        
+        await registry.resolve_drift(drift.resource_id)
+        await registry.delete("proxmox:lab_vm:lab-1-1")
+        labs, _ = await registry.list_lab_summaries()
+        assert labs[0]["total_vms"] == labs[0]["running_vms"] == 2
+        assert labs[0]["healthy"] is True
+        
+        # Removing the last resource drops the lab
+        for rid in ("proxmox:lab_vm:lab-1-0", "proxmox:lab_vm:lab-1-2", "glassdome:lab:lab-1"):
+            await registry.delete(rid)
+        assert await registry.list_lab_summaries() == ([], 0)
+        assert await registry.list_labs() == []
+    
+    @pytest.mark.asyncio
+    async def test_listing_is_one_round_trip_per_page(self, registry):
+        """500 labs page out in registration order with one script call each"""
+        for lab in range(500):
+            await registry.register(lab_vm(f"lab-{lab:03d}", 1))
+        
+        labs, total = await registry.list_lab_summaries(offset=0, limit=500)
+        assert total == 500
+        assert len(labs) == 500
+        assert registry._redis.round_trips == 1
+        
+        page, _ = await registry.list_lab_summaries(offset=490, limit=20)
+        assert [lab["lab_id"] for lab in page] == [f"lab-{n}" for n in range(490, 500)]
+    
+    @pytest.mark.asyncio
+    async def test_rebuild_backfills_existing_registry(self, registry):
+        """Labs registered before summaries existed are indexed by a rebuild"""
+        await registry.register(lab_vm("lab-old", 1))
+        await registry.register(lab_vm("lab-old", 2, ResourceState.STOPPED))
+        data = registry._redis.data
+        del data[LabRegistry.LAB_INDEX]
+        del data["registry:lab:lab-old:summary"]
+        
+        assert await registry.list_labs() == ["lab-old"]
+        assert await registry.rebuild_lab_summaries() == 1
+        
+        labs, total = await registry.list_lab_summaries()
+        assert total == 1
+        assert labs[0]["total_vms"] == 2
+        assert labs[0]["running_vms"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_apply_each_change_once(self, registry):
+        """Racing registers and deletes of one VM never double-count it"""
+        await registry.register(lab_vm("lab-1", 1))
+        await registry.register(lab_vm("lab-1", 2))
+        
+        await asyncio.gather(*(registry.register(lab_vm("lab-1", 1, ResourceState.STOPPED)) for _ in range(5)))
+        labs, _ = await registry.list_lab_summaries()
+        assert (labs[0]["total_vms"], labs[0]["running_vms"]) == (2, 1)
+        
+        deleted = await asyncio.gather(*(registry.delete("proxmox:lab_vm:lab-1-1") for _ in range(3)))
+        assert sorted(deleted) == [False, False, True]
+        labs, _ = await registry.list_lab_summaries()
+        assert (labs[0]["total_vms"], labs[0]["running_vms"]) == (1, 1)
+    
+    @pytest.mark.asyncio
+    async def test_drift_count_follows_drift_set(self, registry):
+        """Resolving drifts after the lab is gone cannot push the count below zero"""
+        drift = Drift(
+            resource_id="proxmox:lab_vm:lab-1-1", resource_type=ResourceType.LAB_VM,
+            drift_type=DriftType.STATE_MISMATCH, expected="running", actual="stopped", lab_id="lab-1",
+        )
+        await registry.register(lab_vm("lab-1", 1))
+        await asyncio.gather(registry.record_drift(drift), registry.record_drift(drift))
+        await registry.delete("proxmox:lab_vm:lab-1-1")
+        await asyncio.gather(registry.resolve_drift(drift.resource_id), registry.resolve_drift(drift.resource_id))
+        
+        await registry.register(lab_vm("lab-1", 1))
+        labs, _ = await registry.list_lab_summaries()
+        assert labs[0]["drift_count"] == 0
+        assert labs[0]["healthy"] is True
@@ -204,6 +204,79 @@ class TestVaultSecretsBackend:
         assert result is None
 
 
+    def test_vault_backend_caches_reads(self):
+        """VaultSecretsBackend serves repeat reads from its cache."""
+        from glassdome.core.secrets_backend import VaultSecretsBackend
+        
+        with patch.dict('sys.modules', {'hvac': MagicMock()}):
+            import sys
+            mock_client = sys.modules['hvac'].Client.return_value
+            mock_client.is_authenticated.return_value = True
+            mock_client.secrets.kv.v2.read_secret_version.return_value = {
+                "data": {"data": {"value": "cached_value"}}
+            }
+            
+            backend = VaultSecretsBackend(addr="http://vault.test:8200")
+            
+            assert backend.get("my_secret") == "cached_value"
+            assert backend.get("my_secret") == "cached_value"
+            assert mock_client.secrets.kv.v2.read_secret_version.call_count == 1
+            
+            stats = backend.cache_stats()
+            assert stats["hits"] == 1
+            assert stats["backend_calls"] == 1
+    
+    def test_vault_backend_set_invalidates_cache(self):
+        """Writing a secret drops its cached value."""
+        from glassdome.core.secrets_backend import VaultSecretsBackend
+        
+        with patch.dict('sys.modules', {'hvac': MagicMock()}):
+            import sys
+            mock_client = sys.modules['hvac'].Client.return_value
+            mock_client.is_authenticated.return_value = True
+            read = mock_client.secrets.kv.v2.read_secret_version
+            read.return_value = {"data": {"data": {"value": "old"}}}
+            
+            backend = VaultSecretsBackend(addr="http://vault.test:8200")
+            assert backend.get("rotating") == "old"
+            
+            read.return_value = {"data": {"data": {"value": "new"}}}
+            assert backend.set("rotating", "new") is True
+            assert backend.get("rotating") == "new"
+    
+    def test_vault_backend_get_many(self):
+        """get_many() returns every key and only reads uncached paths."""
+        from glassdome.core.secrets_backend import VaultSecretsBackend
+        
+        with patch.dict('sys.modules', {'hvac': MagicMock()}):
+            import sys
+            mock_client = sys.modules['hvac'].Client.return_value
+            mock_client.is_authenticated.return_value = True
+            read = mock_client.secrets.kv.v2.read_secret_version
+            read.side_effect = lambda path, mount_point: {"data": {"data": {"value": f"v-{path}"}}}
+            
+            backend = VaultSecretsBackend(addr="http://vault.test:8200")
+            backend.get("a")
+            
+            result = backend.get_many(["a", "b", "c"])
+            
+            assert result == {"a": "v-a", "b": "v-b", "c": "v-c"}
+            assert read.call_count == 3
+    
+    def test_secret_cache_expires(self):
+        """SecretCache entries expire after their TTL."""
+        from glassdome.core.secrets_backend import SecretCache
+        
+        cache = SecretCache(ttl=10, negative_ttl=1)
+        with patch('glassdome.core.secrets_backend.time.monotonic', return_value=100.0):
+            cache.put("present", "value")
+            cache.put("missing", None)
+        
+        with patch('glassdome.core.secrets_backend.time.monotonic', return_value=105.0):
+            assert cache.lookup("present") == (True, "value")
+            assert cache.lookup("missing") == (False, None)
+
+
 # =============================================================================
 # ChainedSecretsBackend Tests
 # =============================================================================
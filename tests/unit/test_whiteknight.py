@@ -0,0 +1,104 @@
+"""
+WhiteKnight Client Unit Tests
+
+Tests for the warm worker pool using a local fake agent process that
+speaks the `--serve` protocol.
+
+Author: Brett Turner (ntounix)
+Created: December 2025
+"""
+
+import sys
+import time
+
+import pytest
+
+from glassdome.whiteknight import client as client_module
+from glassdome.whiteknight.client import WhiteKnightClient, ValidationStatus, validate_exploit
+
+
+FAKE_AGENT = '''
+import json, sys, time
+print("agent booting")  # Non-protocol output is ignored
+print(json.dumps({"ready": True}), flush=True)
+for line in sys.stdin:
+    job = json.loads(line)
+    config = job["config"]
+    if config.get("crash"):
+        sys.exit(1)
+    time.sleep(config.get("delay", 0.3))
+    result = {
+        "status": "success",
+        "exploit_type": config.get("exploit_type", "UNKNOWN"),
+        "target_ip": job["target"],
+        "evidence": config.get("name", ""),
+    }
+    print(json.dumps({"id": job["id"], "result": result}), flush=True)
+'''
+
+
+@pytest.fixture
+def agent_command(tmp_path):
+    script = tmp_path / "fake_agent.py"
+    script.write_text(FAKE_AGENT)
+    return [sys.executable, str(script)]
+
+
+class TestWhiteKnightPool:
+    """Tests for pooled validation"""
+    
+    async def test_validate_multiple_runs_concurrently(self, agent_command):
+        """Test 10 validations on a pool of 5 take ~2 job durations"""
+        client = WhiteKnightClient(pool_size=5, agent_command=agent_command)
+        exploits = [{"id": i, "name": f"exploit-{i}", "exploit_type": "WEB"} for i in range(1, 11)]
+        
+        await client._get_pool()  # Warm up outside the timing
+        start = time.monotonic()
+        results = await client.validate_multiple("10.0.0.5", exploits)
+        elapsed = time.monotonic() - start
+        
+        assert list(results) == [str(i) for i in range(1, 11)]
+        assert all(r.status == ValidationStatus.SUCCESS for r in results.values())
+        assert results["3"].evidence == "exploit-3"
+        assert elapsed < 2.0  # Sequential would be >= 3s
+        
+        stats = client._pool.get_stats()
+        assert stats["workers_started"] == 5
+        assert stats["jobs"] == 10
+        await client.close()
+    
+    async def test_timeout_replaces_worker(self, agent_command):
+        """Test a timed-out job reports TIMEOUT and the pool recovers"""
+        client = WhiteKnightClient(pool_size=1, agent_command=agent_command)
+        
+        result = await client.validate("10.0.0.5", {"delay": 5}, timeout=0.5)
+        assert result.status == ValidationStatus.TIMEOUT
+        
+        result = await client.validate("10.0.0.5", {"delay": 0}, timeout=5)
+        assert result.status == ValidationStatus.SUCCESS
+        assert client._pool.get_stats()["workers_replaced"] == 1
+        await client.close()
+    
+    async def test_crashed_worker_reports_error(self, agent_command):
+        """Test a worker that exits mid-job yields an ERROR result"""
+        client = WhiteKnightClient(pool_size=1, agent_command=agent_command)
+        
+        result = await client.validate("10.0.0.5", {"crash": True}, timeout=5)
+        assert result.status == ValidationStatus.ERROR
+        
+        result = await client.validate("10.0.0.5", {"delay": 0}, timeout=5)
+        assert result.status == ValidationStatus.SUCCESS
+        await client.close()
+    
+    async def test_validate_exploit_reuses_shared_pool(self, agent_command, monkeypatch):
+        """Test the helper goes through the shared client, not a new pool per call"""
+        shared = WhiteKnightClient(pool_size=2, agent_command=agent_command)
+        monkeypatch.setattr(client_module, "_client", shared)
+        
+        for i in range(3):
+            result = await validate_exploit("10.0.0.5", {"name": f"exploit-{i}", "delay": 0})
+            assert result.status == ValidationStatus.SUCCESS
+        
+        assert shared._pool.get_stats()["workers_started"] == 2
+        assert shared._pool.get_stats()["jobs"] == 3
+        await shared.close()
@@ -568,7 +568,57 @@ class MetasploitRunner:
 # CLI ENTRY POINT
 # =============================================================================
 
+async def serve():
+    """
+    Long-lived worker mode (used by the WhiteKnight pool).
+    
+    Reads one JSON job per line from stdin:
+        {"id": "...", "target": "10.0.0.5", "config": {...}}
+    and writes one JSON line per job to stdout:
+        {"id": "...", "result": {...}}
+    A {"ready": true} line is written once the agent is up. Jobs are
+    handled one at a time; the pool runs several workers for concurrency.
+    """
+    # stdout carries the protocol, so console logging moves to stderr
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler) and getattr(handler, "stream", None) is sys.stdout:
+            handler.setStream(sys.stderr)
+    
+    agent = WhiteKnightAgent()
+    loop = asyncio.get_running_loop()
+    
+    def reply(message: Dict[str, Any]):
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+    
+    reply({"ready": True})
+    
+    while True:
+        line = await loop.run_in_executor(None, sys.stdin.readline)
+        if not line:
+            break  # stdin closed: pool is shutting us down
+        line = line.strip()
+        if not line:
+            continue
+        
+        job_id = None
+        try:
+            job = json.loads(line)
+            job_id = job.get("id")
+            target = job["target"]
+            config = job.get("config") or {}
+            result = await agent.validate(target, config)
+            reply({"id": job_id, "result": result.to_dict()})
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            reply({"id": job_id, "error": str(e)})
+
+
 def main():
+    if "--serve" in sys.argv[1:]:
+        asyncio.run(serve())
+        return
+    
     parser = argparse.ArgumentParser(description="WhiteKnight Vulnerability Validator")
     parser.add_argument("--target", "-t", required=True, help="Target IP address")
     parser.add_argument("--config", "-c", help="JSON config file or inline JSON")